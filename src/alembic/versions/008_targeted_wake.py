@@ -0,0 +1,131 @@
+"""Targeted wake payload.
+
+Revision ID: 008_targeted_wake
+Revises: 007_optimize_indexes
+Create Date: 2026-10-16
+
+Changes:
+- ws_wake payload '{}' -> {"id": NEW.id}
+  (EventListener coalesces ids, coordinators reconcile only those workspaces)
+
+Reference: docs/architecture_v2/event-listener.md
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic
+revision = '008_targeted_wake'
+down_revision = '007_optimize_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # ws_wake에 workspace id 포함 (나머지는 006과 동일)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_workspace_changes()
+        RETURNS trigger AS $$
+        BEGIN
+            -- INSERT: new workspace notification
+            IF TG_OP = 'INSERT' THEN
+                -- SSE: new workspace event
+                PERFORM pg_notify('ws_sse', json_build_object(
+                    'id', NEW.id,
+                    'owner_user_id', NEW.owner_user_id
+                )::text);
+
+                -- Wake: if desired_state is set
+                IF NEW.desired_state IS NOT NULL THEN
+                    PERFORM pg_notify('ws_wake', json_build_object(
+                        'id', NEW.id
+                    )::text);
+                END IF;
+
+                RETURN NEW;
+            END IF;
+
+            -- UPDATE: column-specific notifications
+            IF TG_OP = 'UPDATE' THEN
+                -- ws_sse: UI update (all UI-visible fields + deleted_at)
+                IF OLD.phase IS DISTINCT FROM NEW.phase OR
+                   OLD.operation IS DISTINCT FROM NEW.operation OR
+                   OLD.error_reason IS DISTINCT FROM NEW.error_reason OR
+                   OLD.name IS DISTINCT FROM NEW.name OR
+                   OLD.description IS DISTINCT FROM NEW.description OR
+                   OLD.memo IS DISTINCT FROM NEW.memo OR
+                   OLD.desired_state IS DISTINCT FROM NEW.desired_state OR
+                   (OLD.deleted_at IS NULL AND NEW.deleted_at IS NOT NULL) THEN
+                    PERFORM pg_notify('ws_sse', json_build_object(
+                        'id', NEW.id,
+                        'owner_user_id', NEW.owner_user_id
+                    )::text);
+                END IF;
+
+                -- Wake: Coordinator trigger (desired_state, targeted by id)
+                IF OLD.desired_state IS DISTINCT FROM NEW.desired_state THEN
+                    PERFORM pg_notify('ws_wake', json_build_object(
+                        'id', NEW.id
+                    )::text);
+                END IF;
+
+                -- ws_deleted removed (unified into ws_sse)
+            END IF;
+
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+
+def downgrade() -> None:
+    # 006 trigger function 복원 (빈 wake payload)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_workspace_changes()
+        RETURNS trigger AS $$
+        BEGIN
+            -- INSERT: new workspace notification
+            IF TG_OP = 'INSERT' THEN
+                -- SSE: new workspace event
+                PERFORM pg_notify('ws_sse', json_build_object(
+                    'id', NEW.id,
+                    'owner_user_id', NEW.owner_user_id
+                )::text);
+
+                -- Wake: if desired_state is set
+                IF NEW.desired_state IS NOT NULL THEN
+                    PERFORM pg_notify('ws_wake', '{}'::text);
+                END IF;
+
+                RETURN NEW;
+            END IF;
+
+            -- UPDATE: column-specific notifications
+            IF TG_OP = 'UPDATE' THEN
+                -- ws_sse: UI update (all UI-visible fields + deleted_at)
+                IF OLD.phase IS DISTINCT FROM NEW.phase OR
+                   OLD.operation IS DISTINCT FROM NEW.operation OR
+                   OLD.error_reason IS DISTINCT FROM NEW.error_reason OR
+                   OLD.name IS DISTINCT FROM NEW.name OR
+                   OLD.description IS DISTINCT FROM NEW.description OR
+                   OLD.memo IS DISTINCT FROM NEW.memo OR
+                   OLD.desired_state IS DISTINCT FROM NEW.desired_state OR
+                   (OLD.deleted_at IS NULL AND NEW.deleted_at IS NOT NULL) THEN
+                    PERFORM pg_notify('ws_sse', json_build_object(
+                        'id', NEW.id,
+                        'owner_user_id', NEW.owner_user_id
+                    )::text);
+                END IF;
+
+                -- Wake: Coordinator trigger (desired_state)
+                IF OLD.desired_state IS DISTINCT FROM NEW.desired_state THEN
+                    PERFORM pg_notify('ws_wake', '{}'::text);
+                END IF;
+
+                -- ws_deleted removed (unified into ws_sse)
+            END IF;
+
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
@@ -0,0 +1,55 @@
+"""Archive catalog table.
+
+Revision ID: 009_archive_catalog
+Revises: 008_targeted_wake
+Create Date: 2026-10-16
+
+Changes:
+- Add archive_catalog (S3 archive key index, workspace별 최신 archive 조회용)
+  Observer: 전체 bucket listing 대신 catalog 조회 (O(objects) → O(workspaces))
+- Backfill: workspaces.archive_key (GC catalog sync가 나머지 보정)
+
+Reference: docs/spec/04-control-plane.md (Archive catalog)
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = '009_archive_catalog'
+down_revision = '008_targeted_wake'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'archive_catalog',
+        sa.Column('archive_key', sa.String(512), primary_key=True),
+        sa.Column('workspace_id', sa.String(), nullable=False),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text('now()'),
+        ),
+    )
+
+    # workspace별 최신 archive (DISTINCT ON workspace_id ORDER BY created_at DESC)
+    op.create_index(
+        'idx_archive_catalog_latest',
+        'archive_catalog',
+        ['workspace_id', sa.text('created_at DESC')],
+    )
+
+    # 기존 archive 등록 (soft-deleted workspace 포함, GC가 정리)
+    op.execute("""
+        INSERT INTO archive_catalog (archive_key, workspace_id, created_at)
+        SELECT archive_key, id, updated_at FROM workspaces
+        WHERE archive_key IS NOT NULL
+        ON CONFLICT (archive_key) DO NOTHING
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_archive_catalog_latest', table_name='archive_catalog')
+    op.drop_table('archive_catalog')
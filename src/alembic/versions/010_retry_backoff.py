@@ -0,0 +1,40 @@
+"""Per-workspace retry backoff.
+
+Revision ID: 010_retry_backoff
+Revises: 009_archive_catalog
+Create Date: 2026-10-16
+
+Changes:
+- Add workspaces.next_attempt_at (실패한 operation의 다음 재시도 시각)
+  WC: error_count 기반 지수 backoff + jitter, 미도래 workspace는 load에서 제외
+- Partial index: backoff 중인 workspace만 색인 (대부분 NULL)
+
+Reference: docs/spec/04-control-plane.md (Retry backoff)
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = '010_retry_backoff'
+down_revision = '009_archive_catalog'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'workspaces',
+        sa.Column('next_attempt_at', sa.DateTime(timezone=True), nullable=True),
+    )
+
+    op.create_index(
+        'idx_workspaces_next_attempt',
+        'workspaces',
+        ['next_attempt_at'],
+        postgresql_where=sa.text('deleted_at IS NULL AND next_attempt_at IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_workspaces_next_attempt', table_name='workspaces')
+    op.drop_column('workspaces', 'next_attempt_at')
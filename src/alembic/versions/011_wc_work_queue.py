@@ -0,0 +1,51 @@
+"""WC work queue table.
+
+Revision ID: 011_wc_work_queue
+Revises: 010_retry_backoff
+Create Date: 2026-10-16
+
+Changes:
+- Add wc_work_queue (multi-worker WC: 리더가 enqueue, worker가 SKIP LOCKED로 claim)
+  workspace당 1행 (진행 중 operation은 workspace당 1개)
+
+Reference: docs/spec/04-control-plane.md (Work queue)
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = '011_wc_work_queue'
+down_revision = '010_retry_backoff'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'wc_work_queue',
+        sa.Column('workspace_id', sa.String(), primary_key=True),
+        sa.Column('op_id', sa.String(), nullable=False),
+        sa.Column('operation', sa.String(), nullable=False),
+        sa.Column('priority', sa.SmallInteger(), nullable=False),
+        sa.Column(
+            'enqueued_at',
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text('now()'),
+        ),
+        sa.Column('worker_id', sa.String(), nullable=True),
+        sa.Column('leased_until', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+    )
+
+    # claim 순서 (priority, enqueued_at)
+    op.create_index(
+        'idx_wc_work_queue_claim',
+        'wc_work_queue',
+        ['priority', 'enqueued_at'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_wc_work_queue_claim', table_name='wc_work_queue')
+    op.drop_table('wc_work_queue')
@@ -1,5 +1,6 @@
 """Docker instance controller implementation."""
 
+import asyncio
 import logging
 
 import httpx
@@ -30,6 +31,8 @@ class DockerInstanceController(InstanceController):
         self._docker = settings.docker
         self._containers = containers or ContainerAPI()
         self._images = images or ImageAPI()
+        # image_ref → 진행 중인 ensure (pre-pull과 start가 같은 pull 공유)
+        self._image_pulls: dict[str, asyncio.Task[None]] = {}
 
     def _container_name(self, workspace_id: str) -> str:
         return f"{self._runtime.resource_prefix}{workspace_id}"
@@ -61,6 +64,21 @@ class DockerInstanceController(InstanceController):
 
         return results
 
+    async def inspect(self, workspace_id: str) -> ContainerInfo | None:
+        """Inspect a single workspace container (list_all()과 같은 state 표기)."""
+        data = await self._containers.inspect(self._container_name(workspace_id))
+        if not data:
+            return None
+
+        state = data.get("State", {}).get("Status", "unknown")
+        running = state == "running"
+        return ContainerInfo(
+            workspace_id=workspace_id,
+            running=running,
+            reason="Running" if running else state.capitalize(),
+            message=f"Inspect: {state}",
+        )
+
     async def start(self, workspace_id: str, image_ref: str) -> None:
         """Start container for workspace."""
         container_name = self._container_name(workspace_id)
@@ -90,7 +108,7 @@ class DockerInstanceController(InstanceController):
                     raise
 
         image = image_ref or self._runtime.default_image
-        await self._images.ensure(image)
+        await self.ensure_image(image)
 
         port = self._runtime.container_port
         config = ContainerConfig(
@@ -115,6 +133,22 @@ class DockerInstanceController(InstanceController):
             extra={"event": LogEvent.CONTAINER_STARTED, "container": container_name},
         )
 
+    async def ensure_image(self, image_ref: str) -> None:
+        """Ensure image exists locally (deduplicated per image)."""
+        image = image_ref or self._runtime.default_image
+        task = self._image_pulls.get(image)
+        if task is None:
+            task = asyncio.create_task(self._images.ensure(image))
+            self._image_pulls[image] = task
+            task.add_done_callback(lambda t, image=image: self._pull_done(image, t))
+        # shield: 대기 중인 caller가 취소돼도 다른 caller가 공유하는 pull은 계속
+        await asyncio.shield(task)
+
+    def _pull_done(self, image: str, task: asyncio.Task[None]) -> None:
+        self._image_pulls.pop(image, None)  # 실패 시 다음 호출이 다시 pull
+        if not task.cancelled():
+            task.exception()  # 모든 caller가 취소된 경우에도 retrieved 처리
+
     async def delete(self, workspace_id: str) -> None:
         """Delete container for workspace."""
         container_name = self._container_name(workspace_id)
@@ -11,14 +11,17 @@ import io
 import logging
 import tarfile
 from collections import defaultdict
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Sequence
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from botocore.exceptions import ClientError
 
 from codehub.app.config import get_settings
+from codehub.app.metrics.collector import ARCHIVE_RETENTION_TOTAL
 from codehub.core.interfaces import (
     ArchiveInfo,
+    ArchiveResult,
     JobRunner,
     StorageProvider,
     VolumeInfo,
@@ -30,6 +33,35 @@ from codehub.infra import get_s3_client
 logger = logging.getLogger(__name__)
 
 
+# S3 DeleteObjects 요청당 최대 object 수 (archive 1개 = tar.zst + .meta 2개)
+_DELETE_OBJECTS_MAX = 1000
+_ARCHIVES_PER_DELETE = _DELETE_OBJECTS_MAX // 2
+
+_ARCHIVE_SUFFIX = "/home.tar.zst"
+
+
+async def _paginate_pages(
+    bucket: str, prefix: str, start_after: str | None = None
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Paginate S3 list_objects_v2 and yield each page's objects.
+
+    Args:
+        bucket: S3 bucket name
+        prefix: Object key prefix
+        start_after: List keys after this key (S3 key order)
+
+    Yields:
+        Lists of S3 object dicts with Key, LastModified, etc.
+    """
+    params: dict[str, Any] = {"Bucket": bucket, "Prefix": prefix}
+    if start_after is not None:
+        params["StartAfter"] = start_after
+    async with get_s3_client() as s3:
+        paginator = s3.get_paginator("list_objects_v2")
+        async for page in paginator.paginate(**params):
+            yield page.get("Contents", [])
+
+
 async def _paginate_objects(bucket: str, prefix: str) -> AsyncIterator[dict[str, Any]]:
     """Paginate S3 list_objects_v2 and yield each object.
 
@@ -40,11 +72,41 @@ async def _paginate_objects(bucket: str, prefix: str) -> AsyncIterator[dict[str,
     Yields:
         S3 object dicts with Key, LastModified, etc.
     """
-    async with get_s3_client() as s3:
-        paginator = s3.get_paginator("list_objects_v2")
-        async for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
-            for obj in page.get("Contents", []):
-                yield obj
+    async for objects in _paginate_pages(bucket, prefix):
+        for obj in objects:
+            yield obj
+
+
+def select_expired_archives(
+    archives: Sequence[tuple[str, datetime]],
+    keep: set[str],
+    count: int,
+    days: float,
+    now: datetime,
+) -> list[str]:
+    """Retention 정책 밖의 archive key 선택.
+
+    Args:
+        archives: workspace의 (archive_key, last_modified)
+        keep: 정책과 무관하게 유지할 key (방금 생성한 archive, DB의 현재 archive_key)
+        count: 최신 N개 유지 (0 = 조건 없음)
+        days: X일 이내 유지 (0 = 조건 없음)
+        now: 기준 시각
+
+    Returns:
+        삭제 대상 key (설정된 모든 조건 밖인 archive, 둘 다 0이면 없음)
+    """
+    if not count and not days:
+        return []
+    cutoff = now - timedelta(days=days) if days else None
+    newest_first = sorted(archives, key=lambda a: a[1], reverse=True)
+    return [
+        key
+        for rank, (key, last_modified) in enumerate(newest_first)
+        if key not in keep
+        and (not count or rank >= count)
+        and (cutoff is None or last_modified < cutoff)
+    ]
 
 
 class S3StorageProvider(StorageProvider):
@@ -108,6 +170,8 @@ class S3StorageProvider(StorageProvider):
     async def list_archives(self, prefix: str) -> list[ArchiveInfo]:
         """List all archives with given prefix.
 
+        prefix may be narrowed to a single workspace ("{resource_prefix}{id}/").
+
         Performance: 1 S3 API call instead of N+1 (paginated list all objects).
         """
         settings = get_settings()
@@ -128,11 +192,12 @@ class S3StorageProvider(StorageProvider):
                 if len(parts) < 3:
                     continue
 
+                # prefix는 listing 범위만 좁힘 (e.g., "ws-{id}/"), id는 resource prefix 기준
                 ws_prefix_part = parts[0]
-                if not ws_prefix_part.startswith(prefix):
+                if not ws_prefix_part.startswith(self._resource_prefix):
                     continue
 
-                workspace_id = ws_prefix_part[len(prefix) :]
+                workspace_id = ws_prefix_part[len(self._resource_prefix) :]
                 last_modified = obj.get("LastModified", "")
                 workspace_archives[workspace_id].append((key, last_modified))
 
@@ -181,7 +246,7 @@ class S3StorageProvider(StorageProvider):
             async for obj in _paginate_objects(settings.storage.bucket_name, prefix):
                 key = obj.get("Key", "")
                 # Filter for home.tar.zst files (not .meta)
-                if key.endswith("/home.tar.zst"):
+                if key.endswith(_ARCHIVE_SUFFIX):
                     archive_keys.add(key)
 
         except ClientError as e:
@@ -200,12 +265,47 @@ class S3StorageProvider(StorageProvider):
 
         return archive_keys
 
+    async def iter_archive_keys(
+        self, prefix: str, start_after: str | None = None
+    ) -> AsyncIterator[dict[str, datetime]]:
+        """Stream archive keys page by page (S3 list page = 최대 1000 objects).
+
+        S3는 key를 UTF-8 byte 순으로 반환 → page 내/page 간 정렬 보장.
+        값은 LastModified (catalog created_at = 실제 archive 생성 시각).
+        """
+        settings = get_settings()
+
+        try:
+            async for objects in _paginate_pages(settings.storage.bucket_name, prefix, start_after):
+                keys = {
+                    key: obj["LastModified"]
+                    for obj in objects
+                    if (key := obj.get("Key", "")).endswith(_ARCHIVE_SUFFIX)
+                }
+                if keys:
+                    yield keys
+
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            logger.error(
+                "Failed to stream archive keys",
+                extra={
+                    "event": LogEvent.S3_ERROR,
+                    "bucket": settings.storage.bucket_name,
+                    "prefix": prefix,
+                    "start_after": start_after,
+                    "error_code": error_code,
+                    "error": str(e),
+                },
+            )
+            raise  # Propagate to caller (GC handles exception)
+
     async def provision(self, workspace_id: str) -> None:
         """Create new volume for workspace."""
         volume_name = self._volume_name(workspace_id)
         await self._volumes.create(volume_name)
 
-    async def archive(self, workspace_id: str, op_id: str) -> str:
+    async def archive(self, workspace_id: str, op_id: str, retain: str | None = None) -> ArchiveResult:
         """Archive volume to S3 using storage-job container (Spec-v2).
 
         All operations happen inside the container:
@@ -214,12 +314,15 @@ class S3StorageProvider(StorageProvider):
         3. sha256 checksum
         4. S3 upload (tar.zst first, .meta last)
 
+        성공 후 retention 정책 적용 (_enforce_retention, 실패해도 archive는 성공).
+
         Args:
             workspace_id: Workspace ID
             op_id: Operation ID for idempotency
+            retain: retention에서 보호할 key (DB의 현재 archive_key)
 
         Returns:
-            archive_key
+            ArchiveResult (archive_key + retention으로 삭제된 key)
 
         Raises:
             RuntimeError: If archive job fails
@@ -259,7 +362,55 @@ class S3StorageProvider(StorageProvider):
                 "archive_key": archive_key,
             },
         )
-        return archive_key
+        pruned = await self._enforce_retention(workspace_id, {archive_key} | ({retain} if retain else set()))
+        return ArchiveResult(archive_key=archive_key, pruned=tuple(sorted(pruned)))
+
+    async def _enforce_retention(self, workspace_id: str, keep: set[str]) -> set[str]:
+        """Workspace의 오래된 archive generation 삭제 (best-effort, 실패는 GC가 정리).
+
+        Listing 범위는 해당 workspace prefix ("{resource_prefix}{id}/")만.
+
+        Returns:
+            실제 삭제된 archive key (WC가 persist 시 catalog에서 제거)
+        """
+        settings = get_settings()
+        count = settings.storage.archive_retention_count
+        days = settings.storage.archive_retention_days
+        if not count and not days:
+            return set()
+
+        prefix = f"{self._resource_prefix}{workspace_id}/"
+        try:
+            archives = [
+                (key, obj["LastModified"])
+                async for obj in _paginate_objects(settings.storage.bucket_name, prefix)
+                if (key := obj.get("Key", "")).endswith(_ARCHIVE_SUFFIX)
+            ]
+            expired = select_expired_archives(archives, keep, count, days, datetime.now(UTC))
+            if not expired:
+                return set()
+            deleted = await self.delete_archives(expired)
+        except Exception as e:
+            ARCHIVE_RETENTION_TOTAL.labels(result="failed").inc()
+            logger.warning(
+                "Archive retention failed",
+                extra={"event": LogEvent.S3_ERROR, "ws_id": workspace_id, "error": str(e)},
+            )
+            return set()
+
+        ARCHIVE_RETENTION_TOTAL.labels(result="deleted").inc(len(deleted))
+        if failed := len(expired) - len(deleted):
+            ARCHIVE_RETENTION_TOTAL.labels(result="failed").inc(failed)
+        logger.info(
+            "Pruned old archives",
+            extra={
+                "event": LogEvent.OPERATION_SUCCESS,
+                "ws_id": workspace_id,
+                "deleted": len(deleted),
+                "kept": len(archives) - len(deleted),
+            },
+        )
+        return deleted
 
     async def restore(self, workspace_id: str, archive_key: str) -> str:
         """Restore volume from S3 archive using storage-job container (Spec-v2).
@@ -326,6 +477,51 @@ class S3StorageProvider(StorageProvider):
         volume_name = self._volume_name(workspace_id)
         return await self._volumes.exists(volume_name)
 
+    async def inspect_volume(self, workspace_id: str) -> VolumeInfo | None:
+        volume_name = self._volume_name(workspace_id)
+        if not await self._volumes.exists(volume_name):
+            return None
+        return VolumeInfo(
+            workspace_id=workspace_id,
+            exists=True,
+            reason="VolumeExists",
+            message=f"Volume {volume_name} exists",
+        )
+
+    async def head_archive(self, archive_key: str) -> ArchiveInfo | None:
+        """HEAD on a single archive key (workspace 단위 관측, listing 없음)."""
+        settings = get_settings()
+        head = archive_key.split("/", 1)[0]
+        if not head.startswith(self._resource_prefix):
+            return None
+
+        try:
+            async with get_s3_client() as s3:
+                await s3.head_object(Bucket=settings.storage.bucket_name, Key=archive_key)
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            if error_code in ("404", "NoSuchKey", "NotFound"):
+                return None
+            logger.error(
+                "Failed to head archive",
+                extra={
+                    "event": LogEvent.S3_ERROR,
+                    "bucket": settings.storage.bucket_name,
+                    "archive_key": archive_key,
+                    "error_code": error_code,
+                    "error": str(e),
+                },
+            )
+            raise  # Propagate to caller (Observer uses _safe() wrapper)
+
+        return ArchiveInfo(
+            workspace_id=head[len(self._resource_prefix) :],
+            archive_key=archive_key,
+            exists=True,
+            reason="ArchiveUploaded",
+            message=f"Archive: {archive_key}",
+        )
+
     async def create_empty_archive(self, workspace_id: str, op_id: str) -> str:
         """Create empty archive and return archive_key.
 
@@ -395,6 +591,42 @@ class S3StorageProvider(StorageProvider):
             logger.warning("Failed to delete archive %s: %s", archive_key, e)
             return False
 
+    async def delete_archives(self, archive_keys: Sequence[str]) -> set[str]:
+        """Delete archives and meta files (DeleteObjects, 요청당 최대 1000 objects).
+
+        Quiet mode: 응답에는 실패한 object만 포함 → archive key가 실패 목록에 없으면 삭제됨.
+        (.meta만 실패한 경우 archive는 삭제된 것으로 간주, 남은 .meta는 listing 대상 아님)
+        """
+        settings = get_settings()
+        deleted: set[str] = set()
+
+        async with get_s3_client() as s3:
+            for i in range(0, len(archive_keys), _ARCHIVES_PER_DELETE):
+                chunk = archive_keys[i : i + _ARCHIVES_PER_DELETE]
+                response = await s3.delete_objects(
+                    Bucket=settings.storage.bucket_name,
+                    Delete={
+                        "Objects": [
+                            {"Key": k} for key in chunk for k in (key, f"{key}.meta")
+                        ],
+                        "Quiet": True,
+                    },
+                )
+                errors = response.get("Errors", [])
+                failed = {e.get("Key") for e in errors}
+                deleted.update(key for key in chunk if key not in failed)
+                if errors:
+                    logger.warning(
+                        "Failed to delete some archives",
+                        extra={
+                            "event": LogEvent.S3_ERROR,
+                            "failed": len(errors),
+                            "error_code": errors[0].get("Code", "Unknown"),
+                        },
+                    )
+
+        return deleted
+
     async def close(self) -> None:
         """Close is no-op (Docker client is singleton)."""
         pass
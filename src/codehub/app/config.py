@@ -68,6 +68,14 @@ class StorageConfig(BaseSettings):
     access_key: str = Field(default="codehub", validation_alias="S3_ACCESS_KEY")
     secret_key: str = Field(default="codehub123", validation_alias="S3_SECRET_KEY")
     bucket_name: str = Field(default="codehub-archives", validation_alias="S3_BUCKET")
+    # Archive retention (archive() 직후 workspace별 적용, 둘 다 0이면 비활성 → GC만 정리)
+    # 둘 다 설정 시 최신 N개 밖이면서 X일보다 오래된 archive만 삭제
+    archive_retention_count: int = Field(
+        default=0, ge=0, validation_alias="S3_ARCHIVE_RETENTION_COUNT"
+    )  # 최신 N개 유지
+    archive_retention_days: float = Field(
+        default=0.0, ge=0, validation_alias="S3_ARCHIVE_RETENTION_DAYS"
+    )  # X일 이내 유지
 
 
 class RuntimeConfig(BaseSettings):
@@ -113,6 +121,14 @@ class TtlConfig(BaseSettings):
 
     standby_seconds: int = Field(default=600)  # 10분 (테스트용), 프로덕션: 10800 (3시간)
     archive_seconds: int = Field(default=1800)  # 30분 (테스트용), 프로덕션: 86400 (24시간)
+    activity_writeback_interval: float = Field(default=300.0, gt=0)  # seconds (last_access_at 갱신)
+    activity_chunk_size: int = Field(default=1000, ge=1)  # activity ZSET pop/scan chunk
+    activity_drain_limit: int = Field(default=20000, ge=1)  # run당 최대 pop (나머지는 다음 run)
+    # Off-peak archive window ("HH:MM-HH:MM", 자정 넘김 가능, 빈 값 = 즉시 전환)
+    archive_window: str = Field(default="", pattern=r"^(|\d{2}:\d{2}-\d{2}:\d{2})$")
+    archive_window_timezone: str = Field(default="UTC")
+    # window 안 처리량 (archives/hour, 0 = 대기 중인 archive를 남은 window에 균등 분배)
+    archive_window_rate: float = Field(default=0.0, ge=0)
 
 
 class LimitsConfig(BaseSettings):
@@ -137,6 +153,15 @@ class ObserverConfig(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="OBSERVER_")
 
     timeout_s: float = Field(default=5.0)  # API call timeout per resource type
+    targeted_max: int = Field(default=50)  # targeted wake: per-workspace archive listing 상한
+    docker_events: bool = Field(default=True)  # Docker /events stream 기반 관측
+    events_reconnect_delay: float = Field(default=5.0)  # seconds (event stream 재연결 대기)
+    heartbeat_interval: float = Field(default=300.0)  # seconds (미변경 row observed_at 갱신)
+    # two-tier: steady tier (전체 fleet) full sweep 주기, 그 사이 tick은 hot tier만 관측
+    steady_interval: float = Field(default=15.0)
+    archive_catalog: bool = Field(default=True)  # archive 관측: S3 listing 대신 DB catalog
+    # sub-condition staleness 기준 (seconds, > heartbeat_interval): WC는 stale 값에 의존하는 결정 보류
+    stale_after: float = Field(default=900.0)
 
 
 class CacheConfig(BaseSettings):
@@ -195,6 +220,12 @@ class CoordinatorConfig(BaseSettings):
     active_interval: float = Field(default=1.0)  # seconds (active polling)
     min_interval: float = Field(default=1.0)  # seconds (minimum interval)
     active_duration: float = Field(default=30.0)  # seconds (stay active after wake)
+    wake_debounce: float = Field(default=0.05)  # seconds (coalesce targeted wake ids)
+    adaptive_interval: bool = Field(default=True)  # backlog/EWMA/deadline 기반 polling 간격
+    max_idle_interval: float = Field(default=60.0, gt=0)  # seconds (idle 연속 시 최대 간격)
+    interval_ewma_alpha: float = Field(default=0.3, gt=0, le=1)  # reconcile 시간/backlog EWMA
+    backlog_min_interval: float = Field(default=0.1, gt=0)  # seconds (backlog 중 최소 간격)
+    unified_runtime: bool = Field(default=False)  # Observer/WC/Scheduler를 단일 loop + connection으로
 
     # Leader election
     leader_retry_interval: float = Field(default=5.0)  # seconds
@@ -204,12 +235,34 @@ class CoordinatorConfig(BaseSettings):
 
     # WC specific
     operation_timeout: int = Field(default=600)  # seconds (10 minutes)
+    wc_full_resync_interval: float = Field(default=60.0)  # seconds (incremental load safety net)
+    wc_watermark_overlap: float = Field(default=5.0)  # seconds (late commit tolerance)
+    wc_max_concurrent_ops: int = Field(default=32, ge=1)  # global execute concurrency
+    wc_op_concurrency: dict[str, int] = Field(
+        default={"ARCHIVING": 4, "RESTORING": 4, "CREATE_EMPTY_ARCHIVE": 4, "DELETING": 8}
+    )  # per-operation limits (storage job containers)
+    observation_snapshot: bool = Field(default=True)  # 같은 프로세스 Observer → WC conditions 공유
+    wc_chain_operations: bool = Field(default=True)  # RESTORING → STARTING 한 task에서 실행
+    wc_image_prefetch: bool = Field(default=True)  # PROVISIONING/RESTORING 중 image pre-pull
+    wc_retry_backoff_base: float = Field(default=5.0, gt=0)  # seconds (첫 실패 후 재시도 간격)
+    wc_retry_backoff_max: float = Field(default=300.0, gt=0)  # seconds (operation_timeout 미만)
+    wc_work_queue: bool = Field(default=False)  # multi-worker: 리더는 enqueue, worker가 실행
+    wc_work_lease: float = Field(default=720.0, gt=0)  # seconds (operation_timeout + 여유)
+    wc_worker_poll_interval: float = Field(default=5.0, gt=0)  # seconds (wake 누락 대비 polling)
+    wc_tick_budget: float = Field(default=0.5, gt=0)  # seconds (tick당 full pass 처리 시간)
+    wc_pass_chunk_size: int = Field(default=500, ge=1)  # full pass chunk (server-side cursor fetch)
 
     # TTL specific
     ttl_interval: float = Field(default=60.0)  # seconds (1 minute)
 
     # GC specific
     gc_interval: float = Field(default=14400.0)  # seconds (4 hours)
+    gc_budget: float = Field(default=300.0, gt=0)  # seconds (run당 최대 시간, 초과 시 checkpoint)
+    gc_resume_interval: float = Field(default=60.0, gt=0)  # seconds (checkpoint 재개 간격)
+    gc_batch_size: int = Field(default=100, ge=1)  # container/volume 삭제 batch (budget 확인 단위)
+    # archive 삭제 요청당 key 수 (DeleteObjects 1000 objects = archive + .meta 500개)
+    gc_delete_batch_size: int = Field(default=500, ge=1, le=500)
+    gc_delete_concurrency: int = Field(default=4, ge=1)  # 동시 삭제 요청 수
 
 
 class SSEConfig(BaseSettings):
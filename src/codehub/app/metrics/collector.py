@@ -152,6 +152,33 @@ COORDINATOR_RECONCILE_DURATION = Histogram(
     buckets=_BUCKETS_MEDIUM,
 )
 
+COORDINATOR_RECONCILE_MODE_TOTAL = Counter(
+    "codehub_coordinator_reconcile_mode_total",
+    "Total coordinator reconcile cycles by scope",
+    ["coordinator", "mode"],  # full, targeted
+)
+
+COORDINATOR_POLL_INTERVAL = Gauge(
+    "codehub_coordinator_poll_interval_seconds",
+    "Next polling interval chosen by the coordinator",
+    ["coordinator"],
+    multiprocess_mode="livesum",
+)
+
+COORDINATOR_POLL_REASON = Gauge(
+    "codehub_coordinator_poll_reason",
+    "Reason for the chosen polling interval (1 = current reason)",
+    ["coordinator", "reason"],  # backlog, wake, deadline, idle
+    multiprocess_mode="livesum",
+)
+
+COORDINATOR_TICK_LAG = Histogram(
+    "codehub_coordinator_tick_lag_seconds",
+    "Delay between a coordinator's scheduled tick deadline and its start (unified runtime)",
+    ["coordinator"],
+    buckets=_BUCKETS_MEDIUM,
+)
+
 COORDINATOR_IS_LEADER = Gauge(
     "codehub_coordinator_is_leader",
     "Whether this instance is the leader (1) or not (0)",
@@ -162,6 +189,41 @@ COORDINATOR_IS_LEADER = Gauge(
 # =============================================================================
 # Observer Metrics
 # =============================================================================
+
+OBSERVER_DOCKER_EVENTS_TOTAL = Counter(
+    "codehub_observer_docker_events_total",
+    "Total Docker events applied to the observer state map",
+    ["type"],  # container, volume
+)
+
+OBSERVER_CONDITIONS_ROWS_TOTAL = Counter(
+    "codehub_observer_conditions_rows_total",
+    "Total workspace rows per observer conditions write",
+    ["result"],  # written, skipped (fingerprint unchanged)
+)
+
+OBSERVER_PARTIAL_TOTAL = Counter(
+    "codehub_observer_partial_total",
+    "Total observer ticks that wrote conditions without a failed resource",
+    ["resource"],  # container, volume, archive
+)
+
+# Two-tier observation: hot (transitional + wake) / steady (full sweep)
+
+OBSERVER_TIER_WORKSPACES = Gauge(
+    "codehub_observer_tier_workspaces",
+    "Number of workspaces observed in the last tick of each tier",
+    ["tier"],  # hot, steady
+    multiprocess_mode="livesum",
+)
+
+OBSERVER_TIER_DURATION = Histogram(
+    "codehub_observer_tier_duration_seconds",
+    "Duration of observer ticks per tier",
+    ["tier"],  # hot, steady
+    buckets=_BUCKETS_MEDIUM,
+)
+
 # Resource counts from ObserverCoordinator observations
 
 OBSERVER_WORKSPACES = Gauge(
@@ -241,6 +303,70 @@ WC_CAS_FAILURES_TOTAL = Counter(
     "Total CAS update failures",
 )
 
+WC_IMAGE_PREFETCH_TOTAL = Counter(
+    "codehub_wc_image_prefetch_total",
+    "Total background image ensures started during PROVISIONING/RESTORING",
+    ["result"],  # ok, failed
+)
+
+WC_OPERATION_CHAIN_TOTAL = Counter(
+    "codehub_wc_operation_chain_total",
+    "Total RESTORING operations considered for chaining into STARTING",
+    ["result"],  # chained, volume_missing, cas_failed
+)
+
+# Executor queue (priority: interactive, normal, background)
+WC_EXECUTOR_QUEUE_DEPTH = Gauge(
+    "codehub_wc_executor_queue_depth",
+    "Number of WC operations waiting for an execution slot",
+    ["priority"],
+    multiprocess_mode="livesum",
+)
+
+WC_EXECUTOR_WAIT_DURATION = Histogram(
+    "codehub_wc_executor_wait_seconds",
+    "Time WC operations waited for an execution slot",
+    ["priority"],
+    buckets=_BUCKETS_MEDIUM,
+)
+
+WC_INFLIGHT_OPERATIONS = Gauge(
+    "codehub_wc_inflight_operations",
+    "Number of WC operations currently running as detached tasks",
+    multiprocess_mode="livesum",
+)
+
+WC_LOADED_WORKSPACES = Gauge(
+    "codehub_wc_loaded_workspaces",
+    "Number of workspaces loaded in last WC load",
+    ["mode"],  # full, incremental, targeted
+    multiprocess_mode="livesum",
+)
+
+WC_FULL_PASS_DURATION = Histogram(
+    "codehub_wc_full_pass_duration_seconds",
+    "Time for one time-sliced WC pass over all RUNNING workspaces",
+    buckets=_BUCKETS_SLOW,
+)
+
+WC_WORK_QUEUE_TOTAL = Counter(
+    "codehub_wc_work_queue_total",
+    "Total WC work queue items by outcome",
+    ["result"],  # enqueued, claimed, completed, stale, lease_lost
+)
+
+WC_BACKOFF_WORKSPACES = Gauge(
+    "codehub_wc_backoff_workspaces",
+    "Number of workspaces waiting for retry backoff (as of last full load)",
+    multiprocess_mode="livesum",
+)
+
+WC_CONDITIONS_SOURCE_TOTAL = Counter(
+    "codehub_wc_conditions_source_total",
+    "Total WC loads by conditions source",
+    ["source"],  # snapshot (in-process observer), db
+)
+
 
 # =============================================================================
 # TTL Manager Metrics
@@ -253,6 +379,55 @@ TTL_EXPIRATIONS_TOTAL = Counter(
     ["transition"],  # running_to_standby, standby_to_archived
 )
 
+GC_RUNS_TOTAL = Counter(
+    "codehub_gc_runs_total",
+    "GC runs by outcome",
+    ["result"],  # completed, checkpointed, failed
+)
+
+GC_ARCHIVES_TOTAL = Counter(
+    "codehub_gc_archives_total",
+    "Archive keys processed by GC (rate = throughput)",
+    ["result"],  # scanned, protected, deleted, failed
+)
+
+GC_ARCHIVES_SCANNED = Gauge(
+    "codehub_gc_archives_scanned",
+    "Archive keys scanned in the current GC cycle (progress)",
+    multiprocess_mode="livemax",
+)
+
+ARCHIVE_RETENTION_TOTAL = Counter(
+    "codehub_archive_retention_total",
+    "Archives pruned by the retention policy right after ARCHIVING",
+    ["result"],  # deleted, failed
+)
+
+GC_DELETE_DURATION = Histogram(
+    "codehub_gc_delete_duration_seconds",
+    "Duration of GC bulk archive delete requests",
+    buckets=_BUCKETS_MEDIUM,
+)
+
+TTL_ARCHIVE_QUEUE = Gauge(
+    "codehub_ttl_archive_queue",
+    "STANDBY workspaces waiting for the off-peak archive window",
+    ["state"],  # due (archive_ttl 경과), projected (현재/다음 window 종료까지 경과 예정)
+    multiprocess_mode="livesum",
+)
+
+TTL_ARCHIVE_QUEUE_ETA = Gauge(
+    "codehub_ttl_archive_queue_eta_seconds",
+    "Projected seconds until the due archive queue is drained",
+    multiprocess_mode="livesum",
+)
+
+TTL_ACTIVITY_WRITEBACK_TOTAL = Counter(
+    "codehub_ttl_activity_writeback_total",
+    "Workspaces whose last_access_at was written back from the activity ZSET",
+    ["reason"],  # expired, periodic, active
+)
+
 TTL_SYNC_DURATION = Histogram(
     "codehub_ttl_sync_duration_seconds",
     "Duration of TTL sync operations",
@@ -443,10 +618,48 @@ def _init_metrics() -> None:
     # Stage durations (labeled histograms)
     for stage in ["load", "update"]:
         OBSERVER_STAGE_DURATION.labels(stage=stage)
+    for event_type in ["container", "volume"]:
+        OBSERVER_DOCKER_EVENTS_TOTAL.labels(type=event_type)
+    for result in ["written", "skipped"]:
+        OBSERVER_CONDITIONS_ROWS_TOTAL.labels(result=result)
+    for resource in ["container", "volume", "archive"]:
+        OBSERVER_PARTIAL_TOTAL.labels(resource=resource)
+    for tier in ["hot", "steady"]:
+        OBSERVER_TIER_WORKSPACES.labels(tier=tier).set(0)
+        OBSERVER_TIER_DURATION.labels(tier=tier)
     for stage in ["load", "plan", "persist"]:
         WC_STAGE_DURATION.labels(stage=stage)
+    for result in ["chained", "volume_missing", "cas_failed"]:
+        WC_OPERATION_CHAIN_TOTAL.labels(result=result)
+    for result in ["ok", "failed"]:
+        WC_IMAGE_PREFETCH_TOTAL.labels(result=result)
+    for result in ["enqueued", "claimed", "completed", "stale", "lease_lost"]:
+        WC_WORK_QUEUE_TOTAL.labels(result=result)
+    for mode in ["full", "incremental", "targeted"]:
+        WC_LOADED_WORKSPACES.labels(mode=mode).set(0)
+    for source in ["snapshot", "db"]:
+        WC_CONDITIONS_SOURCE_TOTAL.labels(source=source)
+    for coordinator in ["observer", "wc"]:
+        for mode in ["full", "targeted"]:
+            COORDINATOR_RECONCILE_MODE_TOTAL.labels(coordinator=coordinator, mode=mode)
+    for coordinator in ["observer", "wc", "scheduler"]:
+        for reason in ["backlog", "wake", "deadline", "idle"]:
+            COORDINATOR_POLL_REASON.labels(coordinator=coordinator, reason=reason).set(0)
+    for priority in ["interactive", "normal", "background"]:
+        WC_EXECUTOR_QUEUE_DEPTH.labels(priority=priority).set(0)
+        WC_EXECUTOR_WAIT_DURATION.labels(priority=priority)
     for target in ["redis", "db"]:
         TTL_SYNC_DURATION.labels(target=target)
+    for reason in ["expired", "periodic", "active"]:
+        TTL_ACTIVITY_WRITEBACK_TOTAL.labels(reason=reason)
+    for result in ["completed", "checkpointed", "failed"]:
+        GC_RUNS_TOTAL.labels(result=result)
+    for result in ["scanned", "protected", "deleted", "failed"]:
+        GC_ARCHIVES_TOTAL.labels(result=result)
+    for result in ["deleted", "failed"]:
+        ARCHIVE_RETENTION_TOTAL.labels(result=result)
+    for state in ["due", "projected"]:
+        TTL_ARCHIVE_QUEUE.labels(state=state)
 
     # HTTP API (common endpoints - others will be created on first use)
     for method in ["GET", "POST", "PATCH", "DELETE"]:
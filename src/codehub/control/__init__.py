@@ -2,7 +2,14 @@
 
 Coordinator 분류:
 - Critical (독립): Observer, WC, EventListener → 장애 격리 필요
-- Background (통합): Scheduler (TTL + GC) → 장애 시 운영 불편 수준
+- Background (통합): Scheduler (TTL + GC task) → 장애 시 운영 불편 수준
+
+Unified runtime (COORDINATOR_UNIFIED_RUNTIME):
+- Observer/WC/Scheduler → CoordinatorRuntime 하나 (DB connection 1개, wake 구독 1개)
+- EventListener는 psycopg LISTEN connection이 필요하므로 독립 실행
+
+WC work queue mode (COORDINATOR_WC_WORK_QUEUE):
+- WorkQueueWorker → 모든 프로세스에서 실행 (리더십 불필요, 전용 connection)
 
 Process Tasks:
 - flush_activity_buffer → 각 워커 프로세스에서 독립 실행
@@ -19,16 +26,23 @@ from codehub.adapters.instance import DockerInstanceController
 from codehub.adapters.storage import S3StorageProvider
 from codehub.app.config import get_settings
 from codehub.control.coordinator import (
+    CoordinatorRuntime,
     EventListener,
+    ObservationSnapshot,
     ObserverCoordinator,
     Scheduler,
+    WorkQueueWorker,
     WorkspaceController,
 )
 from codehub.control.tasks import flush_activity_buffer
 from codehub.core.logging_schema import LogEvent
 from codehub.infra import get_activity_store
 from codehub.infra.pg_leader import SQLAlchemyLeaderElection
-from codehub.infra.redis_pubsub import ChannelPublisher, ChannelSubscriber
+from codehub.infra.redis_pubsub import (
+    ChannelPublisher,
+    ChannelSubscriber,
+    MultiChannelSubscriber,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +65,44 @@ async def _run_coordinator(
         await coordinator.run()
 
 
+async def _run_runtime(
+    engine: AsyncEngine,
+    redis_client: redis.Redis,
+    coordinators: list[tuple[type, tuple]],
+) -> None:
+    """Run coordinators on one CoordinatorRuntime (shared connection + wake subscription).
+
+    Leader election is still per coordinator type (advisory locks on the shared connection).
+    """
+    async with engine.connect() as conn:
+        runtime = CoordinatorRuntime(
+            MultiChannelSubscriber(redis_client),
+            [
+                coordinator_cls(
+                    conn,
+                    SQLAlchemyLeaderElection(conn, coordinator_cls.COORDINATOR_TYPE),
+                    ChannelSubscriber(redis_client),  # runtime이 wake를 dispatch (구독 안 함)
+                    *args,
+                )
+                for coordinator_cls, args in coordinators
+            ],
+        )
+        await runtime.run()
+
+
+async def _run_worker(
+    engine: AsyncEngine,
+    redis_client: redis.Redis,
+    ic: DockerInstanceController,
+    sp: S3StorageProvider,
+    publisher: ChannelPublisher,
+) -> None:
+    """Run WC work queue worker (리더 선출 없음, 프로세스마다 1개)."""
+    async with engine.connect() as conn:
+        worker = WorkQueueWorker(conn, ChannelSubscriber(redis_client), ic, sp, publisher)
+        await worker.run()
+
+
 async def _run_event_listener(redis_client: redis.Redis) -> None:
     """Run EventListener.
 
@@ -78,18 +130,40 @@ async def run_control_plane(engine: AsyncEngine, redis_client: redis.Redis) -> N
     publisher = ChannelPublisher(redis_client)
     activity_store = get_activity_store()
 
+    # Observer → WC in-process conditions (두 리더가 이 프로세스에 있을 때만 사용됨)
+    snapshot = (
+        ObservationSnapshot() if get_settings().coordinator.observation_snapshot else None
+    )
+
+    # WC work queue mode → 이 프로세스도 operation 실행에 참여
+    workers = (
+        [_run_worker(engine, redis_client, ic, sp, publisher)]
+        if get_settings().coordinator.wc_work_queue
+        else []
+    )
+
+    # Coordinators (리더십 필요)
+    coordinators: list[tuple[type, tuple]] = [
+        (ObserverCoordinator, (ic, sp, publisher, snapshot)),
+        (WorkspaceController, (ic, sp, publisher, snapshot)),
+        (Scheduler, (activity_store, publisher, sp, ic, engine)),
+    ]
+    if get_settings().coordinator.unified_runtime:
+        leader_tasks = [_run_runtime(engine, redis_client, coordinators)]
+    else:
+        leader_tasks = [
+            _run_coordinator(engine, redis_client, coordinator_cls, *args)
+            for coordinator_cls, args in coordinators
+        ]
+
     try:
         await asyncio.gather(
-            # Coordinators (리더십 필요)
-            _run_coordinator(engine, redis_client, ObserverCoordinator, ic, sp),
-            _run_coordinator(engine, redis_client, WorkspaceController, ic, sp),
+            *leader_tasks,
             _run_event_listener(redis_client),
-            _run_coordinator(
-                engine, redis_client, Scheduler, activity_store, publisher, sp, ic
-            ),
 
             # Process Tasks (리더십 불필요 - 각 프로세스에서 독립 실행)
             flush_activity_buffer(),
+            *workers,
         )
     except asyncio.CancelledError:
         logger.info("Control plane cancelled", extra={"event": LogEvent.APP_STOPPED})
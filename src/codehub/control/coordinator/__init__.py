@@ -7,19 +7,25 @@ from codehub.control.coordinator.base import (
     LeaderElection,
 )
 from codehub.control.coordinator.event_listener import EventListener
+from codehub.control.coordinator.observation_snapshot import ObservationSnapshot
 from codehub.control.coordinator.observer import ObserverCoordinator
+from codehub.control.coordinator.runtime import CoordinatorRuntime
 from codehub.control.coordinator.scheduler import Scheduler
 from codehub.control.coordinator.wc import WorkspaceController
+from codehub.control.coordinator.wc_worker import WorkQueueWorker
 from codehub.infra.redis_pubsub import ChannelPublisher
 
 __all__ = [
     "ChannelPublisher",
     "ChannelSubscriber",
     "CoordinatorBase",
+    "CoordinatorRuntime",
     "CoordinatorType",
     "EventListener",
     "LeaderElection",
+    "ObservationSnapshot",
     "ObserverCoordinator",
     "Scheduler",
+    "WorkQueueWorker",
     "WorkspaceController",
 ]
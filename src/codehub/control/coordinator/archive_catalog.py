@@ -0,0 +1,167 @@
+"""Archive catalog - S3 archive key의 Postgres 색인.
+
+Reference: docs/spec/04-control-plane.md (Archive catalog)
+
+Writers:
+- WC: archive()/create_empty_archive() 완료 → record(), retention 삭제분 → remove()
+  (CAS update와 같은 트랜잭션)
+- GC: S3 listing page마다 sync_range() (drift 보정)
+  created_at = S3 LastModified (GC가 나중에 발견한 과거 archive가 최신으로 보이지 않도록)
+  orphan은 key 목록에서 제외 → 삭제 요청 전 같은 page commit에서 제거 (삭제 성공 여부와
+  무관, 삭제 실패한 key도 다음 cycle에서 다시 orphan이므로 재등록되지 않음)
+
+StorageProvider.delete_archive()/delete_archives()는 catalog를 갱신하지 않습니다.
+WC DELETING은 archive를 삭제하지 않으므로 (계약 #9) deleted workspace의 행도 GC orphan 경로로 제거됩니다.
+
+Reader:
+- Observer: latest() - workspace별 최신 archive (전체 bucket listing 대체)
+
+Catalog는 caller의 connection/트랜잭션을 사용합니다 (commit은 caller 책임).
+"""
+
+from collections.abc import Iterable, Mapping
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from codehub.app.config import get_settings
+from codehub.core.interfaces.storage import ArchiveInfo
+
+_settings = get_settings()
+
+
+class ArchiveCatalog:
+    """archive_catalog 테이블 접근."""
+
+    def __init__(self, conn: AsyncConnection) -> None:
+        self._conn = conn
+        self._prefix = _settings.runtime.resource_prefix
+
+    def workspace_id_of(self, archive_key: str) -> str | None:
+        """Archive key에서 workspace id 추출 ({prefix}{ws_id}/{op_id}/home.tar.zst)."""
+        head, sep, _ = archive_key.partition("/")
+        if not sep or not head.startswith(self._prefix):
+            return None
+        return head[len(self._prefix) :] or None
+
+    async def record(self, entries: Iterable[tuple[str, str]]) -> int:
+        """(workspace_id, archive_key) 등록 (이미 있으면 무시).
+
+        Returns:
+            새로 등록된 행 수
+        """
+        entries = list(entries)
+        if not entries:
+            return 0
+        result = await self._conn.execute(
+            text("""
+                INSERT INTO archive_catalog (workspace_id, archive_key)
+                SELECT * FROM unnest(CAST(:ws_ids AS text[]), CAST(:keys AS text[]))
+                ON CONFLICT (archive_key) DO NOTHING
+            """),
+            {"ws_ids": [ws_id for ws_id, _ in entries], "keys": [key for _, key in entries]},
+        )
+        return result.rowcount
+
+    async def remove(self, archive_keys: Iterable[str]) -> None:
+        keys = list(archive_keys)
+        if not keys:
+            return
+        await self._conn.execute(
+            text("DELETE FROM archive_catalog WHERE archive_key = ANY(CAST(:keys AS text[]))"),
+            {"keys": keys},
+        )
+
+    async def latest(self, ws_ids: set[str] | None = None) -> list[ArchiveInfo]:
+        """Workspace별 최신 archive (list_archives()와 동일한 ArchiveInfo).
+
+        Args:
+            ws_ids: 지정 시 해당 workspace만 조회
+        """
+        where = "WHERE workspace_id = ANY(CAST(:ws_ids AS text[]))" if ws_ids is not None else ""
+        result = await self._conn.execute(
+            text(f"""
+                SELECT DISTINCT ON (workspace_id) workspace_id, archive_key
+                FROM archive_catalog
+                {where}
+                ORDER BY workspace_id, created_at DESC
+            """),
+            {"ws_ids": list(ws_ids)} if ws_ids is not None else {},
+        )
+        return [
+            ArchiveInfo(
+                workspace_id=ws_id,
+                archive_key=key,
+                exists=True,
+                reason="ArchiveUploaded",
+                message=f"Archive: {key}",
+            )
+            for ws_id, key in result.fetchall()
+        ]
+
+    async def sync_range(
+        self,
+        storage_keys: Mapping[str, datetime],
+        after: str | None,
+        until: str | None,
+        listed_at: datetime,
+    ) -> tuple[int, int]:
+        """S3 listing 한 page 기준으로 key 범위 (after, until]의 catalog 보정.
+
+        - 범위 안 catalog에만 있음 → 삭제 (S3에서 사라진 archive)
+          listed_at 이후 등록된 행은 listing이 못 봤을 수 있으므로 제외
+        - page에만 있음 → 등록 (record 누락, 예: persist 실패)
+        - created_at = S3 LastModified (기존 행도 보정: backfill/과거 sync의 now() 값 수정)
+          → latest()가 나중에 발견된 과거 archive를 최신으로 고르지 않음
+
+        범위 비교는 COLLATE "C" (S3 listing의 byte 순서와 일치).
+
+        Args:
+            storage_keys: page의 {archive key: LastModified} (범위 안 S3 key 전체)
+            after: 이전 page 마지막 key (None = 처음부터)
+            until: 이 page 마지막 key (None = 끝까지, listing 종료 후)
+            listed_at: listing 시작 시각
+
+        Returns:
+            (added, removed)
+        """
+        result = await self._conn.execute(
+            text("""
+                DELETE FROM archive_catalog
+                WHERE (CAST(:after AS text) IS NULL OR archive_key COLLATE "C" > :after)
+                  AND (CAST(:until AS text) IS NULL OR archive_key COLLATE "C" <= :until)
+                  AND archive_key <> ALL(CAST(:keys AS text[]))
+                  AND created_at < :listed_at
+            """),
+            {"after": after, "until": until, "keys": list(storage_keys), "listed_at": listed_at},
+        )
+        removed = result.rowcount
+
+        entries = [
+            (ws_id, key, created_at)
+            for key, created_at in storage_keys.items()
+            if (ws_id := self.workspace_id_of(key)) is not None
+        ]
+        if not entries:
+            return 0, removed
+        result = await self._conn.execute(
+            text("""
+                INSERT INTO archive_catalog (workspace_id, archive_key, created_at)
+                SELECT * FROM unnest(
+                    CAST(:ws_ids AS text[]),
+                    CAST(:keys AS text[]),
+                    CAST(:created_at AS timestamptz[])
+                )
+                ON CONFLICT (archive_key) DO UPDATE SET created_at = EXCLUDED.created_at
+                WHERE archive_catalog.created_at <> EXCLUDED.created_at
+                RETURNING (xmax = 0) AS inserted
+            """),
+            {
+                "ws_ids": [ws_id for ws_id, _, _ in entries],
+                "keys": [key for _, key, _ in entries],
+                "created_at": [created_at for _, _, created_at in entries],
+            },
+        )
+        added = sum(1 for (inserted,) in result.fetchall() if inserted)
+        return added, removed
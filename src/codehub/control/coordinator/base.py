@@ -4,10 +4,12 @@ Configuration via CoordinatorConfig (COORDINATOR_ env prefix).
 """
 
 import asyncio
+import json
 import logging
 import random
 import time
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from enum import StrEnum
 
 from sqlalchemy.ext.asyncio import AsyncConnection as SAConnection
@@ -15,7 +17,10 @@ from sqlalchemy.ext.asyncio import AsyncConnection as SAConnection
 from codehub.app.config import get_settings
 from codehub.app.metrics.collector import (
     COORDINATOR_IS_LEADER,
+    COORDINATOR_POLL_INTERVAL,
+    COORDINATOR_POLL_REASON,
     COORDINATOR_RECONCILE_DURATION,
+    COORDINATOR_RECONCILE_MODE_TOTAL,
     COORDINATOR_RECONCILE_TOTAL,
     COORDINATOR_WAKE_RECEIVED_TOTAL,
 )
@@ -38,6 +43,38 @@ class CoordinatorType(StrEnum):
     SCHEDULER = "scheduler"  # TTL + GC 통합
 
 
+class PollReason(StrEnum):
+    """다음 polling 간격을 결정한 이유 (COORDINATOR_POLL_REASON label)."""
+
+    BACKLOG = "backlog"  # 남은 작업 있음 → reconcile 비용 기준 최대한 빠르게
+    WAKE = "wake"  # wake 후 ACTIVE_DURATION 이내
+    DEADLINE = "deadline"  # 다음 시간 기반 이벤트 (operation timeout 등)가 idle 간격보다 이름
+    IDLE = "idle"  # 할 일 없음 → 연속 idle tick마다 간격 2배 (MAX_IDLE_INTERVAL까지)
+
+
+def encode_wake(ws_ids: Iterable[str]) -> str:
+    """Targeted wake payload: {"ids": [...]}."""
+    return json.dumps({"ids": sorted(ws_ids)})
+
+
+def parse_wake(payload: str) -> set[str] | None:
+    """Wake payload → workspace ids.
+
+    Returns:
+        workspace id 집합, 또는 None (빈 문자열/형식 불일치 = 전체 wake)
+    """
+    if not payload:
+        return None
+    try:
+        data = json.loads(payload)
+    except ValueError:
+        return None
+    ids = data.get("ids") if isinstance(data, dict) else None
+    if not isinstance(ids, list) or not ids:
+        return None
+    return {str(ws_id) for ws_id in ids}
+
+
 class CoordinatorBase(ABC):
     """Base class for Coordinators with leader election and polling.
 
@@ -56,6 +93,13 @@ class CoordinatorBase(ABC):
             await self._conn.execute(update_stmt)
             await self._conn.commit()
 
+    ## Targeted Wake
+
+    Wake payload에 workspace id가 있으면 (encode_wake) 해당 id를 ACTIVE_DURATION 동안
+    hot set에 유지합니다. _select_targets()로 이번 reconcile 대상을 결정:
+    - None: full sweep (전체 wake 수신 후 active, 또는 IDLE_INTERVAL 경과)
+    - set: targeted (hot set만)
+
     WARNING: Do NOT use AsyncSession(bind=self._conn)!
     - AsyncSession.commit() only commits at session level
     - Connection stays in "idle in transaction" state
@@ -63,6 +107,13 @@ class CoordinatorBase(ABC):
 
     DO NOT use get_session() in Coordinator - it gets connection from pool,
     which may differ from the Advisory Lock connection, causing Zombie Lock risk.
+
+    ## Adaptive Polling
+
+    _get_interval()은 reconcile 시간/backlog의 EWMA와 다음 deadline으로 간격을 고릅니다
+    (PollReason 참고). Subclass는 간격 대신 신호를 제공:
+    - _pending_work(): 다음 tick에서 처리할 남은 작업 수
+    - _next_deadline(): 다음 시간 기반 이벤트까지 남은 초
     """
 
     IDLE_INTERVAL: float = _coordinator_config.idle_interval
@@ -72,6 +123,11 @@ class CoordinatorBase(ABC):
     VERIFY_INTERVAL: float = _coordinator_config.verify_interval
     VERIFY_JITTER: float = _coordinator_config.verify_jitter
     ACTIVE_DURATION: float = _coordinator_config.active_duration
+    ADAPTIVE_INTERVAL: bool = _coordinator_config.adaptive_interval
+    MAX_IDLE_INTERVAL: float = _coordinator_config.max_idle_interval
+    INTERVAL_EWMA_ALPHA: float = _coordinator_config.interval_ewma_alpha
+    BACKLOG_MIN_INTERVAL: float = _coordinator_config.backlog_min_interval
+    WAKE_DRAIN_MAX: int = 100  # wake 1회 대기에서 소비할 최대 메시지 수
 
     COORDINATOR_TYPE: CoordinatorType
     WAKE_TARGET: str | None = None  # e.g., "observer", "wc", "gc" - receives wake from this target
@@ -92,11 +148,22 @@ class CoordinatorBase(ABC):
         self._last_reconcile = 0.0
         # Leadership waiting state tracking (for LEADERSHIP_ACQUIRED log)
         self._waiting_since: float | None = None
+        # Targeted wake: ws_id → expires_at
+        self._hot_ids: dict[str, float] = {}
+        self._last_full_sweep = 0.0
+        # Adaptive polling: reconcile 시간/backlog EWMA, 연속 idle tick 수
+        self._duration_ewma = 0.0
+        self._pending_ewma = 0.0
+        self._idle_streak = 0
 
     @property
     def name(self) -> str:
         return self.__class__.__name__
 
+    @property
+    def is_leader(self) -> bool:
+        return self._leader.is_leader
+
     @property
     def is_active(self) -> bool:
         return time.time() < self._active_until
@@ -109,7 +176,100 @@ class CoordinatorBase(ABC):
         )
 
     def _get_interval(self) -> float:
-        return self.ACTIVE_INTERVAL if self.is_active else self.IDLE_INTERVAL
+        interval, reason = self._choose_interval()
+        COORDINATOR_POLL_INTERVAL.labels(coordinator=self.COORDINATOR_TYPE).set(interval)
+        for r in PollReason:
+            COORDINATOR_POLL_REASON.labels(coordinator=self.COORDINATOR_TYPE, reason=r).set(
+                1 if r == reason else 0
+            )
+        return interval
+
+    def _choose_interval(self) -> tuple[float, PollReason]:
+        """다음 polling 간격 + 이유.
+
+        - backlog: ACTIVE_INTERVAL / (1 + pending EWMA), 단 reconcile 시간 EWMA 이상
+          (backlog가 클수록 빠르게, reconcile보다 자주 돌지는 않음) → [BACKLOG_MIN, ACTIVE]
+        - wake: ACTIVE_INTERVAL (ACTIVE_DURATION 이내 / hot set)
+        - deadline: 다음 deadline까지 남은 시간 (idle 간격보다 이를 때만)
+        - idle: IDLE_INTERVAL × 2^(연속 idle tick), MAX_IDLE_INTERVAL까지
+        """
+        if self._pending_work() > 0:
+            if not self.ADAPTIVE_INTERVAL:
+                return self.ACTIVE_INTERVAL, PollReason.BACKLOG
+            interval = max(self._duration_ewma, self.ACTIVE_INTERVAL / (1 + self._pending_ewma))
+            interval = max(interval, self._min_interval())
+            return min(interval, self.ACTIVE_INTERVAL), PollReason.BACKLOG
+        if self.is_active or self._hot_ids:
+            return self.ACTIVE_INTERVAL, PollReason.WAKE
+        if not self.ADAPTIVE_INTERVAL:
+            return self.IDLE_INTERVAL, PollReason.IDLE
+
+        idle = self.IDLE_INTERVAL * 2 ** min(self._idle_streak, 16)
+        idle = min(idle, max(self.IDLE_INTERVAL, self.MAX_IDLE_INTERVAL))
+        deadline = self._next_deadline()
+        if deadline is not None and deadline < idle:
+            return max(deadline, self.MIN_INTERVAL), PollReason.DEADLINE
+        return idle, PollReason.IDLE
+
+    def _min_interval(self) -> float:
+        """Reconcile 간 최소 간격 (adaptive backlog 중에는 BACKLOG_MIN_INTERVAL까지 허용).
+
+        MIN_INTERVAL (기본 = ACTIVE_INTERVAL)은 wake throttle용이므로 backlog에는 별도 하한.
+        """
+        if self.ADAPTIVE_INTERVAL and self._pending_work() > 0:
+            return min(self.MIN_INTERVAL, self.BACKLOG_MIN_INTERVAL)
+        return self.MIN_INTERVAL
+
+    def _pending_work(self) -> int:
+        """Hook: 다음 tick에서 처리할 남은 작업 수 (> 0이면 backlog polling)."""
+        return 0
+
+    def _next_deadline(self) -> float | None:
+        """Hook: 다음 시간 기반 이벤트까지 남은 초 (None = 없음)."""
+        return None
+
+    def _record_reconcile(self, duration: float) -> None:
+        """Reconcile 시간/backlog EWMA + 연속 idle tick 갱신."""
+        alpha = self.INTERVAL_EWMA_ALPHA
+        pending = self._pending_work()
+        self._duration_ewma = alpha * duration + (1 - alpha) * self._duration_ewma
+        self._pending_ewma = alpha * pending + (1 - alpha) * self._pending_ewma
+        if pending or self.is_active or self._hot_ids:
+            self._idle_streak = 0
+        else:
+            self._idle_streak += 1
+
+    def add_hot_ids(self, ws_ids: Iterable[str]) -> None:
+        """Targeted wake 대상 등록 (ACTIVE_DURATION 동안 유지)."""
+        expires_at = time.time() + self.ACTIVE_DURATION
+        for ws_id in ws_ids:
+            self._hot_ids[ws_id] = expires_at
+
+    def _select_targets(self) -> set[str] | None:
+        """이번 reconcile 대상 결정.
+
+        Returns:
+            None = full sweep, set = targeted (wake된 workspace만)
+        """
+        now = time.time()
+        self._prune_hot_ids(now)
+
+        full_due = now - self._last_full_sweep >= self.IDLE_INTERVAL
+        if self.is_active or not self._hot_ids or full_due:
+            self._last_full_sweep = now
+            self._count_mode("full")
+            return None
+
+        self._count_mode("targeted")
+        return set(self._hot_ids)
+
+    def _prune_hot_ids(self, now: float) -> None:
+        self._hot_ids = {ws_id: exp for ws_id, exp in self._hot_ids.items() if exp > now}
+
+    def _count_mode(self, mode: str) -> None:
+        COORDINATOR_RECONCILE_MODE_TOTAL.labels(
+            coordinator=self.COORDINATOR_TYPE, mode=mode
+        ).inc()
 
     def _jittered_verify_interval(self) -> float:
         """Return VERIFY_INTERVAL with ±VERIFY_JITTER random jitter.
@@ -130,6 +290,12 @@ class CoordinatorBase(ABC):
                 extra={"event": LogEvent.DB_ERROR, "error": str(e)},
             )
 
+    def _on_leadership_lost(self) -> None:
+        """Hook: 리더십 상실 시 per-leader 상태 초기화 (override 시 super() 호출)."""
+        self._hot_ids.clear()
+        self._pending_ewma = 0.0
+        self._idle_streak = 0
+
     @abstractmethod
     async def reconcile(self) -> None:
         """Execute one reconciliation cycle."""
@@ -153,7 +319,14 @@ class CoordinatorBase(ABC):
             await self._cleanup()
 
     async def _ensure_leadership(self) -> bool:
-        """Verify/acquire leadership. Returns False if not leader."""
+        """Verify/acquire leadership. Returns False if not leader (after retry sleep)."""
+        if await self._check_leadership():
+            return True
+        await asyncio.sleep(self.LEADER_RETRY_INTERVAL)
+        return False
+
+    async def _check_leadership(self) -> bool:
+        """Verify/acquire leadership without sleeping. Returns False if not leader."""
         now = time.time()
         # P5: Use jittered interval to prevent Thundering Herd
         if now - self._last_verify <= self._jittered_verify_interval() and self._leader.is_leader:
@@ -174,10 +347,10 @@ class CoordinatorBase(ABC):
         if not acquired:
             COORDINATOR_IS_LEADER.labels(coordinator=self.COORDINATOR_TYPE).set(0)
             await self._release_subscription()
+            self._on_leadership_lost()
             # Track waiting state for LEADERSHIP_ACQUIRED log
             if self._waiting_since is None:
                 self._waiting_since = now
-            await asyncio.sleep(self.LEADER_RETRY_INTERVAL)
             return False
 
         # Leadership acquired - update metric, reset waiting state and log
@@ -195,6 +368,28 @@ class CoordinatorBase(ABC):
         self._last_verify = now
         return True
 
+    async def tick(self) -> float | None:
+        """CoordinatorRuntime용 1회 실행 (sleep/wake 대기 없음 - runtime이 스케줄).
+
+        Returns:
+            다음 tick까지 초 (리더가 아니면 LEADER_RETRY_INTERVAL),
+            None = reconcile 취소 (run()의 loop 종료와 동일 → runtime 종료)
+        """
+        if not await self._check_leadership():
+            return self.LEADER_RETRY_INTERVAL
+        if not await self._execute_reconcile():
+            return None
+        return self._get_interval()
+
+    def handle_wake(self, payload: str) -> None:
+        """Wake 1건 반영 (빈/형식 불일치 payload = 전체 wake → accelerate, ids → hot set)."""
+        COORDINATOR_WAKE_RECEIVED_TOTAL.labels(coordinator=self.COORDINATOR_TYPE).inc()
+        ws_ids = parse_wake(payload)
+        if ws_ids is None:
+            self.accelerate()
+        else:
+            self.add_hot_ids(ws_ids)
+
     async def _ensure_subscribed(self) -> None:
         """Subscribe to wake channel if not already subscribed."""
         if not self._subscribed and self.WAKE_TARGET:
@@ -204,9 +399,13 @@ class CoordinatorBase(ABC):
 
     async def _throttle(self) -> None:
         """Ensure minimum interval between reconcile cycles."""
-        elapsed = time.time() - self._last_reconcile
-        if elapsed < self.MIN_INTERVAL:
-            await asyncio.sleep(self.MIN_INTERVAL - elapsed)
+        delay = self._throttle_delay()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _throttle_delay(self) -> float:
+        """다음 reconcile까지 최소 간격 (_min_interval)을 지키기 위해 남은 초."""
+        return max(0.0, self._min_interval() - (time.time() - self._last_reconcile))
 
     async def _execute_reconcile(self) -> bool:
         """Execute reconcile. Returns False if cancelled or leadership lost."""
@@ -217,6 +416,7 @@ class CoordinatorBase(ABC):
                 extra={"event": LogEvent.LEADERSHIP_LOST},
             )
             await self._release_subscription()
+            self._on_leadership_lost()
             return True  # Continue loop to re-acquire leadership
 
         start_time = time.time()
@@ -227,6 +427,7 @@ class CoordinatorBase(ABC):
             duration = self._last_reconcile - start_time
             COORDINATOR_RECONCILE_TOTAL.labels(coordinator=self.COORDINATOR_TYPE).inc()
             COORDINATOR_RECONCILE_DURATION.labels(coordinator=self.COORDINATOR_TYPE).observe(duration)
+            self._record_reconcile(duration)
             return True
         except asyncio.CancelledError:
             return False
@@ -244,11 +445,14 @@ class CoordinatorBase(ABC):
 
         try:
             msg = await self._subscriber.get_message(timeout=interval)
-            if msg is not None:  # Empty string "" is valid wake signal
-                COORDINATOR_WAKE_RECEIVED_TOTAL.labels(
-                    coordinator=self.COORDINATOR_TYPE
-                ).inc()
-                self.accelerate()
+            # 대기 중인 wake 소비 (coalesce, 최대 WAKE_DRAIN_MAX개)
+            drained = 0
+            while msg is not None:  # Empty string "" is valid wake signal
+                self.handle_wake(msg)
+                drained += 1
+                if drained >= self.WAKE_DRAIN_MAX:
+                    break
+                msg = await self._subscriber.get_message(timeout=0.0)
         except asyncio.CancelledError:
             raise
         except Exception as e:
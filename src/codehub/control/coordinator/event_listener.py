@@ -12,6 +12,7 @@ This prevents psycopg3's notifies() generator from being blocked by queries.
 Listens to 2 PostgreSQL NOTIFY channels:
 - ws_sse: UI-visible field changes -> query DB -> publish full data
 - ws_wake: desired_state changes -> PUBLISH to wake channels
+  (payload {"id": ...} → WAKE_DEBOUNCE 동안 모아 {"ids": [...]}로 coalesce)
 
 Note: Requires leader election - only 1 EventListener should write to prevent duplicates.
 """
@@ -36,6 +37,7 @@ from codehub.app.metrics.collector import (
     EVENT_SSE_PUBLISHED_TOTAL,
     EVENT_WAKE_PUBLISHED_TOTAL,
 )
+from codehub.control.coordinator.base import encode_wake
 from codehub.core.logging_schema import LogEvent
 from codehub.infra.pg_leader import SQLAlchemyLeaderElection
 from codehub.infra.redis_pubsub import ChannelPublisher
@@ -74,6 +76,9 @@ class EventListener:
     # Interval for leader acquisition retry
     LEADER_WAIT_INTERVAL_SEC = 5
 
+    # Targeted wake coalesce window
+    WAKE_DEBOUNCE = _settings.coordinator.wake_debounce
+
     def __init__(
         self,
         database_url: str,
@@ -101,6 +106,11 @@ class EventListener:
         # Event queue for decoupling NOTIFY receiving from processing
         self._event_queue: asyncio.Queue[tuple[str, str]] = asyncio.Queue()
 
+        # Wake coalescing (debounce window 동안 workspace id 누적)
+        self._wake_ids: set[str] = set()
+        self._wake_all = False
+        self._wake_flush: asyncio.Task | None = None
+
     async def run(self) -> None:
         """Start listening to PG NOTIFY channels.
 
@@ -180,6 +190,8 @@ class EventListener:
                     await worker_task
                 except asyncio.CancelledError:
                     pass
+                if self._wake_flush is not None:
+                    self._wake_flush.cancel()
 
         except asyncio.CancelledError:
             logger.info("Cancelled, cleaning up", extra={"event": LogEvent.APP_STOPPED})
@@ -229,7 +241,7 @@ class EventListener:
             if channel == self.CHANNEL_SSE:
                 await self._handle_sse(payload)
             elif channel == self.CHANNEL_WAKE:
-                await self._handle_wake()
+                self._handle_wake(payload)
         except Exception as e:
             logger.exception("Error handling %s: %s", channel, e)
 
@@ -324,8 +336,39 @@ class EventListener:
                 data[col] = value
         return data
 
-    async def _handle_wake(self) -> None:
-        """Handle wake event - PUBLISH to wake channels.
+    def _handle_wake(self, payload: str) -> None:
+        """Handle wake event - coalesce workspace ids over WAKE_DEBOUNCE.
+
+        Payload: {"id": "..."} (targeted) or "{}" (legacy trigger → full wake)
+        """
+        ws_id = None
+        try:
+            data = json.loads(payload) if payload else {}
+            ws_id = data.get("id") if isinstance(data, dict) else None
+        except json.JSONDecodeError:
+            pass
+
+        if ws_id:
+            self._wake_ids.add(str(ws_id))
+        else:
+            self._wake_all = True
+
+        if self._wake_flush is None or self._wake_flush.done():
+            self._wake_flush = asyncio.create_task(self._flush_wake())
+
+    async def _flush_wake(self) -> None:
+        """Debounce 후 누적된 wake를 한 번에 publish."""
+        await asyncio.sleep(self.WAKE_DEBOUNCE)
+        ws_ids, wake_all = self._wake_ids, self._wake_all
+        self._wake_ids, self._wake_all = set(), False
+        # 전체 wake가 섞여 있으면 빈 payload (coordinator full sweep)
+        await self._publish_wake("" if wake_all else encode_wake(ws_ids), len(ws_ids))
+        # publish 중 도착한 wake는 이 task가 아직 done이 아니라 새 flush가 예약되지 않음 → 재예약
+        if self._wake_ids or self._wake_all:
+            self._wake_flush = asyncio.create_task(self._flush_wake())
+
+    async def _publish_wake(self, payload: str, count: int) -> None:
+        """PUBLISH to wake channels.
 
         Publishes to both Observer and WC channels in parallel (1 RTT).
         """
@@ -333,8 +376,8 @@ class EventListener:
             observer_channel = f"{_channel_config.wake_prefix}:observer"
             wc_channel = f"{_channel_config.wake_prefix}:wc"
             observer_count, wc_count = await asyncio.gather(
-                self._publisher.publish(observer_channel),
-                self._publisher.publish(wc_channel),
+                self._publisher.publish(observer_channel, payload),
+                self._publisher.publish(wc_channel, payload),
             )
             EVENT_WAKE_PUBLISHED_TOTAL.labels(target="observer").inc()
             EVENT_WAKE_PUBLISHED_TOTAL.labels(target="wc").inc()
@@ -344,6 +387,8 @@ class EventListener:
                     "event": LogEvent.WAKE_PUBLISHED,
                     "observer_count": observer_count,
                     "wc_count": wc_count,
+                    "ws_count": count,
+                    "targeted": bool(payload),
                 },
             )
         except Exception as e:
@@ -0,0 +1,93 @@
+"""Observation snapshot - Observer → WC in-process conditions 공유.
+
+Observer와 WC 리더가 같은 프로세스에 있으면 WC는 DB의 conditions JSONB를
+다시 읽고 파싱하는 대신 Observer가 commit 직후 publish한 snapshot으로 plan합니다.
+
+- copy-on-write: publish마다 새 dict로 교체 → reader는 view()로 받은 mapping을 그대로 사용
+- ready: Observer가 리더로서 full sweep (3개 resource 모두 관측)을 반영한 이후에만 True
+- Observer 리더십 상실/쓰기 실패 → invalidate() → WC는 DB 읽기로 fallback
+  (리더가 다른 프로세스에 나뉘어 있으면 이 프로세스의 snapshot은 ready가 되지 않음)
+
+DB는 durable record로 유지 (Observer는 항상 DB에 먼저 commit 후 publish).
+"""
+
+from collections.abc import Iterable, Mapping
+from types import MappingProxyType
+
+from codehub.core.domain.conditions import OBSERVED_AT
+
+_EMPTY: Mapping[str, dict] = MappingProxyType({})
+
+
+class ObservationSnapshot:
+    """Versioned, copy-on-write map: workspace_id → conditions (DB conditions와 동일 형식).
+
+    Usage:
+        snapshot = ObservationSnapshot()     # 프로세스당 1개, Observer/WC에 주입
+        snapshot.merge(changes, keep=ws_ids, seeded=True)   # Observer (commit 후)
+        conditions = snapshot.view()         # WC (None = DB fallback)
+    """
+
+    def __init__(self) -> None:
+        self._conditions: Mapping[str, dict] = _EMPTY
+        self._version = 0
+        self._ready = False
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def view(self) -> Mapping[str, dict] | None:
+        """현재 snapshot (immutable view), 또는 None (ready 아님 → DB 사용)."""
+        return self._conditions if self._ready else None
+
+    def merge(
+        self,
+        changes: Mapping[str, tuple[dict, dict]],
+        *,
+        keep: set[str] | None = None,
+        seeded: bool = False,
+    ) -> None:
+        """Observer가 commit한 변경 반영 (DB UPDATE의 jsonb merge와 동일).
+
+        Args:
+            changes: ws_id → (변경된 sub-conditions, resource별 관측 시각)
+            keep: full sweep의 workspace 집합 (그 외 제거 - 삭제된 workspace)
+            seeded: 모든 resource를 관측한 full sweep → 이후 ready
+        """
+        current = self._conditions
+        if keep is not None:
+            updated = {ws_id: cond for ws_id, cond in current.items() if ws_id in keep}
+        else:
+            updated = dict(current)
+        for ws_id, (cond, observed) in changes.items():
+            prev = updated.get(ws_id, {})
+            updated[ws_id] = {
+                **prev,
+                **cond,
+                OBSERVED_AT: {**(prev.get(OBSERVED_AT) or {}), **observed},
+            }
+        self._publish(updated)
+        if seeded:
+            self._ready = True
+
+    def touch(self, ws_ids: Iterable[str], observed: dict) -> None:
+        """Heartbeat 반영 (관측 시각만 갱신)."""
+        updated = dict(self._conditions)
+        for ws_id in ws_ids:
+            prev = updated.get(ws_id, {})
+            updated[ws_id] = {**prev, OBSERVED_AT: {**(prev.get(OBSERVED_AT) or {}), **observed}}
+        self._publish(updated)
+
+    def invalidate(self) -> None:
+        """내용 폐기 + not ready (다음 seeded full sweep까지 DB fallback)."""
+        self._ready = False
+        self._publish({})
+
+    def _publish(self, conditions: dict[str, dict]) -> None:
+        self._conditions = MappingProxyType(conditions)
+        self._version += 1
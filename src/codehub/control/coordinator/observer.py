@@ -2,56 +2,126 @@
 
 Algorithm:
 1. 3개 API (containers, volumes, archives) 병렬 호출 with timeout
-2. 하나라도 실패 → reconcile skip (상태 일관성 보장)
-3. 전체 성공 → DB 기준 모든 workspace 업데이트
+2. 전부 실패 → reconcile skip
+3. 성공한 resource만 DB 기준 모든 workspace의 sub-condition 계산 (per-resource partial)
    - 리소스 있음 → conditions에 상태 기록
    - 리소스 없음 → null로 덮어씀 (삭제 감지 위해 필수)
+   - 실패한 resource → 이전 값 + 이전 관측 시각 유지 (WC가 staleness로 보수적 판단)
+4. Diff-only write: 마지막으로 쓴 fingerprint와 다른 sub-condition만 UPDATE
+   - conditions.observed_at[resource]는 변경 시 + 주기적 heartbeat (OBSERVER_HEARTBEAT_INTERVAL)
+
+Two-tier 관측 빈도:
+- hot tier: transitional (operation != NONE 또는 phase != desired_state) + wake된 workspace
+  → 매 tick (ACTIVE_INTERVAL) targeted 관측 (archive는 workspace별 prefix listing)
+- steady tier: 전체 fleet full sweep → STEADY_INTERVAL 주기
+  (fleet 단위 감지/metrics, event map 보정, heartbeat는 steady sweep에서)
+
+Event mode (OBSERVER_DOCKER_EVENTS): Docker /events 구독 (observer_events.py)
+- 변경된 workspace만 targeted wake → container/volume은 메모리 map에서 읽음
+- full sweep의 listing 결과로 map 보정
+
+Archive catalog (OBSERVER_ARCHIVE_CATALOG): archive는 S3 listing 대신
+archive_catalog 테이블 조회 (archive_catalog.py, GC가 S3와 주기 보정)
+
+Observation snapshot (COORDINATOR_OBSERVATION_SNAPSHOT): commit 후 변경분을
+in-process snapshot에 publish → 같은 프로세스의 WC는 DB conditions 대신 사용
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 import time
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from typing import Coroutine
 
-from sqlalchemy import select, text
+from sqlalchemy import and_, or_, select, text
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from codehub.app.config import get_settings
 from codehub.app.metrics.collector import (
     OBSERVER_API_DURATION,
     OBSERVER_ARCHIVES,
+    OBSERVER_CONDITIONS_ROWS_TOTAL,
     OBSERVER_CONTAINERS,
     OBSERVER_OBSERVE_DURATION,
+    OBSERVER_PARTIAL_TOTAL,
     OBSERVER_STAGE_DURATION,
+    OBSERVER_TIER_DURATION,
+    OBSERVER_TIER_WORKSPACES,
     OBSERVER_VOLUMES,
     OBSERVER_WORKSPACES,
 )
+from codehub.control.coordinator.archive_catalog import ArchiveCatalog
 from codehub.control.coordinator.base import (
     ChannelSubscriber,
     CoordinatorBase,
     CoordinatorType,
     LeaderElection,
+    encode_wake,
 )
+from codehub.control.coordinator.observation_snapshot import ObservationSnapshot
+from codehub.control.coordinator.observer_events import DockerEventWatcher
+from codehub.core.domain.conditions import RESOURCES, observed_stamp
+from codehub.core.domain.workspace import Operation, Phase
 from codehub.core.interfaces.instance import ContainerInfo, InstanceController
 from codehub.core.interfaces.storage import ArchiveInfo, StorageProvider, VolumeInfo
 from codehub.core.logging_schema import LogEvent
 from codehub.core.models import Workspace
+from codehub.infra.redis_pubsub import ChannelPublisher
 
 logger = logging.getLogger(__name__)
 _settings = get_settings()
 _logging_config = _settings.logging
+_channel_config = _settings.redis_channel
+
+
+def _fingerprint(info: dict | None) -> bytes:
+    """Sub-condition fingerprint (message 제외 - "Up 3 minutes" 같은 표시용 텍스트)."""
+    semantic = {k: v for k, v in info.items() if k != "message"} if info else None
+    return hashlib.blake2b(
+        json.dumps(semantic, sort_keys=True).encode(), digest_size=8
+    ).digest()
+
+
+def _transitional():
+    """Hot tier 대상 - 진행 중 또는 수렴 필요.
+
+    ERROR는 operation이 없으면 수동 복구 전까지 변하지 않음 → steady tier.
+    """
+    return or_(
+        Workspace.operation != Operation.NONE.value,
+        and_(
+            Workspace.phase != Workspace.desired_state,
+            Workspace.phase != Phase.ERROR.value,
+        ),
+    )
+
+
+def _filter_ids[T](observed: dict[str, T] | None, ws_ids: set[str]) -> dict[str, T] | None:
+    if observed is None:
+        return None
+    return {ws_id: info for ws_id, info in observed.items() if ws_id in ws_ids}
 
 
 class BulkObserver:
     """3개 API 병렬 호출로 리소스 관측."""
 
-    def __init__(self, ic: InstanceController, sp: StorageProvider) -> None:
+    def __init__(
+        self,
+        ic: InstanceController,
+        sp: StorageProvider,
+        watcher: DockerEventWatcher | None = None,
+        catalog: ArchiveCatalog | None = None,
+    ) -> None:
         self._ic = ic
         self._sp = sp
+        self._watcher = watcher
+        self._catalog = catalog
         self._prefix = _settings.runtime.resource_prefix
         self._timeout_s = _settings.observer.timeout_s
+        self._targeted_max = _settings.observer.targeted_max
 
     async def _safe[T](self, coro: Coroutine[None, None, list[T]], name: str) -> list[T] | None:
         start = time.monotonic()
@@ -83,15 +153,78 @@ class BulkObserver:
             )
             return None
 
-    async def observe_all(self) -> tuple[
+    async def _list_archives_for(
+        self, ws_ids: set[str], archive_keys: dict[str, str | None] | None = None
+    ) -> list[ArchiveInfo]:
+        """Targeted archive 관측 - 알려진 key는 HEAD, 그 외 workspace별 prefix listing."""
+        keys = archive_keys or {}
+        results = await asyncio.gather(
+            *(self._archive_for(ws_id, keys.get(ws_id)) for ws_id in ws_ids)
+        )
+        return [a for archives in results for a in archives]
+
+    async def _archive_for(self, ws_id: str, archive_key: str | None) -> list[ArchiveInfo]:
+        if archive_key is not None:
+            info = await self._sp.head_archive(archive_key)
+            if info is not None:
+                return [info]
+        return await self._sp.list_archives(f"{self._prefix}{ws_id}/")
+
+    async def _inspect_containers(self, ws_ids: set[str]) -> list[ContainerInfo]:
+        results = await asyncio.gather(*(self._ic.inspect(ws_id) for ws_id in ws_ids))
+        return [c for c in results if c is not None]
+
+    async def _inspect_volumes(self, ws_ids: set[str]) -> list[VolumeInfo]:
+        results = await asyncio.gather(*(self._sp.inspect_volume(ws_id) for ws_id in ws_ids))
+        return [v for v in results if v is not None]
+
+    async def observe_all(
+        self,
+        ws_ids: set[str] | None = None,
+        archive_keys: dict[str, str | None] | None = None,
+    ) -> tuple[
         dict[str, ContainerInfo] | None,
         dict[str, VolumeInfo] | None,
         dict[str, ArchiveInfo] | None,
     ]:
+        """리소스 관측.
+
+        Args:
+            ws_ids: 지정 시 해당 workspace만 반환 (targeted wake).
+                targeted_max 이하이면 workspace 단위 관측 (container/volume inspect,
+                archive HEAD 또는 prefix listing) - 전체 listing 없음.
+                event watcher가 synced면 container/volume은 map에서 읽음.
+            archive_keys: workspace별 알려진 archive key (DB archive_key, HEAD 대상)
+
+        archive catalog가 있으면 S3 listing 대신 catalog 조회 (O(workspaces)).
+        """
+        per_workspace = ws_ids is not None and len(ws_ids) <= self._targeted_max
+        if self._catalog is not None:
+            archives_coro = self._catalog.latest(ws_ids)
+        elif per_workspace:
+            archives_coro = self._list_archives_for(ws_ids, archive_keys)
+        else:
+            archives_coro = self._sp.list_archives(self._prefix)
+
+        if ws_ids is not None and self._watcher is not None and self._watcher.synced:
+            a_list = await self._safe(archives_coro, "archives")
+            archives = {a.workspace_id: a for a in a_list} if a_list is not None else None
+            return (
+                self._watcher.containers_for(ws_ids),
+                self._watcher.volumes_for(ws_ids),
+                _filter_ids(archives, ws_ids),
+            )
+
+        if per_workspace:
+            containers_coro = self._inspect_containers(ws_ids)
+            volumes_coro = self._inspect_volumes(ws_ids)
+        else:
+            containers_coro = self._ic.list_all(self._prefix)
+            volumes_coro = self._sp.list_volumes(self._prefix)
         results = await asyncio.gather(
-            self._safe(self._ic.list_all(self._prefix), "containers"),
-            self._safe(self._sp.list_volumes(self._prefix), "volumes"),
-            self._safe(self._sp.list_archives(self._prefix), "archives"),
+            self._safe(containers_coro, "containers"),
+            self._safe(volumes_coro, "volumes"),
+            self._safe(archives_coro, "archives"),
         )
 
         c_list, v_list, a_list = results
@@ -99,6 +232,11 @@ class BulkObserver:
         volumes = {v.workspace_id: v for v in v_list} if v_list is not None else None
         archives = {a.workspace_id: a for a in a_list} if a_list is not None else None
 
+        if ws_ids is not None:
+            containers = _filter_ids(containers, ws_ids)
+            volumes = _filter_ids(volumes, ws_ids)
+            archives = _filter_ids(archives, ws_ids)
+
         return containers, volumes, archives
 
 
@@ -108,6 +246,9 @@ class ObserverCoordinator(CoordinatorBase):
     COORDINATOR_TYPE = CoordinatorType.OBSERVER
     WAKE_TARGET = "observer"
 
+    OBSERVED_HEARTBEAT_INTERVAL: float = _settings.observer.heartbeat_interval
+    STEADY_INTERVAL: float = _settings.observer.steady_interval
+
     def __init__(
         self,
         conn: AsyncConnection,
@@ -115,40 +256,125 @@ class ObserverCoordinator(CoordinatorBase):
         subscriber: ChannelSubscriber,
         ic: InstanceController,
         sp: StorageProvider,
+        publisher: ChannelPublisher | None = None,
+        snapshot: ObservationSnapshot | None = None,
     ) -> None:
         super().__init__(conn, leader, subscriber)
-        self._observer = BulkObserver(ic, sp)
+        self._publisher = publisher
+        self._snapshot = snapshot
+        # Event mode: publisher가 있어야 변경 workspace를 targeted wake 가능
+        self._watcher = (
+            DockerEventWatcher(publisher)
+            if publisher is not None and _settings.observer.docker_events
+            else None
+        )
+        catalog = ArchiveCatalog(conn) if _settings.observer.archive_catalog else None
+        self._observer = BulkObserver(ic, sp, self._watcher, catalog)
         # Track previous state to log only on changes (reduces noise)
-        self._prev_state: tuple[int, int, int, int] | None = None
+        self._prev_state: tuple[int, int | None, int | None, int | None] | None = None
         self._last_heartbeat: float = 0.0
         # Track previous container IDs to detect disappeared containers
         self._prev_container_ids: set[str] | None = None
+        # Diff-only write: ws_id → resource → 마지막으로 commit된 sub-condition fingerprint
+        self._fingerprints: dict[str, dict[str, bytes]] = {}
+        # UPDATE 후 commit 전 변경분 (commit 성공 시 snapshot에 publish)
+        self._pending_changes: dict[str, tuple[dict, dict]] = {}
+        self._last_observed_heartbeat: float = time.monotonic()
+        # 마지막 hot tier 크기 (> 0이면 ACTIVE_INTERVAL 유지)
+        self._hot_count = 0
+
+    def _pending_work(self) -> int:
+        """Hot tier (transitional 포함)가 남아 있으면 backlog polling."""
+        return self._hot_count
+
+    def _next_deadline(self) -> float | None:
+        """다음 steady sweep까지 남은 초 (idle 간격이 늘어나도 STEADY_INTERVAL 유지)."""
+        return self.STEADY_INTERVAL - (time.time() - self._last_full_sweep)
+
+    def _select_targets(self) -> set[str] | None:
+        """Two-tier 대상 결정.
+
+        Returns:
+            None = steady sweep (STEADY_INTERVAL 경과),
+            set = hot tier의 wake된 workspace (transitional은 load 시 합류)
+        """
+        now = time.time()
+        self._prune_hot_ids(now)
+
+        if now - self._last_full_sweep >= self.STEADY_INTERVAL:
+            self._last_full_sweep = now
+            self._count_mode("full")
+            return None
+
+        self._count_mode("targeted")
+        return set(self._hot_ids)
 
     async def reconcile(self) -> None:
         reconcile_start = time.monotonic()
+        targets = self._select_targets()
+        if self._watcher is not None:
+            self._watcher.start()  # 리더일 때만 구독 (idempotent)
 
-        # Stage 1: Load workspace IDs from DB
+        # Stage 1: Load workspace IDs from DB (hot tier는 archive key 포함 - HEAD 관측용)
         load_start = time.monotonic()
-        ws_ids = await self._load_workspace_ids()
+        archive_keys = None
+        if targets is None:
+            ws_ids = await self._load_workspace_ids()
+        else:
+            archive_keys = await self._load_hot(targets)
+            ws_ids = set(archive_keys)
         OBSERVER_STAGE_DURATION.labels(stage="load").observe(time.monotonic() - load_start)
+        if targets is not None:
+            self._hot_count = len(ws_ids)
+            OBSERVER_TIER_WORKSPACES.labels(tier="hot").set(len(ws_ids))
         if not ws_ids:
             return
 
         # Stage 2: Observe resources (parallel API calls)
+        # listing 도중 반영된 이벤트는 seed()에서 listing보다 우선 (mark = listing 시작 전)
+        event_mark = self._watcher.mark() if self._watcher is not None else 0
         observe_start = time.monotonic()
-        containers, volumes, archives = await self._observer.observe_all()
+        containers, volumes, archives = await self._observer.observe_all(
+            ws_ids if targets is not None else None, archive_keys
+        )
         OBSERVER_OBSERVE_DURATION.observe(time.monotonic() - observe_start)
 
-        # 하나라도 실패 → skip (상태 일관성 보장, 다음 reconcile에서 재시도)
-        if any(x is None for x in [containers, volumes, archives]):
+        # 실패한 resource만 제외 (예: S3 장애가 container conditions 갱신을 막지 않음)
+        failed = [
+            resource
+            for resource, observed in zip(RESOURCES, (containers, volumes, archives), strict=True)
+            if observed is None
+        ]
+        if len(failed) == len(RESOURCES):
             logger.warning(
                 "Observation failed, skipping reconcile",
                 extra={"event": LogEvent.OPERATION_FAILED},
             )
             return
+        if failed:
+            for resource in failed:
+                OBSERVER_PARTIAL_TOTAL.labels(resource=resource).inc()
+            logger.warning(
+                "Partial observation, keeping previous conditions for failed resources",
+                extra={"event": LogEvent.OPERATION_FAILED, "failed": failed},
+            )
+
+        # Hot tier: 해당 workspace만 업데이트 (fleet 단위 감지/metrics는 steady sweep에서)
+        if targets is not None:
+            count = await self._write_conditions(ws_ids, containers, volumes, archives)
+            OBSERVER_TIER_DURATION.labels(tier="hot").observe(time.monotonic() - reconcile_start)
+            logger.debug(
+                "Hot tier observation completed",
+                extra={
+                    "event": LogEvent.OBSERVATION_COMPLETE,
+                    "workspaces": count,
+                    "duration_ms": (time.monotonic() - reconcile_start) * 1000,
+                },
+            )
+            return
 
         # Orphan 경고 (DB에 없는데 리소스 있음 → GC 대상)
-        observed_ws_ids = set(containers) | set(volumes) | set(archives)
+        observed_ws_ids = set(containers or ()) | set(volumes or ()) | set(archives or ())
         for ws_id in observed_ws_ids - ws_ids:
             logger.warning(
                 "Orphan detected",
@@ -156,37 +382,59 @@ class ObserverCoordinator(CoordinatorBase):
             )
 
         # Detect disappeared containers (critical for OOM/crash diagnosis)
-        current_container_ids = set(containers.keys())
-        if self._prev_container_ids is not None:
-            disappeared = self._prev_container_ids - current_container_ids
-            for ws_id in disappeared:
-                # Only warn if the workspace still exists (not deleted)
-                if ws_id in ws_ids:
-                    logger.warning(
-                        "Container disappeared",
-                        extra={
-                            "event": LogEvent.CONTAINER_DISAPPEARED,
-                            "ws_id": ws_id,
-                        },
-                    )
-        self._prev_container_ids = current_container_ids
-
-        # Stage 3: Bulk update conditions in DB
+        if containers is not None:
+            current_container_ids = set(containers.keys())
+            if self._prev_container_ids is not None:
+                disappeared = self._prev_container_ids - current_container_ids
+                for ws_id in disappeared:
+                    # Only warn if the workspace still exists (not deleted)
+                    if ws_id in ws_ids:
+                        logger.warning(
+                            "Container disappeared",
+                            extra={
+                                "event": LogEvent.CONTAINER_DISAPPEARED,
+                                "ws_id": ws_id,
+                            },
+                        )
+            self._prev_container_ids = current_container_ids
+
+        # Event map 보정 (누락 이벤트 repair)
+        if self._watcher is not None and containers is not None and volumes is not None:
+            self._watcher.seed(containers, volumes, event_mark)
+
+        # Stage 3: Bulk update conditions in DB (변경된 row만)
         update_start = time.monotonic()
-        count = await self._bulk_update_conditions(ws_ids, containers, volumes, archives)
-        await self._conn.commit()
+        self._fingerprints = {
+            ws_id: fp for ws_id, fp in self._fingerprints.items() if ws_id in ws_ids
+        }
+        written = await self._write_conditions(
+            ws_ids, containers, volumes, archives, full_sweep=True
+        )
+        if time.monotonic() - self._last_observed_heartbeat >= self.OBSERVED_HEARTBEAT_INTERVAL:
+            fresh = [r for r in RESOURCES if r not in failed]
+            await self._heartbeat_observed_at(ws_ids, fresh)
         OBSERVER_STAGE_DURATION.labels(stage="update").observe(time.monotonic() - update_start)
 
-        # Update metrics
+        # Update metrics (실패한 resource gauge는 이전 값 유지)
+        count = len(ws_ids)
         OBSERVER_WORKSPACES.set(count)
-        OBSERVER_CONTAINERS.set(len(containers))
-        OBSERVER_VOLUMES.set(len(volumes))
-        OBSERVER_ARCHIVES.set(len(archives))
+        OBSERVER_TIER_WORKSPACES.labels(tier="steady").set(count)
+        OBSERVER_TIER_DURATION.labels(tier="steady").observe(time.monotonic() - reconcile_start)
+        for gauge, observed in (
+            (OBSERVER_CONTAINERS, containers),
+            (OBSERVER_VOLUMES, volumes),
+            (OBSERVER_ARCHIVES, archives),
+        ):
+            if observed is not None:
+                gauge.set(len(observed))
 
         duration_ms = (time.monotonic() - reconcile_start) * 1000
+        n_containers = len(containers) if containers is not None else None
+        n_volumes = len(volumes) if volumes is not None else None
+        n_archives = len(archives) if archives is not None else None
 
         # Log only when state changes OR 1-hour heartbeat (reduces noise from ~86k/day)
-        current_state = (count, len(containers), len(volumes), len(archives))
+        current_state = (count, n_containers, n_volumes, n_archives)
         now = time.monotonic()
 
         # 1시간마다 heartbeat (변화 없어도 "살아있음" 확인)
@@ -196,9 +444,10 @@ class ObserverCoordinator(CoordinatorBase):
                 extra={
                     "event": LogEvent.OBSERVATION_COMPLETE,
                     "workspaces": count,
-                    "containers": len(containers),
-                    "volumes": len(volumes),
-                    "archives": len(archives),
+                    "written": written,
+                    "containers": n_containers,
+                    "volumes": n_volumes,
+                    "archives": n_archives,
                     "duration_ms": duration_ms,
                 },
             )
@@ -210,9 +459,10 @@ class ObserverCoordinator(CoordinatorBase):
                 extra={
                     "event": LogEvent.OBSERVATION_COMPLETE,
                     "workspaces": count,
-                    "containers": len(containers),
-                    "volumes": len(volumes),
-                    "archives": len(archives),
+                    "written": written,
+                    "containers": n_containers,
+                    "volumes": n_volumes,
+                    "archives": n_archives,
                     "duration_ms": duration_ms,
                 },
             )
@@ -230,48 +480,192 @@ class ObserverCoordinator(CoordinatorBase):
                 },
             )
 
+    def _on_leadership_lost(self) -> None:
+        """리더십 상실 → Docker event 구독 중단 + fingerprint 초기화 (재획득 시 전체 기록)."""
+        super()._on_leadership_lost()
+        self._fingerprints.clear()
+        self._hot_count = 0
+        if self._snapshot is not None:
+            self._snapshot.invalidate()
+        if self._watcher is not None:
+            self._watcher.stop()
+
+    async def _cleanup(self) -> None:
+        if self._snapshot is not None:
+            self._snapshot.invalidate()
+        if self._watcher is not None:
+            self._watcher.stop()
+        await super()._cleanup()
+
     async def _load_workspace_ids(self) -> set[str]:
-        result = await self._conn.execute(
-            select(Workspace.id).where(Workspace.deleted_at.is_(None))
-        )
+        """Steady sweep 대상 (삭제되지 않은 전체 workspace)."""
+        stmt = select(Workspace.id).where(Workspace.deleted_at.is_(None))
+        result = await self._conn.execute(stmt)
         return {str(row[0]) for row in result.fetchall()}
 
-    async def _bulk_update_conditions(
+    async def _load_hot(self, targets: set[str]) -> dict[str, str | None]:
+        """Hot tier 대상 (wake된 id + transitional) → ws_id: archive_key."""
+        hot = _transitional()
+        if targets:
+            hot = or_(Workspace.id.in_(list(targets)), hot)
+        stmt = select(Workspace.id, Workspace.archive_key).where(
+            Workspace.deleted_at.is_(None), hot
+        )
+        result = await self._conn.execute(stmt)
+        return {str(row[0]): row[1] for row in result.fetchall()}
+
+    async def _write_conditions(
         self,
         ws_ids: set[str],
-        containers: dict[str, ContainerInfo],
-        volumes: dict[str, VolumeInfo],
-        archives: dict[str, ArchiveInfo],
+        containers: dict[str, ContainerInfo] | None,
+        volumes: dict[str, VolumeInfo] | None,
+        archives: dict[str, ArchiveInfo] | None,
+        *,
+        full_sweep: bool = False,
     ) -> int:
-        """O(1) round-trip bulk UPDATE."""
+        """변경된 conditions만 UPDATE + commit (None = 관측 실패한 resource, 기존 값 유지).
+
+        실패 시 fingerprint/snapshot 초기화 → 다음 tick에 전체 재기록 (commit 안 된 row 누락 방지).
+        commit 성공 시 변경분을 snapshot에 publish (full sweep은 삭제된 workspace 제거).
+        """
+        try:
+            written = await self._bulk_update_conditions(ws_ids, containers, volumes, archives)
+            await self._conn.commit()
+        except Exception:
+            self._fingerprints.clear()
+            if self._snapshot is not None:
+                self._snapshot.invalidate()
+            raise
+        finally:
+            changes, self._pending_changes = self._pending_changes, {}
+        if self._snapshot is not None:
+            self._snapshot.merge(
+                changes,
+                keep=ws_ids if full_sweep else None,
+                seeded=full_sweep and None not in (containers, volumes, archives),
+            )
+        if not full_sweep and changes:
+            await self._wake_wc(changes)
+        OBSERVER_CONDITIONS_ROWS_TOTAL.labels(result="written").inc(written)
+        OBSERVER_CONDITIONS_ROWS_TOTAL.labels(result="skipped").inc(len(ws_ids) - written)
+        return written
+
+    async def _wake_wc(self, ws_ids: Iterable[str]) -> None:
+        """Hot tier에서 바뀐 workspace → WC targeted wake (operation 완료를 다음 tick 전에 반영)."""
+        if self._publisher is None:
+            return
+        try:
+            await self._publisher.publish(
+                f"{_channel_config.wake_prefix}:wc", encode_wake(ws_ids)
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to publish wc wake",
+                extra={"event": LogEvent.REDIS_CONNECTION_ERROR, "error": str(e)},
+            )
+
+    async def _heartbeat_observed_at(self, ws_ids: set[str], resources: list[str]) -> None:
+        """observed_at 일괄 갱신 (conditions 미변경 row의 관측 시각).
+
+        이번 sweep에서 관측 성공한 resource의 conditions.observed_at만 갱신
+        (sub-condition 값은 그대로 - fingerprint 동일).
+        """
         now = datetime.now(UTC)
-        ws_id_list = list(ws_ids)
+        await self._conn.execute(
+            text("""
+                UPDATE workspaces
+                SET observed_at = :now,
+                    conditions = COALESCE(conditions, '{}'::jsonb) || jsonb_build_object(
+                        'observed_at',
+                        COALESCE(conditions->'observed_at', '{}'::jsonb) || CAST(:observed AS jsonb)
+                    )
+                WHERE deleted_at IS NULL AND id = ANY(CAST(:ids AS text[]))
+            """),
+            {
+                "now": now,
+                "ids": list(ws_ids),
+                "observed": json.dumps(dict.fromkeys(resources, observed_stamp(now))),
+            },
+        )
+        await self._conn.commit()
+        self._last_observed_heartbeat = time.monotonic()
+        if self._snapshot is not None:
+            self._snapshot.touch(ws_ids, dict.fromkeys(resources, observed_stamp(now)))
 
+    async def _bulk_update_conditions(
+        self,
+        ws_ids: set[str],
+        containers: dict[str, ContainerInfo] | None,
+        volumes: dict[str, VolumeInfo] | None,
+        archives: dict[str, ArchiveInfo] | None,
+    ) -> int:
+        """O(1) round-trip bulk UPDATE (fingerprint가 바뀐 sub-condition만).
+
+        기존 conditions에 merge (jsonb ||) → 기록하지 않은 resource는 이전 값 유지.
+
+        Returns:
+            UPDATE된 row 수
+        """
+        now = datetime.now(UTC)
+        stamp = observed_stamp(now)
+        sources = [
+            (resource, observed)
+            for resource, observed in zip(RESOURCES, (containers, volumes, archives), strict=True)
+            if observed is not None
+        ]
+        ws_id_list = []
         conditions_list = []
-        for ws_id in ws_id_list:
-            c, v, a = containers.get(ws_id), volumes.get(ws_id), archives.get(ws_id)
-            conditions_list.append({
-                "container": c.model_dump() if c else None,
-                "volume": v.model_dump() if v else None,
-                "archive": a.model_dump() if a else None,
-            })
+        observed_list = []
+        fingerprints: dict[str, dict[str, bytes]] = {}
+        for ws_id in ws_ids:
+            prev = self._fingerprints.get(ws_id, {})
+            cond = {}
+            changed = {}
+            for resource, observed in sources:
+                info = observed.get(ws_id)
+                sub = info.model_dump() if info else None
+                fp = _fingerprint(sub)
+                if prev.get(resource) != fp:
+                    cond[resource] = sub
+                    changed[resource] = fp
+            if not cond:
+                continue
+            ws_id_list.append(ws_id)
+            conditions_list.append(cond)
+            observed_list.append(dict.fromkeys(cond, stamp))
+            fingerprints[ws_id] = changed
+
+        if not ws_id_list:
+            return 0
 
         result = await self._conn.execute(
             text("""
                 UPDATE workspaces AS w
-                SET conditions = v.cond::jsonb, observed_at = v.ts
+                SET conditions = COALESCE(w.conditions, '{}'::jsonb) || v.cond || jsonb_build_object(
+                        'observed_at',
+                        COALESCE(w.conditions->'observed_at', '{}'::jsonb) || v.observed
+                    ),
+                    observed_at = v.ts
                 FROM unnest(
                     CAST(:ids AS text[]),
                     CAST(:conds AS jsonb[]),
+                    CAST(:observed AS jsonb[]),
                     CAST(:timestamps AS timestamptz[])
-                ) AS v(id, cond, ts)
+                ) AS v(id, cond, observed, ts)
                 WHERE w.id = v.id
                 RETURNING w.id
             """),
             {
                 "ids": ws_id_list,
                 "conds": [json.dumps(c) for c in conditions_list],
+                "observed": [json.dumps(o) for o in observed_list],
                 "timestamps": [now] * len(ws_id_list),
             },
         )
+        for ws_id, changed in fingerprints.items():
+            self._fingerprints.setdefault(ws_id, {}).update(changed)
+        self._pending_changes = {
+            ws_id: (cond, observed)
+            for ws_id, cond, observed in zip(ws_id_list, conditions_list, observed_list, strict=True)
+        }
         return len(result.fetchall())
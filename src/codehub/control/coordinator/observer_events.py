@@ -0,0 +1,242 @@
+"""Observer event mode - Docker /events stream 기반 관측.
+
+Docker Engine /events (container, volume)를 장기 구독해 container/volume 상태 map을
+메모리에 유지합니다. 변경된 workspace id만 targeted wake로 publish
+→ Observer는 해당 workspace만 map에서 읽어 conditions 업데이트 (Docker API 호출 없음).
+
+Safety net:
+- 주기적 full listing (Observer full sweep) → seed()로 map 교체 (누락 이벤트 보정)
+  listing 도중 반영된 이벤트가 더 최신이므로 유지 (이벤트 sequence: mark() 이후 변경된 workspace)
+- stream 연결 직후에는 unsynced → 연결 이후 시작한 full sweep 전까지 list API 사용
+
+Configuration via ObserverConfig (OBSERVER_ env prefix).
+"""
+
+import asyncio
+import logging
+
+from codehub.app.config import get_settings
+from codehub.app.metrics.collector import OBSERVER_DOCKER_EVENTS_TOTAL
+from codehub.control.coordinator.base import encode_wake
+from codehub.core.interfaces.instance import ContainerInfo
+from codehub.core.interfaces.storage import VolumeInfo
+from codehub.core.logging_schema import LogEvent
+from codehub.infra.docker import EventAPI
+from codehub.infra.redis_pubsub import ChannelPublisher
+
+logger = logging.getLogger(__name__)
+
+_settings = get_settings()
+_channel_config = _settings.redis_channel
+
+# container event action → state (listing의 "State"와 동일 표기)
+_CONTAINER_STATES = {
+    "create": "created",
+    "start": "running",
+    "restart": "running",
+    "unpause": "running",
+    "pause": "paused",
+    "die": "exited",
+    "stop": "exited",
+}  # kill/oom은 뒤이어 die 이벤트 발생
+_REMOVED = "destroy"
+
+
+class DockerEventWatcher:
+    """Docker /events 구독 → container/volume 상태 map + targeted wake.
+
+    Usage:
+        watcher = DockerEventWatcher(publisher)
+        watcher.start()                      # 리더 획득 후
+        mark = watcher.mark()                # full listing 시작 전
+        watcher.seed(containers, volumes, mark)  # full sweep 결과로 map 교체
+        watcher.containers_for(ws_ids)       # synced일 때만 사용
+        watcher.stop()                       # 리더십 상실/종료
+    """
+
+    RECONNECT_DELAY: float = _settings.observer.events_reconnect_delay
+    WAKE_DEBOUNCE: float = _settings.coordinator.wake_debounce
+
+    def __init__(self, publisher: ChannelPublisher, events: EventAPI | None = None) -> None:
+        self._publisher = publisher
+        self._events = events or EventAPI()
+        self._prefix = _settings.runtime.resource_prefix
+        self._containers: dict[str, ContainerInfo] = {}
+        self._volumes: dict[str, VolumeInfo] = {}
+        self._synced = False
+        # 이벤트 sequence: workspace별 마지막 반영 이벤트 (listing보다 최신인지 판단)
+        self._seq = 0
+        self._container_seq: dict[str, int] = {}
+        self._volume_seq: dict[str, int] = {}
+        self._resync_after = 0  # 이 sequence 이후 시작한 listing만 synced로 인정 (연결 시점)
+        self._task: asyncio.Task | None = None
+        self._dirty: set[str] = set()
+        self._flush: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def synced(self) -> bool:
+        """Stream 연결 이후 full listing으로 seed 되었는지."""
+        return self._synced and self.running
+
+    def start(self) -> None:
+        if not self.running:
+            self._synced = False
+            self._resync_after = self._next_seq()
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        self._synced = False
+        for task in (self._task, self._flush):
+            if task is not None:
+                task.cancel()
+        self._task = None
+        self._flush = None
+
+    def mark(self) -> int:
+        """현재 이벤트 sequence (full listing 시작 전에 기록 → seed()에 전달)."""
+        return self._seq
+
+    def seed(
+        self,
+        containers: dict[str, ContainerInfo],
+        volumes: dict[str, VolumeInfo],
+        since: int,
+    ) -> None:
+        """Full listing 결과로 map 교체 (누락 이벤트 보정).
+
+        Args:
+            since: listing 시작 전 mark() - 이후 이벤트가 반영된 workspace는 map 값 유지
+        """
+        if not self.running:
+            return
+        self._containers = self._merge(self._containers, containers, self._container_seq, since)
+        self._volumes = self._merge(self._volumes, volumes, self._volume_seq, since)
+        # listing 도중 재연결 (이벤트 유실 가능) → 다음 full sweep까지 unsynced
+        self._synced = since >= self._resync_after
+
+    @staticmethod
+    def _merge[T](
+        current: dict[str, T], listed: dict[str, T], seqs: dict[str, int], since: int
+    ) -> dict[str, T]:
+        merged = dict(listed)
+        for ws_id, seq in list(seqs.items()):
+            if seq <= since:
+                del seqs[ws_id]  # listing 시작 전 이벤트 → listing이 최신
+            elif ws_id in current:
+                merged[ws_id] = current[ws_id]
+            else:
+                merged.pop(ws_id, None)  # listing 도중 삭제됨
+        return merged
+
+    def _next_seq(self) -> int:
+        self._seq += 1
+        return self._seq
+
+    def containers_for(self, ws_ids: set[str]) -> dict[str, ContainerInfo]:
+        return {ws_id: self._containers[ws_id] for ws_id in ws_ids if ws_id in self._containers}
+
+    def volumes_for(self, ws_ids: set[str]) -> dict[str, VolumeInfo]:
+        return {ws_id: self._volumes[ws_id] for ws_id in ws_ids if ws_id in self._volumes}
+
+    async def _run(self) -> None:
+        filters = {"type": ["container", "volume"]}
+        while True:
+            try:
+                async for event in self._events.stream(filters):
+                    ws_id = self.apply(event)
+                    if ws_id is not None:
+                        self._mark_dirty(ws_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    "Docker event stream error",
+                    extra={"event": LogEvent.OPERATION_FAILED, "error": str(e)},
+                )
+            # 재연결 구간의 이벤트는 유실될 수 있음 → 재연결 이후 시작한 full sweep까지 unsynced
+            self._synced = False
+            await asyncio.sleep(self.RECONNECT_DELAY)
+            self._resync_after = self._next_seq()
+
+    def apply(self, event: dict) -> str | None:
+        """이벤트 1건을 map에 반영.
+
+        Returns:
+            변경된 workspace id, 또는 None (관련 없는 이벤트)
+        """
+        event_type = event.get("Type")
+        action = str(event.get("Action", "")).split(":", 1)[0]  # "exec_start: sh" 형태 대비
+        actor = event.get("Actor") or {}
+
+        if event_type == "container":
+            name = (actor.get("Attributes") or {}).get("name", "")
+            if not name.startswith(self._prefix):
+                return None
+            ws_id = name[len(self._prefix) :]
+            if action == _REMOVED:
+                self._containers.pop(ws_id, None)
+                self._container_seq[ws_id] = self._next_seq()
+            elif action in _CONTAINER_STATES:
+                state = _CONTAINER_STATES[action]
+                running = state == "running"
+                self._containers[ws_id] = ContainerInfo(
+                    workspace_id=ws_id,
+                    running=running,
+                    reason="Running" if running else state.capitalize(),
+                    message=f"Event: {action}",
+                )
+                self._container_seq[ws_id] = self._next_seq()
+            else:
+                return None
+
+        elif event_type == "volume":
+            name = actor.get("ID", "")
+            if not name.startswith(self._prefix) or not name.endswith("-home"):
+                return None
+            ws_id = name[len(self._prefix) : -len("-home")]
+            if action == _REMOVED:
+                self._volumes.pop(ws_id, None)
+                self._volume_seq[ws_id] = self._next_seq()
+            elif action == "create":
+                self._volumes[ws_id] = VolumeInfo(
+                    workspace_id=ws_id,
+                    exists=True,
+                    reason="VolumeExists",
+                    message=f"Volume {name} exists",
+                )
+                self._volume_seq[ws_id] = self._next_seq()
+            else:
+                return None
+        else:
+            return None
+
+        OBSERVER_DOCKER_EVENTS_TOTAL.labels(type=event_type).inc()
+        return ws_id
+
+    def _mark_dirty(self, ws_id: str) -> None:
+        self._dirty.add(ws_id)
+        if self._flush is None or self._flush.done():
+            self._flush = asyncio.create_task(self._flush_wake())
+
+    async def _flush_wake(self) -> None:
+        """Debounce 후 변경된 workspace를 observer/wc에 targeted wake."""
+        await asyncio.sleep(self.WAKE_DEBOUNCE)
+        ws_ids, self._dirty = self._dirty, set()
+        payload = encode_wake(ws_ids)
+        try:
+            await asyncio.gather(
+                self._publisher.publish(f"{_channel_config.wake_prefix}:observer", payload),
+                self._publisher.publish(f"{_channel_config.wake_prefix}:wc", payload),
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to publish event wake",
+                extra={"event": LogEvent.REDIS_CONNECTION_ERROR, "error": str(e)},
+            )
+        # publish 중 도착한 변경은 이 task가 아직 done이 아니라 새 flush가 예약되지 않음 → 재예약
+        if self._dirty:
+            self._flush = asyncio.create_task(self._flush_wake())
@@ -0,0 +1,199 @@
+"""Coordinator runtime - 프로세스의 coordinator를 단일 loop로 multiplex.
+
+Reference: docs/spec/04-control-plane.md (Unified runtime)
+
+독립 loop (기본): coordinator마다 DB connection + Redis subscription + sleep/poll loop
+Runtime (COORDINATOR_UNIFIED_RUNTIME):
+- DB connection 1개: 모든 role의 advisory lock + reconcile
+  (tick이 순차 실행이므로 ADR-012 유지 - connection 장애 시 모든 role의 lock/트랜잭션이 함께 실패)
+- Leader election은 role별 (lock key = CoordinatorType) → role마다 다른 프로세스가 리더일 수 있음
+- Timer heap: deadline이 된 coordinator의 tick() 실행 → _get_interval()로 다음 deadline 재등록
+  (여러 개가 due면 Observer → WC → Scheduler 순: WC가 방금 기록된 conditions를 봄)
+- Wake dispatch: PubSub 1개로 모든 WAKE_TARGET 구독 → channel의 coordinator에 전달 + 앞당겨 스케줄
+  (MIN_INTERVAL throttle 유지, 리더가 아닌 role의 wake는 무시)
+
+EventListener (psycopg LISTEN 전용 connection)와 WorkQueueWorker는 기존처럼 독립 실행.
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+from collections.abc import Sequence
+
+from codehub.app.config import get_settings
+from codehub.app.metrics.collector import COORDINATOR_TICK_LAG
+from codehub.control.coordinator.base import CoordinatorBase, CoordinatorType
+from codehub.core.logging_schema import LogEvent
+from codehub.infra.redis_pubsub import MultiChannelSubscriber
+
+logger = logging.getLogger(__name__)
+
+_channel_config = get_settings().redis_channel
+
+# 여러 coordinator가 due일 때 실행 순서 (낮을수록 먼저)
+TICK_PRIORITY: dict[CoordinatorType, int] = {
+    CoordinatorType.OBSERVER: 0,
+    CoordinatorType.WC: 1,
+    CoordinatorType.SCHEDULER: 2,
+}
+
+
+class CoordinatorRuntime:
+    """Coordinator들을 하나의 timer heap + wake dispatch로 실행.
+
+    Usage:
+        runtime = CoordinatorRuntime(subscriber, [observer, wc, scheduler])
+        await runtime.run()   # coordinator.run() 대신 (같은 connection 공유)
+    """
+
+    WAKE_DRAIN_MAX: int = CoordinatorBase.WAKE_DRAIN_MAX
+
+    def __init__(
+        self,
+        subscriber: MultiChannelSubscriber,
+        coordinators: Sequence[CoordinatorBase],
+    ) -> None:
+        self._subscriber = subscriber
+        self._coordinators = list(coordinators)
+        self._channels = {
+            f"{_channel_config.wake_prefix}:{c.WAKE_TARGET}": index
+            for index, c in enumerate(self._coordinators)
+            if c.WAKE_TARGET
+        }
+        # (deadline, priority, index) - 재스케줄 시 이전 entry는 _deadlines와 달라 무시 (lazy)
+        self._heap: list[tuple[float, int, int]] = []
+        self._deadlines: dict[int, float] = {}
+        self._running = False
+
+    async def run(self) -> None:
+        """Main runtime loop."""
+        self._running = True
+        logger.info(
+            "Starting coordinator runtime",
+            extra={
+                "event": LogEvent.APP_STARTED,
+                "coordinators": [c.COORDINATOR_TYPE.value for c in self._coordinators],
+            },
+        )
+        try:
+            if self._channels:
+                await self._subscriber.subscribe(*self._channels)
+            for index in range(len(self._coordinators)):
+                self._schedule(index, 0.0)
+            while self._running:
+                await self._wait_due()
+                await self._run_next()
+        finally:
+            await self._cleanup()
+
+    def _schedule(self, index: int, delay: float, *, earlier_only: bool = False) -> None:
+        deadline = time.monotonic() + delay
+        current = self._deadlines.get(index)
+        if earlier_only and current is not None and current <= deadline:
+            return
+        self._deadlines[index] = deadline
+        coordinator_type = self._coordinators[index].COORDINATOR_TYPE
+        priority = TICK_PRIORITY.get(coordinator_type, len(TICK_PRIORITY))
+        heapq.heappush(self._heap, (deadline, priority, index))
+
+    def _peek_deadline(self) -> float:
+        """Heap top의 유효 deadline (재스케줄로 무효가 된 entry 제거)."""
+        while self._heap:
+            deadline, _, index = self._heap[0]
+            if self._deadlines.get(index) == deadline:
+                return deadline
+            heapq.heappop(self._heap)
+        return time.monotonic() + CoordinatorBase.IDLE_INTERVAL
+
+    async def _wait_due(self) -> None:
+        """다음 deadline까지 wake 대기 (wake로 deadline이 앞당겨지면 즉시 반환)."""
+        drained = 0
+        while True:
+            delay = self._peek_deadline() - time.monotonic()
+            if delay <= 0:
+                # 밀린 tick 전에 대기 중인 wake 반영 (coalesce, 최대 WAKE_DRAIN_MAX개)
+                while drained < self.WAKE_DRAIN_MAX and (msg := await self._get_message(0.0)):
+                    self._dispatch(*msg)
+                    drained += 1
+                return
+            msg = await self._get_message(delay)
+            if msg is None:
+                # timeout 또는 Redis 오류 (즉시 None) → busy loop 방지
+                await asyncio.sleep(max(0.0, self._peek_deadline() - time.monotonic()))
+                continue
+            self._dispatch(*msg)
+            drained += 1
+
+    async def _get_message(self, timeout: float) -> tuple[str, str] | None:
+        if not self._channels:
+            return None
+        return await self._subscriber.get_message(timeout=timeout)
+
+    def _dispatch(self, channel: str, payload: str) -> None:
+        index = self._channels.get(channel)
+        if index is None or not self._coordinators[index].is_leader:
+            return
+        coordinator = self._coordinators[index]
+        coordinator.handle_wake(payload)
+        # 독립 loop의 _throttle()과 같은 MIN_INTERVAL 보장
+        self._schedule(index, coordinator._throttle_delay(), earlier_only=True)
+
+    def _pop_due(self) -> tuple[float, int]:
+        """Due entry 중 priority가 가장 높은 것 (없으면 가장 이른 deadline)."""
+        now = time.monotonic()
+        due: list[tuple[float, int, int]] = []
+        while self._heap and (not due or self._heap[0][0] <= now):
+            entry = heapq.heappop(self._heap)
+            if self._deadlines.get(entry[2]) == entry[0]:
+                due.append(entry)
+        deadline, _, index = min(due, key=lambda entry: (entry[1], entry[0]))
+        for entry in due:
+            if entry[2] != index:
+                heapq.heappush(self._heap, entry)
+        return deadline, index
+
+    async def _run_next(self) -> None:
+        deadline, index = self._pop_due()
+        coordinator = self._coordinators[index]
+        COORDINATOR_TICK_LAG.labels(coordinator=coordinator.COORDINATOR_TYPE).observe(
+            max(0.0, time.monotonic() - deadline)
+        )
+        try:
+            interval = await coordinator.tick()
+        except asyncio.CancelledError:
+            self._running = False
+            raise
+        except Exception as e:
+            # _execute_reconcile이 reconcile 예외를 처리하므로 여기는 leader election 등
+            logger.exception(
+                "Coordinator tick failed",
+                extra={
+                    "event": LogEvent.OPERATION_FAILED,
+                    "coordinator": coordinator.name,
+                    "error": str(e),
+                },
+            )
+            await coordinator._safe_rollback()
+            interval = coordinator.LEADER_RETRY_INTERVAL
+        if interval is None:
+            # reconcile 취소 (독립 loop의 break와 동일) → runtime 종료
+            self._running = False
+            return
+        self._schedule(index, max(interval, coordinator._min_interval()))
+
+    async def _cleanup(self) -> None:
+        """종료 시 각 coordinator 정리 (in-flight 취소, 리더십 반납) + 구독 해제."""
+        for coordinator in self._coordinators:
+            try:
+                await coordinator._cleanup()
+            except Exception as e:
+                logger.warning(
+                    "Coordinator cleanup failed",
+                    extra={
+                        "event": LogEvent.APP_STOPPED,
+                        "coordinator": coordinator.name,
+                        "error": str(e),
+                    },
+                )
+        await self._subscriber.unsubscribe()
@@ -1,16 +1,23 @@
 """Scheduler - TTL + GC 오케스트레이터.
 
 Background tasks:
-- TTL: RUNNING → STANDBY → ARCHIVED 전환 (매 60초)
-- GC: 고아 archive/container/volume 정리 (매 4시간)
+- TTL: RUNNING → STANDBY → ARCHIVED 전환 (매 60초, reconcile에서 실행)
+- GC: 고아 archive/container/volume 정리 (매 4시간, 별도 task)
 
 장애 시 사용자 영향: 낮음 (운영 불편)
 → 같은 coordinator에서 실행해도 무방
+
+GC 분리:
+- GC는 리더인 동안 전용 connection을 가진 background task로 실행 → 오래 걸려도 TTL 주기 보장
+- run당 gc_budget 제한, 초과 시 checkpoint 후 gc_resume_interval 뒤 재개
+- 리더십 상실 / 종료 시 task 취소 (checkpoint는 per-leader 상태라 함께 폐기)
 """
 
+import asyncio
+import logging
 import time
 
-from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
 
 from codehub.app.config import get_settings
 from codehub.control.coordinator.base import (
@@ -22,9 +29,12 @@ from codehub.control.coordinator.base import (
 from codehub.control.coordinator.scheduler_gc import GCRunner
 from codehub.control.coordinator.scheduler_ttl import TTLRunner
 from codehub.core.interfaces import InstanceController, StorageProvider
+from codehub.core.logging_schema import LogEvent
 from codehub.infra.redis_kv import ActivityStore
 from codehub.infra.redis_pubsub import ChannelPublisher
 
+logger = logging.getLogger(__name__)
+
 # Module-level settings cache
 _settings = get_settings()
 
@@ -34,7 +44,7 @@ class Scheduler(CoordinatorBase):
 
     reconcile()에서 시간 기반으로 각 작업 실행:
     - TTL: 매 ttl_interval (60초)
-    - GC: 매 gc_interval (4시간)
+    - GC: task가 없으면 시작 (task가 gc_interval / gc_resume_interval로 자체 스케줄)
     """
 
     COORDINATOR_TYPE = CoordinatorType.SCHEDULER
@@ -44,6 +54,9 @@ class Scheduler(CoordinatorBase):
     IDLE_INTERVAL = _settings.coordinator.ttl_interval
     ACTIVE_INTERVAL = _settings.coordinator.ttl_interval
 
+    GC_BUDGET: float = _settings.coordinator.gc_budget
+    GC_RESUME_INTERVAL: float = _settings.coordinator.gc_resume_interval
+
     def __init__(
         self,
         conn: AsyncConnection,
@@ -53,29 +66,96 @@ class Scheduler(CoordinatorBase):
         publisher: ChannelPublisher,
         storage: StorageProvider,
         ic: InstanceController,
+        engine: AsyncEngine,
     ) -> None:
         super().__init__(conn, leader, subscriber)
 
-        # Compose runners
+        # Compose runners (GCRunner는 task의 전용 connection으로 생성)
         self._ttl = TTLRunner(conn, activity_store, publisher)
-        self._gc = GCRunner(conn, storage, ic)
+        self._engine = engine
+        self._storage = storage
+        self._ic = ic
+        self._gc_task: asyncio.Task[None] | None = None
 
         # Interval tracking
         self._ttl_interval = _settings.coordinator.ttl_interval
         self._gc_interval = _settings.coordinator.gc_interval
         self._last_ttl: float = 0.0
-        self._last_gc: float = 0.0
+        self._last_gc: float | None = None  # None = 첫 GC는 즉시 (monotonic은 부팅 기준)
 
     async def reconcile(self) -> None:
         """Execute scheduled tasks based on elapsed time."""
         now = time.monotonic()
 
+        # GC task 먼저 보장 (TTL 실패와 무관하게 GC 진행)
+        self._ensure_gc_task()
+
         # TTL check (every ttl_interval)
         if now - self._last_ttl >= self._ttl_interval:
             await self._ttl.run()
             self._last_ttl = now
 
-        # GC cleanup (every gc_interval)
-        if now - self._last_gc >= self._gc_interval:
-            await self._gc.run()
-            self._last_gc = now
+    def _next_deadline(self) -> float | None:
+        """다음 TTL 실행까지 남은 초 (GC는 task가 자체 스케줄)."""
+        return self._ttl_interval - (time.monotonic() - self._last_ttl)
+
+    def _ensure_gc_task(self) -> None:
+        """GC task가 없거나 종료됐으면 시작 (예외로 종료된 경우 로그 후 재시작)."""
+        task = self._gc_task
+        if task is not None and not task.done():
+            return
+        if task is not None and not task.cancelled() and (exc := task.exception()) is not None:
+            logger.error(
+                "GC task crashed",
+                exc_info=exc,
+                extra={"event": LogEvent.OPERATION_FAILED, "error": str(exc)},
+            )
+        self._gc_task = asyncio.create_task(self._gc_loop(), name="scheduler:gc")
+
+    async def _gc_loop(self) -> None:
+        """리더인 동안 GC 반복 (전용 connection, budget 초과 시 checkpoint 후 재개)."""
+        async with self._engine.connect() as conn:
+            runner = GCRunner(conn, self._storage, self._ic)
+            while True:
+                if runner.resuming:
+                    delay = self.GC_RESUME_INTERVAL
+                elif self._last_gc is None:
+                    delay = 0.0
+                else:
+                    delay = self._gc_interval - (time.monotonic() - self._last_gc)
+                await asyncio.sleep(max(0.0, delay))
+                if not self.is_leader:
+                    return
+                started = time.monotonic()
+                try:
+                    done = await runner.run(budget=self.GC_BUDGET)
+                except Exception:
+                    # run()이 로그 기록, 다음 주기에 새 cycle로 재시도
+                    try:
+                        await conn.rollback()
+                    except Exception as e:
+                        logger.warning(
+                            "Rollback failed", extra={"event": LogEvent.DB_ERROR, "error": str(e)}
+                        )
+                    runner = GCRunner(conn, self._storage, self._ic)
+                    done = True
+                if done:
+                    self._last_gc = started
+
+    def _cancel_gc(self) -> asyncio.Task[None] | None:
+        task, self._gc_task = self._gc_task, None
+        if task is not None:
+            task.cancel()
+        return task
+
+    def _on_leadership_lost(self) -> None:
+        """리더십 상실 → GC task 취소 (새 리더가 자신의 주기로 실행)."""
+        super()._on_leadership_lost()
+        self._cancel_gc()
+
+    async def _cleanup(self) -> None:
+        """종료 시 GC task 취소 (전용 connection 반환까지 대기)."""
+        task = self._cancel_gc()
+        if task is not None:
+            await asyncio.gather(task, return_exceptions=True)
+        await super()._cleanup()
@@ -1,15 +1,39 @@
 """GC Runner - 고아 리소스 정리.
 
 Archive: S3에 있지만 DB에 없는 파일 삭제
+Archive catalog: S3 listing page 범위별 drift 보정 (GC listing 재사용)
 Container/Volume: 존재하지만 DB에 없는 리소스 삭제
+
+Archive streaming (bounded memory):
+- S3 listing page 단위 (최대 1000 key) → page key만 DB 보호 여부 조회 (= ANY(:keys))
+- orphan은 DeleteObjects bulk 요청 (archive 500개 = 1000 objects)으로 삭제,
+  최대 gc_delete_concurrency개 요청이 다음 page 처리와 병렬로 진행
+- 메모리: page 1개 + in-flight 삭제 요청분 (전체 key 집합을 만들지 않음)
+
+Budget / checkpoint:
+- run(budget)은 page / 삭제 batch 경계마다 budget을 확인하고, 초과 시 진행 위치를 checkpoint로 보관
+- archive: 마지막으로 처리한 key (S3 StartAfter로 재개, in-flight 삭제는 완료 후 중단)
+- container/volume: 남은 orphan (재개 시 유효 workspace 재조회 후 다시 차감)
 """
 
+import asyncio
 import logging
+import time
+from collections.abc import Mapping, Sequence
+from contextlib import aclosing
+from datetime import UTC, datetime
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from codehub.app.config import get_settings
+from codehub.app.metrics.collector import (
+    GC_ARCHIVES_SCANNED,
+    GC_ARCHIVES_TOTAL,
+    GC_DELETE_DURATION,
+    GC_RUNS_TOTAL,
+)
+from codehub.control.coordinator.archive_catalog import ArchiveCatalog
 from codehub.core.interfaces import InstanceController, StorageProvider
 from codehub.core.logging_schema import LogEvent
 from codehub.core.retryable import with_retry
@@ -21,7 +45,11 @@ _settings = get_settings()
 
 
 class GCRunner:
-    """고아 리소스 정리."""
+    """고아 리소스 정리 (archive streaming + batch 삭제, budget 초과 시 checkpoint)."""
+
+    BATCH_SIZE: int = _settings.coordinator.gc_batch_size
+    DELETE_BATCH_SIZE: int = _settings.coordinator.gc_delete_batch_size
+    DELETE_CONCURRENCY: int = _settings.coordinator.gc_delete_concurrency
 
     def __init__(
         self,
@@ -32,164 +60,346 @@ class GCRunner:
         self._conn = conn
         self._storage = storage
         self._ic = ic
+        self._catalog = ArchiveCatalog(conn)
         self._prefix = _settings.runtime.resource_prefix
+        # Archive checkpoint (listed_at None = 새 cycle): 마지막 처리 key + cycle 통계
+        self._listed_at: datetime | None = None
+        self._cursor: str | None = None
+        self._scanned = 0
+        self._deleted = 0
+        self._cycle_elapsed = 0.0
+        self._deletes: set[asyncio.Task[int]] = set()
+        # Checkpoint (None = 새 cycle): 남은 orphan container/volume workspace id
+        self._resource_pending: tuple[set[str], set[str]] | None = None
+
+    @property
+    def resuming(self) -> bool:
+        """이전 run이 budget 초과로 중단되어 checkpoint가 남아 있는지."""
+        return self._listed_at is not None or self._resource_pending is not None
+
+    async def run(self, budget: float | None = None) -> bool:
+        """GC 사이클 실행 (checkpoint가 있으면 이어서).
 
-    async def run(self) -> None:
-        """GC 사이클 실행."""
+        Args:
+            budget: 이번 run의 최대 시간 (초, None = 무제한) - page/batch 경계에서 확인
+
+        Returns:
+            True = cycle 완료, False = budget 초과 (checkpoint 저장, 다음 run에서 재개)
+        """
+        deadline = None if budget is None else time.monotonic() + budget
         try:
-            await self._cleanup_orphan_archives()
-            await self._cleanup_orphan_resources()
+            # container/volume checkpoint = archive 단계는 이미 완료
+            done = self._resource_pending is not None or await self._cleanup_orphan_archives(
+                deadline
+            )
+            done = done and await self._cleanup_orphan_resources(deadline)
         except Exception as e:
+            GC_RUNS_TOTAL.labels(result="failed").inc()
             logger.exception("GC cycle failed: %s", e)
             raise
+        GC_RUNS_TOTAL.labels(result="completed" if done else "checkpointed").inc()
+        return done
 
-    async def _cleanup_orphan_archives(self) -> None:
-        """Archive orphan 정리."""
-        s3_archives = await self._list_archives()
-        if s3_archives is None:
-            return
-        if not s3_archives:
-            logger.debug("No archives in storage")
-            return
+    def _over_budget(self, deadline: float | None) -> bool:
+        return deadline is not None and time.monotonic() >= deadline
 
-        protected = await self._get_protected_paths()
-        orphans = s3_archives - protected
+    async def _cleanup_orphan_archives(self, deadline: float | None = None) -> bool:
+        """Archive orphan 정리 + catalog 보정 (S3 listing page 단위 streaming).
 
-        if not orphans:
-            logger.debug(
-                "No orphans found (storage=%d, protected=%d)",
-                len(s3_archives),
-                len(protected),
-            )
-            return
+        Returns:
+            True = 완료 (listing 실패 포함), False = budget 초과 (cursor checkpoint)
+        """
+        if self._listed_at is None:
+            self._listed_at = datetime.now(UTC)
+            self._cursor = None
+            self._scanned = self._deleted = 0
+            self._cycle_elapsed = 0.0
+            GC_ARCHIVES_SCANNED.set(0)
+        listed_at = self._listed_at
+
+        started = time.monotonic()
+        try:
+            async with aclosing(
+                self._storage.iter_archive_keys(self._prefix, self._cursor)
+            ) as pages:
+                while True:
+                    try:
+                        page = await anext(pages)
+                    except StopAsyncIteration:
+                        break
+                    except Exception as e:
+                        logger.error(
+                            "Failed to list archives from S3, skipping cleanup",
+                            extra={"event": LogEvent.S3_ERROR, "error": str(e)},
+                        )
+                        self._cancel_deletes()
+                        self._listed_at = None
+                        return True
+
+                    await self._process_page(page, listed_at)
+                    if self._over_budget(deadline):
+                        await self._drain_deletes()
+                        self._cycle_elapsed += time.monotonic() - started
+                        logger.info(
+                            "GC budget exceeded, checkpointing archives",
+                            extra={
+                                "event": LogEvent.OPERATION_SUCCESS,
+                                "scanned": self._scanned,
+                                "deleted": self._deleted,
+                                "cursor": self._cursor,
+                            },
+                        )
+                        return False
+            await self._drain_deletes()
+        except BaseException:
+            # DB 오류 / 취소 → in-flight 삭제 취소, 다음 run은 새 cycle
+            self._cancel_deletes()
+            self._listed_at = None
+            raise
+
+        if self._cursor is None:
+            # 빈 listing (bucket 설정 오류 등)으로 catalog 전체 삭제 방지
+            logger.debug("No archives in storage")
+        else:
+            # 마지막 page 이후 범위의 stale catalog 행
+            await self._sync_catalog({}, self._cursor, None, listed_at)
 
-        deleted = await self._delete_archives(orphans)
+        elapsed = self._cycle_elapsed + time.monotonic() - started
+        self._listed_at = None
         logger.info(
-            "Deleted orphan archives",
+            "Archive GC finished",
             extra={
                 "event": LogEvent.OPERATION_SUCCESS,
-                "deleted": deleted,
-                "total": len(orphans),
+                "scanned": self._scanned,
+                "deleted": self._deleted,
+                "keys_per_second": round(self._scanned / elapsed, 1) if elapsed > 0 else None,
             },
         )
+        return True
 
-    async def _cleanup_orphan_resources(self) -> None:
-        """Container/Volume orphan 정리 (Observer 패턴)."""
-        containers = await self._ic.list_all(self._prefix)
-        volumes = await self._storage.list_volumes(self._prefix)
+    async def _process_page(self, page: Mapping[str, datetime], listed_at: datetime) -> None:
+        """Page 1개: 보호 여부 조회 → catalog 보정 → orphan 삭제 요청 제출."""
+        keys = list(page)
+        protected = await self._get_protected_paths(keys)
+        orphans = [key for key in keys if key not in protected]
 
-        container_ids = {c.workspace_id for c in containers}
-        volume_ids = {v.workspace_id for v in volumes}
+        self._scanned += len(keys)
+        GC_ARCHIVES_SCANNED.set(self._scanned)
+        GC_ARCHIVES_TOTAL.labels(result="scanned").inc(len(keys))
+        GC_ARCHIVES_TOTAL.labels(result="protected").inc(len(keys) - len(orphans))
 
-        if not container_ids and not volume_ids:
-            logger.debug("No containers/volumes in system")
-            return
-
-        valid_ws_ids = await self._get_valid_workspace_ids()
+        # orphan은 삭제 대상이므로 catalog에서도 제외 (범위 보정으로 함께 제거)
+        await self._sync_catalog(
+            {key: page[key] for key in keys if key in protected}, self._cursor, keys[-1], listed_at
+        )
+        self._cursor = keys[-1]
 
-        orphan_containers = container_ids - valid_ws_ids
-        orphan_volumes = volume_ids - valid_ws_ids
+        for i in range(0, len(orphans), self.DELETE_BATCH_SIZE):
+            await self._submit_delete(orphans[i : i + self.DELETE_BATCH_SIZE])
+        logger.debug(
+            "GC page processed (keys=%d, orphans=%d, scanned=%d)",
+            len(keys),
+            len(orphans),
+            self._scanned,
+        )
 
-        for ws_id in orphan_containers:
+    async def _sync_catalog(
+        self,
+        storage_keys: Mapping[str, datetime],
+        after: str | None,
+        until: str | None,
+        listed_at: datetime,
+    ) -> None:
+        """Archive catalog의 key 범위를 S3 listing과 일치시킴 (삭제된 archive 제거, 누락 등록)."""
+        try:
+            added, removed = await self._catalog.sync_range(storage_keys, after, until, listed_at)
+            await self._conn.commit()
+        except Exception as e:
             logger.warning(
-                "Deleting orphan container",
-                extra={"event": LogEvent.OPERATION_SUCCESS, "ws_id": ws_id},
+                "Failed to sync archive catalog",
+                extra={"event": LogEvent.DB_ERROR, "error": str(e)},
             )
-            try:
-                await with_retry(
-                    lambda ws_id=ws_id: self._ic.delete(ws_id),
-                    circuit_breaker="external",
-                )
-            except Exception as e:
-                logger.warning(
-                    "Failed to delete container",
-                    extra={"event": LogEvent.OPERATION_FAILED, "ws_id": ws_id, "error": str(e)},
-                )
+            await self._conn.rollback()
+            return
+
+        if added or removed:
+            logger.info(
+                "Archive catalog synced",
+                extra={"event": LogEvent.OPERATION_SUCCESS, "added": added, "removed": removed},
+            )
+
+    async def _submit_delete(self, keys: list[str]) -> None:
+        """삭제 요청을 background로 제출 (in-flight가 DELETE_CONCURRENCY면 하나 끝날 때까지 대기)."""
+        while len(self._deletes) >= self.DELETE_CONCURRENCY:
+            done, _ = await asyncio.wait(self._deletes, return_when=asyncio.FIRST_COMPLETED)
+            self._collect(done)
+        self._deletes.add(asyncio.create_task(self._delete_archives(keys)))
+
+    async def _drain_deletes(self) -> None:
+        if self._deletes:
+            done, _ = await asyncio.wait(self._deletes)
+            self._collect(done)
 
-        for ws_id in orphan_volumes:
+    def _collect(self, done: set[asyncio.Task[int]]) -> None:
+        self._deletes -= done
+        for task in done:
+            self._deleted += task.result()
+
+    def _cancel_deletes(self) -> None:
+        for task in self._deletes:
+            task.cancel()
+        self._deletes.clear()
+
+    async def _delete_archives(self, archive_keys: Sequence[str]) -> int:
+        """Orphan archive bulk 삭제 (요청 실패는 재시도 후 로그만).
+
+        Returns:
+            삭제된 archive 수
+        """
+        start = time.monotonic()
+        try:
+            deleted = await with_retry(
+                lambda: self._storage.delete_archives(archive_keys),
+                circuit_breaker="external",
+            )
+        except Exception as e:
+            GC_ARCHIVES_TOTAL.labels(result="failed").inc(len(archive_keys))
             logger.warning(
-                "Deleting orphan volume",
-                extra={"event": LogEvent.OPERATION_SUCCESS, "ws_id": ws_id},
+                "Failed to delete archives",
+                extra={
+                    "event": LogEvent.OPERATION_FAILED,
+                    "count": len(archive_keys),
+                    "first_key": archive_keys[0],
+                    "error": str(e),
+                },
             )
-            try:
-                await with_retry(
-                    lambda ws_id=ws_id: self._storage.delete_volume(ws_id),
-                    circuit_breaker="external",
-                )
-            except Exception as e:
-                logger.warning(
-                    "Failed to delete volume",
-                    extra={"event": LogEvent.OPERATION_FAILED, "ws_id": ws_id, "error": str(e)},
+            return 0
+        finally:
+            GC_DELETE_DURATION.observe(time.monotonic() - start)
+
+        GC_ARCHIVES_TOTAL.labels(result="deleted").inc(len(deleted))
+        if failed := len(archive_keys) - len(deleted):
+            GC_ARCHIVES_TOTAL.labels(result="failed").inc(failed)
+        return len(deleted)
+
+    async def _cleanup_orphan_resources(self, deadline: float | None = None) -> bool:
+        """Container/Volume orphan 정리 (Observer 패턴).
+
+        Returns:
+            True = 완료, False = budget 초과 (남은 orphan은 checkpoint)
+        """
+        if self._resource_pending is None:
+            containers = await self._ic.list_all(self._prefix)
+            volumes = await self._storage.list_volumes(self._prefix)
+
+            container_ids = {c.workspace_id for c in containers}
+            volume_ids = {v.workspace_id for v in volumes}
+
+            if not container_ids and not volume_ids:
+                logger.debug("No containers/volumes in system")
+                return True
+            self._resource_pending = (container_ids, volume_ids)
+
+        # Listing 후 DB 조회 (Observer 패턴) - 재개 시에도 다시 조회
+        valid_ws_ids = await self._get_valid_workspace_ids()
+        orphan_containers, orphan_volumes = self._resource_pending
+        orphan_containers -= valid_ws_ids
+        orphan_volumes -= valid_ws_ids
+
+        deleted_containers = deleted_volumes = 0
+        while orphan_containers or orphan_volumes:
+            if self._over_budget(deadline):
+                logger.info(
+                    "GC budget exceeded, checkpointing resources",
+                    extra={
+                        "event": LogEvent.OPERATION_SUCCESS,
+                        "containers": len(orphan_containers),
+                        "volumes": len(orphan_volumes),
+                    },
                 )
+                return False
+            containers_batch = sorted(orphan_containers)[: self.BATCH_SIZE]
+            volumes_batch = sorted(orphan_volumes)[: self.BATCH_SIZE - len(containers_batch)]
+            for ws_id in containers_batch:
+                await self._delete_container(ws_id)
+            for ws_id in volumes_batch:
+                await self._delete_volume(ws_id)
+            orphan_containers.difference_update(containers_batch)
+            orphan_volumes.difference_update(volumes_batch)
+            deleted_containers += len(containers_batch)
+            deleted_volumes += len(volumes_batch)
 
-        if orphan_containers or orphan_volumes:
+        self._resource_pending = None
+        if deleted_containers or deleted_volumes:
             logger.info(
                 "Deleted orphan resources",
                 extra={
                     "event": LogEvent.OPERATION_SUCCESS,
-                    "containers": len(orphan_containers),
-                    "volumes": len(orphan_volumes),
+                    "containers": deleted_containers,
+                    "volumes": deleted_volumes,
                 },
             )
+        return True
 
-    async def _list_archives(self) -> set[str] | None:
-        """List all archive keys from storage."""
+    async def _delete_container(self, ws_id: str) -> None:
+        logger.warning(
+            "Deleting orphan container",
+            extra={"event": LogEvent.OPERATION_SUCCESS, "ws_id": ws_id},
+        )
         try:
-            archive_keys = await self._storage.list_all_archive_keys(self._prefix)
-            logger.debug("Found %d archives in storage", len(archive_keys))
-            return archive_keys
+            await with_retry(lambda: self._ic.delete(ws_id), circuit_breaker="external")
         except Exception as e:
-            logger.error(
-                "Failed to list archives from S3, skipping cleanup",
-                extra={"event": LogEvent.S3_ERROR, "error": str(e)},
+            logger.warning(
+                "Failed to delete container",
+                extra={"event": LogEvent.OPERATION_FAILED, "ws_id": ws_id, "error": str(e)},
+            )
+
+    async def _delete_volume(self, ws_id: str) -> None:
+        logger.warning(
+            "Deleting orphan volume",
+            extra={"event": LogEvent.OPERATION_SUCCESS, "ws_id": ws_id},
+        )
+        try:
+            await with_retry(
+                lambda: self._storage.delete_volume(ws_id), circuit_breaker="external"
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to delete volume",
+                extra={"event": LogEvent.OPERATION_FAILED, "ws_id": ws_id, "error": str(e)},
             )
-            return None
 
-    async def _get_protected_paths(self) -> set[str]:
-        """Query DB for protected archive paths."""
+    async def _get_protected_paths(self, archive_keys: Sequence[str]) -> set[str]:
+        """Query DB for protected paths among the given archive keys.
+
+        Page key만 조회 (archive_key = ANY, op_id 경로는 page의 workspace id = ANY).
+        """
+        if not archive_keys:
+            return set()
+        ws_ids = {
+            ws_id for key in archive_keys if (ws_id := self._catalog.workspace_id_of(key))
+        }
         result = await self._conn.execute(
             text("""
-                SELECT DISTINCT path FROM (
-                    SELECT archive_key AS path FROM workspaces
-                    WHERE archive_key IS NOT NULL
-                      AND deleted_at IS NULL
-
-                    UNION ALL
-
-                    SELECT :prefix || id || '/' || op_id || '/home.tar.zst' AS path
-                    FROM workspaces
-                    WHERE deleted_at IS NULL
-                      AND op_id IS NOT NULL
-                ) AS protected WHERE path IS NOT NULL
+                SELECT archive_key AS path FROM workspaces
+                WHERE deleted_at IS NULL
+                  AND archive_key = ANY(CAST(:keys AS text[]))
+
+                UNION
+
+                SELECT :prefix || id || '/' || op_id || '/home.tar.zst' AS path
+                FROM workspaces
+                WHERE deleted_at IS NULL
+                  AND op_id IS NOT NULL
+                  AND id = ANY(CAST(:ws_ids AS text[]))
             """),
-            {"prefix": self._prefix},
+            {"keys": list(archive_keys), "ws_ids": list(ws_ids), "prefix": self._prefix},
         )
 
-        paths = {row[0] for row in result.fetchall()}
-        logger.debug("Found %d protected paths in DB", len(paths))
+        paths = {row[0] for row in result.fetchall()} & set(archive_keys)
+        logger.debug("Found %d protected paths in page", len(paths))
         return paths
 
-    async def _delete_archives(self, archive_keys: set[str]) -> int:
-        """Delete orphan archives via StorageProvider."""
-        deleted = 0
-
-        for key in archive_keys:
-            try:
-                result = await with_retry(
-                    lambda key=key: self._storage.delete_archive(key),
-                    circuit_breaker="external",
-                )
-                if result:
-                    deleted += 1
-                    logger.debug("Deleted: %s", key)
-            except Exception as e:
-                logger.warning(
-                    "Failed to delete archive",
-                    extra={"event": LogEvent.OPERATION_FAILED, "key": key, "error": str(e)},
-                )
-
-        return deleted
-
     async def _get_valid_workspace_ids(self) -> set[str]:
         """Get valid workspace IDs from DB."""
         result = await self._conn.execute(
@@ -2,17 +2,38 @@
 
 RUNNING → STANDBY: standby_ttl 초과 시
 STANDBY → ARCHIVED: archive_ttl 초과 시
+
+Activity (Redis ZSET codehub:activity)가 활동 시각의 live source이고,
+DB last_access_at은 lazy하게만 갱신합니다 (매 run마다 ZSET 전체를 DB로 sync하지 않음):
+1. Drain: score <= cutoff (standby_ttl 이전) member를 Lua pop (chunk 단위, run당 상한)
+   → last_access_at write-back → 이후 standby 후보로 DB에서 조회됨
+2. Periodic: activity_writeback_interval마다 마지막 write-back 이후 활동한 member만 write-back
+3. Standby 후보 (DB last_access_at 기준) 중 ZSET에 cutoff 이후 활동이 있으면 제외 + write-back
+→ run당 비용은 만료/후보 수에 비례 (활동 중인 workspace 수와 무관)
+
+Off-peak archive window (TTL_ARCHIVE_WINDOW):
+- archive_ttl이 지난 STANDBY는 window 밖에서는 대기 (queue), window 안에서만 ARCHIVED 전환
+- window 안 전환량: archive_window_rate (archives/hour) 또는 대기분을 남은 window에 균등 분배
+  (run마다 경과 시간만큼 credit 누적 → 오래 대기한 순서로 credit만큼 전환)
+- 대기 queue (due / projected)와 예상 소진 시간을 gauge로 노출
 """
 
 import logging
+import math
 import time
-from datetime import datetime, timezone
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta, timezone
+from datetime import time as dtime
+from zoneinfo import ZoneInfo
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from codehub.app.config import get_settings
 from codehub.app.metrics.collector import (
+    TTL_ACTIVITY_WRITEBACK_TOTAL,
+    TTL_ARCHIVE_QUEUE,
+    TTL_ARCHIVE_QUEUE_ETA,
     TTL_EXPIRATIONS_TOTAL,
     TTL_SYNC_DURATION,
 )
@@ -28,6 +49,50 @@ _settings = get_settings()
 _channel_config = _settings.redis_channel
 
 
+_DAY = 86400.0
+
+
+@dataclass(frozen=True, slots=True)
+class ArchiveWindow:
+    """Off-peak window - 로컬 시각 [start, end) 매일 반복 (start >= end면 자정을 넘김)."""
+
+    start: dtime
+    end: dtime
+    tz: ZoneInfo
+
+    @classmethod
+    def parse(cls, spec: str, tz: str) -> "ArchiveWindow | None":
+        """ "HH:MM-HH:MM" → ArchiveWindow (빈 값 = window 없음)."""
+        if not spec:
+            return None
+        start, _, end = spec.partition("-")
+        return cls(dtime.fromisoformat(start), dtime.fromisoformat(end), ZoneInfo(tz))
+
+    def bounds(self, now: datetime) -> tuple[datetime, datetime]:
+        """진행 중인 window 또는 다음 window의 (start, end) - UTC."""
+        local = now.astimezone(self.tz)
+        for offset in (-1, 0, 1):
+            day = local.date() + timedelta(days=offset)
+            end_day = day if self.end > self.start else day + timedelta(days=1)
+            start = datetime.combine(day, self.start, self.tz).astimezone(UTC)
+            end = datetime.combine(end_day, self.end, self.tz).astimezone(UTC)
+            if now < end:
+                return start, end
+        raise AssertionError("unreachable: tomorrow's window always ends after now")
+
+    def drain_eta(self, now: datetime, count: int, rate: float) -> float:
+        """count개를 rate (/sec)로 window 안에서만 처리할 때 완료까지 초 (window 밖 시간 포함)."""
+        start, end = self.bounds(now)
+        first = (end - max(start, now)).total_seconds()  # 현재/다음 window의 처리 가능 시간
+        if count <= rate * first:
+            return max(0.0, (start - now).total_seconds()) + count / rate
+        length = (end - start).total_seconds()
+        remaining = count - rate * first
+        full = math.ceil(remaining / (rate * length)) - 1  # 마지막 window 전까지 꽉 채우는 window 수
+        last = remaining - full * rate * length
+        return (end - now).total_seconds() + _DAY - length + full * _DAY + last / rate
+
+
 class TTLRunner:
     """TTL 만료 체크 및 상태 전환."""
 
@@ -42,15 +107,32 @@ class TTLRunner:
         self._publisher = publisher
         self._standby_ttl = _settings.ttl.standby_seconds
         self._archive_ttl = _settings.ttl.archive_seconds
+        self._writeback_interval = _settings.ttl.activity_writeback_interval
+        self._chunk_size = _settings.ttl.activity_chunk_size
+        self._drain_limit = _settings.ttl.activity_drain_limit
+        # Periodic write-back: 마지막 실행 시각 (monotonic) + 이미 반영한 최대 activity score
+        self._last_writeback = 0.0
+        self._writeback_mark = 0.0
+        # Off-peak archive window: window 안에서 누적된 전환 credit + 마지막 체크 시각 (monotonic)
+        self._archive_window = ArchiveWindow.parse(
+            _settings.ttl.archive_window, _settings.ttl.archive_window_timezone
+        )
+        self._archive_rate = _settings.ttl.archive_window_rate / 3600  # archives/sec
+        self._archive_credit = 0.0
+        self._last_archive_check: float | None = None
 
     async def run(self) -> None:
         """TTL 체크 실행."""
         try:
-            # 1. Redis → DB 동기화
-            await self._sync_to_db()
+            cutoff = time.time() - self._standby_ttl
+
+            # 1. 만료된 activity → DB (lazy write-back)
+            await self._drain_expired(cutoff)
+            if time.monotonic() - self._last_writeback >= self._writeback_interval:
+                await self._writeback_recent()
 
             # 2. standby_ttl 체크 (RUNNING → STANDBY)
-            standby_expired = await self._check_standby_ttl()
+            standby_expired = await self._check_standby_ttl(cutoff)
             TTL_EXPIRATIONS_TOTAL.labels(transition="running_to_standby").inc(standby_expired)
 
             # 3. archive_ttl 체크 (STANDBY → ARCHIVED)
@@ -75,23 +157,51 @@ class TTLRunner:
             logger.exception("TTL check failed: %s", e)
             raise
 
-    async def _sync_to_db(self) -> int:
-        """Sync Redis last_access:* to DB last_access_at."""
-        # 1. Redis scan
-        redis_start = time.monotonic()
-        activities = await self._activity.scan_all()
-        TTL_SYNC_DURATION.labels(target="redis").observe(time.monotonic() - redis_start)
+    async def _drain_expired(self, cutoff: float) -> int:
+        """ZSET에서 cutoff 이전 activity를 chunk 단위로 pop → last_access_at write-back.
+
+        Lua pop은 원자적 (pop 사이에 ZADD GT로 갱신된 member는 남음).
+        run당 drain_limit까지만 처리 (나머지는 다음 run).
+        """
+        drained = 0
+        while drained < self._drain_limit:
+            redis_start = time.monotonic()
+            chunk = await self._activity.pop_expired(
+                cutoff, min(self._chunk_size, self._drain_limit - drained)
+            )
+            TTL_SYNC_DURATION.labels(target="redis").observe(time.monotonic() - redis_start)
+            if not chunk:
+                break
+            drained += len(chunk)
+            await self._write_back(chunk, "expired")
+            if len(chunk) < self._chunk_size:
+                break
+        return drained
 
+    async def _writeback_recent(self) -> int:
+        """마지막 write-back 이후 활동한 member만 last_access_at에 반영 (API 표시용, coarse).
+
+        ZSET에는 그대로 남김 (TTL 판정의 live source).
+        """
+        self._last_writeback = time.monotonic()
+        written = 0
+        while True:
+            redis_start = time.monotonic()
+            chunk = await self._activity.get_since(self._writeback_mark, self._chunk_size)
+            TTL_SYNC_DURATION.labels(target="redis").observe(time.monotonic() - redis_start)
+            if not chunk:
+                break
+            written += await self._write_back(dict(chunk), "periodic")
+            self._writeback_mark = chunk[-1][1]
+            if len(chunk) < self._chunk_size:
+                break
+        return written
+
+    async def _write_back(self, activities: dict[str, float], reason: str) -> int:
+        """last_access_at = GREATEST(기존, activity) - 값이 바뀌는 행만 UPDATE."""
         if not activities:
-            TTL_SYNC_DURATION.labels(target="db").observe(0)  # No activities to sync
             return 0
 
-        ws_ids = list(activities.keys())
-        timestamps = [
-            datetime.fromtimestamp(ts, tz=timezone.utc) for ts in activities.values()
-        ]
-
-        # 2. DB bulk update
         db_start = time.monotonic()
         result = await self._conn.execute(
             text("""
@@ -99,36 +209,72 @@ class TTLRunner:
                 SET last_access_at = v.ts
                 FROM unnest(CAST(:ids AS text[]), CAST(:timestamps AS timestamptz[])) AS v(id, ts)
                 WHERE w.id = v.id
+                  AND (w.last_access_at IS NULL OR w.last_access_at < v.ts)
                 RETURNING w.id
             """),
-            {"ids": ws_ids, "timestamps": timestamps},
+            {
+                "ids": list(activities),
+                "timestamps": [
+                    datetime.fromtimestamp(ts, tz=timezone.utc) for ts in activities.values()
+                ],
+            },
         )
         TTL_SYNC_DURATION.labels(target="db").observe(time.monotonic() - db_start)
 
-        updated_ids = [row[0] for row in result.fetchall()]
-        if updated_ids:
-            await self._activity.delete(updated_ids)
+        count = len(result.fetchall())
+        TTL_ACTIVITY_WRITEBACK_TOTAL.labels(reason=reason).inc(count)
+        logger.debug("Wrote back %d workspace activities (%s)", count, reason)
+        return count
 
-        logger.debug("Synced %d workspace activities to DB", len(updated_ids))
-        return len(updated_ids)
+    async def _check_standby_ttl(self, cutoff: float) -> int:
+        """Check standby_ttl for RUNNING workspaces.
 
-    async def _check_standby_ttl(self) -> int:
-        """Check standby_ttl for RUNNING workspaces."""
+        DB last_access_at 기준 후보 → ZSET에 cutoff 이후 활동이 있는 후보는 제외
+        (DB 값이 아직 write-back 전) + write-back (다음 run에서 다시 후보가 되지 않도록).
+        """
         result = await self._conn.execute(
             text("""
-                UPDATE workspaces
-                SET desired_state = :desired_state
+                SELECT id FROM workspaces
                 WHERE phase = :phase
                   AND operation = :operation
                   AND deleted_at IS NULL
                   AND last_access_at IS NOT NULL
                   AND NOW() - last_access_at > make_interval(secs := :standby_ttl)
-                RETURNING id
             """),
             {
                 "phase": Phase.RUNNING.value,
                 "operation": Operation.NONE.value,
                 "standby_ttl": self._standby_ttl,
+            },
+        )
+        candidates = [row[0] for row in result.fetchall()]
+        if not candidates:
+            return 0
+
+        recent = {
+            ws_id: ts
+            for ws_id, ts in (await self._activity.get_many(candidates)).items()
+            if ts > cutoff
+        }
+        await self._write_back(recent, "active")
+        expired = [ws_id for ws_id in candidates if ws_id not in recent]
+        if not expired:
+            return 0
+
+        result = await self._conn.execute(
+            text("""
+                UPDATE workspaces
+                SET desired_state = :desired_state
+                WHERE id = ANY(CAST(:ids AS text[]))
+                  AND phase = :phase
+                  AND operation = :operation
+                  AND deleted_at IS NULL
+                RETURNING id
+            """),
+            {
+                "ids": expired,
+                "phase": Phase.RUNNING.value,
+                "operation": Operation.NONE.value,
                 "desired_state": DesiredState.STANDBY.value,
             },
         )
@@ -146,9 +292,119 @@ class TTLRunner:
         return len(updated_ids)
 
     async def _check_archive_ttl(self) -> int:
-        """Check archive_ttl for STANDBY workspaces."""
+        """Check archive_ttl for STANDBY workspaces (window 설정 시 window 안에서 pacing)."""
+        if self._archive_window is None:
+            return await self._archive_expired(None)
+
+        now = datetime.now(UTC)
+        start, end = self._archive_window.bounds(now)
+        due = await self._archive_queue(now, start, end)
+        if now < start:
+            self._archive_credit = 0.0
+            self._last_archive_check = None
+            return 0
+
+        limit = self._archive_quota(due, (end - now).total_seconds())
+        return await self._archive_expired(limit) if limit else 0
+
+    def _archive_quota(self, due: int, remaining: float) -> int:
+        """이번 run의 전환 수 = 경과 시간 × pace (소수점은 다음 run으로 이월).
+
+        pace: archive_window_rate, 미설정 시 due / 남은 window (window 종료까지 소진).
+        """
+        now = time.monotonic()
+        elapsed = (
+            _settings.coordinator.ttl_interval
+            if self._last_archive_check is None
+            else now - self._last_archive_check
+        )
+        self._last_archive_check = now
+        if not due:
+            self._archive_credit = 0.0
+            return 0
+
+        pace = self._archive_rate or due / max(remaining, 1.0)
+        # run 간격이 길어져도 한 번에 몰리지 않도록 credit 상한 (ttl_interval 2회분, 최소 1)
+        cap = max(1.0, pace * _settings.coordinator.ttl_interval * 2)
+        self._archive_credit = min(self._archive_credit + pace * elapsed, cap)
+        quota = min(due, math.floor(self._archive_credit))
+        self._archive_credit -= quota
+        return quota
+
+    async def _archive_queue(self, now: datetime, start: datetime, end: datetime) -> int:
+        """대기 queue 조회 + gauge 갱신.
+
+        - due: archive_ttl 경과 (지금 전환 대상, 이미 desired ARCHIVED인 행 제외)
+        - projected: 현재/다음 window 종료 시점까지 경과 예정 (due 포함)
+
+        Returns:
+            due 수
+        """
         result = await self._conn.execute(
             text("""
+                SELECT
+                    count(*) FILTER (
+                        WHERE NOW() - phase_changed_at > make_interval(secs := :archive_ttl)
+                    ),
+                    count(*) FILTER (
+                        WHERE NOW() + make_interval(secs := :horizon) - phase_changed_at
+                              > make_interval(secs := :archive_ttl)
+                    )
+                FROM workspaces
+                WHERE phase = :phase
+                  AND operation = :operation
+                  AND desired_state <> :desired_state
+                  AND deleted_at IS NULL
+                  AND phase_changed_at IS NOT NULL
+            """),
+            {
+                "phase": Phase.STANDBY.value,
+                "operation": Operation.NONE.value,
+                "desired_state": DesiredState.ARCHIVED.value,
+                "archive_ttl": self._archive_ttl,
+                "horizon": (end - now).total_seconds(),
+            },
+        )
+        due, projected = result.one()
+
+        if not due:
+            eta = 0.0
+        elif self._archive_rate:
+            eta = self._archive_window.drain_eta(now, due, self._archive_rate)
+        else:
+            eta = (end - now).total_seconds()  # 남은 window에 균등 분배 → window 종료 시 소진
+        TTL_ARCHIVE_QUEUE.labels(state="due").set(due)
+        TTL_ARCHIVE_QUEUE.labels(state="projected").set(projected)
+        TTL_ARCHIVE_QUEUE_ETA.set(eta)
+        logger.debug(
+            "Archive queue (due=%d, projected=%d, eta=%.0fs, window=%s~%s)",
+            due,
+            projected,
+            eta,
+            start.isoformat(),
+            end.isoformat(),
+        )
+        return due
+
+    async def _archive_expired(self, limit: int | None) -> int:
+        """archive_ttl 경과 STANDBY → desired ARCHIVED (limit 지정 시 오래 대기한 순서로)."""
+        limit_clause = (
+            """AND id = ANY(ARRAY(
+                      SELECT id FROM workspaces
+                      WHERE phase = :phase
+                        AND operation = :operation
+                        AND desired_state <> :desired_state
+                        AND deleted_at IS NULL
+                        AND phase_changed_at IS NOT NULL
+                        AND NOW() - phase_changed_at > make_interval(secs := :archive_ttl)
+                      ORDER BY phase_changed_at
+                      LIMIT :limit
+                  ))"""
+            if limit is not None
+            else ""
+        )
+        result = await self._conn.execute(
+            text(f"""
                 UPDATE workspaces
                 SET desired_state = :desired_state
                 WHERE phase = :phase
@@ -156,6 +412,7 @@ class TTLRunner:
                   AND deleted_at IS NULL
                   AND phase_changed_at IS NOT NULL
                   AND NOW() - phase_changed_at > make_interval(secs := :archive_ttl)
+                  {limit_clause}
                 RETURNING id
             """),
             {
@@ -163,6 +420,7 @@ class TTLRunner:
                 "operation": Operation.NONE.value,
                 "archive_ttl": self._archive_ttl,
                 "desired_state": DesiredState.ARCHIVED.value,
+                **({"limit": limit} if limit is not None else {}),
             },
         )
         updated_ids = [row[0] for row in result.fetchall()]
@@ -174,6 +432,7 @@ class TTLRunner:
                     "event": LogEvent.STATE_CHANGED,
                     "ttl_type": "archive",
                     "count": len(updated_ids),
+                    "limit": limit,
                 },
             )
         return len(updated_ids)
@@ -10,46 +10,55 @@ Configuration via CoordinatorConfig (COORDINATOR_ env prefix).
 """
 
 import asyncio
+import json
 import logging
+import random
 import time
 from collections import Counter
-from datetime import UTC, datetime
-from typing import Any
+from contextlib import aclosing
+from datetime import UTC, datetime, timedelta
+from typing import NamedTuple
 from uuid import uuid4
 
-from sqlalchemy import case, func, or_, select, update
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from codehub.app.config import get_settings
 from codehub.app.logging import clear_trace_context, set_trace_id
 from codehub.app.metrics.collector import (
     WC_CAS_FAILURES_TOTAL,
+    WC_CONDITIONS_SOURCE_TOTAL,
     WC_EXECUTE_DURATION,
-    WC_OPERATION_DURATION,
+    WC_OPERATION_CHAIN_TOTAL,
     WC_STAGE_DURATION,
+    WC_WORK_QUEUE_TOTAL,
 )
+from codehub.control.coordinator.archive_catalog import ArchiveCatalog
 from codehub.control.coordinator.base import (
     ChannelSubscriber,
     CoordinatorBase,
     CoordinatorType,
     LeaderElection,
+    encode_wake,
 )
-from codehub.control.coordinator.wc_planner import (
-    PlanAction,
-    PlanInput,
-    needs_execute,
-    plan,
-)
+from codehub.control.coordinator.observation_snapshot import ObservationSnapshot
+from codehub.control.coordinator.wc_actuator import OperationRunner
+from codehub.control.coordinator.wc_executor import OperationExecutor
+from codehub.control.coordinator.wc_inflight import InflightRegistry
+from codehub.control.coordinator.wc_loader import WorkspaceLoader, WorkspaceRow
+from codehub.control.coordinator.wc_plan_table import plan_many
+from codehub.control.coordinator.wc_planner import PlanAction, needs_execute
+from codehub.control.coordinator.wc_work_queue import WorkQueue
 from codehub.core.domain.workspace import (
+    DesiredState,
     ErrorReason,
     Operation,
     Phase,
 )
 from codehub.core.interfaces.instance import InstanceController
 from codehub.core.interfaces.storage import StorageProvider
-from codehub.core.models import Workspace
 from codehub.core.logging_schema import LogEvent
-from codehub.core.retryable import classify_error, with_retry
+from codehub.infra.redis_pubsub import ChannelPublisher
 
 logger = logging.getLogger(__name__)
 
@@ -57,24 +66,36 @@ logger = logging.getLogger(__name__)
 _settings = get_settings()
 _coordinator_config = _settings.coordinator
 _logging_config = _settings.logging
+_channel_config = _settings.redis_channel
 
 
-class WorkspaceController(CoordinatorBase):
+class WorkspaceController(OperationRunner, CoordinatorBase):
     """워크스페이스 상태 수렴 컨트롤러.
 
     Reconcile Loop:
-    1. Load: DB에서 workspace 목록 로드 (conditions 포함)
+    1. Load: DB에서 workspace 목록 로드 (watermark 기반 incremental, 주기적 full pass,
+       targeted wake 시 해당 workspace만) - full pass는 TICK_BUDGET 단위로 나눠 처리
     2. Judge: judge() 호출 → phase 계산
     3. Plan: operation 결정
-    4. Execute: Actuator 호출
-    5. Persist: CAS 패턴으로 DB 저장
+    4. Execute: Actuator 호출 (detached task, InflightRegistry로 추적)
+    5. Persist: CAS 패턴으로 DB 저장 (완료된 operation은 다음 tick에 저장)
+
+    Work queue mode (WORK_QUEUE): 4를 직접 실행하지 않고 operation 시작 CAS와 함께
+    wc_work_queue에 enqueue → 모든 프로세스의 WorkQueueWorker가 claim/실행/완료 CAS.
     """
 
     COORDINATOR_TYPE = CoordinatorType.WC
     WAKE_TARGET = "wc"
 
-    # Operation timeout from config
-    OPERATION_TIMEOUT = _coordinator_config.operation_timeout
+    # Observer sub-condition staleness (관측 실패가 지속된 resource에 의존하는 결정 보류)
+    CONDITION_STALE_AFTER = _settings.observer.stale_after
+    # RESTORING → STARTING을 한 task에서 실행 (desired RUNNING)
+    CHAIN_OPERATIONS = _coordinator_config.wc_chain_operations
+    # Multi-worker 실행 (리더는 enqueue만)
+    WORK_QUEUE = _coordinator_config.wc_work_queue
+    # Full pass time slicing (tick당 처리 시간, chunk 크기)
+    TICK_BUDGET = _coordinator_config.wc_tick_budget
+    PASS_CHUNK_SIZE = _coordinator_config.wc_pass_chunk_size
 
     def __init__(
         self,
@@ -83,20 +104,33 @@ class WorkspaceController(CoordinatorBase):
         subscriber: ChannelSubscriber,
         ic: InstanceController,
         sp: StorageProvider,
+        publisher: ChannelPublisher | None = None,
+        snapshot: ObservationSnapshot | None = None,
     ) -> None:
         super().__init__(conn, leader, subscriber)
         self._ic = ic
         self._sp = sp
+        self._publisher = publisher
+        self._snapshot = snapshot
+        self._loader = WorkspaceLoader(conn)
+        self._catalog = ArchiveCatalog(conn)
+        self._work_queue = WorkQueue(conn)
+        self._executor = OperationExecutor()
+        self._inflight = InflightRegistry()
+        self._prefetches: set[asyncio.Task[None]] = set()
         # Track previous state to log only on changes (reduces noise)
         self._prev_state: tuple[int, int] | None = None
         self._last_heartbeat: float = 0.0
+        # 진행 중 operation 중 가장 이른 timeout 시각 (adaptive polling deadline)
+        self._timeout_at: datetime | None = None
 
     async def reconcile(self) -> None:
         """Reconcile loop: Load → Judge → Plan → Execute → Persist.
 
         Hybrid execution strategy (ADR-012):
         - DB operations: Sequential (asyncpg single connection limit)
-        - External operations (Docker/S3): Parallel for performance
+        - External operations (Docker/S3): Parallel, detached from the tick
+          (slow ARCHIVING/RESTORING do not block other workspaces)
 
         Metrics strategy:
         - Always record metrics (even when idle) for continuous graphs
@@ -111,56 +145,67 @@ class WorkspaceController(CoordinatorBase):
 
             # Stage 1: Load (DB) - always measured
             load_start = time.monotonic()
-            workspaces = await self._load_for_reconcile()
+            targets = self._select_targets()
+            workspaces = await self._load_for_reconcile(targets)
             load_duration = time.monotonic() - load_start
-            load_ms = load_duration * 1000
-            WC_STAGE_DURATION.labels(stage="load").observe(load_duration)
+            if targets is None:
+                self._timeout_at = self._earliest_timeout(workspaces)
 
             # Initialize metrics variables for pass-through structure
-            plan_duration = 0.0
-            plan_ms = 0.0
-            exec_duration = 0.0
-            exec_ms = 0.0
             persist_duration = 0.0
             persist_ms = 0.0
             action_counts: Counter[str] = Counter()
 
-            if workspaces:
-                # Stage 2: Judge + Plan (CPU)
-                plan_start = time.monotonic()
-                plans: list[tuple[Workspace, PlanAction]] = []
-                for ws in workspaces:
-                    action = self._judge_and_plan(ws)
-                    plans.append((ws, action))
-                plan_duration = time.monotonic() - plan_start
-                plan_ms = plan_duration * 1000
-
-                # Stage 3: Execute 병렬 (Docker/S3 - DB 미사용!)
-                exec_start = time.monotonic()
-                results = await asyncio.gather(
-                    *[self._execute_one(ws, action) for ws, action in plans],
-                    return_exceptions=False,  # 개별 예외 처리됨
+            # 완료된 operation 결과 (이전 tick에서 제출한 detached task)
+            completed = self._inflight.drain()
+            # 진행 중 + 방금 완료된 ws는 이번 tick에서 plan 제외 (로드된 row가 완료 전 상태)
+            skip_ids = {ws.id for ws, _ in completed}
+            workspaces = [
+                ws for ws in workspaces if ws.id not in skip_ids and ws.id not in self._inflight
+            ]
+            results: list[tuple[WorkspaceRow, PlanAction]] = list(completed)
+            queued: list[tuple[WorkspaceRow, PlanAction]] = []
+
+            # Stage 2 + 3: Judge/Plan → Execute 제출
+            plan_duration, exec_duration = self._plan_submit(workspaces, results, queued)
+            processed_count = len(workspaces)
+
+            # Full pass slice: 나머지 RUNNING을 id 순 chunk로 (tick budget까지, 이후 다음 tick)
+            if targets is None and self._loader.pass_active:
+                slice_start = time.monotonic()
+                skip_ids.update(ws.id for ws in workspaces)
+                count, slice_plan, slice_exec = await self._reconcile_pass_slice(
+                    reconcile_start + self.TICK_BUDGET, skip_ids, results, queued
                 )
-                exec_duration = time.monotonic() - exec_start
-                exec_ms = exec_duration * 1000
+                processed_count += count
+                plan_duration += slice_plan
+                exec_duration += slice_exec
+                load_duration += time.monotonic() - slice_start - slice_plan - slice_exec
+
+            load_ms = load_duration * 1000
+            plan_ms = plan_duration * 1000
+            exec_ms = exec_duration * 1000
+            WC_STAGE_DURATION.labels(stage="load").observe(load_duration)
 
-                # Stage 4: Persist 순차 (DB - ADR-012 준수)
+            if results or queued:
+                # Stage 4: Persist 일괄 (DB - ADR-012 준수, 단일 UPDATE + 단일 commit)
                 persist_start = time.monotonic()
-                for ws, action in results:
-                    try:
-                        await self._persist(ws, action)
+                try:
+                    await self._persist(results, queued)
+                    for _, action in (*results, *queued):
                         if action.operation != Operation.NONE:
                             action_counts[action.operation.value] += 1
-                    except Exception:
-                        logger.exception(
-                            "Failed to persist",
-                            extra={
-                                "event": LogEvent.OPERATION_FAILED,
-                                "ws_id": ws.id,
-                                "operation": action.operation.value,
-                                "error_class": "transient",
-                            },
-                        )
+                except Exception:
+                    logger.exception(
+                        "Failed to persist",
+                        extra={
+                            "event": LogEvent.OPERATION_FAILED,
+                            "count": len(results),
+                            "error_class": "transient",
+                        },
+                    )
+                    await self._safe_rollback()
+                    self._inflight.settle({})  # checkpoint 대기 task → chain 중단
                 persist_duration = time.monotonic() - persist_start
                 persist_ms = persist_duration * 1000
 
@@ -170,7 +215,6 @@ class WorkspaceController(CoordinatorBase):
             WC_STAGE_DURATION.labels(stage="persist").observe(persist_duration)
 
             # Reconcile summary for logging (metrics removed - logs are sufficient)
-            processed_count = len(workspaces)
             changed_count = sum(action_counts.values())
 
             # Log reconcile result only when state changes OR hourly heartbeat
@@ -184,6 +228,9 @@ class WorkspaceController(CoordinatorBase):
                 "processed": processed_count,
                 "changed": changed_count,
                 "actions": dict(action_counts) if action_counts else {},
+                "load_mode": self._loader.last_mode,
+                "full_pass": self._loader.pass_active,
+                "inflight": len(self._inflight),
                 "duration_ms": duration_ms,
                 "load_ms": load_ms,
                 "plan_ms": plan_ms,
@@ -219,258 +266,510 @@ class WorkspaceController(CoordinatorBase):
         finally:
             clear_trace_context()
 
-    def _judge_and_plan(self, ws: Workspace) -> PlanAction:
-        """Judge + Plan (순수 계산, DB 미사용).
+    def _plan_submit(
+        self,
+        workspaces: list[WorkspaceRow],
+        results: list[tuple[WorkspaceRow, PlanAction]],
+        queued: list[tuple[WorkspaceRow, PlanAction]],
+    ) -> tuple[float, float]:
+        """Stage 2 (Judge + Plan) + Stage 3 (Execute 제출).
 
-        wc_planner.plan()에 위임합니다.
-        """
-        plan_input = PlanInput.from_workspace(ws)
-        return plan(plan_input, timeout_seconds=self.OPERATION_TIMEOUT)
+        실행 불필요 → results, work queue mode → queued, 그 외 detached task 제출.
 
-    def _needs_execute(self, action: PlanAction, ws: Workspace) -> bool:
+        Returns:
+            (plan 소요 시간, execute 제출 소요 시간)
+        """
+        if not workspaces:
+            return 0.0, 0.0
+
+        # Stage 2: Judge + Plan (CPU, transition table lookup)
+        plan_start = time.monotonic()
+        actions = plan_many(
+            workspaces,
+            timeout_seconds=self.OPERATION_TIMEOUT,
+            stale_seconds=self.CONDITION_STALE_AFTER,
+        )
+        plan_duration = time.monotonic() - plan_start
+
+        # Stage 3: Execute 제출 (detached task - tick을 막지 않음, OperationExecutor로 제한)
+        exec_start = time.monotonic()
+        for ws, action in zip(workspaces, actions, strict=True):
+            if not self._needs_execute(action, ws):
+                results.append((ws, action))
+            elif self.WORK_QUEUE:
+                queued.append((ws, action))
+            else:
+                self._inflight.submit(ws, action, self._execute_one(ws, action))
+        return plan_duration, time.monotonic() - exec_start
+
+    async def _reconcile_pass_slice(
+        self,
+        deadline: float,
+        skip_ids: set[str],
+        results: list[tuple[WorkspaceRow, PlanAction]],
+        queued: list[tuple[WorkspaceRow, PlanAction]],
+    ) -> tuple[int, float, float]:
+        """Full pass의 chunk를 deadline (monotonic)까지 plan/execute.
+
+        chunk 사이에 event loop 양보, deadline을 넘기면 중단 → 나머지는 다음 tick에서
+        loader cursor부터 (tick이 slow threshold를 넘지 않고, wake/리더십 확인이 밀리지 않음).
+
+        Returns:
+            (처리한 workspace 수, plan 소요 시간, execute 제출 소요 시간)
+        """
+        snapshot = self._snapshot.view() if self._snapshot is not None else None
+        processed = 0
+        plan_duration = 0.0
+        exec_duration = 0.0
+        async with aclosing(self._loader.stream_pass(self.PASS_CHUNK_SIZE, snapshot)) as chunks:
+            async for chunk in chunks:
+                workspaces = [
+                    ws for ws in chunk if ws.id not in skip_ids and ws.id not in self._inflight
+                ]
+                chunk_plan, chunk_exec = self._plan_submit(workspaces, results, queued)
+                processed += len(workspaces)
+                plan_duration += chunk_plan
+                exec_duration += chunk_exec
+                if time.monotonic() >= deadline:
+                    break
+                await asyncio.sleep(0)  # detached operation task 진행
+        return processed, plan_duration, exec_duration
+
+    def _needs_execute(self, action: PlanAction, ws: WorkspaceRow) -> bool:
         """Execute 필요 여부 판단.
 
         wc_planner.needs_execute()에 위임합니다.
+        실패한 operation의 재시도는 next_attempt_at 도래 전까지 보류 (retry backoff).
         """
-        return needs_execute(action, Operation(ws.operation))
+        if not needs_execute(action, Operation(ws.operation)):
+            return False
+        return not (
+            action.operation == ws.operation
+            and ws.next_attempt_at is not None
+            and ws.next_attempt_at > datetime.now(UTC)
+        )
 
     async def _execute_one(
-        self, ws: Workspace, action: PlanAction
-    ) -> tuple[Workspace, PlanAction]:
+        self, ws: WorkspaceRow, action: PlanAction
+    ) -> tuple[WorkspaceRow, PlanAction]:
         """Execute single workspace operation with retry and error handling.
 
         Early return 패턴으로 실행 불필요 시 즉시 리턴합니다.
+        OperationExecutor 슬롯 획득 후 실행 (timeout은 슬롯 획득 이후부터 측정).
         """
         if not self._needs_execute(action, ws):
             return (ws, action)
 
-        try:
-            await asyncio.wait_for(
-                with_retry(
-                    lambda ws=ws, action=action: self._execute(ws, action),
-                    max_retries=3,
-                    base_delay=1.0,
-                    max_delay=30.0,
-                    circuit_breaker="external",
-                ),
-                timeout=self.OPERATION_TIMEOUT,
-            )
-        except asyncio.TimeoutError:
-            logger.error(
-                "Operation timeout",
-                extra={
-                    "event": LogEvent.OPERATION_TIMEOUT,
-                    "ws_id": ws.id,
-                    "operation": action.operation.value,
-                    "error_class": "timeout",
-                    "timeout_s": self.OPERATION_TIMEOUT,
-                },
-            )
-        except Exception as exc:
-            error_class = classify_error(exc)
-            logger.exception(
-                "Operation failed",
-                extra={
-                    "event": LogEvent.OPERATION_FAILED,
-                    "ws_id": ws.id,
-                    "operation": action.operation.value,
-                    "error_class": error_class,
-                    "retryable": error_class == "transient",
-                },
-            )
+        self._maybe_prefetch_image(ws, action)
+        succeeded = await self._run_operation(ws, action)
+        action.failed = not succeeded
+        await self._wake("observer", ws.id)
+        if succeeded and self._chains_to_start(ws, action):
+            return await self._chain_start(ws, action)
         return (ws, action)
 
-    async def _execute(self, ws: Workspace, action: PlanAction) -> None:
-        """Actuator 호출.
+    def _chains_to_start(self, ws: WorkspaceRow, action: PlanAction) -> bool:
+        """RESTORING 성공 + desired RUNNING → 같은 task에서 STARTING까지 진행."""
+        return (
+            self.CHAIN_OPERATIONS
+            and action.operation == Operation.RESTORING
+            and action.restore_marker is not None
+            and DesiredState(ws.desired_state) == DesiredState.RUNNING
+            and ws.deleted_at is None
+        )
 
-        계약 #8: 순서 보장
-        - ARCHIVING: archive() → delete_volume()
-        - DELETING: delete() → delete_volume()
-        """
-        start = time.perf_counter()
-        try:
-            match action.operation:
-                case Operation.PROVISIONING:
-                    await self._sp.provision(ws.id)
-
-                case Operation.RESTORING:
-                    if ws.archive_key:
-                        await self._sp.restore(ws.id, ws.archive_key)
-                        action.restore_marker = ws.archive_key  # 완료 확인용 marker
-
-                case Operation.STARTING:
-                    await self._ic.start(ws.id, ws.image_ref)
-
-                case Operation.STOPPING:
-                    await self._ic.delete(ws.id)
-
-                case Operation.ARCHIVING:
-                    # 3단계 operation: archive → delete container → delete_volume
-                    # 컨테이너 삭제 추가: Exited 컨테이너도 볼륨 참조하므로 먼저 삭제 필요
-                    op_id = action.op_id or ws.op_id or str(uuid4())
-                    archive_key = await self._sp.archive(ws.id, op_id)
-                    action.archive_key = archive_key
-                    await self._ic.delete(ws.id)  # Exited 컨테이너 정리 (idempotent)
-                    await self._sp.delete_volume(ws.id)
-
-                case Operation.CREATE_EMPTY_ARCHIVE:
-                    op_id = action.op_id or ws.op_id or str(uuid4())
-                    archive_key = await self._sp.create_empty_archive(ws.id, op_id)
-                    action.archive_key = archive_key
-
-                case Operation.DELETING:
-                    # 2단계 operation: delete container → delete_volume (계약 #8)
-                    await self._ic.delete(ws.id)
-                    await self._sp.delete_volume(ws.id)
-        finally:
-            duration = time.perf_counter() - start
-            WC_OPERATION_DURATION.labels(operation=action.operation.name).observe(duration)
+    async def _chain_start(
+        self, ws: WorkspaceRow, action: PlanAction
+    ) -> tuple[WorkspaceRow, PlanAction]:
+        """Operation chaining: RESTORING → (volume 확인) → STARTING.
 
-    async def _persist(self, ws: Workspace, action: PlanAction) -> None:
-        """CAS 패턴으로 DB 저장.
+        1. volume을 로컬 inspect로 확인 (Observer 관측/다음 plan을 기다리지 않음)
+        2. 중간 상태 (STANDBY + STARTING, restore_marker) checkpoint → 다음 tick에서 persist
+           (SSE에 진행 상황 노출, CAS 실패 시 chain 중단)
+        3. persist된 row 기준으로 STARTING 실행 → 완료 판정은 기존처럼 conditions 기준
 
-        CAS 조건: operation = expected_op
-        - 다른 WC 인스턴스가 동시에 처리하면 CAS 실패 → 다음 tick에서 재시도
+        chain 불가 시 RESTORING 결과를 그대로 반환 (기존 경로).
         """
-        ws_op = ws.operation
-        now = datetime.now(UTC)
+        try:
+            volume = await self._sp.inspect_volume(ws.id)
+        except Exception as e:
+            logger.warning(
+                "Volume check failed, not chaining",
+                extra={"event": LogEvent.OPERATION_FAILED, "ws_id": ws.id, "error": str(e)},
+            )
+            volume = None
+        if volume is None:
+            WC_OPERATION_CHAIN_TOTAL.labels(result="volume_missing").inc()
+            return (ws, action)
 
-        # operation 시작 시점 결정
-        if action.operation != Operation.NONE and ws_op == Operation.NONE:
-            # 새 operation 시작
-            op_started_at = now
-            op_id = action.op_id or str(uuid4())
-        elif action.operation == Operation.NONE:
-            # operation 완료 또는 no-op
-            op_started_at = None
-            op_id = ws.op_id  # GC 보호용 유지
-        else:
-            # 진행 중
-            op_started_at = ws.op_started_at
-            op_id = ws.op_id
-
-        # error_count 계산
-        if action.error_reason:
-            error_count = ws.error_count + 1
-        elif action.complete:
-            error_count = 0  # 성공 완료 시 리셋
-        else:
-            error_count = ws.error_count
-
-        # home_ctx 업데이트 (restore_marker 저장)
-        home_ctx: dict | None = None
-        if action.restore_marker:
-            home_ctx = dict(ws.home_ctx) if ws.home_ctx else {}
-            home_ctx["restore_marker"] = action.restore_marker
-
-        success = await self._cas_update(
-            workspace_id=ws.id,
-            expected_operation=Operation(ws_op),
-            phase=action.phase,
-            operation=action.operation,
-            op_started_at=op_started_at,
-            op_id=op_id,
-            archive_key=action.archive_key,
-            error_count=error_count,
-            error_reason=action.error_reason,
-            home_ctx=home_ctx,
-            updated_at=now,
+        step = PlanAction(
+            operation=Operation.STARTING,
+            phase=Phase.STANDBY,
+            op_id=str(uuid4()),
+            complete=True,  # RESTORING 완료 (error_count 리셋)
+            restore_marker=action.restore_marker,
         )
-        # Commit at connection level
-        await self._conn.commit()
+        persisted = self._inflight.checkpoint(ws, step)
+        await self._wake("wc", ws.id)
+        row = await persisted
+        if row is None:
+            WC_OPERATION_CHAIN_TOTAL.labels(result="cas_failed").inc()
+            return (ws, action)
 
-        if not success:
-            WC_CAS_FAILURES_TOTAL.inc()
-            logger.debug(
-                "CAS failed, will retry next tick",
-                extra={"ws_id": ws.id, "expected_op": ws_op.value},
+        WC_OPERATION_CHAIN_TOTAL.labels(result="chained").inc()
+        started = ws._replace(
+            phase=row.phase,
+            operation=row.operation,
+            op_started_at=row.op_started_at,
+            op_id=row.op_id,
+            error_count=row.error_count,
+            error_reason=None,
+            home_ctx=row.home_ctx if row.home_ctx is not None else ws.home_ctx,
+        )
+        start = PlanAction(operation=Operation.STARTING, phase=Phase.STANDBY, op_id=row.op_id)
+        start.failed = not await self._run_operation(started, start)
+        await self._wake("observer", ws.id)
+        return (started, start)  # 성공 시 persist된 row와 동일 → 쓰기 없음
+
+    async def _wake_workers(self) -> None:
+        """Work queue worker 전체 wake (claim 즉시 시도, polling 대기 생략)."""
+        if self._publisher is None:
+            return
+        try:
+            await self._publisher.publish(f"{_channel_config.wake_prefix}:wc-worker")
+        except Exception as e:
+            logger.warning(
+                "Failed to publish worker wake",
+                extra={"event": LogEvent.REDIS_CONNECTION_ERROR, "error": str(e)},
             )
-        elif action.phase != Phase(ws.phase) or action.operation != Operation.NONE:
-            # Log state changes (phase change or operation in progress)
-            logger.info(
-                "State changed",
+
+    async def _wake(self, target: str, ws_id: str) -> None:
+        """Targeted wake (operation 반환 직후 Observer 관측, checkpoint 즉시 persist).
+
+        Observer hot tier가 해당 workspace만 inspect/HEAD로 관측 → conditions 기록
+        → WC targeted wake (다음 full listing tick을 기다리지 않음).
+        """
+        if self._publisher is None:
+            return
+        try:
+            await self._publisher.publish(
+                f"{_channel_config.wake_prefix}:{target}", encode_wake([ws_id])
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to publish wake",
                 extra={
-                    "event": LogEvent.STATE_CHANGED,
-                    "ws_id": ws.id,
-                    "phase_from": ws.phase.value if isinstance(ws.phase, Phase) else ws.phase,
-                    "phase_to": action.phase.value,
-                    "operation": action.operation.value,
+                    "event": LogEvent.REDIS_CONNECTION_ERROR,
+                    "target": target,
+                    "ws_id": ws_id,
+                    "error": str(e),
                 },
             )
 
+    async def _persist(
+        self,
+        results: list[tuple[WorkspaceRow, PlanAction]],
+        queued: list[tuple[WorkspaceRow, PlanAction]] | None = None,
+    ) -> None:
+        """CAS 패턴으로 DB 일괄 저장.
+
+        - 변경 없는 row는 skip (no-op action)
+        - 나머지는 단일 UPDATE ... FROM unnest + 단일 commit
+        - CAS 조건: row별 operation = expected_op
+          다른 WC 인스턴스가 동시에 처리하면 CAS 실패 → 다음 tick에서 재시도
+        - 새로 업로드된 archive는 같은 트랜잭션에서 catalog에 등록하고, retention으로
+          삭제된 과거 generation은 제거 (CAS와 무관하게 S3 상태 기준)
+        - queued (work queue mode): operation 시작 CAS 성공 (또는 진행 중 재시도) 행만
+          같은 트랜잭션에서 enqueue → commit 후 worker wake
+        """
+        now = datetime.now(UTC)
+        pending: list[tuple[WorkspaceRow, PlanAction, CasRow]] = []
+        for ws, action in results:
+            row = build_cas_row(ws, action, now)
+            if row is not None:
+                pending.append((ws, action, row))
+        starts = [(ws, action, build_cas_row(ws, action, now)) for ws, action in queued or ()]
+        pending.extend((ws, action, row) for ws, action, row in starts if row is not None)
+        archived = [
+            (ws.id, action.archive_key) for ws, action in results if action.archive_key is not None
+        ]
+        pruned = [key for _, action in results for key in action.pruned_archives]
+
+        if not pending and not archived and not pruned and not starts:
+            self._inflight.settle({})
+            return
+
+        updated = (
+            await self._cas_update_many([row for _, _, row in pending], now) if pending else set()
+        )
+        await self._catalog.record(archived)
+        await self._catalog.remove(pruned)
+        enqueued = await self._work_queue.enqueue(
+            (ws.id, row.op_id if row is not None else ws.op_id or "", action.operation)
+            for ws, action, row in starts
+            if row is None or ws.id in updated
+        )
+        # Commit at connection level
+        await self._conn.commit()
+        self._inflight.settle({ws.id: row for ws, _, row in pending if ws.id in updated})
+        if enqueued:
+            WC_WORK_QUEUE_TOTAL.labels(result="enqueued").inc(enqueued)
+            await self._wake_workers()
+
+        for ws, action, _ in pending:
+            if ws.id not in updated:
+                WC_CAS_FAILURES_TOTAL.inc()
+                logger.debug(
+                    "CAS failed, will retry next tick",
+                    extra={"ws_id": ws.id, "expected_op": Operation(ws.operation).value},
+                )
+            elif action.phase != Phase(ws.phase) or action.operation != Operation.NONE:
+                # Log state changes (phase change or operation in progress)
+                logger.info(
+                    "State changed",
+                    extra={
+                        "event": LogEvent.STATE_CHANGED,
+                        "ws_id": ws.id,
+                        "phase_from": ws.phase.value if isinstance(ws.phase, Phase) else ws.phase,
+                        "phase_to": action.phase.value,
+                        "operation": action.operation.value,
+                    },
+                )
+
     # =================================================================
     # DB Operations (WC-owned columns, CAS pattern)
     # =================================================================
 
-    async def _load_for_reconcile(self) -> list[Workspace]:
+    def _pending_work(self) -> int:
+        """In-flight operation + 남은 full pass가 backlog.
+
+        완료 결과를 빠르게 persist하고, 남은 pass chunk를 다음 tick에서 바로 이어감.
+        """
+        return len(self._inflight) + (1 if self._loader.pass_active else 0)
+
+    def _next_deadline(self) -> float | None:
+        """다음 in-flight operation timeout까지 남은 초 (마지막 non-targeted load 기준)."""
+        if self._timeout_at is None:
+            return None
+        return (self._timeout_at - datetime.now(UTC)).total_seconds()
+
+    def _earliest_timeout(self, workspaces: list[WorkspaceRow]) -> datetime | None:
+        """진행 중 operation (incremental load에 항상 포함) 중 가장 이른 timeout 시각."""
+        started = [
+            ws.op_started_at
+            for ws in workspaces
+            if ws.operation != Operation.NONE and ws.op_started_at is not None
+        ]
+        if not started:
+            return None
+        return min(started) + timedelta(seconds=self.OPERATION_TIMEOUT)
+
+    def _select_targets(self) -> set[str] | None:
+        """Full pass 진행 중이면 전체 tick (incremental load + 다음 chunk, hot set 포함)."""
+        if self._loader.pass_active:
+            self._prune_hot_ids(time.time())
+            self._count_mode("full")
+            return None
+        return super()._select_targets()
+
+    def _on_leadership_lost(self) -> None:
+        """리더십 상실 → in-flight operation 취소 + watermark 초기화 (재획득 시 full load)."""
+        super()._on_leadership_lost()
+        self._inflight.cancel_all()
+        self._loader.reset()
+        self._timeout_at = None
+
+    async def _cleanup(self) -> None:
+        """종료 시 in-flight operation + image prefetch 취소."""
+        self._inflight.cancel_all()
+        self._cancel_prefetches()
+        await super()._cleanup()
+
+    async def _load_for_reconcile(self, targets: set[str] | None = None) -> list[WorkspaceRow]:
         """Load workspaces needing reconciliation.
 
-        Conditions:
-        - operation != NONE (in progress)
-        - OR phase != desired_state (needs convergence)
-        - OR phase == RUNNING (always check - container may be deleted externally)
+        WorkspaceLoader에 위임합니다 (watermark 기반 incremental + 주기적 full).
+        targets가 있으면 해당 workspace만 로드 (targeted wake).
+        같은 프로세스의 Observer snapshot이 ready면 conditions는 snapshot에서 (아니면 DB).
         """
-        stmt = select(Workspace).where(
-            Workspace.deleted_at.is_(None),
-            or_(
-                Workspace.operation != Operation.NONE.value,
-                Workspace.phase != Workspace.desired_state,
-                Workspace.phase == Phase.RUNNING.value,  # RUNNING은 항상 체크
-            ),
-        )
-        result = await self._conn.execute(stmt)
-        rows = result.mappings().all()
-        return [Workspace.model_validate(dict(row)) for row in rows]
+        snapshot = self._snapshot.view() if self._snapshot is not None else None
+        WC_CONDITIONS_SOURCE_TOTAL.labels(source="db" if snapshot is None else "snapshot").inc()
+        if targets is not None:
+            return await self._loader.load_ids(targets, snapshot)
+        return await self._loader.load(snapshot)
 
-    async def _cas_update(
-        self,
-        workspace_id: str,
-        expected_operation: Operation,
-        phase: Phase,
-        operation: Operation,
-        op_started_at: datetime | None,
-        op_id: str | None,
-        archive_key: str | None,
-        error_count: int,
-        error_reason: ErrorReason | None,
-        home_ctx: dict | None = None,
-        updated_at: datetime | None = None,
-    ) -> bool:
-        """CAS update for WC-owned columns.
-
-        CAS condition: current operation must match expected_operation.
+    async def _cas_update_many(self, rows: list["CasRow"], updated_at: datetime) -> set[str]:
+        """Batched CAS update (cas_update_many, O(1) round-trip).
+
+        Returns:
+            CAS 성공한 workspace id 집합
         """
-        values: dict[str, Any] = {
-            "phase": phase.value,
-            "operation": operation.value,
-            "op_started_at": op_started_at,
-            "op_id": op_id,
-            "error_count": error_count,
-            "error_reason": error_reason.value if error_reason else None,
-            "updated_at": updated_at or datetime.now(UTC),
-            # phase_changed_at: only update when phase actually changes
-            "phase_changed_at": case(
-                (Workspace.phase != phase.value, func.now()),
-                else_=Workspace.phase_changed_at,
-            ),
-        }
-
-        # Only update archive_key if provided
-        if archive_key is not None:
-            values["archive_key"] = archive_key
-
-        # Only update home_ctx if provided (restore_marker 저장용)
-        if home_ctx is not None:
-            values["home_ctx"] = home_ctx
-
-        stmt = (
-            update(Workspace)
-            .where(
-                Workspace.id == workspace_id,
-                Workspace.operation == expected_operation.value,
+        return await cas_update_many(self._conn, rows, updated_at)
+
+
+class CasRow(NamedTuple):
+    """CAS update 1행 (WC-owned columns)."""
+
+    id: str
+    expected_operation: Operation
+    phase: Phase
+    operation: Operation
+    op_started_at: datetime | None
+    op_id: str | None
+    archive_key: str | None  # None = 유지
+    error_count: int
+    error_reason: ErrorReason | None
+    next_attempt_at: datetime | None  # retry backoff (None = 해제)
+    home_ctx: dict | None  # None = 유지
+
+
+async def cas_update_many(
+    conn: AsyncConnection, rows: list[CasRow], updated_at: datetime
+) -> set[str]:
+    """Batched CAS update for WC-owned columns (WC 리더 persist, work queue worker 공용).
+
+    CAS condition (row별): current operation must match expected_operation.
+    archive_key/home_ctx: NULL이면 기존 값 유지.
+    phase_changed_at: phase가 실제로 바뀐 row만 갱신.
+
+    Returns:
+        CAS 성공한 workspace id 집합
+    """
+    result = await conn.execute(
+        text("""
+            UPDATE workspaces AS w
+            SET phase = v.phase,
+                operation = v.operation,
+                op_started_at = v.op_started_at,
+                op_id = v.op_id,
+                archive_key = COALESCE(v.archive_key, w.archive_key),
+                error_count = v.error_count,
+                error_reason = v.error_reason,
+                next_attempt_at = v.next_attempt_at,
+                home_ctx = COALESCE(v.home_ctx, w.home_ctx),
+                updated_at = :updated_at,
+                phase_changed_at = CASE
+                    WHEN w.phase <> v.phase THEN now()
+                    ELSE w.phase_changed_at
+                END
+            FROM unnest(
+                CAST(:ids AS text[]),
+                CAST(:expected_ops AS text[]),
+                CAST(:phases AS text[]),
+                CAST(:operations AS text[]),
+                CAST(:op_started_ats AS timestamptz[]),
+                CAST(:op_ids AS text[]),
+                CAST(:archive_keys AS text[]),
+                CAST(:error_counts AS integer[]),
+                CAST(:error_reasons AS text[]),
+                CAST(:next_attempt_ats AS timestamptz[]),
+                CAST(:home_ctxs AS jsonb[])
+            ) AS v(
+                id, expected_op, phase, operation, op_started_at, op_id,
+                archive_key, error_count, error_reason, next_attempt_at, home_ctx
             )
-            .values(**values)
-            .returning(Workspace.id)
-        )
-        result = await self._conn.execute(stmt)
-        return result.rowcount > 0
+            WHERE w.id = v.id AND w.operation = v.expected_op
+            RETURNING w.id
+        """),
+        {
+            "ids": [r.id for r in rows],
+            "expected_ops": [r.expected_operation.value for r in rows],
+            "phases": [r.phase.value for r in rows],
+            "operations": [r.operation.value for r in rows],
+            "op_started_ats": [r.op_started_at for r in rows],
+            "op_ids": [r.op_id for r in rows],
+            "archive_keys": [r.archive_key for r in rows],
+            "error_counts": [r.error_count for r in rows],
+            "error_reasons": [r.error_reason.value if r.error_reason else None for r in rows],
+            "next_attempt_ats": [r.next_attempt_at for r in rows],
+            "home_ctxs": [json.dumps(r.home_ctx) if r.home_ctx is not None else None for r in rows],
+            "updated_at": updated_at,
+        },
+    )
+    return {row[0] for row in result.fetchall()}
+
+
+def build_cas_row(ws: WorkspaceRow, action: PlanAction, now: datetime) -> CasRow | None:
+    """Plan 결과 → CAS update 값 계산 (순수 함수).
+
+    Returns:
+        CasRow, 또는 로드된 값과 동일하면 None (쓰기 불필요)
+    """
+    ws_op = Operation(ws.operation)
+
+    # operation 시작 시점 결정
+    if action.operation != Operation.NONE and action.operation != ws_op:
+        # 새 operation 시작 (chaining: 진행 중이던 operation에서 바로 전환 포함)
+        op_started_at = now
+        op_id = action.op_id or str(uuid4())
+    elif action.operation == Operation.NONE:
+        # operation 완료 또는 no-op
+        op_started_at = None
+        op_id = ws.op_id  # GC 보호용 유지
+    else:
+        # 진행 중
+        op_started_at = ws.op_started_at
+        op_id = ws.op_id
+
+    # error_count 계산
+    if action.error_reason or action.failed:
+        error_count = ws.error_count + 1
+    elif action.complete:
+        error_count = 0  # 성공 완료 시 리셋
+    else:
+        error_count = ws.error_count
+
+    # retry backoff: 실행 실패 → 새 재시도 시각, 진행 중 → 유지, 그 외 (완료/전환) → 해제
+    if action.failed:
+        next_attempt_at = now + timedelta(seconds=retry_backoff(error_count))
+    elif action.operation != Operation.NONE and action.operation == ws_op:
+        next_attempt_at = ws.next_attempt_at
+    else:
+        next_attempt_at = None
+
+    # home_ctx 업데이트 (restore_marker 저장)
+    home_ctx: dict | None = None
+    if action.restore_marker:
+        home_ctx = dict(ws.home_ctx) if ws.home_ctx else {}
+        home_ctx["restore_marker"] = action.restore_marker
+
+    error_reason = action.error_reason.value if action.error_reason else None
+    unchanged = (
+        action.phase == Phase(ws.phase)
+        and action.operation == ws_op
+        and op_started_at == ws.op_started_at
+        and op_id == ws.op_id
+        and error_count == ws.error_count
+        and error_reason == ws.error_reason
+        and next_attempt_at == ws.next_attempt_at
+        and (action.archive_key is None or action.archive_key == ws.archive_key)
+        and (home_ctx is None or home_ctx == ws.home_ctx)
+    )
+    if unchanged:
+        return None
+
+    return CasRow(
+        id=ws.id,
+        expected_operation=ws_op,
+        phase=action.phase,
+        operation=action.operation,
+        op_started_at=op_started_at,
+        op_id=op_id,
+        archive_key=action.archive_key,
+        error_count=error_count,
+        error_reason=action.error_reason,
+        next_attempt_at=next_attempt_at,
+        home_ctx=home_ctx,
+    )
+
+
+def retry_backoff(error_count: int) -> float:
+    """실패 횟수 기반 재시도 간격 (지수 backoff + jitter, with_retry와 동일 방식).
+
+    base * 2^(n-1) → 50% ~ 150% jitter (동시 실패한 workspace 분산) → 상한 max.
+    상한은 jitter 이후 적용 (상한 도달 후에도 max를 넘지 않고, 50% ~ 100% 범위로 분산).
+    """
+    exponent = min(max(error_count - 1, 0), 30)  # float overflow 방지 (상한에 이미 도달)
+    max_delay = _coordinator_config.wc_retry_backoff_max
+    delay = min(_coordinator_config.wc_retry_backoff_base * (2**exponent), max_delay)
+    return min(delay * (0.5 + random.random()), max_delay)
@@ -0,0 +1,171 @@
+"""WC operation runner - Actuator 호출 (WC 리더 / work queue worker 공용).
+
+Reference: docs/spec/04-control-plane.md (Work queue)
+
+- _run_operation: OperationExecutor 슬롯 + retry + timeout
+- _execute: operation별 InstanceController/StorageProvider 호출 (계약 #8 순서 보장)
+- _maybe_prefetch_image: RUNNING으로 가는 PROVISIONING/RESTORING 중 image pre-pull
+
+Mixin: 사용하는 클래스가 _ic, _sp, _executor, _prefetches를 제공합니다.
+"""
+
+import asyncio
+import logging
+import time
+from uuid import uuid4
+
+from codehub.app.config import get_settings
+from codehub.app.metrics.collector import WC_IMAGE_PREFETCH_TOTAL, WC_OPERATION_DURATION
+from codehub.control.coordinator.wc_executor import OperationExecutor
+from codehub.control.coordinator.wc_loader import WorkspaceRow
+from codehub.control.coordinator.wc_planner import PlanAction
+from codehub.core.domain.workspace import DesiredState, Operation
+from codehub.core.interfaces.instance import InstanceController
+from codehub.core.interfaces.storage import StorageProvider
+from codehub.core.logging_schema import LogEvent
+from codehub.core.retryable import classify_error, with_retry
+
+logger = logging.getLogger(__name__)
+
+_coordinator_config = get_settings().coordinator
+
+
+class OperationRunner:
+    """Actuator 호출 mixin (WorkspaceController, WorkQueueWorker)."""
+
+    # Operation timeout from config
+    OPERATION_TIMEOUT = _coordinator_config.operation_timeout
+    # PROVISIONING/RESTORING 중 image pre-pull (desired RUNNING)
+    IMAGE_PREFETCH = _coordinator_config.wc_image_prefetch
+
+    _ic: InstanceController
+    _sp: StorageProvider
+    _executor: OperationExecutor
+    _prefetches: set[asyncio.Task[None]]
+
+    def _maybe_prefetch_image(self, ws: WorkspaceRow, action: PlanAction) -> None:
+        if self._prefetches_image(ws, action):
+            self._prefetch_image(ws.image_ref)
+
+    def _prefetches_image(self, ws: WorkspaceRow, action: PlanAction) -> bool:
+        """RUNNING으로 가는 PROVISIONING/RESTORING → STARTING 전에 image pull 시작."""
+        return (
+            self.IMAGE_PREFETCH
+            and action.operation in (Operation.PROVISIONING, Operation.RESTORING)
+            and DesiredState(ws.desired_state) == DesiredState.RUNNING
+        )
+
+    def _prefetch_image(self, image_ref: str) -> None:
+        """Background image ensure (IC가 image별로 dedup, STARTING은 진행 중인 pull만 대기)."""
+        task = asyncio.create_task(self._ensure_image(image_ref), name=f"wc-prefetch:{image_ref}")
+        self._prefetches.add(task)
+        task.add_done_callback(self._prefetches.discard)
+
+    async def _ensure_image(self, image_ref: str) -> None:
+        try:
+            await self._ic.ensure_image(image_ref)
+            WC_IMAGE_PREFETCH_TOTAL.labels(result="ok").inc()
+        except Exception as e:
+            # STARTING에서 다시 ensure (실패는 그때 operation 에러로 처리)
+            WC_IMAGE_PREFETCH_TOTAL.labels(result="failed").inc()
+            logger.warning(
+                "Image prefetch failed",
+                extra={"event": LogEvent.OPERATION_FAILED, "image": image_ref, "error": str(e)},
+            )
+
+    def _cancel_prefetches(self) -> None:
+        for task in self._prefetches:
+            task.cancel()
+
+    async def _run_operation(self, ws: WorkspaceRow, action: PlanAction) -> bool:
+        """OperationExecutor 슬롯 + retry + timeout으로 Actuator 호출.
+
+        Returns:
+            성공 여부 (실패는 로그만 - 완료/에러 판정은 다음 plan에서 conditions 기준)
+        """
+        try:
+            async with self._executor.slot(action.operation, ws.owner_user_id):
+                await asyncio.wait_for(
+                    with_retry(
+                        lambda ws=ws, action=action: self._execute(ws, action),
+                        max_retries=3,
+                        base_delay=1.0,
+                        max_delay=30.0,
+                        circuit_breaker="external",
+                    ),
+                    timeout=self.OPERATION_TIMEOUT,
+                )
+        except asyncio.TimeoutError:
+            logger.error(
+                "Operation timeout",
+                extra={
+                    "event": LogEvent.OPERATION_TIMEOUT,
+                    "ws_id": ws.id,
+                    "operation": action.operation.value,
+                    "error_class": "timeout",
+                    "timeout_s": self.OPERATION_TIMEOUT,
+                },
+            )
+            return False
+        except Exception as exc:
+            error_class = classify_error(exc)
+            logger.exception(
+                "Operation failed",
+                extra={
+                    "event": LogEvent.OPERATION_FAILED,
+                    "ws_id": ws.id,
+                    "operation": action.operation.value,
+                    "error_class": error_class,
+                    "retryable": error_class == "transient",
+                },
+            )
+            return False
+        return True
+
+    async def _execute(self, ws: WorkspaceRow, action: PlanAction) -> None:
+        """Actuator 호출.
+
+        계약 #8: 순서 보장
+        - ARCHIVING: archive() → delete_volume()
+        - DELETING: delete() → delete_volume()
+        """
+        start = time.perf_counter()
+        try:
+            match action.operation:
+                case Operation.PROVISIONING:
+                    await self._sp.provision(ws.id)
+
+                case Operation.RESTORING:
+                    if ws.archive_key:
+                        await self._sp.restore(ws.id, ws.archive_key)
+                        action.restore_marker = ws.archive_key  # 완료 확인용 marker
+
+                case Operation.STARTING:
+                    await self._ic.start(ws.id, ws.image_ref)
+
+                case Operation.STOPPING:
+                    await self._ic.delete(ws.id)
+
+                case Operation.ARCHIVING:
+                    # 3단계 operation: archive → delete container → delete_volume
+                    # 컨테이너 삭제 추가: Exited 컨테이너도 볼륨 참조하므로 먼저 삭제 필요
+                    op_id = action.op_id or ws.op_id or str(uuid4())
+                    # 현재 archive_key는 새 key persist 전까지 retention에서 보호
+                    result = await self._sp.archive(ws.id, op_id, retain=ws.archive_key)
+                    action.archive_key = result.archive_key
+                    action.pruned_archives = result.pruned  # persist 시 catalog에서 제거
+                    await self._ic.delete(ws.id)  # Exited 컨테이너 정리 (idempotent)
+                    await self._sp.delete_volume(ws.id)
+
+                case Operation.CREATE_EMPTY_ARCHIVE:
+                    op_id = action.op_id or ws.op_id or str(uuid4())
+                    archive_key = await self._sp.create_empty_archive(ws.id, op_id)
+                    action.archive_key = archive_key
+
+                case Operation.DELETING:
+                    # 2단계 operation: delete container → delete_volume (계약 #8)
+                    await self._ic.delete(ws.id)
+                    await self._sp.delete_volume(ws.id)
+        finally:
+            duration = time.perf_counter() - start
+            WC_OPERATION_DURATION.labels(operation=action.operation.name).observe(duration)
@@ -0,0 +1,190 @@
+"""WC operation executor - 동시성 제한 + 우선순위 + owner 공정성.
+
+Reference: docs/architecture/wc.md
+
+Execute stage의 외부 호출(Docker/S3)을 제한합니다.
+- 전역 동시 실행 제한 + operation별 제한 (storage job 폭주 방지)
+- 우선순위: interactive (STARTING/RESTORING) > normal > background (ARCHIVING/DELETING/...)
+- 같은 우선순위 내에서는 owner_user_id 단위 round-robin (한 사용자가 독점 불가)
+
+Configuration via CoordinatorConfig (COORDINATOR_ env prefix).
+"""
+
+import asyncio
+import time
+from collections import Counter, OrderedDict, deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+
+from codehub.app.config import get_settings
+from codehub.app.metrics.collector import (
+    WC_EXECUTOR_QUEUE_DEPTH,
+    WC_EXECUTOR_WAIT_DURATION,
+)
+from codehub.core.domain.workspace import Operation
+
+_coordinator_config = get_settings().coordinator
+
+
+class Priority(IntEnum):
+    """실행 우선순위 (낮을수록 먼저)."""
+
+    INTERACTIVE = 0  # 사용자가 기다리는 작업
+    NORMAL = 1
+    BACKGROUND = 2  # TTL wave 등 대량 작업
+
+
+OPERATION_PRIORITY: dict[Operation, Priority] = {
+    Operation.STARTING: Priority.INTERACTIVE,
+    Operation.RESTORING: Priority.INTERACTIVE,
+    Operation.PROVISIONING: Priority.NORMAL,
+    Operation.STOPPING: Priority.NORMAL,
+    Operation.ARCHIVING: Priority.BACKGROUND,
+    Operation.DELETING: Priority.BACKGROUND,
+    Operation.CREATE_EMPTY_ARCHIVE: Priority.BACKGROUND,
+}
+
+
+@dataclass(eq=False)
+class _Waiter:
+    operation: Operation
+    owner: str
+    future: asyncio.Future[None]
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class OperationExecutor:
+    """우선순위 + 공정 큐잉 기반 동시성 제한기.
+
+    Usage:
+        async with executor.slot(Operation.STARTING, ws.owner_user_id):
+            await ic.start(...)
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int | None = None,
+        op_limits: dict[str, int] | None = None,
+    ) -> None:
+        self._max_concurrent = max_concurrent or _coordinator_config.wc_max_concurrent_ops
+        limits = _coordinator_config.wc_op_concurrency if op_limits is None else op_limits
+        self._op_limits = {Operation(op): n for op, n in limits.items()}
+        self._running = 0
+        self._running_by_op: Counter[Operation] = Counter()
+        # priority → owner → waiters (OrderedDict 순서 = round-robin 순서)
+        self._queues: dict[Priority, OrderedDict[str, deque[_Waiter]]] = {
+            p: OrderedDict() for p in Priority
+        }
+
+    @property
+    def running(self) -> int:
+        return self._running
+
+    def queued(self, priority: Priority | None = None) -> int:
+        """대기 중인 작업 수."""
+        priorities = [priority] if priority is not None else list(Priority)
+        return sum(
+            len(waiters)
+            for p in priorities
+            for waiters in self._queues[p].values()
+        )
+
+    def free_slots(self, busy: Counter[Operation]) -> dict[Operation, int]:
+        """busy (실행 중 + 대기 중) 기준 operation별로 즉시 시작 가능한 수."""
+        free = max(0, self._max_concurrent - sum(busy.values()))
+        return {
+            op: min(free, max(0, self._op_limits[op] - busy[op])) if op in self._op_limits else free
+            for op in Operation
+            if op != Operation.NONE
+        }
+
+    @asynccontextmanager
+    async def slot(self, operation: Operation, owner: str) -> AsyncIterator[None]:
+        """실행 슬롯 획득 (대기 포함) → 종료 시 반환."""
+        await self._acquire(operation, owner)
+        try:
+            yield
+        finally:
+            self._release(operation)
+
+    def _has_capacity(self, operation: Operation) -> bool:
+        if self._running >= self._max_concurrent:
+            return False
+        limit = self._op_limits.get(operation)
+        return limit is None or self._running_by_op[operation] < limit
+
+    async def _acquire(self, operation: Operation, owner: str) -> None:
+        priority = OPERATION_PRIORITY.get(operation, Priority.NORMAL)
+        waiter = _Waiter(operation, owner, asyncio.get_running_loop().create_future())
+        self._queues[priority].setdefault(owner, deque()).append(waiter)
+        self._dispatch()
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # 슬롯 할당 직후 취소 → 반환
+                self._release(operation)
+            else:
+                self._remove(priority, waiter)
+                self._update_queue_depth()
+            raise
+        finally:
+            WC_EXECUTOR_WAIT_DURATION.labels(priority=priority.name.lower()).observe(
+                time.monotonic() - waiter.enqueued_at
+            )
+
+    def _release(self, operation: Operation) -> None:
+        self._running -= 1
+        self._running_by_op[operation] -= 1
+        self._dispatch()
+
+    def _remove(self, priority: Priority, waiter: _Waiter) -> None:
+        owners = self._queues[priority]
+        waiters = owners.get(waiter.owner)
+        if waiters is None:
+            return
+        try:
+            waiters.remove(waiter)
+        except ValueError:
+            return
+        if not waiters:
+            del owners[waiter.owner]
+
+    def _next_waiter(self) -> tuple[Priority, _Waiter] | None:
+        """다음 실행 대상 선택: 우선순위 → owner round-robin → owner 내 FIFO.
+
+        operation별 제한에 걸린 waiter는 건너뜀 (다른 operation이 먼저 실행).
+        """
+        for priority in Priority:
+            owners = self._queues[priority]
+            for waiters in owners.values():
+                for waiter in waiters:
+                    if self._has_capacity(waiter.operation):
+                        return priority, waiter
+        return None
+
+    def _dispatch(self) -> None:
+        while self._running < self._max_concurrent:
+            selected = self._next_waiter()
+            if selected is None:
+                break
+            priority, waiter = selected
+            self._remove(priority, waiter)
+            owners = self._queues[priority]
+            if waiter.owner in owners:
+                owners.move_to_end(waiter.owner)  # round-robin: 다음 차례는 다른 owner
+            if waiter.future.done():
+                continue  # 취소된 waiter
+            self._running += 1
+            self._running_by_op[waiter.operation] += 1
+            waiter.future.set_result(None)
+        self._update_queue_depth()
+
+    def _update_queue_depth(self) -> None:
+        for priority in Priority:
+            WC_EXECUTOR_QUEUE_DEPTH.labels(priority=priority.name.lower()).set(
+                self.queued(priority)
+            )
@@ -0,0 +1,129 @@
+"""WC in-flight operation registry.
+
+Reference: docs/architecture/wc.md
+
+Execute를 reconcile tick과 분리 (detached task):
+- 느린 operation (ARCHIVING/RESTORING 등)이 tick 전체를 막지 않음
+- key: (workspace_id, op_id) - 같은 workspace에 동시 operation 불가
+- 완료 결과는 다음 tick에서 drain → persist
+- 리더십 상실/종료 시 cancel_all()로 정리
+
+Checkpoint (operation chaining):
+- task가 중간 결과를 checkpoint()로 제출 → 다음 tick에서 drain → persist
+- task는 settle() (persist 결과: CasRow 또는 None = CAS 실패)까지 대기 후 다음 단계 진행
+"""
+
+import asyncio
+import logging
+from collections.abc import Coroutine
+from typing import TYPE_CHECKING, Any
+
+from codehub.app.metrics.collector import WC_INFLIGHT_OPERATIONS
+from codehub.control.coordinator.wc_loader import WorkspaceRow
+from codehub.control.coordinator.wc_planner import PlanAction
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from codehub.control.coordinator.wc import CasRow
+
+type OperationResult = tuple[WorkspaceRow, PlanAction]
+
+
+class InflightRegistry:
+    """진행 중인 operation task 관리."""
+
+    def __init__(self) -> None:
+        self._tasks: dict[tuple[str, str], asyncio.Task[OperationResult]] = {}
+        self._by_ws: dict[str, tuple[str, str]] = {}
+        self._completed: list[OperationResult] = []
+        # ws_id → checkpoint persist 결과 future (pending: drain 전, draining: persist 대기)
+        self._pending: dict[str, asyncio.Future["CasRow | None"]] = {}
+        self._draining: dict[str, asyncio.Future["CasRow | None"]] = {}
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __contains__(self, ws_id: object) -> bool:
+        return ws_id in self._by_ws
+
+    def submit(
+        self,
+        ws: WorkspaceRow,
+        action: PlanAction,
+        coro: Coroutine[Any, Any, OperationResult],
+    ) -> None:
+        """Operation task 등록 (workspace당 1개)."""
+        if ws.id in self._by_ws:
+            coro.close()
+            raise ValueError(f"Operation already in flight: {ws.id}")
+
+        key = (ws.id, action.op_id or ws.op_id or "")
+        task = asyncio.create_task(coro, name=f"wc-op:{ws.id}:{action.operation.value}")
+        self._tasks[key] = task
+        self._by_ws[ws.id] = key
+        task.add_done_callback(lambda t, key=key: self._on_done(key, t))
+        WC_INFLIGHT_OPERATIONS.set(len(self._tasks))
+
+    def _on_done(self, key: tuple[str, str], task: asyncio.Task[OperationResult]) -> None:
+        if self._tasks.get(key) is not task:
+            return  # cancel_all()로 이미 제거됨
+        del self._tasks[key]
+        self._by_ws.pop(key[0], None)
+        WC_INFLIGHT_OPERATIONS.set(len(self._tasks))
+
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            # _execute_one이 예외를 처리하므로 여기 도달하면 버그
+            logger.error("In-flight operation crashed", exc_info=exc, extra={"ws_id": key[0]})
+            return
+        self._completed.append(task.result())
+
+    def drain(self) -> list[OperationResult]:
+        """완료된 operation 결과 + checkpoint 반환 (반환 후 비움)."""
+        completed, self._completed = self._completed, []
+        self._draining.update(self._pending)
+        self._pending = {}
+        return completed
+
+    def checkpoint(self, ws: WorkspaceRow, action: PlanAction) -> asyncio.Future["CasRow | None"]:
+        """진행 중 task의 중간 결과 제출 (다음 tick에서 persist).
+
+        Returns:
+            settle()에서 완료되는 future (persist된 CasRow, CAS 실패/쓰기 오류 시 None)
+        """
+        future: asyncio.Future[CasRow | None] = asyncio.get_running_loop().create_future()
+        self._completed.append((ws, action))
+        self._pending[ws.id] = future
+        return future
+
+    def settle(self, persisted: dict[str, "CasRow"]) -> None:
+        """drain된 checkpoint의 persist 결과 전달 (persisted에 없으면 None)."""
+        draining, self._draining = self._draining, {}
+        for ws_id, future in draining.items():
+            if not future.done():
+                future.set_result(persisted.get(ws_id))
+
+    def cancel_all(self) -> None:
+        """모든 in-flight operation 취소 + 완료 결과 폐기.
+
+        리더십 상실 시 호출: 새 리더가 DB 상태 기준으로 재시도 (Actuator 멱등).
+        """
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
+        self._by_ws.clear()
+        self._completed.clear()
+        for future in (*self._pending.values(), *self._draining.values()):
+            future.cancel()
+        self._pending.clear()
+        self._draining.clear()
+        WC_INFLIGHT_OPERATIONS.set(0)
+
+    async def wait(self) -> None:
+        """모든 in-flight operation 완료 대기."""
+        tasks = list(self._tasks.values())
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,310 @@
+"""WC workspace loading - watermark 기반 incremental load.
+
+Reference: docs/architecture/wc.md
+
+Load 대상:
+- operation != NONE (진행 중) → 매 tick (timeout/완료 체크)
+- phase != desired_state (수렴 필요) → 매 tick
+- phase == RUNNING → watermark 이후 변경분 + full pass (아래)
+
+Full pass (time-sliced):
+- full resync 주기마다 RUNNING 전체를 id 순 cursor로 순회 (server-side cursor, chunk 단위)
+- WC가 tick time budget 안에서 chunk를 처리하고 중단 → 다음 tick에서 cursor부터 이어감
+  (한 tick에 전체 fleet을 materialize하지 않음, wake/리더십 확인이 tick마다 가능)
+- pass 완료 시 소요 시간 기록 (codehub_wc_full_pass_duration_seconds)
+
+Watermark:
+- GREATEST(updated_at, observed_at) 기준 (WC/API 쓰기 + Observer 관측)
+- per-leader 메모리 상태 (리더십 상실 시 reset → 다음 tick full)
+- overlap margin: 늦게 commit된 트랜잭션 누락 방지
+- 주기적 full resync: 누락 보정 (safety net)
+
+Targeted (wake payload의 workspace id):
+- 지정된 id만 로드, watermark/full 주기에 영향 없음
+
+Retry backoff:
+- next_attempt_at 미도래 workspace는 full/incremental load에서 제외 (재시도 대기)
+- targeted load는 포함 (관측 변화로 완료 판정 가능, 재실행은 WC가 보류)
+- full load마다 backoff 중인 workspace 수 집계 (idx_workspaces_next_attempt)
+
+Observation snapshot (in-process, Observer 리더와 같은 프로세스일 때):
+- conditions 컬럼을 조회하지 않고 snapshot 값 사용 (JSONB 전송/파싱 생략)
+
+Configuration via CoordinatorConfig (COORDINATOR_ env prefix).
+"""
+
+import logging
+import time
+from collections.abc import AsyncIterator, Mapping
+from datetime import UTC, datetime, timedelta
+from typing import NamedTuple
+
+from sqlalchemy import and_, func, null, or_, select
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from codehub.app.config import get_settings
+from codehub.app.metrics.collector import (
+    WC_BACKOFF_WORKSPACES,
+    WC_FULL_PASS_DURATION,
+    WC_LOADED_WORKSPACES,
+)
+from codehub.core.domain.workspace import DesiredState, Operation, Phase
+from codehub.core.logging_schema import LogEvent
+from codehub.core.models import Workspace
+
+logger = logging.getLogger(__name__)
+
+_coordinator_config = get_settings().coordinator
+
+
+class WorkspaceRow(NamedTuple):
+    """WC reconcile에 필요한 컬럼만 담은 경량 row.
+
+    Workspace.model_validate() 대신 사용 (narrow projection).
+    """
+
+    id: str
+    owner_user_id: str
+    image_ref: str
+    phase: Phase
+    operation: Operation
+    desired_state: DesiredState
+    conditions: dict
+    archive_key: str | None
+    op_started_at: datetime | None
+    op_id: str | None
+    deleted_at: datetime | None
+    home_ctx: dict | None
+    error_count: int
+    error_reason: str | None
+    next_attempt_at: datetime | None = None
+
+
+# WorkspaceRow 필드 순서와 동일
+_COLUMNS = (
+    Workspace.id,
+    Workspace.owner_user_id,
+    Workspace.image_ref,
+    Workspace.phase,
+    Workspace.operation,
+    Workspace.desired_state,
+    Workspace.conditions,
+    Workspace.archive_key,
+    Workspace.op_started_at,
+    Workspace.op_id,
+    Workspace.deleted_at,
+    Workspace.home_ctx,
+    Workspace.error_count,
+    Workspace.error_reason,
+    Workspace.next_attempt_at,
+)
+
+
+# snapshot 사용 시: conditions 컬럼 제외 (같은 위치에 NULL)
+_COLUMNS_WITHOUT_CONDITIONS = tuple(
+    null().label("conditions") if col is Workspace.conditions else col for col in _COLUMNS
+)
+
+
+def _to_row(row, snapshot: Mapping[str, dict] | None = None) -> WorkspaceRow:
+    return WorkspaceRow(
+        row.id,
+        row.owner_user_id,
+        row.image_ref,
+        Phase(row.phase),
+        Operation(row.operation),
+        DesiredState(row.desired_state),
+        snapshot.get(row.id, {}) if snapshot is not None else row.conditions or {},
+        row.archive_key,
+        row.op_started_at,
+        row.op_id,
+        row.deleted_at,
+        row.home_ctx,
+        row.error_count,
+        row.error_reason,
+        row.next_attempt_at,
+    )
+
+
+def _columns(snapshot: Mapping[str, dict] | None) -> tuple:
+    return _COLUMNS if snapshot is None else _COLUMNS_WITHOUT_CONDITIONS
+
+
+def _needs_convergence():
+    """진행 중 또는 수렴 필요 (항상 로드)."""
+    return or_(
+        Workspace.operation != Operation.NONE.value,
+        Workspace.phase != Workspace.desired_state,
+    )
+
+
+def _attempt_due(now: datetime):
+    """Retry backoff 없음 또는 재시도 시각 도래."""
+    return or_(Workspace.next_attempt_at.is_(None), Workspace.next_attempt_at <= now)
+
+
+class WorkspaceLoader:
+    """Watermark 기반 workspace loader (per-leader 상태).
+
+    Usage:
+        loader = WorkspaceLoader(conn)
+        rows = await loader.load()   # 첫 호출은 full (full pass 시작)
+        async for chunk in loader.stream_pass(500):  # pass_active일 때, 중단 가능
+            ...
+        rows = await loader.load_ids({"ws-1"})  # targeted wake
+        loader.reset()               # 리더십 상실 시
+    """
+
+    FULL_RESYNC_INTERVAL: float = _coordinator_config.wc_full_resync_interval
+    WATERMARK_OVERLAP: float = _coordinator_config.wc_watermark_overlap
+
+    def __init__(self, conn: AsyncConnection) -> None:
+        self._conn = conn
+        self._watermark: datetime | None = None
+        self._last_full: float = 0.0  # monotonic
+        self.last_mode: str = "full"
+        # Full pass: 마지막으로 처리한 id (None = pass 없음, "" = 처음부터)
+        self._cursor: str | None = None
+        self._pass_started: float = 0.0  # monotonic
+        self._pass_rows = 0
+
+    @property
+    def watermark(self) -> datetime | None:
+        return self._watermark
+
+    @property
+    def pass_active(self) -> bool:
+        """Full pass 진행 중 (stream_pass로 이어서 처리할 RUNNING row가 남음)."""
+        return self._cursor is not None
+
+    def reset(self) -> None:
+        """Watermark/cursor 초기화 → 다음 load는 full (새 pass)."""
+        self._watermark = None
+        self._cursor = None
+
+    def _is_full_due(self, now: float) -> bool:
+        if self._watermark is None:
+            return True
+        return now - self._last_full >= self.FULL_RESYNC_INTERVAL
+
+    async def load(self, snapshot: Mapping[str, dict] | None = None) -> list[WorkspaceRow]:
+        """Load workspaces needing reconciliation.
+
+        Watermark는 쿼리 실행 전 시각 기준으로 갱신 (쿼리 중 commit된 변경은 다음 tick에 포함).
+
+        Args:
+            snapshot: observation snapshot (지정 시 conditions는 DB 대신 snapshot에서)
+        """
+        started_at = datetime.now(UTC)
+        now = time.monotonic()
+        full = self._is_full_due(now)
+
+        targets = [_needs_convergence()]
+        if self._watermark is not None:
+            # 변경된 RUNNING (나머지 RUNNING은 full pass가 cursor로 순회)
+            targets.append(
+                and_(
+                    Workspace.phase == Phase.RUNNING.value,
+                    or_(
+                        Workspace.updated_at > self._watermark,
+                        Workspace.observed_at > self._watermark,
+                    ),
+                )
+            )
+
+        if full:
+            await self._count_backoff(started_at)
+            if self._cursor is None:  # 이전 pass가 아직 진행 중이면 이어서
+                self._cursor = ""
+                self._pass_started = now
+                self._pass_rows = 0
+
+        stmt = select(*_columns(snapshot)).where(
+            Workspace.deleted_at.is_(None),
+            or_(*targets),
+            _attempt_due(started_at),
+        )
+        result = await self._conn.execute(stmt)
+        rows = [_to_row(row, snapshot) for row in result.all()]
+
+        self._watermark = started_at - timedelta(seconds=self.WATERMARK_OVERLAP)
+        if full:
+            self._last_full = now
+        self.last_mode = "full" if full else "incremental"
+        WC_LOADED_WORKSPACES.labels(mode=self.last_mode).set(len(rows))
+        return rows
+
+    async def stream_pass(
+        self, chunk_size: int, snapshot: Mapping[str, dict] | None = None
+    ) -> AsyncIterator[list[WorkspaceRow]]:
+        """Full pass의 남은 RUNNING row를 id 순 chunk로 (server-side cursor).
+
+        caller가 중간에 멈추면 (aclosing) 마지막으로 yield한 chunk까지 cursor 반영
+        → 다음 호출은 그 다음 id부터. 끝까지 읽으면 pass 완료.
+        """
+        if self._cursor is None:
+            return
+        stmt = (
+            select(*_columns(snapshot))
+            .where(
+                Workspace.deleted_at.is_(None),
+                Workspace.phase == Phase.RUNNING.value,
+                Workspace.id > self._cursor,
+                _attempt_due(datetime.now(UTC)),
+            )
+            .order_by(Workspace.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        result = await self._conn.stream(stmt)
+        try:
+            async for partition in result.partitions(chunk_size):
+                rows = [_to_row(row, snapshot) for row in partition]
+                self._cursor = rows[-1].id
+                self._pass_rows += len(rows)
+                yield rows
+        finally:
+            await result.close()
+        self._finish_pass()
+
+    def _finish_pass(self) -> None:
+        duration = time.monotonic() - self._pass_started
+        WC_FULL_PASS_DURATION.observe(duration)
+        logger.debug(
+            "Full pass completed",
+            extra={
+                "event": LogEvent.RECONCILE_COMPLETE,
+                "rows": self._pass_rows,
+                "duration_s": round(duration, 3),
+            },
+        )
+        self._cursor = None
+
+    async def _count_backoff(self, now: datetime) -> None:
+        """Backoff 중 (next_attempt_at 미도래) workspace 수 → gauge."""
+        stmt = select(func.count()).where(
+            Workspace.deleted_at.is_(None),
+            Workspace.next_attempt_at > now,
+        )
+        result = await self._conn.execute(stmt)
+        WC_BACKOFF_WORKSPACES.set(result.scalar_one())
+
+    async def load_ids(
+        self, ws_ids: set[str], snapshot: Mapping[str, dict] | None = None
+    ) -> list[WorkspaceRow]:
+        """Targeted load - wake된 workspace만 (상태 무관, watermark 유지)."""
+        rows = await self.fetch_ids(ws_ids, snapshot)
+
+        self.last_mode = "targeted"
+        WC_LOADED_WORKSPACES.labels(mode=self.last_mode).set(len(rows))
+        return rows
+
+    async def fetch_ids(
+        self, ws_ids: set[str], snapshot: Mapping[str, dict] | None = None
+    ) -> list[WorkspaceRow]:
+        """지정 id의 row 조회 (load 상태/metric 갱신 없음 - work queue worker 공용)."""
+        stmt = select(*_columns(snapshot)).where(
+            Workspace.deleted_at.is_(None),
+            Workspace.id.in_(list(ws_ids)),
+        )
+        result = await self._conn.execute(stmt)
+        return [_to_row(row, snapshot) for row in result.all()]
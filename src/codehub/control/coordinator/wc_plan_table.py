@@ -0,0 +1,242 @@
+"""Table-driven Judge + Plan (batch API).
+
+Reference: docs/architecture/wc.md
+
+plan()은 workspace마다 PlanInput/ConditionInput/JudgeInput/JudgeOutput/PlanAction
+pydantic 모델을 생성합니다 (plan stage CPU 대부분이 validation).
+
+plan_many()는 같은 결과를 사전 계산된 transition table로 얻습니다.
+- key: (phase, operation, desired_state, flags)
+  flags = container_ready | volume_ready | archive_ready | deleted | restore_marker_match
+- table은 최초 사용 시 plan() 자체로 전체 입력 공간을 평가해 생성 (단일 진실 원천)
+- 시간 의존 부분(timeout, stale sub-condition)과 op_id 생성만 row별로 처리
+- stale resource가 있으면 해당 ready bit의 모든 조합을 lookup → 일치할 때만 적용 (plan()과 동일)
+"""
+
+import functools
+import itertools
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+from enum import IntEnum
+from typing import NamedTuple, Protocol
+from uuid import uuid4
+
+from codehub.control.coordinator.wc_planner import PlanAction, PlanInput, plan
+from codehub.core.domain.conditions import OBSERVED_AT, observed_stamp
+from codehub.core.domain.workspace import (
+    DesiredState,
+    ErrorReason,
+    Operation,
+    Phase,
+)
+
+# flags bit
+CONTAINER_READY = 1
+VOLUME_READY = 2
+ARCHIVE_READY = 4
+DELETED = 8
+RESTORE_MARKER_MATCH = 16  # restore_marker 없음 또는 archive_key와 일치
+_FLAGS_SPACE = 32
+# stale 판정 대상 resource → ready bit
+_RESOURCE_BITS = (("container", CONTAINER_READY), ("volume", VOLUME_READY), ("archive", ARCHIVE_READY))
+
+
+class OpId(IntEnum):
+    """PlanAction.op_id 생성 규칙."""
+
+    NONE = 0  # op_id 없음
+    NEW = 1  # 새 operation → uuid4
+    KEEP = 2  # 진행 중 → 기존 op_id 유지
+
+
+class Transition(NamedTuple):
+    """Table entry (PlanAction 템플릿)."""
+
+    operation: Operation
+    phase: Phase
+    error_reason: ErrorReason | None
+    complete: bool
+    op_id: OpId
+    timeout_applies: bool  # 진행 중 미완료 → op_started_at 기준 timeout 체크
+
+
+class PlanRow(Protocol):
+    """plan_many() 입력 (WorkspaceRow 호환)."""
+
+    phase: Phase
+    operation: Operation
+    desired_state: DesiredState
+    conditions: dict
+    archive_key: str | None
+    op_started_at: datetime | None
+    op_id: str | None
+    deleted_at: datetime | None
+    home_ctx: dict | None
+
+
+_TIMEOUT_ACTION = (Operation.NONE, Phase.ERROR, ErrorReason.TIMEOUT)
+_PROBE_ARCHIVE_KEY = "probe/archive"
+_PROBE_OP_ID = "probe-op"
+
+
+def _probe_input(
+    phase: Phase,
+    operation: Operation,
+    desired: DesiredState,
+    flags: int,
+    op_started_at: datetime | None,
+) -> PlanInput:
+    marker = _PROBE_ARCHIVE_KEY if flags & RESTORE_MARKER_MATCH else "probe/other"
+    return PlanInput(
+        id="probe",
+        phase=phase,
+        operation=operation,
+        desired_state=desired,
+        conditions={
+            "container": {"running": bool(flags & CONTAINER_READY)},
+            "volume": {"exists": bool(flags & VOLUME_READY)},
+            "archive": {"exists": bool(flags & ARCHIVE_READY)},
+        },
+        archive_key=_PROBE_ARCHIVE_KEY,
+        op_started_at=op_started_at,
+        op_id=_PROBE_OP_ID,
+        deleted_at=datetime.now(UTC) if flags & DELETED else None,
+        home_ctx={"restore_marker": marker},
+    )
+
+
+@functools.cache
+def transitions() -> dict[tuple[Phase, Operation, DesiredState, int], Transition]:
+    """전체 입력 공간에서 plan()을 평가해 transition table 생성 (최초 1회)."""
+    long_ago = datetime(2000, 1, 1, tzinfo=UTC)
+    table: dict[tuple[Phase, Operation, DesiredState, int], Transition] = {}
+    for phase, operation, desired, flags in itertools.product(
+        Phase, Operation, DesiredState, range(_FLAGS_SPACE)
+    ):
+        action = plan(_probe_input(phase, operation, desired, flags, None))
+        # timeout은 진행 중 operation에만 적용
+        timed_out = (
+            plan(_probe_input(phase, operation, desired, flags, long_ago))
+            if operation != Operation.NONE
+            else action
+        )
+
+        if action.op_id is None:
+            op_id = OpId.NONE
+        elif action.op_id == _PROBE_OP_ID:
+            op_id = OpId.KEEP
+        else:
+            op_id = OpId.NEW
+
+        timeout_applies = (
+            (timed_out.operation, timed_out.phase, timed_out.error_reason) == _TIMEOUT_ACTION
+            and (action.operation, action.phase, action.error_reason) != _TIMEOUT_ACTION
+        )
+        table[(phase, operation, desired, flags)] = Transition(
+            action.operation,
+            action.phase,
+            action.error_reason,
+            action.complete,
+            op_id,
+            timeout_applies,
+        )
+    return table
+
+
+def _flags(row: PlanRow) -> int:
+    conditions = row.conditions or {}
+    container = conditions.get("container")
+    volume = conditions.get("volume")
+    archive = conditions.get("archive")
+
+    flags = 0
+    if container and container.get("running"):
+        flags |= CONTAINER_READY
+    if volume and volume.get("exists"):
+        flags |= VOLUME_READY
+    if archive and archive.get("exists"):
+        flags |= ARCHIVE_READY
+    if row.deleted_at is not None:
+        flags |= DELETED
+    marker = row.home_ctx.get("restore_marker") if row.home_ctx else None
+    if not marker or marker == row.archive_key:
+        flags |= RESTORE_MARKER_MATCH
+    return flags
+
+
+def _stale_mask(row: PlanRow, cutoff: str) -> int:
+    observed = (row.conditions or {}).get(OBSERVED_AT)
+    if not observed:
+        return 0
+    mask = 0
+    for resource, bit in _RESOURCE_BITS:
+        ts = observed.get(resource)
+        if ts is not None and ts < cutoff:
+            mask |= bit
+    return mask
+
+
+def _lookup_stale(
+    table: dict[tuple[Phase, Operation, DesiredState, int], Transition],
+    row: PlanRow,
+    flags: int,
+    stale: int,
+) -> Transition:
+    """Stale ready bit의 모든 조합이 같은 결정이면 그 transition, 아니면 hold."""
+    base = flags & ~stale
+    first: Transition | None = None
+    subset = 0
+    while True:  # stale의 모든 부분집합 (0부터)
+        t = table[(row.phase, row.operation, row.desired_state, base | subset)]
+        if first is None:
+            first = t
+        elif (t.operation, t.phase, t.error_reason, t.complete) != (
+            first.operation, first.phase, first.error_reason, first.complete
+        ):
+            if row.operation == Operation.NONE:
+                return Transition(Operation.NONE, row.phase, None, False, OpId.NONE, False)
+            return Transition(row.operation, row.phase, None, False, OpId.KEEP, True)
+        if subset == stale:
+            return first
+        subset = (subset - stale) & stale
+
+
+def plan_many(
+    rows: Iterable[PlanRow],
+    timeout_seconds: float = 300.0,
+    stale_seconds: float | None = None,
+) -> list[PlanAction]:
+    """여러 workspace의 plan() 결과를 table lookup으로 계산.
+
+    plan()과 동일한 PlanAction을 반환 (pydantic 입력 모델 생성 없음).
+    """
+    table = transitions()
+    now = datetime.now(UTC)
+    deadline = now - timedelta(seconds=timeout_seconds)
+    cutoff = (
+        observed_stamp(now - timedelta(seconds=stale_seconds)) if stale_seconds is not None else None
+    )
+    actions: list[PlanAction] = []
+    append = actions.append
+
+    for row in rows:
+        flags = _flags(row)
+        stale = _stale_mask(row, cutoff) if cutoff is not None else 0
+        if stale:
+            t = _lookup_stale(table, row, flags, stale)
+        else:
+            t = table[(row.phase, row.operation, row.desired_state, flags)]
+
+        if t.timeout_applies and row.op_started_at and row.op_started_at < deadline:
+            append(PlanAction(Operation.NONE, Phase.ERROR, ErrorReason.TIMEOUT))
+            continue
+
+        if t.op_id is OpId.NEW:
+            op_id = str(uuid4())
+        elif t.op_id is OpId.KEEP:
+            op_id = row.op_id
+        else:
+            op_id = None
+
+        append(PlanAction(t.operation, t.phase, t.error_reason, None, op_id, t.complete))
+    return actions
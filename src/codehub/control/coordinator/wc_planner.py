@@ -6,14 +6,16 @@ WC의 Plan 로직을 순수 함수로 분리하여 테스트 용이성 향상.
 Judge 결과를 받아 다음 operation을 결정합니다.
 """
 
-from datetime import UTC, datetime
+import itertools
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
 from pydantic import BaseModel
 
 from codehub.control.coordinator.wc_judge import JudgeInput, JudgeOutput, judge
-from codehub.core.domain.conditions import ConditionInput
+from codehub.core.domain.conditions import ConditionInput, observed_stamp, stale_resources
 from codehub.core.domain.workspace import (
     DesiredState,
     ErrorReason,
@@ -22,6 +24,7 @@ from codehub.core.domain.workspace import (
 )
 
 if TYPE_CHECKING:
+    from codehub.control.coordinator.wc_loader import WorkspaceRow
     from codehub.core.models import Workspace
 
 
@@ -45,8 +48,8 @@ class PlanInput(BaseModel):
     model_config = {"frozen": True}
 
     @classmethod
-    def from_workspace(cls, ws: "Workspace") -> "PlanInput":
-        """Workspace 모델에서 생성."""
+    def from_workspace(cls, ws: "Workspace | WorkspaceRow") -> "PlanInput":
+        """Workspace 모델 (또는 WorkspaceRow)에서 생성."""
         return cls(
             id=ws.id,
             phase=Phase(ws.phase),
@@ -61,8 +64,13 @@ class PlanInput(BaseModel):
         )
 
 
-class PlanAction(BaseModel):
-    """Plan 단계 결과."""
+@dataclass(slots=True)
+class PlanAction:
+    """Plan 단계 결과.
+
+    tick마다 workspace 수만큼 생성되므로 pydantic 대신 slotted dataclass
+    (Execute 단계에서 archive_key/restore_marker를 기록하므로 mutable).
+    """
 
     operation: Operation
     phase: Phase
@@ -71,9 +79,19 @@ class PlanAction(BaseModel):
     op_id: str | None = None
     complete: bool = False  # operation 완료 여부
     restore_marker: str | None = None  # restore 완료 확인용 marker
+    failed: bool = False  # Actuator 실행 실패 (retry backoff 대상)
+    pruned_archives: tuple[str, ...] = ()  # retention으로 삭제된 archive key (catalog 제거)
+
+
+# resource → ready 판정 키 (ConditionInput.from_conditions와 동일)
+_READY_KEYS = {"container": "running", "volume": "exists", "archive": "exists"}
 
 
-def plan(input: PlanInput, timeout_seconds: float = 300.0) -> PlanAction:
+def plan(
+    input: PlanInput,
+    timeout_seconds: float = 300.0,
+    stale_seconds: float | None = None,
+) -> PlanAction:
     """operation 결정 로직 (순수 함수).
 
     Cases:
@@ -82,13 +100,27 @@ def plan(input: PlanInput, timeout_seconds: float = 300.0) -> PlanAction:
     3. phase == desired → no-op
     4. phase != desired → operation 선택
 
+    Stale sub-condition (관측 시각이 stale_seconds 이전)이 있으면 보수적으로 판단:
+    stale 값이 무엇이든 같은 결정일 때만 적용, 아니면 hold (see _plan_stale).
+
     Args:
         input: PlanInput
         timeout_seconds: operation timeout (기본 300초)
+        stale_seconds: sub-condition staleness 기준 (None = 판정 안 함)
 
     Returns:
         PlanAction
     """
+    if stale_seconds is not None:
+        cutoff = observed_stamp(datetime.now(UTC) - timedelta(seconds=stale_seconds))
+        stale = stale_resources(input.conditions, cutoff)
+        if stale:
+            return _plan_stale(input, stale, timeout_seconds)
+    return _plan_observed(input, timeout_seconds)
+
+
+def _plan_observed(input: PlanInput, timeout_seconds: float) -> PlanAction:
+    """관측된 conditions를 그대로 신뢰하는 plan."""
     # Judge 호출
     cond_input = ConditionInput.from_conditions(input.conditions)
     judge_input = JudgeInput(
@@ -150,6 +182,44 @@ def needs_execute(action: PlanAction, current_operation: Operation) -> bool:
 # === Private helpers ===
 
 
+def _decision(action: PlanAction) -> tuple:
+    return (action.operation, action.phase, action.error_reason, action.complete)
+
+
+def _plan_stale(
+    input: PlanInput,
+    stale: tuple[str, ...],
+    timeout_seconds: float,
+) -> PlanAction:
+    """Stale resource의 ready 값을 모든 조합으로 대입해 plan.
+
+    모든 조합의 결정이 같으면 그 결정 (stale 값과 무관 - 예: archive만 stale인 STARTING 완료),
+    다르면 hold: 새 operation 시작/완료 판정 없이 현재 phase/operation 유지 (timeout은 적용).
+    """
+    candidates = []
+    for values in itertools.product((False, True), repeat=len(stale)):
+        conditions = dict(input.conditions)
+        for resource, ready in zip(stale, values, strict=True):
+            conditions[resource] = {_READY_KEYS[resource]: ready}
+        candidates.append(
+            _plan_observed(input.model_copy(update={"conditions": conditions}), timeout_seconds)
+        )
+
+    first = candidates[0]
+    if all(_decision(c) == _decision(first) for c in candidates):
+        return first
+
+    if input.operation == Operation.NONE:
+        return PlanAction(operation=Operation.NONE, phase=input.phase)
+    if input.op_started_at and _is_timeout(input.op_started_at, timeout_seconds):
+        return PlanAction(
+            operation=Operation.NONE,
+            phase=Phase.ERROR,
+            error_reason=ErrorReason.TIMEOUT,
+        )
+    return PlanAction(operation=input.operation, phase=input.phase, op_id=input.op_id)
+
+
 def _handle_in_progress(
     input: PlanInput,
     judge_output: JudgeOutput,
@@ -0,0 +1,147 @@
+"""WC work queue - multi-worker operation 실행용 Postgres 큐.
+
+Reference: docs/spec/04-control-plane.md (Work queue)
+
+Writers:
+- WC 리더: operation 시작 CAS와 같은 트랜잭션에서 enqueue() (workspace당 1행)
+- Worker: claim() (FOR UPDATE SKIP LOCKED + lease) → 실행 → complete() (결과 CAS와 같은 트랜잭션)
+
+Lease:
+- claim 시 leased_until = now + lease → 만료된 행은 다른 worker가 다시 claim (worker 장애 복구)
+- worker는 즉시 시작 가능한 수만 claim (operation별 빈 슬롯) → lease가 executor 대기로 소모되지 않음
+- complete()는 자신의 lease인 행만 삭제 → lease를 잃은 worker의 결과는 버림
+
+Queue는 caller의 connection/트랜잭션을 사용합니다 (commit은 caller 책임).
+"""
+
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from codehub.control.coordinator.wc_executor import OPERATION_PRIORITY, Priority
+from codehub.core.domain.workspace import Operation
+
+
+class WorkItem(NamedTuple):
+    """Claim된 work queue 1행."""
+
+    workspace_id: str
+    op_id: str
+    operation: Operation
+
+
+class WorkQueue:
+    """wc_work_queue 테이블 접근."""
+
+    def __init__(self, conn: AsyncConnection) -> None:
+        self._conn = conn
+
+    async def enqueue(self, items: Iterable[tuple[str, str, Operation]]) -> int:
+        """(workspace_id, op_id, operation) 등록 (이미 대기/실행 중이면 무시).
+
+        Returns:
+            새로 등록된 행 수
+        """
+        items = list(items)
+        if not items:
+            return 0
+        result = await self._conn.execute(
+            text("""
+                INSERT INTO wc_work_queue (workspace_id, op_id, operation, priority)
+                SELECT * FROM unnest(
+                    CAST(:ws_ids AS text[]),
+                    CAST(:op_ids AS text[]),
+                    CAST(:operations AS text[]),
+                    CAST(:priorities AS smallint[])
+                )
+                ON CONFLICT (workspace_id) DO NOTHING
+                RETURNING workspace_id
+            """),
+            {
+                "ws_ids": [ws_id for ws_id, _, _ in items],
+                "op_ids": [op_id for _, op_id, _ in items],
+                "operations": [op.value for _, _, op in items],
+                "priorities": [
+                    int(OPERATION_PRIORITY.get(op, Priority.NORMAL)) for _, _, op in items
+                ],
+            },
+        )
+        return len(result.fetchall())
+
+    async def claim(
+        self, worker_id: str, limit: int, slots: dict[Operation, int], lease_seconds: float
+    ) -> list[WorkItem]:
+        """대기 중이거나 lease가 만료된 행을 우선순위 순으로 claim.
+
+        FOR UPDATE SKIP LOCKED: 동시에 claim하는 worker끼리 같은 행을 가져가지 않음.
+
+        Args:
+            limit: 전체 claim 상한
+            slots: operation별 claim 상한 (없는 operation은 claim하지 않음)
+        """
+        slots = {op: n for op, n in slots.items() if n > 0}
+        if limit <= 0 or not slots:
+            return []
+        result = await self._conn.execute(
+            text("""
+                UPDATE wc_work_queue AS q
+                SET worker_id = :worker_id,
+                    leased_until = now() + make_interval(secs => :lease),
+                    attempts = q.attempts + 1
+                FROM (
+                    SELECT c.workspace_id
+                    FROM unnest(CAST(:operations AS text[]), CAST(:slots AS int[])) AS s(op, n)
+                    CROSS JOIN LATERAL (
+                        SELECT workspace_id, priority, enqueued_at FROM wc_work_queue
+                        WHERE operation = s.op
+                          AND (leased_until IS NULL OR leased_until < now())
+                        ORDER BY priority, enqueued_at
+                        LIMIT s.n
+                        FOR UPDATE SKIP LOCKED
+                    ) AS c
+                    ORDER BY c.priority, c.enqueued_at
+                    LIMIT :limit
+                ) AS c
+                WHERE q.workspace_id = c.workspace_id
+                RETURNING q.workspace_id, q.op_id, q.operation
+            """),
+            {
+                "worker_id": worker_id,
+                "lease": lease_seconds,
+                "limit": limit,
+                "operations": [op.value for op in slots],
+                "slots": list(slots.values()),
+            },
+        )
+        return [WorkItem(ws_id, op_id, Operation(op)) for ws_id, op_id, op in result.fetchall()]
+
+    async def complete(self, worker_id: str, ws_ids: Iterable[str]) -> set[str]:
+        """처리 완료 행 삭제 (자신의 lease인 행만).
+
+        Returns:
+            삭제된 workspace id 집합 (없는 id = lease 상실 → 결과 버림)
+        """
+        ids = list(ws_ids)
+        if not ids:
+            return set()
+        result = await self._conn.execute(
+            text("""
+                DELETE FROM wc_work_queue
+                WHERE workspace_id = ANY(CAST(:ws_ids AS text[])) AND worker_id = :worker_id
+                RETURNING workspace_id
+            """),
+            {"ws_ids": ids, "worker_id": worker_id},
+        )
+        return {row[0] for row in result.fetchall()}
+
+    async def release(self, worker_id: str) -> None:
+        """종료 시 자신의 lease 반납 (lease 만료를 기다리지 않고 다른 worker가 claim)."""
+        await self._conn.execute(
+            text("""
+                UPDATE wc_work_queue SET worker_id = NULL, leased_until = NULL
+                WHERE worker_id = :worker_id
+            """),
+            {"worker_id": worker_id},
+        )
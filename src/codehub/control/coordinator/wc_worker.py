@@ -0,0 +1,274 @@
+"""WC work queue worker - 프로세스마다 operation 실행 (리더십 불필요).
+
+Reference: docs/spec/04-control-plane.md (Work queue)
+
+WC 리더 (WORK_QUEUE mode)는 plan + operation 시작 CAS + enqueue만 수행하고,
+모든 control plane 프로세스의 worker가 wc_work_queue를 나눠서 실행합니다.
+→ operation 처리량이 리더 1개의 event loop / DB connection에 묶이지 않음
+
+Tick:
+1. Complete: 완료된 operation 결과 → queue 행 삭제 (자신의 lease만) + 결과 CAS (한 트랜잭션)
+   → Observer targeted wake (완료 판정은 기존처럼 리더의 plan에서 conditions 기준)
+2. Claim: 즉시 시작 가능한 수만큼 (전체 + operation별 빈 슬롯) FOR UPDATE SKIP LOCKED로 claim
+   → row 조회 → detached task로 실행 (executor 대기 중 lease 만료 → 중복 실행 방지)
+   (operation/op_id가 바뀐 행 = stale → 실행 없이 삭제)
+
+ADR-012: worker도 전용 connection 1개 (DB 작업은 tick 안에서 순차, 외부 호출만 병렬).
+Configuration via CoordinatorConfig (COORDINATOR_ env prefix).
+"""
+
+import asyncio
+import logging
+import os
+import socket
+from collections import Counter
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from codehub.app.config import get_settings
+from codehub.app.metrics.collector import WC_WORK_QUEUE_TOTAL
+from codehub.control.coordinator.archive_catalog import ArchiveCatalog
+from codehub.control.coordinator.base import encode_wake
+from codehub.control.coordinator.wc import build_cas_row, cas_update_many
+from codehub.control.coordinator.wc_actuator import OperationRunner
+from codehub.control.coordinator.wc_executor import OperationExecutor
+from codehub.control.coordinator.wc_loader import WorkspaceLoader, WorkspaceRow
+from codehub.control.coordinator.wc_planner import PlanAction
+from codehub.control.coordinator.wc_work_queue import WorkItem, WorkQueue
+from codehub.core.domain.workspace import Operation, Phase
+from codehub.core.interfaces.instance import InstanceController
+from codehub.core.interfaces.storage import StorageProvider
+from codehub.core.logging_schema import LogEvent
+from codehub.infra.redis_pubsub import ChannelPublisher, ChannelSubscriber
+
+logger = logging.getLogger(__name__)
+
+_settings = get_settings()
+_coordinator_config = _settings.coordinator
+_channel_config = _settings.redis_channel
+
+type OperationResult = tuple[WorkspaceRow, PlanAction]
+
+
+class WorkQueueWorker(OperationRunner):
+    """wc_work_queue claim → Actuator 실행 → 완료 CAS.
+
+    Usage:
+        worker = WorkQueueWorker(conn, subscriber, ic, sp, publisher)
+        await worker.run()   # 프로세스당 1개 (WC WORK_QUEUE mode)
+    """
+
+    WAKE_TARGET = "wc-worker"
+    LEASE: float = _coordinator_config.wc_work_lease
+    POLL_INTERVAL: float = _coordinator_config.wc_worker_poll_interval
+    ACTIVE_INTERVAL: float = _coordinator_config.active_interval
+    MAX_CONCURRENT: int = _coordinator_config.wc_max_concurrent_ops
+
+    def __init__(
+        self,
+        conn: AsyncConnection,
+        subscriber: ChannelSubscriber,
+        ic: InstanceController,
+        sp: StorageProvider,
+        publisher: ChannelPublisher | None = None,
+    ) -> None:
+        self._conn = conn
+        self._subscriber = subscriber
+        self._ic = ic
+        self._sp = sp
+        self._publisher = publisher
+        self._queue = WorkQueue(conn)
+        self._loader = WorkspaceLoader(conn)
+        self._catalog = ArchiveCatalog(conn)
+        self._executor = OperationExecutor()
+        self._worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self._tasks: dict[str, asyncio.Task[OperationResult]] = {}
+        self._task_ops: dict[str, Operation] = {}
+        self._prefetches: set[asyncio.Task[None]] = set()
+        self._completed: list[OperationResult] = []
+        self._running = False
+
+    @property
+    def worker_id(self) -> str:
+        return self._worker_id
+
+    async def run(self) -> None:
+        """Main worker loop."""
+        self._running = True
+        logger.info(
+            "Starting work queue worker",
+            extra={"event": LogEvent.APP_STARTED, "worker_id": self._worker_id},
+        )
+        try:
+            await self._subscriber.subscribe(f"{_channel_config.wake_prefix}:{self.WAKE_TARGET}")
+            while self._running:
+                try:
+                    await self.tick()
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    logger.exception(
+                        "Work queue tick failed",
+                        extra={"event": LogEvent.OPERATION_FAILED, "worker_id": self._worker_id},
+                    )
+                    await self._safe_rollback()
+                await self._wait()
+        finally:
+            await self._cleanup()
+
+    async def tick(self) -> None:
+        """Complete (완료 결과 persist) → Claim (빈 슬롯만큼)."""
+        await self._complete()
+        await self._claim()
+
+    async def _claim(self) -> None:
+        busy = Counter(self._task_ops.values())
+        items = await self._queue.claim(
+            self._worker_id,
+            self.MAX_CONCURRENT - len(self._tasks),
+            self._executor.free_slots(busy),
+            self.LEASE,
+        )
+        if not items:
+            await self._conn.commit()  # claim 조회 트랜잭션 종료 (idle in transaction 방지)
+            return
+
+        rows = {
+            ws.id: ws
+            for ws in await self._loader.fetch_ids({item.workspace_id for item in items}, {})
+        }
+        runnable: list[tuple[WorkspaceRow, WorkItem]] = []
+        stale: list[str] = []
+        for item in items:
+            ws = rows.get(item.workspace_id)
+            if ws is None or ws.operation != item.operation or ws.op_id != item.op_id:
+                stale.append(item.workspace_id)  # 완료/취소/삭제된 operation
+            else:
+                runnable.append((ws, item))
+        await self._queue.complete(self._worker_id, stale)
+        await self._conn.commit()
+
+        WC_WORK_QUEUE_TOTAL.labels(result="claimed").inc(len(items))
+        if stale:
+            WC_WORK_QUEUE_TOTAL.labels(result="stale").inc(len(stale))
+        for ws, item in runnable:
+            action = PlanAction(operation=item.operation, phase=Phase(ws.phase), op_id=item.op_id)
+            self._submit(ws, action)
+
+    def _submit(self, ws: WorkspaceRow, action: PlanAction) -> None:
+        task = asyncio.create_task(
+            self._run_one(ws, action), name=f"wc-worker:{ws.id}:{action.operation.value}"
+        )
+        self._tasks[ws.id] = task
+        self._task_ops[ws.id] = action.operation
+        task.add_done_callback(lambda t, ws_id=ws.id: self._on_done(ws_id, t))
+
+    def _on_done(self, ws_id: str, task: asyncio.Task[OperationResult]) -> None:
+        if self._tasks.get(ws_id) is not task:
+            return  # _cleanup()으로 이미 제거됨
+        del self._tasks[ws_id]
+        del self._task_ops[ws_id]
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            # _run_operation이 예외를 처리하므로 여기 도달하면 버그 (lease 만료 후 재시도)
+            logger.error("Work item crashed", exc_info=exc, extra={"ws_id": ws_id})
+            return
+        self._completed.append(task.result())
+
+    async def _run_one(self, ws: WorkspaceRow, action: PlanAction) -> OperationResult:
+        self._maybe_prefetch_image(ws, action)
+        action.failed = not await self._run_operation(ws, action)
+        return (ws, action)
+
+    async def _complete(self) -> None:
+        """완료 결과 → queue 삭제 + CAS (lease를 잃은 결과는 버림) → Observer wake."""
+        results, self._completed = self._completed, []
+        if not results:
+            return
+
+        now = datetime.now(UTC)
+        owned = await self._queue.complete(self._worker_id, [ws.id for ws, _ in results])
+        rows = [
+            row
+            for ws, action in results
+            if ws.id in owned and (row := build_cas_row(ws, action, now)) is not None
+        ]
+        if rows:
+            await cas_update_many(self._conn, rows, now)
+        # S3 상태 기준이므로 lease와 무관하게 catalog 등록 / retention 삭제분 제거
+        await self._catalog.record(
+            (ws.id, action.archive_key) for ws, action in results if action.archive_key is not None
+        )
+        await self._catalog.remove(key for _, action in results for key in action.pruned_archives)
+        await self._conn.commit()
+
+        WC_WORK_QUEUE_TOTAL.labels(result="completed").inc(len(owned))
+        if len(owned) < len(results):
+            WC_WORK_QUEUE_TOTAL.labels(result="lease_lost").inc(len(results) - len(owned))
+        if owned:
+            await self._wake_observer(owned)
+
+    async def _wake_observer(self, ws_ids: set[str]) -> None:
+        if self._publisher is None:
+            return
+        try:
+            await self._publisher.publish(
+                f"{_channel_config.wake_prefix}:observer", encode_wake(ws_ids)
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to publish wake",
+                extra={"event": LogEvent.REDIS_CONNECTION_ERROR, "error": str(e)},
+            )
+
+    async def _wait(self) -> None:
+        """Wake (리더 enqueue) 또는 interval 대기 (실행 중이면 완료 결과를 빠르게 persist)."""
+        interval = self.ACTIVE_INTERVAL if self._tasks or self._completed else self.POLL_INTERVAL
+        try:
+            msg = await self._subscriber.get_message(timeout=interval)
+            while msg is not None:  # 대기 중인 wake 소비 (coalesce)
+                msg = await self._subscriber.get_message(timeout=0.0)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(
+                "Error checking notify",
+                extra={"event": LogEvent.REDIS_CONNECTION_ERROR, "error": str(e)},
+            )
+            await asyncio.sleep(interval)
+
+    async def _safe_rollback(self) -> None:
+        try:
+            await self._conn.rollback()
+        except Exception as e:
+            logger.warning("Rollback failed", extra={"event": LogEvent.DB_ERROR, "error": str(e)})
+
+    async def _cleanup(self) -> None:
+        """종료 시 실행 중 task + image prefetch 취소 + lease 반납 (다른 worker가 즉시 claim)."""
+        logger.info("Cleaning up", extra={"event": LogEvent.APP_STOPPED})
+        for task in self._tasks.values():
+            task.cancel()
+        self._cancel_prefetches()
+        self._tasks.clear()
+        self._task_ops.clear()
+        self._completed.clear()
+        try:
+            await self._safe_rollback()
+            await self._queue.release(self._worker_id)
+            await self._conn.commit()
+        except Exception as e:
+            logger.warning(
+                "Failed to release work leases",
+                extra={"event": LogEvent.DB_ERROR, "error": str(e)},
+            )
+        try:
+            await self._subscriber.unsubscribe()
+        except Exception as e:
+            logger.warning(
+                "Error unsubscribing",
+                extra={"event": LogEvent.REDIS_CONNECTION_ERROR, "error": str(e)},
+            )
@@ -1,10 +1,32 @@
 """Condition input types for Judge.
 
 Reference: docs/architecture_v2/wc-judge.md
+
+Per-resource freshness:
+    conditions["observed_at"] = {"container": ts, "volume": ts, "archive": ts}
+    - Observer가 resource별로 독립 갱신 (관측 실패한 resource는 이전 값 + 이전 ts 유지)
+    - ts는 UTC ISO 8601 초 단위 문자열 → cutoff 문자열과 사전순 비교로 staleness 판정
+    - ts 없음 (관측 시각 기록 이전 row) → fresh 취급
 """
 
+from datetime import UTC, datetime
+
 from pydantic import BaseModel
 
+RESOURCES = ("container", "volume", "archive")
+OBSERVED_AT = "observed_at"
+
+
+def observed_stamp(at: datetime) -> str:
+    """Sub-condition 관측 시각 표기 (UTC, 초 단위)."""
+    return at.astimezone(UTC).isoformat(timespec="seconds")
+
+
+def stale_resources(conditions: dict, cutoff: str) -> tuple[str, ...]:
+    """관측 시각이 cutoff(observed_stamp) 이전인 resource 목록."""
+    observed = conditions.get(OBSERVED_AT) or {}
+    return tuple(r for r in RESOURCES if (ts := observed.get(r)) is not None and ts < cutoff)
+
 
 class ConditionInput(BaseModel):
     """Judge 입력용 condition 요약.
@@ -9,6 +9,7 @@ from codehub.core.interfaces.job import JobResult, JobRunner
 from codehub.core.interfaces.leader import LeaderElection
 from codehub.core.interfaces.storage import (
     ArchiveInfo,
+    ArchiveResult,
     StorageProvider,
     VolumeInfo,
 )
@@ -19,6 +20,7 @@ __all__ = [
     "InstanceController",
     "UpstreamInfo",
     "ArchiveInfo",
+    "ArchiveResult",
     "LeaderElection",
     "StorageProvider",
     "VolumeInfo",
@@ -57,6 +57,18 @@ class InstanceController(ABC):
         """
         ...
 
+    @abstractmethod
+    async def inspect(self, workspace_id: str) -> ContainerInfo | None:
+        """Observe a single workspace container (targeted observation).
+
+        Args:
+            workspace_id: Workspace ID
+
+        Returns:
+            ContainerInfo (list_all()과 동일 형식), or None if container not found
+        """
+        ...
+
     @abstractmethod
     async def start(self, workspace_id: str, image_ref: str) -> None:
         """Start container for workspace.
@@ -67,6 +79,18 @@ class InstanceController(ABC):
         """
         ...
 
+    @abstractmethod
+    async def ensure_image(self, image_ref: str) -> None:
+        """Make image available locally (pull if missing).
+
+        Concurrent calls for the same image share one pull; start() waits on
+        an in-progress pull instead of starting another.
+
+        Args:
+            image_ref: Container image reference
+        """
+        ...
+
     @abstractmethod
     async def delete(self, workspace_id: str) -> None:
         """Delete container for workspace.
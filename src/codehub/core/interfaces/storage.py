@@ -1,6 +1,8 @@
 """Storage provider interface for volume and archive operations."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
 
 from pydantic import BaseModel
 
@@ -28,6 +30,15 @@ class ArchiveInfo(BaseModel):
     model_config = {"frozen": True}
 
 
+class ArchiveResult(BaseModel):
+    """archive() result."""
+
+    archive_key: str
+    pruned: tuple[str, ...] = ()  # retention으로 삭제된 과거 generation key (catalog 제거 대상)
+
+    model_config = {"frozen": True}
+
+
 class StorageProvider(ABC):
     """Interface for storage operations.
 
@@ -74,6 +85,23 @@ class StorageProvider(ABC):
         """
         ...
 
+    @abstractmethod
+    def iter_archive_keys(
+        self, prefix: str, start_after: str | None = None
+    ) -> AsyncIterator[dict[str, datetime]]:
+        """Stream archive keys page by page (storage key order).
+
+        GC용 bounded-memory listing (list_all_archive_keys()의 streaming 버전).
+
+        Args:
+            prefix: Archive key prefix (e.g., "ws-")
+            start_after: 이 key 다음부터 listing (checkpoint 재개)
+
+        Yields:
+            Page별 {archive key: 생성 시각 (LastModified)} (key 순 정렬, 빈 page는 생략)
+        """
+        ...
+
     @abstractmethod
     async def provision(self, workspace_id: str) -> None:
         """Create new volume for workspace.
@@ -97,15 +125,19 @@ class StorageProvider(ABC):
         ...
 
     @abstractmethod
-    async def archive(self, workspace_id: str, op_id: str) -> str:
-        """Archive volume and return archive_key.
+    async def archive(self, workspace_id: str, op_id: str, retain: str | None = None) -> ArchiveResult:
+        """Archive volume and return archive_key with retention-pruned keys.
+
+        성공 후 archive retention 정책을 적용합니다 (설정 시, best-effort).
 
         Args:
             workspace_id: Workspace ID
             op_id: Operation ID for idempotency (archive_key = {workspace_id}/{op_id}/home.tar.zst)
+            retain: retention과 무관하게 유지할 archive key (DB의 현재 archive_key -
+                새 key가 persist되기 전까지 restore 대상)
 
         Returns:
-            Archive key for the created archive
+            ArchiveResult (생성된 archive_key + retention으로 삭제된 key)
         """
         ...
 
@@ -130,6 +162,30 @@ class StorageProvider(ABC):
         """
         ...
 
+    @abstractmethod
+    async def inspect_volume(self, workspace_id: str) -> VolumeInfo | None:
+        """Observe a single workspace volume (targeted observation).
+
+        Args:
+            workspace_id: Workspace ID
+
+        Returns:
+            VolumeInfo (list_volumes()와 동일 형식), or None if volume not found
+        """
+        ...
+
+    @abstractmethod
+    async def head_archive(self, archive_key: str) -> ArchiveInfo | None:
+        """Observe a single archive by key (HEAD, no listing).
+
+        Args:
+            archive_key: Full archive path (e.g., "ws-xxx/op-id/home.tar.zst")
+
+        Returns:
+            ArchiveInfo (list_archives()와 동일 형식), or None if object not found
+        """
+        ...
+
     @abstractmethod
     async def create_empty_archive(self, workspace_id: str, op_id: str) -> str:
         """Create empty archive and return archive_key.
@@ -147,6 +203,8 @@ class StorageProvider(ABC):
     async def delete_archive(self, archive_key: str) -> bool:
         """Delete archive by key.
 
+        archive_catalog는 갱신하지 않음 (DB 트랜잭션을 가진 caller 책임).
+
         Args:
             archive_key: Full archive path (e.g., "ws-xxx/op-id/home.tar.zst")
 
@@ -155,6 +213,23 @@ class StorageProvider(ABC):
         """
         ...
 
+    @abstractmethod
+    async def delete_archives(self, archive_keys: Sequence[str]) -> set[str]:
+        """Delete archives (and meta files) in bulk requests.
+
+        archive_catalog는 갱신하지 않음 (GC는 page 범위 보정, retention은 ArchiveResult.pruned).
+
+        Args:
+            archive_keys: Full archive paths
+
+        Returns:
+            삭제된 archive key 집합 (개별 실패는 제외)
+
+        Raises:
+            요청 자체가 실패하면 예외 (caller가 재시도)
+        """
+        ...
+
     @abstractmethod
     async def close(self) -> None:
         """Close provider and release resources."""
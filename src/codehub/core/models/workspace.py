@@ -55,6 +55,9 @@ class Workspace(SQLModel, table=True):
     )
     error_reason: str | None = None  # ErrorReason enum value
     error_count: int = Field(default=0)
+    next_attempt_at: datetime | None = Field(
+        default=None, sa_column=Column(DateTime(timezone=True))
+    )  # retry backoff (실패한 operation 재시도 시각)
 
     created_at: datetime = Field(sa_column=Column(DateTime(timezone=True), nullable=False))
     updated_at: datetime = Field(sa_column=Column(DateTime(timezone=True), nullable=False))
@@ -102,4 +105,10 @@ class Workspace(SQLModel, table=True):
             "phase",
             postgresql_where="deleted_at IS NULL AND phase = 'ERROR'",
         ),
+        # Retry backoff (WC load 제외 + backoff gauge)
+        Index(
+            "idx_workspaces_next_attempt",
+            "next_attempt_at",
+            postgresql_where="deleted_at IS NULL AND next_attempt_at IS NOT NULL",
+        ),
     )
@@ -6,8 +6,10 @@ Supports both Unix socket and TCP (docker-proxy) connections.
 Configuration via DockerConfig (DOCKER_ env prefix).
 """
 
+import json
 import logging
 import os
+from collections.abc import AsyncIterator
 
 import httpx
 from pydantic import BaseModel
@@ -464,6 +466,39 @@ class VolumeAPI:
         )
 
 
+# =============================================================================
+# Event API
+# =============================================================================
+
+
+class EventAPI:
+    """Docker Engine /events stream."""
+
+    def __init__(self, client: DockerClient | None = None) -> None:
+        self._docker = client or get_docker_client()
+
+    async def stream(self, filters: dict | None = None) -> AsyncIterator[dict]:
+        """Stream events (long-lived, newline-delimited JSON).
+
+        Args:
+            filters: Docker API filters (e.g., {"type": ["container", "volume"]})
+
+        Yields:
+            Event dicts (Type, Action, Actor, time)
+        """
+        client = await self._docker.get()
+        params: dict = {}
+        if filters:
+            params["filters"] = json.dumps(filters)
+        # Read timeout 없음 (idle 시 이벤트가 오지 않음)
+        timeout = httpx.Timeout(_docker_config.api_timeout, read=None)
+        async with client.stream("GET", "/events", params=params, timeout=timeout) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                if line:
+                    yield json.loads(line)
+
+
 # =============================================================================
 # Image API
 # =============================================================================
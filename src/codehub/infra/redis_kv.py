@@ -9,6 +9,7 @@ Advantages over Key-Value:
 - O(1) RTT for bulk operations (vs N+1 with SCAN+GET)
 - ZADD GT prevents timestamp rollback (race condition fix)
 - ZRANGEBYSCORE for efficient TTL queries
+- Lua pop (ZRANGEBYSCORE + ZREM) drains expired members atomically in bounded chunks
 """
 
 import logging
@@ -22,6 +23,15 @@ logger = logging.getLogger(__name__)
 # ZSET key name (single key for all workspaces)
 ACTIVITY_KEY = "codehub:activity"
 
+# score <= cutoff인 member를 최대 limit개 조회 + 삭제 (원자적 - 사이에 ZADD GT로 갱신된 member는 유지)
+_POP_EXPIRED_LUA = """
+local items = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'WITHSCORES', 'LIMIT', 0, ARGV[2])
+for i = 1, #items, 2 do
+    redis.call('ZREM', KEYS[1], items[i])
+end
+return items
+"""
+
 
 class ActivityStore:
     """Manages workspace activity timestamps in Redis ZSET.
@@ -94,6 +104,61 @@ class ActivityStore:
         )
 
 
+    async def pop_expired(self, cutoff_timestamp: float, limit: int) -> dict[str, float]:
+        """Atomically remove and return up to limit members with timestamp <= cutoff.
+
+        Args:
+            cutoff_timestamp: Maximum timestamp (inclusive).
+            limit: Maximum number of members per call (bounded Lua execution).
+
+        Returns:
+            Mapping of workspace_id -> timestamp (lowest timestamps first).
+        """
+        items = await self._client.eval(
+            _POP_EXPIRED_LUA, 1, ACTIVITY_KEY, cutoff_timestamp, limit
+        )
+        return {items[i]: float(items[i + 1]) for i in range(0, len(items), 2)}
+
+    async def get_since(
+        self, min_timestamp: float, limit: int
+    ) -> list[tuple[str, float]]:
+        """Get up to limit members with timestamp > min_timestamp (ascending).
+
+        Page through by passing the last returned timestamp as the next min_timestamp.
+
+        Args:
+            min_timestamp: Minimum timestamp (exclusive).
+            limit: Maximum number of members.
+
+        Returns:
+            List of (workspace_id, timestamp).
+        """
+        return await self._client.zrangebyscore(
+            ACTIVITY_KEY,
+            min=f"({min_timestamp}",
+            max="+inf",
+            start=0,
+            num=limit,
+            withscores=True,
+        )
+
+    async def get_many(self, workspace_ids: list[str]) -> dict[str, float]:
+        """Get timestamps for the given workspaces using ZMSCORE.
+
+        Returns:
+            Mapping of workspace_id -> timestamp (members not in the ZSET are omitted).
+        """
+        if not workspace_ids:
+            return {}
+
+        scores = await self._client.zmscore(ACTIVITY_KEY, workspace_ids)
+        return {
+            ws_id: score
+            for ws_id, score in zip(workspace_ids, scores, strict=True)
+            if score is not None
+        }
+
+
 # =============================================================================
 # Global Instance Management
 # =============================================================================
@@ -145,3 +145,93 @@ class ChannelSubscriber:
                 },
             )
             return None
+
+
+class MultiChannelSubscriber:
+    """Generic Redis PUB/SUB subscriber for several channels on one connection.
+
+    Messages are returned with their channel so the caller can dispatch them.
+    """
+
+    def __init__(self, client: redis.Redis) -> None:
+        """Initialize subscriber.
+
+        Args:
+            client: Redis client instance.
+        """
+        self._client = client
+        self._pubsub: redis.client.PubSub | None = None
+        self._channels: tuple[str, ...] = ()
+
+    @property
+    def channels(self) -> tuple[str, ...]:
+        """Get the subscribed channel names."""
+        return self._channels
+
+    async def subscribe(self, *channels: str) -> None:
+        """Subscribe to channels on a single PubSub connection.
+
+        Args:
+            channels: Full channel names to subscribe to.
+        """
+        self._channels = channels
+        self._pubsub = self._client.pubsub()
+        await self._pubsub.subscribe(*channels)
+        logger.info(
+            "Redis subscribed",
+            extra={"event": LogEvent.REDIS_SUBSCRIBED, "channel": ",".join(channels)},
+        )
+
+    async def unsubscribe(self) -> None:
+        """Unsubscribe and close PubSub connection."""
+        if self._pubsub:
+            try:
+                await self._pubsub.unsubscribe()
+                await self._pubsub.close()
+            except Exception as e:
+                logger.warning(
+                    "Error closing pubsub",
+                    extra={"event": LogEvent.REDIS_CONNECTION_ERROR, "error": str(e)},
+                )
+            self._pubsub = None
+        self._channels = ()
+
+    async def get_message(self, timeout: float = 0.0) -> tuple[str, str] | None:
+        """Read message from any subscribed channel.
+
+        Args:
+            timeout: Maximum time to wait for message (seconds).
+                     0.0 means non-blocking.
+
+        Returns:
+            (channel, payload) if received, None otherwise.
+        """
+        if not self._pubsub:
+            return None
+
+        try:
+            msg = await self._pubsub.get_message(
+                ignore_subscribe_messages=True,
+                timeout=timeout,
+            )
+            if msg and msg["type"] == "message":
+                channel, data = msg["channel"], msg["data"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode()
+                if isinstance(data, bytes):
+                    data = data.decode()
+                logger.debug("RECEIVED from %s", channel)
+                return channel, data
+            return None
+
+        except Exception as e:
+            logger.warning(
+                "Error reading from pubsub",
+                extra={
+                    "event": LogEvent.REDIS_CONNECTION_ERROR,
+                    "channel": ",".join(self._channels),
+                    "error_type": type(e).__name__,
+                    "error": str(e),
+                },
+            )
+            return None
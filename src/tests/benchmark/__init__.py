@@ -0,0 +1 @@
+# Benchmarks (pytest-benchmark)
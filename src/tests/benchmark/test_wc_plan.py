@@ -0,0 +1,83 @@
+"""Plan stage benchmark: plan() vs plan_many().
+
+10k는 기본 실행에 포함, 100k는 benchmark marker (기본 addopts에서 제외):
+    pytest tests/benchmark -m benchmark --benchmark-only
+"""
+
+import random
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from codehub.control.coordinator.wc_loader import WorkspaceRow
+from codehub.control.coordinator.wc_plan_table import plan_many, transitions
+from codehub.control.coordinator.wc_planner import PlanInput, plan
+from codehub.core.domain.workspace import DesiredState, Operation, Phase
+
+TIMEOUT = 600.0
+FLEET_SIZES = [10_000, pytest.param(100_000, marks=pytest.mark.benchmark)]
+
+_RUNNING = {
+    "container": {"running": True, "reason": "Running", "message": ""},
+    "volume": {"exists": True, "reason": "VolumeExists", "message": ""},
+    "archive": None,
+}
+_STANDBY = {
+    "container": None,
+    "volume": {"exists": True, "reason": "VolumeExists", "message": ""},
+    "archive": None,
+}
+
+
+def _fleet(n: int) -> list[WorkspaceRow]:
+    """운영 분포 근사: 대부분 RUNNING 수렴, 일부 전이/진행 중."""
+    rng = random.Random(n)
+    now = datetime.now(UTC)
+    rows = []
+    for i in range(n):
+        r = rng.random()
+        if r < 0.85:
+            phase, op, desired, cond = Phase.RUNNING, Operation.NONE, DesiredState.RUNNING, _RUNNING
+        elif r < 0.95:
+            phase, op, desired, cond = Phase.STANDBY, Operation.NONE, DesiredState.RUNNING, _STANDBY
+        else:
+            phase, op, desired, cond = Phase.STANDBY, Operation.STARTING, DesiredState.RUNNING, _STANDBY
+        rows.append(WorkspaceRow(
+            id=f"ws-{i}",
+            owner_user_id=f"user-{i % 100}",
+            image_ref="ubuntu:22.04",
+            phase=phase,
+            operation=op,
+            desired_state=desired,
+            conditions=cond,
+            archive_key=None,
+            op_started_at=now - timedelta(seconds=5) if op != Operation.NONE else None,
+            op_id="op-1" if op != Operation.NONE else None,
+            deleted_at=None,
+            home_ctx=None,
+            error_count=0,
+            error_reason=None,
+        ))
+    return rows
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _warm_table() -> None:
+    transitions()
+
+
+@pytest.mark.parametrize("n", FLEET_SIZES)
+def test_plan_per_row(benchmark, n: int):
+    rows = _fleet(n)
+    benchmark.group = f"plan-{n}"
+    benchmark.pedantic(
+        lambda: [plan(PlanInput.from_workspace(r), timeout_seconds=TIMEOUT) for r in rows],
+        rounds=3,
+    )
+
+
+@pytest.mark.parametrize("n", FLEET_SIZES)
+def test_plan_many(benchmark, n: int):
+    rows = _fleet(n)
+    benchmark.group = f"plan-{n}"
+    benchmark.pedantic(lambda: plan_many(rows, timeout_seconds=TIMEOUT), rounds=3)
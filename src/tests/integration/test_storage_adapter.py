@@ -130,6 +130,36 @@ class TestS3StorageProvider:
             await storage_provider.delete_archive(archive_key)
 
 
+    @pytest.mark.asyncio
+    async def test_stream_and_bulk_delete_archives(
+        self, storage_provider: S3StorageProvider, test_prefix: str
+    ):
+        """iter_archive_keys streams sorted pages, delete_archives removes key + .meta."""
+        keys = [
+            await storage_provider.create_empty_archive(f"{test_prefix}gc{i}", "op-gc")
+            for i in range(3)
+        ]
+        prefix = keys[0].split("/")[0][: -1]  # "{resource_prefix}{test_prefix}gc"
+        try:
+            streamed = [
+                key async for page in storage_provider.iter_archive_keys(prefix) for key in page
+            ]
+            assert streamed == sorted(keys)
+
+            resumed = [
+                key
+                async for page in storage_provider.iter_archive_keys(prefix, keys[0])
+                for key in page
+            ]
+            assert resumed == sorted(keys)[1:]
+
+            deleted = await storage_provider.delete_archives(keys)
+            assert deleted == set(keys)
+            assert await storage_provider.list_all_archive_keys(prefix) == set()
+        finally:
+            await storage_provider.delete_archives(keys)
+
+
 @pytest.mark.integration
 class TestArchiveRestore:
     """Archive and Restore integration tests (Spec-v2)."""
@@ -153,7 +183,7 @@ class TestArchiveRestore:
             await _write_test_data(workspace_id, b"archive test data", container_api)
 
             # Archive
-            archive_key = await storage_provider.archive(workspace_id, op_id)
+            archive_key = (await storage_provider.archive(workspace_id, op_id)).archive_key
 
             # Verify archive key format
             assert archive_key.endswith("/home.tar.zst")
@@ -179,10 +209,10 @@ class TestArchiveRestore:
             await _write_test_data(workspace_id, b"idempotent test", container_api)
 
             # Archive twice with same op_id
-            key1 = await storage_provider.archive(workspace_id, op_id)
-            key2 = await storage_provider.archive(workspace_id, op_id)
+            result1 = await storage_provider.archive(workspace_id, op_id)
+            result2 = await storage_provider.archive(workspace_id, op_id)
 
-            assert key1 == key2
+            assert result1.archive_key == result2.archive_key
 
         finally:
             await storage_provider.delete_volume(workspace_id)
@@ -205,7 +235,7 @@ class TestArchiveRestore:
             await _write_test_data(workspace_id, test_data, container_api)
 
             # 2. Archive
-            archive_key = await storage_provider.archive(workspace_id, op_id)
+            archive_key = (await storage_provider.archive(workspace_id, op_id)).archive_key
 
             # 3. Delete volume
             await storage_provider.delete_volume(workspace_id)
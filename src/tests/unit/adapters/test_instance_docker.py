@@ -1,5 +1,6 @@
 """Unit tests for DockerInstanceController."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -128,3 +129,55 @@ class TestDockerInstanceController:
 
         mock_containers.stop.assert_called_once()
         mock_containers.remove.assert_called_once()
+
+    async def test_inspect_returns_container_info(
+        self, controller: DockerInstanceController, mock_containers: AsyncMock
+    ):
+        """inspect는 list_all()과 같은 표기의 ContainerInfo 반환."""
+        mock_containers.inspect.return_value = {"State": {"Status": "exited", "Running": False}}
+
+        info = await controller.inspect("ws-1")
+
+        mock_containers.inspect.assert_called_once_with("test-ws-1")
+        assert info is not None
+        assert info.workspace_id == "ws-1"
+        assert info.running is False
+        assert info.reason == "Exited"
+
+    async def test_inspect_missing_container(
+        self, controller: DockerInstanceController, mock_containers: AsyncMock
+    ):
+        """컨테이너 없음 → None."""
+        assert await controller.inspect("ws-1") is None
+
+    async def test_ensure_image_deduplicates_concurrent_pulls(
+        self, controller: DockerInstanceController, mock_images: AsyncMock
+    ):
+        """Pre-pull 진행 중 start()는 같은 pull을 대기 (중복 pull 없음)."""
+        gate = asyncio.Event()
+
+        async def slow_ensure(_image: str) -> None:
+            await gate.wait()
+
+        mock_images.ensure.side_effect = slow_ensure
+        prefetch = asyncio.create_task(controller.ensure_image("ubuntu:22.04"))
+        start = asyncio.create_task(controller.start("ws-1", "ubuntu:22.04"))
+        await asyncio.sleep(0)
+        assert not start.done()
+
+        gate.set()
+        await asyncio.gather(prefetch, start)
+
+        mock_images.ensure.assert_awaited_once_with("ubuntu:22.04")
+        assert controller._image_pulls == {}
+
+    async def test_ensure_image_failure_retries_next_call(
+        self, controller: DockerInstanceController, mock_images: AsyncMock
+    ):
+        mock_images.ensure.side_effect = [RuntimeError("registry down"), None]
+
+        with pytest.raises(RuntimeError):
+            await controller.ensure_image("ubuntu:22.04")
+        await controller.ensure_image("ubuntu:22.04")
+
+        assert mock_images.ensure.await_count == 2
@@ -0,0 +1,130 @@
+"""Unit tests for S3StorageProvider archive retention."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from codehub.adapters.storage.s3 import S3StorageProvider, select_expired_archives
+
+NOW = datetime(2026, 10, 16, tzinfo=UTC)
+
+
+def _archives(*ages_days: float) -> list[tuple[str, datetime]]:
+    """gen0 = 가장 최근 (ages_days 순서대로 오래됨)."""
+    return [
+        (f"ws-1/op{i}/home.tar.zst", NOW - timedelta(days=age))
+        for i, age in enumerate(ages_days)
+    ]
+
+
+class TestSelectExpiredArchives:
+    """select_expired_archives() 테스트."""
+
+    def test_disabled_keeps_everything(self):
+        assert select_expired_archives(_archives(0, 10, 20), set(), 0, 0, NOW) == []
+
+    def test_keep_latest_n(self):
+        archives = _archives(0, 1, 2, 3)
+
+        expired = select_expired_archives(list(reversed(archives)), set(), 2, 0, NOW)
+
+        assert expired == ["ws-1/op2/home.tar.zst", "ws-1/op3/home.tar.zst"]
+
+    def test_keep_younger_than_days(self):
+        expired = select_expired_archives(_archives(0, 5, 10), set(), 0, 7, NOW)
+
+        assert expired == ["ws-1/op2/home.tar.zst"]
+
+    def test_both_rules_must_be_violated(self):
+        """최신 N개 밖이면서 X일보다 오래된 archive만 삭제."""
+        expired = select_expired_archives(_archives(0, 1, 2, 30), set(), 1, 7, NOW)
+
+        assert expired == ["ws-1/op3/home.tar.zst"]
+
+    def test_keep_set_always_retained(self):
+        """DB의 현재 archive_key는 정책 밖이어도 유지 (새 key persist 전 restore 대상)."""
+        expired = select_expired_archives(
+            _archives(0, 1, 2), {"ws-1/op1/home.tar.zst"}, 1, 0, NOW
+        )
+
+        assert expired == ["ws-1/op2/home.tar.zst"]
+
+
+class TestEnforceRetention:
+    """archive() 직후 retention 적용 테스트."""
+
+    @pytest.fixture
+    def provider(self) -> S3StorageProvider:
+        return S3StorageProvider(volumes=AsyncMock(), job_runner=AsyncMock())
+
+    @pytest.fixture
+    def objects(self) -> list[dict]:
+        return [
+            {"Key": key, "LastModified": last_modified}
+            for key, last_modified in _archives(0, 1, 2)
+        ] + [{"Key": "ws-1/op0/home.tar.zst.meta", "LastModified": NOW}]
+
+    def _settings(self, count: int, days: float = 0.0) -> MagicMock:
+        settings = MagicMock()
+        settings.storage.archive_retention_count = count
+        settings.storage.archive_retention_days = days
+        return settings
+
+    async def test_prunes_workspace_prefix_only(
+        self, provider: S3StorageProvider, objects: list[dict]
+    ):
+        listed: list[str] = []
+
+        async def _paginate(bucket: str, prefix: str):
+            listed.append(prefix)
+            for obj in objects:
+                yield obj
+
+        provider.delete_archives = AsyncMock(side_effect=lambda keys: set(keys))
+        with (
+            patch("codehub.adapters.storage.s3._paginate_objects", _paginate),
+            patch("codehub.adapters.storage.s3.get_settings", return_value=self._settings(2)),
+        ):
+            deleted = await provider._enforce_retention("1", {"ws-1/op0/home.tar.zst"})
+
+        assert listed == [f"{provider._resource_prefix}1/"]
+        provider.delete_archives.assert_awaited_once_with(["ws-1/op2/home.tar.zst"])
+        assert deleted == {"ws-1/op2/home.tar.zst"}
+
+    async def test_disabled_skips_listing(self, provider: S3StorageProvider):
+        paginate = MagicMock()
+        with (
+            patch("codehub.adapters.storage.s3._paginate_objects", paginate),
+            patch("codehub.adapters.storage.s3.get_settings", return_value=self._settings(0)),
+        ):
+            await provider._enforce_retention("1", set())
+
+        paginate.assert_not_called()
+
+    async def test_failure_does_not_raise(
+        self, provider: S3StorageProvider, objects: list[dict]
+    ):
+        """Retention 실패는 archive 결과에 영향 없음 (GC가 나중에 정리)."""
+
+        async def _paginate(bucket: str, prefix: str):
+            for obj in objects:
+                yield obj
+
+        provider.delete_archives = AsyncMock(side_effect=RuntimeError("S3 down"))
+        with (
+            patch("codehub.adapters.storage.s3._paginate_objects", _paginate),
+            patch("codehub.adapters.storage.s3.get_settings", return_value=self._settings(1)),
+        ):
+            deleted = await provider._enforce_retention("1", {"ws-1/op0/home.tar.zst"})
+
+        assert deleted == set()
+
+    async def test_archive_retains_current_key(self, provider: S3StorageProvider):
+        provider._job_runner.run_archive.return_value = MagicMock(exit_code=0)
+        provider._enforce_retention = AsyncMock(return_value={"op-b", "op-a"})
+
+        result = await provider.archive("1", "op-new", retain="old-key")
+
+        provider._enforce_retention.assert_awaited_once_with("1", {result.archive_key, "old-key"})
+        assert result.pruned == ("op-a", "op-b")
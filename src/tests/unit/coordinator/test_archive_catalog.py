@@ -0,0 +1,137 @@
+"""Tests for archive catalog (S3 archive key의 Postgres 색인).
+
+Reference: docs/spec/04-control-plane.md (Archive catalog)
+"""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from codehub.control.coordinator.archive_catalog import ArchiveCatalog
+from codehub.control.coordinator.scheduler_gc import GCRunner
+from codehub.core.interfaces import InstanceController, StorageProvider
+
+
+@pytest.fixture
+def conn() -> AsyncMock:
+    conn = AsyncMock()
+    conn.execute.return_value = MagicMock()
+    return conn
+
+
+@pytest.fixture
+def catalog(conn: AsyncMock) -> ArchiveCatalog:
+    return ArchiveCatalog(conn)
+
+
+def _key(catalog: ArchiveCatalog, ws_id: str, op_id: str = "op1") -> str:
+    return f"{catalog._prefix}{ws_id}/{op_id}/home.tar.zst"
+
+
+class TestArchiveCatalog:
+    def test_workspace_id_of(self, catalog: ArchiveCatalog):
+        assert catalog.workspace_id_of(_key(catalog, "ws-1")) == "ws-1"
+        assert catalog.workspace_id_of("other/op1/home.tar.zst") is None
+        assert catalog.workspace_id_of("no-slash") is None
+
+    async def test_record_empty_is_noop(self, catalog: ArchiveCatalog, conn: AsyncMock):
+        await catalog.record([])
+        await catalog.remove([])
+
+        conn.execute.assert_not_called()
+
+    async def test_latest_returns_archive_info(self, catalog: ArchiveCatalog, conn: AsyncMock):
+        """DISTINCT ON 결과 → list_archives()와 같은 ArchiveInfo."""
+        key = _key(catalog, "ws-1")
+        conn.execute.return_value.fetchall.return_value = [("ws-1", key)]
+
+        archives = await catalog.latest({"ws-1"})
+
+        assert [(a.workspace_id, a.archive_key, a.exists) for a in archives] == [
+            ("ws-1", key, True)
+        ]
+        assert conn.execute.call_args[0][1] == {"ws_ids": ["ws-1"]}
+
+    async def test_sync_range_removes_stale_and_records_page(
+        self, catalog: ArchiveCatalog, conn: AsyncMock
+    ):
+        """범위 (after, until] 안에서 page에 없는 행 삭제 (listing 이전 등록분만) + page 등록."""
+        kept, missing = _key(catalog, "ws-1"), _key(catalog, "ws-2")
+        conn.execute.return_value.rowcount = 1
+        conn.execute.return_value.fetchall.return_value = [(True,)]  # missing만 신규 (kept 보정 없음)
+        listed_at = datetime.now(UTC)
+        modified = datetime(2026, 10, 1, tzinfo=UTC)
+
+        added, removed = await catalog.sync_range(
+            {kept: modified, missing: modified}, "a", missing, listed_at
+        )
+
+        assert (added, removed) == (1, 1)
+        delete_sql, delete_params = conn.execute.call_args_list[0][0]
+        assert 'COLLATE "C"' in str(delete_sql)
+        assert "created_at < :listed_at" in str(delete_sql)
+        assert delete_params == {
+            "after": "a", "until": missing, "keys": [kept, missing], "listed_at": listed_at,
+        }
+        record_params = conn.execute.call_args_list[1][0][1]
+        assert record_params == {
+            "ws_ids": ["ws-1", "ws-2"], "keys": [kept, missing], "created_at": [modified, modified],
+        }
+
+    async def test_sync_older_key_after_newer_recorded(
+        self, catalog: ArchiveCatalog, conn: AsyncMock
+    ):
+        """WC가 최신 archive 등록 후 GC가 과거 archive를 발견 → created_at = S3 LastModified.
+
+        sync 시각 (now())으로 등록하면 latest()가 과거 archive를 최신으로 고름.
+        """
+        newer, older = _key(catalog, "ws-1", "op-new"), _key(catalog, "ws-1", "op-old")
+        await catalog.record([("ws-1", newer)])
+        older_modified = datetime(2026, 1, 1, tzinfo=UTC)
+        conn.execute.return_value.rowcount = 0
+        conn.execute.return_value.fetchall.return_value = [(True,)]
+
+        await catalog.sync_range(
+            {newer: datetime.now(UTC), older: older_modified}, None, None, datetime.now(UTC)
+        )
+
+        sql, params = conn.execute.call_args[0]
+        assert "ON CONFLICT (archive_key) DO UPDATE SET created_at = EXCLUDED.created_at" in str(sql)
+        assert dict(zip(params["keys"], params["created_at"], strict=True))[older] == older_modified
+        # latest()는 created_at 순 → 과거 archive (2026-01-01)가 최신으로 선택되지 않음
+        conn.execute.return_value.fetchall.return_value = [("ws-1", newer)]
+        await catalog.latest({"ws-1"})
+        assert "ORDER BY workspace_id, created_at DESC" in str(conn.execute.call_args[0][0])
+
+    async def test_sync_range_tail_without_keys(self, catalog: ArchiveCatalog, conn: AsyncMock):
+        """Listing 종료 후 (cursor, 끝) 범위 → 삭제만 (등록 없음)."""
+        conn.execute.return_value.rowcount = 0
+
+        await catalog.sync_range({}, "last", None, datetime.now(UTC))
+
+        conn.execute.assert_awaited_once()
+        assert conn.execute.call_args[0][1]["until"] is None
+
+
+class TestGCCatalogSync:
+    async def test_gc_syncs_catalog_without_deleted_keys(self, conn: AsyncMock):
+        """GC listing page 재사용 → 삭제 대상 orphan 제외한 key로 범위 보정 + commit."""
+        kept = "ws-a/op1/home.tar.zst"
+        modified = datetime(2026, 10, 1, tzinfo=UTC)
+
+        async def _pages(prefix: str, start_after: str | None = None):
+            yield {kept: modified, "ws-orphan/op1/home.tar.zst": modified}
+
+        storage = MagicMock(spec=StorageProvider)
+        storage.iter_archive_keys = MagicMock(side_effect=_pages)
+        storage.delete_archives = AsyncMock(side_effect=lambda keys: set(keys))
+        runner = GCRunner(conn, storage, MagicMock(spec=InstanceController))
+        runner._get_protected_paths = AsyncMock(return_value={kept})
+        runner._catalog.sync_range = AsyncMock(return_value=(0, 1))
+
+        await runner._cleanup_orphan_archives()
+
+        first = runner._catalog.sync_range.await_args_list[0]
+        assert first.args[:3] == ({kept: modified}, None, "ws-orphan/op1/home.tar.zst")
+        assert conn.commit.await_count == 2  # page + tail
@@ -9,6 +9,9 @@ from codehub.control.coordinator.base import (
     CoordinatorBase,
     CoordinatorType,
     LeaderElection,
+    PollReason,
+    encode_wake,
+    parse_wake,
 )
 from codehub.infra.redis_pubsub import ChannelSubscriber
 
@@ -103,6 +106,128 @@ class TestGetInterval:
         assert coord._get_interval() == coord.IDLE_INTERVAL
 
 
+class TestAdaptiveInterval:
+    """_choose_interval() 테스트 (backlog / wake / deadline / idle)."""
+
+    @pytest.fixture
+    def coord(
+        self, mock_conn: AsyncMock, mock_leader: AsyncMock, mock_subscriber: AsyncMock
+    ) -> DummyCoordinator:
+        coord = DummyCoordinator(mock_conn, mock_leader, mock_subscriber)
+        coord._active_until = time.time() - 1
+        coord.MAX_IDLE_INTERVAL = 2.0
+        return coord
+
+    def test_backlog_outlasts_active_duration(self, coord: DummyCoordinator) -> None:
+        """Wake 후 ACTIVE_DURATION이 지나도 남은 작업이 있으면 빠르게 polling."""
+        coord._pending_work = lambda: 100  # type: ignore[method-assign]
+        coord._record_reconcile(0.0)
+
+        interval, reason = coord._choose_interval()
+
+        assert reason == PollReason.BACKLOG
+        assert coord.MIN_INTERVAL <= interval < coord.ACTIVE_INTERVAL
+
+    def test_backlog_not_faster_than_reconcile(self, coord: DummyCoordinator) -> None:
+        """Reconcile 시간 EWMA보다 자주 돌지 않음 (ACTIVE_INTERVAL 이내)."""
+        coord._pending_work = lambda: 100  # type: ignore[method-assign]
+        coord._pending_ewma = 100.0
+        coord._duration_ewma = 0.08
+
+        assert coord._choose_interval() == (0.08, PollReason.BACKLOG)
+
+        coord._duration_ewma = 5.0
+        assert coord._choose_interval() == (coord.ACTIVE_INTERVAL, PollReason.BACKLOG)
+
+    def test_idle_grows_until_max(self, coord: DummyCoordinator) -> None:
+        """연속 idle tick마다 2배 → MAX_IDLE_INTERVAL에서 멈춤."""
+        intervals = []
+        for _ in range(4):
+            intervals.append(coord._choose_interval())
+            coord._record_reconcile(0.01)
+
+        assert intervals == [
+            (0.5, PollReason.IDLE),
+            (1.0, PollReason.IDLE),
+            (2.0, PollReason.IDLE),
+            (2.0, PollReason.IDLE),
+        ]
+
+    def test_wake_resets_idle_streak(self, coord: DummyCoordinator) -> None:
+        coord._idle_streak = 3
+        coord.accelerate()
+
+        assert coord._choose_interval() == (coord.ACTIVE_INTERVAL, PollReason.WAKE)
+        coord._record_reconcile(0.01)
+        assert coord._idle_streak == 0
+
+    def test_deadline_shortens_idle(self, coord: DummyCoordinator) -> None:
+        """다음 deadline이 idle 간격보다 이르면 그때 깨어남 (MIN_INTERVAL 이상)."""
+        coord._idle_streak = 2
+        coord._next_deadline = lambda: 0.3  # type: ignore[method-assign]
+        assert coord._choose_interval() == (0.3, PollReason.DEADLINE)
+
+        coord._next_deadline = lambda: -5.0  # type: ignore[method-assign]
+        assert coord._choose_interval() == (coord.MIN_INTERVAL, PollReason.DEADLINE)
+
+        coord._next_deadline = lambda: 10.0  # type: ignore[method-assign]
+        assert coord._choose_interval() == (2.0, PollReason.IDLE)
+
+    def test_disabled_keeps_two_tier(self, coord: DummyCoordinator) -> None:
+        """ADAPTIVE_INTERVAL=False → backlog는 ACTIVE, 그 외 IDLE (deadline/증가 없음)."""
+        coord.ADAPTIVE_INTERVAL = False
+        coord._idle_streak = 5
+        coord._next_deadline = lambda: 0.1  # type: ignore[method-assign]
+        assert coord._choose_interval() == (coord.IDLE_INTERVAL, PollReason.IDLE)
+
+        coord._pending_work = lambda: 1  # type: ignore[method-assign]
+        assert coord._choose_interval() == (coord.ACTIVE_INTERVAL, PollReason.BACKLOG)
+
+
+class DefaultCoordinator(CoordinatorBase):
+    """기본 설정 (class attribute override 없음) Coordinator."""
+
+    COORDINATOR_TYPE = CoordinatorType.WC
+
+    def __init__(self, conn, leader, subscriber, pending: int = 0) -> None:
+        super().__init__(conn, leader, subscriber)
+        self.pending = pending
+
+    async def reconcile(self) -> None:
+        pass
+
+    def _pending_work(self) -> int:
+        return self.pending
+
+
+class TestBacklogDefaults:
+    """기본 설정에서 backlog pacing (MIN_INTERVAL = ACTIVE_INTERVAL = 1s)."""
+
+    def test_backlog_faster_than_active_with_defaults(
+        self, mock_conn: AsyncMock, mock_leader: AsyncMock, mock_subscriber: AsyncMock
+    ) -> None:
+        coord = DefaultCoordinator(mock_conn, mock_leader, mock_subscriber, pending=20)
+        for _ in range(5):
+            coord._record_reconcile(0.02)
+
+        interval, reason = coord._choose_interval()
+
+        assert reason == PollReason.BACKLOG
+        assert coord.BACKLOG_MIN_INTERVAL <= interval < coord.ACTIVE_INTERVAL
+        # throttle도 backlog 하한 기준 (MIN_INTERVAL 1s로 다시 늦추지 않음)
+        coord._last_reconcile = time.time()
+        assert coord._throttle_delay() <= coord.BACKLOG_MIN_INTERVAL
+
+    def test_wake_throttle_keeps_min_interval(
+        self, mock_conn: AsyncMock, mock_leader: AsyncMock, mock_subscriber: AsyncMock
+    ) -> None:
+        """남은 작업 없음 → wake throttle은 MIN_INTERVAL 유지."""
+        coord = DefaultCoordinator(mock_conn, mock_leader, mock_subscriber)
+        coord._last_reconcile = time.time()
+
+        assert coord._throttle_delay() > coord.BACKLOG_MIN_INTERVAL
+
+
 class TestWaitForNotify:
     """_wait_for_notify() 테스트."""
 
@@ -145,6 +270,91 @@ class TestWaitForNotify:
         assert coord.is_active is False
 
 
+    @pytest.mark.asyncio
+    async def test_wait_for_notify_targeted_adds_hot_ids(
+        self, mock_conn: AsyncMock, mock_leader: AsyncMock, mock_subscriber: AsyncMock
+    ) -> None:
+        """id payload → hot set 등록, accelerate 안 함."""
+        coord = DummyCoordinator(mock_conn, mock_leader, mock_subscriber)
+        coord._active_until = time.time() - 1
+
+        mock_subscriber.get_message = AsyncMock(
+            side_effect=[encode_wake(["ws-1"]), encode_wake(["ws-2"]), None]
+        )
+
+        await coord._wait_for_notify(10.0)
+
+        assert coord.is_active is False
+        assert set(coord._hot_ids) == {"ws-1", "ws-2"}
+        assert coord._get_interval() == coord.ACTIVE_INTERVAL
+
+    @pytest.mark.asyncio
+    async def test_wait_for_notify_drain_is_bounded(
+        self, mock_conn: AsyncMock, mock_leader: AsyncMock, mock_subscriber: AsyncMock
+    ) -> None:
+        """메시지가 계속 와도 WAKE_DRAIN_MAX개까지만 소비."""
+        coord = DummyCoordinator(mock_conn, mock_leader, mock_subscriber)
+        mock_subscriber.get_message = AsyncMock(return_value="")
+
+        await coord._wait_for_notify(10.0)
+
+        assert mock_subscriber.get_message.await_count == coord.WAKE_DRAIN_MAX
+
+
+class TestTargetedWake:
+    """parse_wake() / _select_targets() 테스트."""
+
+    def test_parse_wake_roundtrip(self) -> None:
+        assert parse_wake(encode_wake({"b", "a"})) == {"a", "b"}
+
+    @pytest.mark.parametrize("payload", ["", "{}", "wc:wake", '{"ids": []}', "[1]"])
+    def test_parse_wake_full(self, payload: str) -> None:
+        """빈/형식 불일치 payload → 전체 wake."""
+        assert parse_wake(payload) is None
+
+    def test_select_targets_full_when_active(
+        self, mock_conn: AsyncMock, mock_leader: AsyncMock, mock_subscriber: AsyncMock
+    ) -> None:
+        coord = DummyCoordinator(mock_conn, mock_leader, mock_subscriber)
+        coord.add_hot_ids(["ws-1"])
+
+        assert coord._select_targets() is None
+
+    def test_select_targets_targeted_between_sweeps(
+        self, mock_conn: AsyncMock, mock_leader: AsyncMock, mock_subscriber: AsyncMock
+    ) -> None:
+        """Inactive + hot set → 첫 tick full sweep, 이후 IDLE_INTERVAL 동안 targeted."""
+        coord = DummyCoordinator(mock_conn, mock_leader, mock_subscriber)
+        coord._active_until = time.time() - 1
+        coord.add_hot_ids(["ws-1"])
+
+        assert coord._select_targets() is None
+        assert coord._select_targets() == {"ws-1"}
+
+        coord._last_full_sweep = time.time() - coord.IDLE_INTERVAL
+        assert coord._select_targets() is None
+
+    def test_select_targets_drops_expired(
+        self, mock_conn: AsyncMock, mock_leader: AsyncMock, mock_subscriber: AsyncMock
+    ) -> None:
+        coord = DummyCoordinator(mock_conn, mock_leader, mock_subscriber)
+        coord._active_until = time.time() - 1
+        coord._last_full_sweep = time.time()
+        coord._hot_ids = {"ws-1": time.time() - 1, "ws-2": time.time() + 10}
+
+        assert coord._select_targets() == {"ws-2"}
+
+    def test_leadership_lost_clears_hot_ids(
+        self, mock_conn: AsyncMock, mock_leader: AsyncMock, mock_subscriber: AsyncMock
+    ) -> None:
+        coord = DummyCoordinator(mock_conn, mock_leader, mock_subscriber)
+        coord.add_hot_ids(["ws-1"])
+
+        coord._on_leadership_lost()
+
+        assert coord._hot_ids == {}
+
+
 class TestThrottle:
     """_throttle() 테스트."""
 
@@ -0,0 +1,83 @@
+"""Unit tests for EventListener wake coalescing."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from codehub.control.coordinator.event_listener import EventListener
+from codehub.infra.redis_pubsub import ChannelPublisher
+
+
+@pytest.fixture
+def mock_publisher() -> AsyncMock:
+    publisher = AsyncMock(spec=ChannelPublisher)
+    publisher.publish = AsyncMock(return_value=1)
+    return publisher
+
+
+@pytest.fixture
+def listener(mock_publisher: AsyncMock) -> EventListener:
+    el = EventListener("postgresql://test", MagicMock(), publisher=mock_publisher)
+    el.WAKE_DEBOUNCE = 0.01
+    return el
+
+
+class TestWakeCoalesce:
+    """_handle_wake() debounce 테스트."""
+
+    async def test_coalesces_ids_into_single_publish(
+        self, listener: EventListener, mock_publisher: AsyncMock
+    ) -> None:
+        """Debounce window 내 wake → 채널별 1회 publish ({"ids": [...]})."""
+        for ws_id in ["ws-2", "ws-1", "ws-2"]:
+            await listener._dispatch(EventListener.CHANNEL_WAKE, json.dumps({"id": ws_id}))
+        await listener._wake_flush
+
+        assert mock_publisher.publish.await_count == 2  # observer + wc
+        payloads = {call.args[1] for call in mock_publisher.publish.await_args_list}
+        assert payloads == {json.dumps({"ids": ["ws-1", "ws-2"]})}
+
+    async def test_payload_without_id_is_full_wake(
+        self, listener: EventListener, mock_publisher: AsyncMock
+    ) -> None:
+        """Legacy '{}' payload가 섞이면 빈 payload (전체 wake)."""
+        await listener._dispatch(EventListener.CHANNEL_WAKE, json.dumps({"id": "ws-1"}))
+        await listener._dispatch(EventListener.CHANNEL_WAKE, "{}")
+        await listener._wake_flush
+
+        payloads = {call.args[1] for call in mock_publisher.publish.await_args_list}
+        assert payloads == {""}
+
+    async def test_new_window_after_flush(
+        self, listener: EventListener, mock_publisher: AsyncMock
+    ) -> None:
+        await listener._dispatch(EventListener.CHANNEL_WAKE, json.dumps({"id": "ws-1"}))
+        await listener._wake_flush
+        await listener._dispatch(EventListener.CHANNEL_WAKE, json.dumps({"id": "ws-2"}))
+        await listener._wake_flush
+
+        assert mock_publisher.publish.await_count == 4
+        assert mock_publisher.publish.await_args.args[1] == json.dumps({"ids": ["ws-2"]})
+
+    async def test_wake_during_publish_is_flushed(
+        self, listener: EventListener, mock_publisher: AsyncMock
+    ) -> None:
+        """Publish 도중 도착한 wake → 다음 flush로 publish (다른 wake를 기다리지 않음)."""
+
+        async def slow_publish(channel: str, payload: str) -> int:
+            await asyncio.sleep(0.01)
+            return 1
+
+        mock_publisher.publish.side_effect = slow_publish
+        await listener._dispatch(EventListener.CHANNEL_WAKE, json.dumps({"id": "ws-1"}))
+        first = listener._wake_flush
+        await asyncio.sleep(listener.WAKE_DEBOUNCE + 0.005)  # publish 진행 중
+        await listener._dispatch(EventListener.CHANNEL_WAKE, json.dumps({"id": "ws-2"}))
+        await first
+        await listener._wake_flush
+
+        payloads = [call.args[1] for call in mock_publisher.publish.await_args_list]
+        assert payloads[-1] == json.dumps({"ids": ["ws-2"]})
+        assert listener._wake_ids == set()
@@ -4,6 +4,9 @@ Reference: docs/spec/05-data-plane.md (Archive GC)
 Contract #9: GC Separation & Protection
 """
 
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -21,6 +24,33 @@ def mock_conn() -> MagicMock:
     return conn
 
 
+_MODIFIED = datetime(2026, 10, 1, tzinfo=UTC)
+
+
+def _set_pages(storage: MagicMock, *pages: list[str]) -> None:
+    """iter_archive_keys mock (start_after 이후 page만 반환, S3 StartAfter와 동일)."""
+
+    async def _iter(
+        prefix: str, start_after: str | None = None
+    ) -> AsyncIterator[dict[str, datetime]]:
+        for page in pages:
+            if start_after is None or page[-1] > start_after:
+                yield {key: _MODIFIED for key in page if start_after is None or key > start_after}
+
+    storage.iter_archive_keys = MagicMock(side_effect=_iter)
+
+
+def _protect(conn: MagicMock, *paths: str) -> None:
+    result = MagicMock()
+    result.fetchall.return_value = [(path,) for path in paths]
+    result.rowcount = 0
+    conn.execute.return_value = result
+
+
+def _deleted(storage: MagicMock) -> list[str]:
+    return [key for call in storage.delete_archives.call_args_list for key in call.args[0]]
+
+
 @pytest.fixture
 def mock_storage() -> MagicMock:
     """Mock StorageProvider."""
@@ -29,6 +59,8 @@ def mock_storage() -> MagicMock:
     storage.list_all_archive_keys = AsyncMock(return_value=set())
     storage.list_volumes = AsyncMock(return_value=[])
     storage.delete_archive = AsyncMock(return_value=True)
+    storage.delete_archives = AsyncMock(side_effect=lambda keys: set(keys))
+    _set_pages(storage)
     storage.delete_volume = AsyncMock()
     return storage
 
@@ -52,144 +84,67 @@ def runner(
     return GCRunner(mock_conn, mock_storage, mock_ic)
 
 
-class TestListArchives:
-    """_list_archives() tests."""
-
-    async def test_empty_storage(
-        self,
-        runner: GCRunner,
-        mock_storage: MagicMock,
-    ):
-        """Returns empty set when no archives in storage."""
-        mock_storage.list_all_archive_keys.return_value = set()
-
-        result = await runner._list_archives()
-
-        assert result == set()
-
-    async def test_returns_all_archive_keys(
-        self,
-        runner: GCRunner,
-        mock_storage: MagicMock,
-    ):
-        """Returns all archive keys from storage."""
-        mock_storage.list_all_archive_keys.return_value = {
-            "ws-abc123/op1/home.tar.zst",
-            "ws-abc123/op2/home.tar.zst",  # Multiple per workspace
-            "ws-def456/op1/home.tar.zst",
-        }
-
-        result = await runner._list_archives()
-
-        assert len(result) == 3
-        assert "ws-abc123/op1/home.tar.zst" in result
-        assert "ws-abc123/op2/home.tar.zst" in result
-        assert "ws-def456/op1/home.tar.zst" in result
-
-    async def test_uses_list_all_archive_keys(
-        self,
-        runner: GCRunner,
-        mock_storage: MagicMock,
-    ):
-        """Uses list_all_archive_keys() not list_archives()."""
-        mock_storage.list_all_archive_keys.return_value = {
-            "ws-abc123/op1/home.tar.zst",
-        }
-
-        await runner._list_archives()
-
-        mock_storage.list_all_archive_keys.assert_called_once()
-        mock_storage.list_archives.assert_not_called()
-
-
 class TestGetProtectedPaths:
-    """_get_protected_paths() tests."""
+    """_get_protected_paths(keys) tests."""
 
-    async def test_archive_key_protected(
-        self,
-        runner: GCRunner,
-        mock_conn: MagicMock,
-    ):
-        """archive_key from any workspace is protected."""
-        mock_result = MagicMock()
-        mock_result.fetchall.return_value = [
-            ("ws-abc123/op1/home.tar.zst",),
-        ]
-        mock_conn.execute.return_value = mock_result
-
-        result = await runner._get_protected_paths()
-
-        assert "ws-abc123/op1/home.tar.zst" in result
+    async def test_queries_only_page_keys(self, runner: GCRunner, mock_conn: MagicMock):
+        """Page key만 = ANY로 조회 (전체 보호 목록을 만들지 않음)."""
+        _protect(mock_conn, "ws-abc123/op1/home.tar.zst")
 
-    async def test_op_id_protected_for_active_workspace(
-        self,
-        runner: GCRunner,
-        mock_conn: MagicMock,
-    ):
-        """op_id path protected for active (not deleted) workspace."""
-        mock_result = MagicMock()
-        mock_result.fetchall.return_value = [
-            ("ws-abc123/current-op-id/home.tar.zst",),
-        ]
-        mock_conn.execute.return_value = mock_result
-
-        result = await runner._get_protected_paths()
+        result = await runner._get_protected_paths(
+            ["ws-abc123/op1/home.tar.zst", "ws-def456/op1/home.tar.zst"]
+        )
 
-        assert "ws-abc123/current-op-id/home.tar.zst" in result
+        assert result == {"ws-abc123/op1/home.tar.zst"}
+        sql, params = mock_conn.execute.call_args[0]
+        assert "archive_key = ANY" in str(sql)
+        assert "id = ANY" in str(sql)
+        assert params["keys"] == ["ws-abc123/op1/home.tar.zst", "ws-def456/op1/home.tar.zst"]
 
-    async def test_empty_db(
-        self,
-        runner: GCRunner,
-        mock_conn: MagicMock,
-    ):
-        """Returns empty set when no protected paths."""
-        mock_result = MagicMock()
-        mock_result.fetchall.return_value = []
-        mock_conn.execute.return_value = mock_result
+    async def test_op_id_path_outside_page_ignored(self, runner: GCRunner, mock_conn: MagicMock):
+        """op_id 경로는 workspace 단위 조회 → page에 없는 경로는 결과에서 제외."""
+        _protect(mock_conn, "ws-abc123/current-op/home.tar.zst")
 
-        result = await runner._get_protected_paths()
+        result = await runner._get_protected_paths(["ws-abc123/old-op/home.tar.zst"])
 
         assert result == set()
 
+    async def test_empty_page(self, runner: GCRunner, mock_conn: MagicMock):
+        assert await runner._get_protected_paths([]) == set()
+        mock_conn.execute.assert_not_called()
+
 
 class TestDeleteArchives:
     """_delete_archives() tests."""
 
-    async def test_calls_storage_delete(
-        self,
-        runner: GCRunner,
-        mock_storage: MagicMock,
-    ):
-        """Calls storage.delete_archive for each key."""
-        mock_storage.delete_archive.return_value = True
+    async def test_bulk_delete(self, runner: GCRunner, mock_storage: MagicMock):
+        """Key 목록을 한 번의 bulk 요청으로 삭제."""
+        keys = ["ws-a/op1/home.tar.zst", "ws-b/op1/home.tar.zst"]
+
+        deleted = await runner._delete_archives(keys)
+
+        assert deleted == 2
+        mock_storage.delete_archives.assert_awaited_once_with(keys)
+        mock_storage.delete_archive.assert_not_called()
+
+    async def test_partial_failure_counted(self, runner: GCRunner, mock_storage: MagicMock):
+        mock_storage.delete_archives.side_effect = None
+        mock_storage.delete_archives.return_value = {"ws-b/op1/home.tar.zst"}
 
-        archive_keys = {"ws-abc123/op1/home.tar.zst"}
-        deleted = await runner._delete_archives(archive_keys)
+        deleted = await runner._delete_archives(["ws-a/op1/home.tar.zst", "ws-b/op1/home.tar.zst"])
 
         assert deleted == 1
-        mock_storage.delete_archive.assert_called_once_with(
-            "ws-abc123/op1/home.tar.zst"
-        )
 
-    async def test_continues_on_single_failure(
-        self,
-        runner: GCRunner,
-        mock_storage: MagicMock,
+    async def test_request_failure_does_not_raise(
+        self, runner: GCRunner, mock_storage: MagicMock, monkeypatch: pytest.MonkeyPatch
     ):
-        """Continues deleting other archives if one fails."""
-        # First delete fails, second succeeds
-        mock_storage.delete_archive.side_effect = [False, True]
+        async def _no_retry(fn, **_kwargs):
+            return await fn()
 
-        archive_keys = {
-            "ws-fail/op1/home.tar.zst",
-            "ws-success/op2/home.tar.zst",
-        }
-        deleted = await runner._delete_archives(archive_keys)
+        monkeypatch.setattr("codehub.control.coordinator.scheduler_gc.with_retry", _no_retry)
+        mock_storage.delete_archives.side_effect = RuntimeError("S3 down")
 
-        # Only 1 succeeded
-        assert deleted == 1
-        # Both were attempted
-        assert mock_storage.delete_archive.call_count == 2
+        assert await runner._delete_archives(["ws-a/op1/home.tar.zst"]) == 0
 
 
 class TestRun:
@@ -202,11 +157,9 @@ class TestRun:
         mock_storage: MagicMock,
     ):
         """run() returns early when no archives in storage."""
-        mock_storage.list_all_archive_keys.return_value = set()
-
         await runner.run()
 
-        # Should not query DB for protected paths
+        # Should not query DB for protected paths (or sync catalog)
         mock_conn.execute.assert_not_called()
 
     async def test_no_orphans(
@@ -216,20 +169,12 @@ class TestRun:
         mock_storage: MagicMock,
     ):
         """run() does not delete when all archives are protected."""
-        # Storage has one archive
-        mock_storage.list_all_archive_keys.return_value = {
-            "ws-abc123/op1/home.tar.zst",
-        }
-
-        # DB also has it protected
-        mock_result = MagicMock()
-        mock_result.fetchall.return_value = [("ws-abc123/op1/home.tar.zst",)]
-        mock_conn.execute.return_value = mock_result
+        _set_pages(mock_storage, ["ws-abc123/op1/home.tar.zst"])
+        _protect(mock_conn, "ws-abc123/op1/home.tar.zst")
 
         await runner.run()
 
-        # Should not call delete_archive
-        mock_storage.delete_archive.assert_not_called()
+        mock_storage.delete_archives.assert_not_called()
 
     async def test_deletes_orphans(
         self,
@@ -238,78 +183,103 @@ class TestRun:
         mock_storage: MagicMock,
     ):
         """run() deletes archives not in protected list."""
-        # Storage has two archives
-        mock_storage.list_all_archive_keys.return_value = {
-            "ws-abc123/op1/home.tar.zst",  # Protected
-            "ws-orphan/op2/home.tar.zst",  # Orphan
-        }
-
-        # DB only has one protected
-        mock_result = MagicMock()
-        mock_result.fetchall.return_value = [("ws-abc123/op1/home.tar.zst",)]
-        mock_conn.execute.return_value = mock_result
+        _set_pages(
+            mock_storage,
+            ["ws-abc123/op1/home.tar.zst", "ws-orphan/op2/home.tar.zst"],
+        )
+        _protect(mock_conn, "ws-abc123/op1/home.tar.zst")
 
         await runner.run()
 
-        # Should call delete_archive for orphan
-        mock_storage.delete_archive.assert_called_once_with(
-            "ws-orphan/op2/home.tar.zst"
-        )
+        assert _deleted(mock_storage) == ["ws-orphan/op2/home.tar.zst"]
 
-    async def test_handles_storage_error_gracefully(
+    async def test_streams_pages(
         self,
         runner: GCRunner,
+        mock_conn: MagicMock,
         mock_storage: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
     ):
-        """run() skips archive cleanup on S3 error (doesn't propagate)."""
-        mock_storage.list_all_archive_keys.side_effect = RuntimeError("Storage error")
-
-        # Should NOT raise - S3 error is caught and logged, cleanup skipped
-        await runner.run()
+        """Page마다 보호 조회 + 삭제 batch (DELETE_BATCH_SIZE 단위)."""
+        monkeypatch.setattr(GCRunner, "DELETE_BATCH_SIZE", 2)
+        pages = [[f"ws-{p}{i}/op/home.tar.zst" for i in range(3)] for p in "ab"]
+        _set_pages(mock_storage, *pages)
+        _protect(mock_conn)
+
+        assert await runner.run() is True
+
+        assert sorted(_deleted(mock_storage)) == sorted(pages[0] + pages[1])
+        assert [len(c.args[0]) for c in mock_storage.delete_archives.call_args_list] == [2, 1, 2, 1]
+        protected_queries = [
+            c for c in mock_conn.execute.call_args_list if "ws_ids" in c.args[1]
+        ]
+        assert len(protected_queries) == 2
+        assert runner._scanned == 6 and runner._deleted == 6
 
-        # delete_archive should NOT be called since list failed
-        mock_storage.delete_archive.assert_not_called()
+    async def test_delete_concurrency_bounded(
+        self,
+        runner: GCRunner,
+        mock_conn: MagicMock,
+        mock_storage: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setattr(GCRunner, "DELETE_BATCH_SIZE", 1)
+        monkeypatch.setattr(GCRunner, "DELETE_CONCURRENCY", 2)
+        _set_pages(mock_storage, [f"ws-{i}/op/home.tar.zst" for i in range(6)])
+        _protect(mock_conn)
+        active = peak = 0
+
+        async def _delete(keys):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+            return set(keys)
+
+        mock_storage.delete_archives.side_effect = _delete
 
+        await runner.run()
 
-class TestProtectionRules:
-    """Contract #9 protection rule tests."""
+        assert peak == 2
+        assert mock_storage.delete_archives.await_count == 6
 
-    async def test_deleted_workspace_archive_key_not_protected(
+    async def test_handles_storage_error_gracefully(
         self,
         runner: GCRunner,
-        mock_conn: MagicMock,
+        mock_storage: MagicMock,
     ):
-        """deleted_at workspace: archive_key is NOT protected (user wants deletion).
+        """run() skips archive cleanup on S3 error (doesn't propagate)."""
 
-        SQL query now includes deleted_at IS NULL filter for archive_key protection.
-        """
-        mock_result = MagicMock()
-        # Deleted workspace's archive_key is NOT in result
-        mock_result.fetchall.return_value = []
-        mock_conn.execute.return_value = mock_result
+        async def _fail(prefix: str, start_after: str | None = None):
+            raise RuntimeError("Storage error")
+            yield []
 
-        result = await runner._get_protected_paths()
+        mock_storage.iter_archive_keys.side_effect = _fail
 
-        # Deleted workspace's archive_key should NOT be protected
-        assert result == set()
+        # Should NOT raise - S3 error is caught and logged, cleanup skipped
+        assert await runner.run() is True
+
+        mock_storage.delete_archives.assert_not_called()
+        assert not runner.resuming
 
-    async def test_deleted_workspace_op_id_not_protected(
+
+class TestProtectionRules:
+    """Contract #9 protection rule tests."""
+
+    async def test_deleted_workspace_not_protected(
         self,
         runner: GCRunner,
         mock_conn: MagicMock,
     ):
-        """deleted_at workspace: op_id path is NOT protected (user wants deletion)."""
-        # This is verified by the SQL query:
-        # Active op_id paths only selected WHERE deleted_at IS NULL
-        # So deleted workspace's op_id path won't be in result
-        mock_result = MagicMock()
-        mock_result.fetchall.return_value = []  # No paths from deleted workspace
-        mock_conn.execute.return_value = mock_result
+        """deleted_at workspace: archive_key / op_id 경로 모두 보호하지 않음 (user wants deletion)."""
+        _protect(mock_conn)  # deleted_at IS NULL 조건으로 결과 없음
 
-        result = await runner._get_protected_paths()
+        result = await runner._get_protected_paths(["ws-deleted/op1/home.tar.zst"])
 
-        # Deleted workspace's op_id path should NOT be protected
         assert result == set()
+        sql = str(mock_conn.execute.call_args[0][0])
+        assert sql.count("deleted_at IS NULL") == 2
 
     async def test_error_workspace_both_protected(
         self,
@@ -317,19 +287,17 @@ class TestProtectionRules:
         mock_conn: MagicMock,
     ):
         """ERROR workspace: both archive_key and op_id paths are protected."""
-        # SQL query includes:
-        # WHERE (conditions->'policy.healthy'->>'status') != 'True' AND op_id IS NOT NULL
-        mock_result = MagicMock()
-        mock_result.fetchall.return_value = [
-            ("ws-error/archive-key/home.tar.zst",),  # archive_key path
-            ("ws-error/current-op/home.tar.zst",),  # op_id path (ERROR state)
-        ]
-        mock_conn.execute.return_value = mock_result
+        _protect(
+            mock_conn,
+            "ws-error/archive-key/home.tar.zst",  # archive_key path
+            "ws-error/current-op/home.tar.zst",  # op_id path (ERROR state)
+        )
 
-        result = await runner._get_protected_paths()
+        result = await runner._get_protected_paths(
+            ["ws-error/archive-key/home.tar.zst", "ws-error/current-op/home.tar.zst"]
+        )
 
-        assert "ws-error/archive-key/home.tar.zst" in result
-        assert "ws-error/current-op/home.tar.zst" in result
+        assert result == {"ws-error/archive-key/home.tar.zst", "ws-error/current-op/home.tar.zst"}
 
 
 class TestCleanupOrphanResources:
@@ -457,3 +425,122 @@ class TestCleanupOrphanResources:
 
         # Neither should be deleted
         mock_ic.delete.assert_not_called()
+
+
+class TestBudgetCheckpoint:
+    """run(budget) checkpoint/resume tests."""
+
+    @pytest.fixture
+    def pages(self, mock_conn: MagicMock, mock_storage: MagicMock) -> list[list[str]]:
+        pages = [["ws-a/op1/home.tar.zst"], ["ws-b/op1/home.tar.zst"]]
+        _set_pages(mock_storage, *pages)
+        _protect(mock_conn)
+        return pages
+
+    async def test_budget_exceeded_checkpoints_then_resumes(
+        self,
+        runner: GCRunner,
+        mock_storage: MagicMock,
+        pages: list[list[str]],
+    ):
+        """Budget 초과 → page 경계에서 cursor 보관, 다음 run은 cursor 다음 page부터."""
+        assert await runner.run(budget=0.0) is False
+        assert runner.resuming
+        assert _deleted(mock_storage) == pages[0]  # in-flight 삭제는 완료 후 중단
+
+        assert await runner.run() is True
+
+        assert not runner.resuming
+        assert _deleted(mock_storage) == pages[0] + pages[1]
+        resumed = mock_storage.iter_archive_keys.call_args_list[1]
+        assert resumed.args == (runner._prefix, "ws-a/op1/home.tar.zst")
+
+    async def test_resume_rechecks_protection(
+        self,
+        runner: GCRunner,
+        mock_conn: MagicMock,
+        mock_storage: MagicMock,
+        pages: list[list[str]],
+    ):
+        """재개한 page는 그 시점의 DB로 보호 여부 판단."""
+        await runner.run(budget=0.0)
+        mock_conn.execute.return_value.fetchall.return_value = [("ws-b/op1/home.tar.zst",)]
+
+        await runner.run()
+
+        assert _deleted(mock_storage) == pages[0]
+
+    async def test_catalog_synced_by_range(
+        self,
+        runner: GCRunner,
+        mock_storage: MagicMock,
+        pages: list[list[str]],
+    ):
+        """Page마다 (이전 cursor, page 끝] 범위 보정 → 마지막에 (cursor, 끝) 범위."""
+        runner._catalog.sync_range = AsyncMock(return_value=(0, 0))
+
+        await runner.run()
+
+        ranges = [c.args[1:3] for c in runner._catalog.sync_range.call_args_list]
+        assert ranges == [
+            (None, "ws-a/op1/home.tar.zst"),
+            ("ws-a/op1/home.tar.zst", "ws-b/op1/home.tar.zst"),
+            ("ws-b/op1/home.tar.zst", None),
+        ]
+        # orphan은 catalog key 목록에서 제외 (삭제 대상)
+        assert all(list(c.args[0]) == [] for c in runner._catalog.sync_range.call_args_list)
+
+    async def test_orphan_dropped_from_catalog_even_if_delete_fails(
+        self,
+        runner: GCRunner,
+        mock_conn: MagicMock,
+        mock_storage: MagicMock,
+    ):
+        """orphan (deleted workspace 포함) 행은 page 보정에서 제거, 삭제 실패해도 재등록 안 됨."""
+        _set_pages(mock_storage, ["ws-live/op1/home.tar.zst", "ws-gone/op1/home.tar.zst"])
+        _protect(mock_conn, "ws-live/op1/home.tar.zst")
+        mock_storage.delete_archives = AsyncMock(return_value=set())
+        runner._catalog.sync_range = AsyncMock(return_value=(0, 0))
+
+        await runner.run()
+        await runner.run()
+
+        assert _deleted(mock_storage) == ["ws-gone/op1/home.tar.zst"] * 2
+        synced = [list(c.args[0]) for c in runner._catalog.sync_range.call_args_list]
+        assert synced == [["ws-live/op1/home.tar.zst"], [], ["ws-live/op1/home.tar.zst"], []]
+
+    async def test_resource_checkpoint_requeries_valid_ids(
+        self,
+        runner: GCRunner,
+        mock_conn: MagicMock,
+        mock_ic: MagicMock,
+    ):
+        """Container checkpoint 재개 시 유효 workspace 재조회 (그 사이 생성된 workspace 보호)."""
+        containers = [MagicMock(workspace_id="ws-a"), MagicMock(workspace_id="ws-b")]
+        mock_ic.list_all.return_value = containers
+        _protect(mock_conn)
+
+        assert await runner._cleanup_orphan_resources(deadline=0.0) is False
+        mock_conn.execute.return_value.fetchall.return_value = [("ws-a",)]
+        assert await runner._cleanup_orphan_resources() is True
+
+        mock_ic.list_all.assert_awaited_once()
+        mock_ic.delete.assert_called_once_with("ws-b")
+
+    async def test_resource_checkpoint_skips_archive_phase(
+        self,
+        runner: GCRunner,
+        mock_conn: MagicMock,
+        mock_storage: MagicMock,
+        mock_ic: MagicMock,
+        pages: list[list[str]],
+    ):
+        """Container/volume 단계에서 중단 → 재개 시 archive listing 다시 하지 않음."""
+        mock_ic.list_all.return_value = [MagicMock(workspace_id="ws-x")]
+        assert await runner._cleanup_orphan_archives() is True
+        assert await runner._cleanup_orphan_resources(deadline=0.0) is False
+
+        assert await runner.run() is True
+
+        mock_storage.iter_archive_keys.assert_called_once()
+        mock_ic.delete.assert_called_once_with("ws-x")
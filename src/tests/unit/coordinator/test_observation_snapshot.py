@@ -0,0 +1,125 @@
+"""Tests for in-process observation snapshot (Observer → WC)."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from codehub.control.coordinator.observation_snapshot import ObservationSnapshot
+from codehub.control.coordinator.observer import ObserverCoordinator, _settings
+from codehub.core.interfaces.instance import ContainerInfo
+from codehub.core.interfaces.leader import LeaderElection
+from codehub.infra.redis_pubsub import ChannelSubscriber
+
+_RUNNING = {"running": True, "reason": "Running"}
+
+
+class TestObservationSnapshot:
+    def test_not_ready_until_seeded(self):
+        snapshot = ObservationSnapshot()
+        snapshot.merge({"ws-1": ({"container": _RUNNING}, {"container": "t1"})})
+
+        assert snapshot.view() is None
+
+        snapshot.merge({}, keep={"ws-1"}, seeded=True)
+
+        assert snapshot.view()["ws-1"]["container"] == _RUNNING
+
+    def test_merge_keeps_unchanged_resources(self):
+        """DB jsonb merge와 동일: 기록하지 않은 resource/관측 시각 유지."""
+        snapshot = ObservationSnapshot()
+        snapshot.merge(
+            {"ws-1": ({"container": _RUNNING, "volume": None}, {"container": "t1", "volume": "t1"})},
+            seeded=True,
+        )
+
+        snapshot.merge({"ws-1": ({"volume": {"exists": True}}, {"volume": "t2"})})
+
+        assert snapshot.view()["ws-1"] == {
+            "container": _RUNNING,
+            "volume": {"exists": True},
+            "observed_at": {"container": "t1", "volume": "t2"},
+        }
+
+    def test_copy_on_write(self):
+        """이전 view는 이후 publish에 영향받지 않음."""
+        snapshot = ObservationSnapshot()
+        snapshot.merge({"ws-1": ({"container": None}, {})}, seeded=True)
+        before, version = snapshot.view(), snapshot.version
+
+        snapshot.merge({"ws-1": ({"container": _RUNNING}, {})})
+
+        assert before["ws-1"]["container"] is None
+        assert snapshot.version == version + 1
+
+    def test_full_sweep_prunes_and_touch_refreshes(self):
+        snapshot = ObservationSnapshot()
+        snapshot.merge({"ws-1": ({}, {}), "ws-2": ({}, {})}, seeded=True)
+
+        snapshot.merge({}, keep={"ws-1"})
+        snapshot.touch({"ws-1"}, {"archive": "t3"})
+
+        assert dict(snapshot.view()) == {"ws-1": {"observed_at": {"archive": "t3"}}}
+
+    def test_invalidate_falls_back_to_db(self):
+        snapshot = ObservationSnapshot()
+        snapshot.merge({"ws-1": ({}, {})}, seeded=True)
+
+        snapshot.invalidate()
+
+        assert snapshot.view() is None
+        assert snapshot.ready is False
+
+
+@pytest.fixture
+def observer(monkeypatch: pytest.MonkeyPatch) -> ObserverCoordinator:
+    monkeypatch.setattr(_settings.observer, "archive_catalog", False)
+    conn = MagicMock()
+    conn.execute = AsyncMock()
+    conn.commit = AsyncMock()
+    result = MagicMock()
+    result.fetchall.side_effect = lambda: [
+        (ws_id,) for ws_id in conn.execute.call_args[0][1]["ids"]
+    ]
+    conn.execute.return_value = result
+    return ObserverCoordinator(
+        conn,
+        MagicMock(spec=LeaderElection),
+        MagicMock(spec=ChannelSubscriber),
+        AsyncMock(),
+        AsyncMock(),
+        snapshot=ObservationSnapshot(),
+    )
+
+
+class TestObserverPublishesSnapshot:
+    async def test_full_sweep_seeds_snapshot_after_commit(self, observer: ObserverCoordinator):
+        containers = {
+            "ws-1": ContainerInfo(workspace_id="ws-1", running=True, reason="Running", message="")
+        }
+
+        await observer._write_conditions({"ws-1"}, containers, {}, {}, full_sweep=True)
+
+        view = observer._snapshot.view()
+        assert view["ws-1"]["container"]["running"] is True
+        assert set(view["ws-1"]["observed_at"]) == {"container", "volume", "archive"}
+
+    async def test_partial_full_sweep_does_not_seed(self, observer: ObserverCoordinator):
+        await observer._write_conditions({"ws-1"}, {}, {}, None, full_sweep=True)
+
+        assert observer._snapshot.view() is None
+
+    async def test_commit_failure_invalidates(self, observer: ObserverCoordinator):
+        await observer._write_conditions({"ws-1"}, {}, {}, {}, full_sweep=True)
+        observer._conn.commit.side_effect = Exception("connection lost")
+
+        with pytest.raises(Exception, match="connection lost"):
+            await observer._write_conditions({"ws-2"}, {}, {}, {})
+
+        assert observer._snapshot.view() is None
+
+    async def test_leadership_lost_invalidates(self, observer: ObserverCoordinator):
+        await observer._write_conditions({"ws-1"}, {}, {}, {}, full_sweep=True)
+
+        observer._on_leadership_lost()
+
+        assert observer._snapshot.view() is None
@@ -1,21 +1,25 @@
 """Tests for Observer Coordinator."""
 
 import asyncio
+import json
+import time
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from codehub.core.interfaces.leader import LeaderElection
 from codehub.infra.redis_pubsub import ChannelSubscriber
-from codehub.control.coordinator.observer import BulkObserver, ObserverCoordinator
+from codehub.control.coordinator.base import PollReason, parse_wake
+from codehub.control.coordinator.observer import BulkObserver, ObserverCoordinator, _settings
 from codehub.core.interfaces.instance import ContainerInfo, InstanceController
-from codehub.core.interfaces.storage import StorageProvider, VolumeInfo
+from codehub.core.interfaces.storage import ArchiveInfo, StorageProvider, VolumeInfo
 
 
 @pytest.fixture
 def mock_ic() -> AsyncMock:
     ic = AsyncMock(spec=InstanceController)
     ic.list_all = AsyncMock(return_value=[])
+    ic.inspect = AsyncMock(return_value=None)
     return ic
 
 
@@ -24,6 +28,8 @@ def mock_sp() -> AsyncMock:
     sp = AsyncMock(spec=StorageProvider)
     sp.list_volumes = AsyncMock(return_value=[])
     sp.list_archives = AsyncMock(return_value=[])
+    sp.inspect_volume = AsyncMock(return_value=None)
+    sp.head_archive = AsyncMock(return_value=None)
     return sp
 
 
@@ -73,6 +79,74 @@ class TestBulkObserver:
         assert archives == {}
 
 
+    async def test_targeted_inspects_per_workspace(
+        self, mock_ic: AsyncMock, mock_sp: AsyncMock
+    ):
+        """Targeted → container/volume inspect, archive는 workspace별 prefix listing."""
+        mock_ic.inspect.return_value = ContainerInfo(
+            workspace_id="ws-1", running=True, reason="Running", message=""
+        )
+        mock_sp.list_archives.return_value = [
+            ArchiveInfo(workspace_id="ws-1", archive_key="k", exists=True, reason="", message="")
+        ]
+        observer = BulkObserver(mock_ic, mock_sp)
+
+        containers, volumes, archives = await observer.observe_all({"ws-1"})
+
+        assert set(containers) == {"ws-1"}
+        assert volumes == {}
+        assert set(archives) == {"ws-1"}
+        mock_ic.inspect.assert_awaited_once_with("ws-1")
+        mock_sp.inspect_volume.assert_awaited_once_with("ws-1")
+        mock_ic.list_all.assert_not_called()
+        mock_sp.list_volumes.assert_not_called()
+        mock_sp.list_archives.assert_awaited_once_with(f"{observer._prefix}ws-1/")
+
+    async def test_targeted_heads_known_archive_key(
+        self, mock_ic: AsyncMock, mock_sp: AsyncMock
+    ):
+        """Archive key를 알면 HEAD (없으면 prefix listing으로 fallback)."""
+        mock_sp.head_archive.side_effect = lambda key: (
+            ArchiveInfo(workspace_id="ws-1", archive_key=key, exists=True, reason="", message="")
+            if key == "ws-1/op/home.tar.zst"
+            else None
+        )
+        observer = BulkObserver(mock_ic, mock_sp)
+
+        _, _, archives = await observer.observe_all(
+            {"ws-1", "ws-2"}, {"ws-1": "ws-1/op/home.tar.zst", "ws-2": "ws-2/gone/home.tar.zst"}
+        )
+
+        assert archives["ws-1"].archive_key == "ws-1/op/home.tar.zst"
+        mock_sp.list_archives.assert_awaited_once_with(f"{observer._prefix}ws-2/")
+
+    async def test_targeted_over_limit_uses_full_archive_listing(
+        self, mock_ic: AsyncMock, mock_sp: AsyncMock
+    ):
+        observer = BulkObserver(mock_ic, mock_sp)
+        observer._targeted_max = 1
+
+        await observer.observe_all({"ws-1", "ws-2"})
+
+        mock_sp.list_archives.assert_awaited_once_with(observer._prefix)
+
+    async def test_catalog_replaces_archive_listing(
+        self, mock_ic: AsyncMock, mock_sp: AsyncMock
+    ):
+        """Archive catalog → S3 listing 없이 catalog에서 최신 archive 조회."""
+        catalog = AsyncMock()
+        catalog.latest.return_value = [
+            ArchiveInfo(workspace_id="ws-1", archive_key="k", exists=True, reason="", message="")
+        ]
+        observer = BulkObserver(mock_ic, mock_sp, catalog=catalog)
+
+        _, _, archives = await observer.observe_all({"ws-1"})
+
+        assert set(archives) == {"ws-1"}
+        catalog.latest.assert_awaited_once_with({"ws-1"})
+        mock_sp.list_archives.assert_not_called()
+
+
 @pytest.fixture
 def mock_conn() -> MagicMock:
     conn = MagicMock()
@@ -100,27 +174,64 @@ def coordinator(
     mock_subscriber: MagicMock,
     mock_ic: AsyncMock,
     mock_sp: AsyncMock,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> ObserverCoordinator:
+    # S3 listing 경로 (catalog 경로는 TestBulkObserver에서)
+    monkeypatch.setattr(_settings.observer, "archive_catalog", False)
     return ObserverCoordinator(mock_conn, mock_leader, mock_subscriber, mock_ic, mock_sp)
 
 
 class TestObserverTick:
     """tick() 동작 테스트."""
 
-    async def test_skip_when_any_observation_fails(
-        self, coordinator: ObserverCoordinator, mock_conn: MagicMock, mock_ic: AsyncMock
+    async def test_skip_when_all_observations_fail(
+        self,
+        coordinator: ObserverCoordinator,
+        mock_conn: MagicMock,
+        mock_ic: AsyncMock,
+        mock_sp: AsyncMock,
     ):
-        """하나라도 실패 → tick skip."""
+        """전부 실패 → tick skip."""
         mock_ws_result = MagicMock()
         mock_ws_result.fetchall.return_value = [("ws-1",)]
         mock_conn.execute.return_value = mock_ws_result
 
         mock_ic.list_all = AsyncMock(side_effect=asyncio.TimeoutError())
+        mock_sp.list_volumes = AsyncMock(side_effect=asyncio.TimeoutError())
+        mock_sp.list_archives = AsyncMock(side_effect=asyncio.TimeoutError())
 
         await coordinator.reconcile()
 
         mock_conn.commit.assert_not_called()
 
+    async def test_partial_observation_keeps_failed_resource(
+        self,
+        coordinator: ObserverCoordinator,
+        mock_conn: MagicMock,
+        mock_ic: AsyncMock,
+        mock_sp: AsyncMock,
+    ):
+        """archive listing 실패 → container/volume만 기록 (archive는 이전 값 유지)."""
+        mock_ws_result = MagicMock()
+        mock_ws_result.fetchall.return_value = [("ws-1",)]
+        mock_update_result = MagicMock()
+        mock_update_result.fetchall.return_value = [("ws-1",)]
+        mock_conn.execute.side_effect = [mock_ws_result, mock_update_result]
+        mock_ic.list_all.return_value = [
+            ContainerInfo(workspace_id="ws-1", running=True, reason="Running", message="")
+        ]
+        mock_sp.list_archives = AsyncMock(side_effect=asyncio.TimeoutError())
+
+        await coordinator.reconcile()
+
+        params = mock_conn.execute.call_args[0][1]
+        cond = json.loads(params["conds"][0])
+        observed = json.loads(params["observed"][0])
+        assert set(cond) == {"container", "volume"}
+        assert cond["container"]["running"] is True
+        assert set(observed) == {"container", "volume"}
+        mock_conn.commit.assert_called_once()
+
     async def test_updates_when_all_succeed(
         self, coordinator: ObserverCoordinator, mock_conn: MagicMock, mock_ic: AsyncMock
     ):
@@ -139,6 +250,89 @@ class TestObserverTick:
 
         mock_conn.commit.assert_called_once()
 
+    async def test_targeted_updates_only_hot_workspaces(
+        self, coordinator: ObserverCoordinator, mock_conn: MagicMock, mock_ic: AsyncMock
+    ):
+        """Targeted tick → hot workspace만 업데이트, 컨테이너 소멸 추적 유지."""
+        coordinator._active_until = 0.0
+        coordinator._last_full_sweep = time.time()
+        coordinator._prev_container_ids = {"ws-1", "ws-2"}
+        coordinator.add_hot_ids(["ws-1"])
+
+        mock_ws_result = MagicMock()
+        mock_ws_result.fetchall.return_value = [("ws-1", None)]
+        mock_update_result = MagicMock()
+        mock_update_result.fetchall.return_value = [("ws-1",)]
+        mock_conn.execute.side_effect = [mock_ws_result, mock_update_result]
+        mock_ic.inspect.return_value = ContainerInfo(
+            workspace_id="ws-1", running=True, reason="Running", message=""
+        )
+
+        await coordinator.reconcile()
+
+        params = mock_conn.execute.call_args[0][1]
+        assert params["ids"] == ["ws-1"]
+        assert coordinator._prev_container_ids == {"ws-1", "ws-2"}
+        mock_conn.commit.assert_called_once()
+
+
+class TestTwoTier:
+    """Hot tier (transitional + wake) / steady tier (full sweep) 분리."""
+
+    def test_active_wake_does_not_force_full_sweep(self, coordinator: ObserverCoordinator):
+        """Active 구간에도 steady sweep은 STEADY_INTERVAL 주기만."""
+        coordinator._last_full_sweep = time.time()
+        coordinator.accelerate()
+
+        assert coordinator._select_targets() == set()
+
+    def test_steady_sweep_when_interval_elapsed(self, coordinator: ObserverCoordinator):
+        coordinator._last_full_sweep = time.time() - coordinator.STEADY_INTERVAL - 1
+        coordinator.add_hot_ids(["ws-1"])
+
+        assert coordinator._select_targets() is None
+
+    async def test_hot_tier_loads_transitional_workspaces(
+        self, coordinator: ObserverCoordinator, mock_conn: MagicMock
+    ):
+        """Hot tier load → wake id 또는 transitional 조건 (operation/phase)."""
+        result = MagicMock()
+        result.fetchall.return_value = [("ws-2", "ws-2/op/home.tar.zst")]
+        mock_conn.execute.return_value = result
+
+        hot = await coordinator._load_hot({"ws-1"})
+
+        sql = str(mock_conn.execute.call_args[0][0])
+        assert "workspaces.operation !=" in sql
+        assert "workspaces.phase != workspaces.desired_state" in sql
+        assert "workspaces.id IN" in sql
+        assert hot == {"ws-2": "ws-2/op/home.tar.zst"}
+
+    async def test_hot_tier_keeps_active_interval(
+        self, coordinator: ObserverCoordinator, mock_conn: MagicMock
+    ):
+        """Transitional workspace가 있으면 ACTIVE_INTERVAL, 없어지면 다음 steady sweep까지."""
+        coordinator._active_until = 0.0
+        coordinator._last_full_sweep = time.time()
+
+        hot = MagicMock()
+        hot.fetchall.return_value = [("ws-1", None)]
+        update = MagicMock()
+        update.fetchall.return_value = [("ws-1",)]
+        mock_conn.execute.side_effect = [hot, update]
+        await coordinator.reconcile()
+        assert coordinator._get_interval() == coordinator.ACTIVE_INTERVAL
+
+        empty = MagicMock()
+        empty.fetchall.return_value = []
+        mock_conn.execute.side_effect = [empty]
+        await coordinator.reconcile()
+        assert coordinator._choose_interval() == (
+            pytest.approx(coordinator.STEADY_INTERVAL, abs=1.0),
+            PollReason.DEADLINE,
+        )
+        mock_conn.commit.assert_called_once()
+
 
 class TestBulkUpdateConditions:
     """_bulk_update_conditions() 테스트."""
@@ -200,3 +394,113 @@ class TestBulkUpdateConditions:
         ws2_idx = ws_ids.index("ws-2")
         cond = json.loads(params["conds"][ws2_idx])
         assert cond["container"] is None
+
+
+class TestDiffOnlyWrite:
+    """Fingerprint 기반 diff-only conditions write 테스트."""
+
+    @pytest.fixture(autouse=True)
+    def update_result(self, mock_conn: MagicMock) -> None:
+        result = MagicMock()
+        result.fetchall.side_effect = lambda: [
+            (ws_id,) for ws_id in mock_conn.execute.call_args[0][1]["ids"]
+        ]
+        mock_conn.execute.return_value = result
+
+    async def test_unchanged_conditions_are_skipped(
+        self, coordinator: ObserverCoordinator, mock_conn: MagicMock
+    ):
+        containers = {
+            "ws-1": ContainerInfo(
+                workspace_id="ws-1", running=True, reason="Running", message="Up 1 minute"
+            )
+        }
+        assert await coordinator._write_conditions({"ws-1", "ws-2"}, containers, {}, {}) == 2
+
+        # message만 바뀜 → skip
+        containers = {
+            "ws-1": ContainerInfo(
+                workspace_id="ws-1", running=True, reason="Running", message="Up 2 minutes"
+            )
+        }
+        assert await coordinator._write_conditions({"ws-1", "ws-2"}, containers, {}, {}) == 0
+        assert mock_conn.execute.call_count == 1
+
+    async def test_only_changed_rows_are_written(
+        self, coordinator: ObserverCoordinator, mock_conn: MagicMock
+    ):
+        await coordinator._write_conditions({"ws-1", "ws-2"}, {}, {}, {})
+
+        volumes = {
+            "ws-2": VolumeInfo(workspace_id="ws-2", exists=True, reason="VolumeExists", message="")
+        }
+        written = await coordinator._write_conditions({"ws-1", "ws-2"}, {}, volumes, {})
+
+        assert written == 1
+        assert mock_conn.execute.call_args[0][1]["ids"] == ["ws-2"]
+
+    async def test_commit_failure_resets_fingerprints(
+        self, coordinator: ObserverCoordinator, mock_conn: MagicMock
+    ):
+        mock_conn.commit = AsyncMock(side_effect=Exception("connection lost"))
+
+        with pytest.raises(Exception, match="connection lost"):
+            await coordinator._write_conditions({"ws-1"}, {}, {}, {})
+
+        assert coordinator._fingerprints == {}
+
+    async def test_leadership_lost_resets_fingerprints(
+        self, coordinator: ObserverCoordinator
+    ):
+        await coordinator._write_conditions({"ws-1"}, {}, {}, {})
+
+        coordinator._on_leadership_lost()
+
+        assert coordinator._fingerprints == {}
+
+    async def test_heartbeat_refreshes_observed_at(
+        self, coordinator: ObserverCoordinator, mock_conn: MagicMock
+    ):
+        """Heartbeat → 관측 성공한 resource의 관측 시각만 갱신 (sub-condition 값 없음)."""
+        await coordinator._heartbeat_observed_at({"ws-1"}, ["container", "volume"])
+
+        sql = str(mock_conn.execute.call_args[0][0])
+        params = mock_conn.execute.call_args[0][1]
+        assert "SET observed_at" in sql
+        assert set(json.loads(params["observed"])) == {"container", "volume"}
+        assert params["ids"] == ["ws-1"]
+        mock_conn.commit.assert_called_once()
+
+    async def test_only_changed_sub_conditions_are_written(
+        self, coordinator: ObserverCoordinator, mock_conn: MagicMock
+    ):
+        await coordinator._write_conditions({"ws-1"}, {}, {}, {})
+
+        volumes = {
+            "ws-1": VolumeInfo(workspace_id="ws-1", exists=True, reason="VolumeExists", message="")
+        }
+        await coordinator._write_conditions({"ws-1"}, {}, volumes, None)
+
+        params = mock_conn.execute.call_args[0][1]
+        assert list(json.loads(params["conds"][0])) == ["volume"]
+        assert list(json.loads(params["observed"][0])) == ["volume"]
+
+    async def test_changed_hot_workspace_wakes_wc(
+        self, coordinator: ObserverCoordinator, mock_conn: MagicMock
+    ):
+        """Hot tier write에서 바뀐 workspace만 WC targeted wake."""
+        publisher = AsyncMock()
+        coordinator._publisher = publisher
+        containers = {
+            "ws-1": ContainerInfo(workspace_id="ws-1", running=True, reason="Running", message="")
+        }
+
+        await coordinator._write_conditions({"ws-1"}, containers, {}, {})
+
+        channel, payload = publisher.publish.call_args[0]
+        assert channel.endswith(":wc")
+        assert parse_wake(payload) == {"ws-1"}
+
+        publisher.publish.reset_mock()
+        await coordinator._write_conditions({"ws-1"}, containers, {}, {})
+        publisher.publish.assert_not_called()
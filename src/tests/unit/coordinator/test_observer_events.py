@@ -0,0 +1,206 @@
+"""Tests for Observer event mode (Docker /events watcher)."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from codehub.control.coordinator.observer import BulkObserver
+from codehub.control.coordinator.observer_events import DockerEventWatcher
+from codehub.core.interfaces.instance import ContainerInfo, InstanceController
+from codehub.core.interfaces.storage import StorageProvider, VolumeInfo
+from codehub.infra.redis_pubsub import ChannelPublisher
+
+
+def container_event(action: str, name: str) -> dict:
+    return {"Type": "container", "Action": action, "Actor": {"Attributes": {"name": name}}}
+
+
+def volume_event(action: str, name: str) -> dict:
+    return {"Type": "volume", "Action": action, "Actor": {"ID": name}}
+
+
+class IdleEvents:
+    """이벤트 없이 연결만 유지하는 stream."""
+
+    async def stream(self, filters: dict | None = None):
+        await asyncio.Event().wait()
+        yield {}
+
+
+@pytest.fixture
+def publisher() -> AsyncMock:
+    publisher = AsyncMock(spec=ChannelPublisher)
+    publisher.publish = AsyncMock(return_value=1)
+    return publisher
+
+
+@pytest.fixture
+def watcher(publisher: AsyncMock) -> DockerEventWatcher:
+    w = DockerEventWatcher(publisher, events=IdleEvents())
+    w.WAKE_DEBOUNCE = 0.01
+    return w
+
+
+class TestApply:
+    """apply() 이벤트 → state map 반영."""
+
+    def test_container_lifecycle(self, watcher: DockerEventWatcher):
+        name = f"{watcher._prefix}ws-1"
+
+        assert watcher.apply(container_event("start", name)) == "ws-1"
+        assert watcher.containers_for({"ws-1"})["ws-1"].running is True
+
+        watcher.apply(container_event("die", name))
+        info = watcher.containers_for({"ws-1"})["ws-1"]
+        assert info.running is False
+        assert info.reason == "Exited"
+
+        watcher.apply(container_event("destroy", name))
+        assert watcher.containers_for({"ws-1"}) == {}
+
+    def test_volume_lifecycle(self, watcher: DockerEventWatcher):
+        name = f"{watcher._prefix}ws-1-home"
+
+        assert watcher.apply(volume_event("create", name)) == "ws-1"
+        assert watcher.volumes_for({"ws-1"})["ws-1"].exists is True
+
+        watcher.apply(volume_event("destroy", name))
+        assert watcher.volumes_for({"ws-1"}) == {}
+
+    def test_ignores_unrelated_events(self, watcher: DockerEventWatcher):
+        prefix = watcher._prefix
+        events = [
+            container_event("start", "codehub-job-archive-1"),  # storage job
+            container_event("exec_start: sh", f"{prefix}ws-1"),
+            volume_event("mount", f"{prefix}ws-1-home"),
+            {"Type": "network", "Action": "connect", "Actor": {}},
+        ]
+
+        assert [watcher.apply(e) for e in events] == [None] * len(events)
+
+
+class TestLifecycle:
+    async def test_synced_only_after_seed(self, watcher: DockerEventWatcher):
+        assert watcher.synced is False
+        watcher.seed({}, {}, watcher.mark())
+        assert watcher.synced is False  # 미구독 상태에서는 무시
+
+        watcher.start()
+        assert watcher.synced is False
+        watcher.seed({}, {}, watcher.mark())
+        assert watcher.synced is True
+
+        watcher.stop()
+        assert watcher.synced is False
+
+    async def test_seed_keeps_events_applied_during_listing(self, watcher: DockerEventWatcher):
+        """Listing 시작 후 반영된 이벤트가 listing (더 오래된 상태)보다 우선."""
+        prefix = watcher._prefix
+        running = ContainerInfo(workspace_id="ws-1", running=True, reason="Running", message="")
+        volume = VolumeInfo(workspace_id="ws-2", exists=True, reason="VolumeExists", message="")
+        watcher.start()
+        watcher.apply(container_event("start", f"{prefix}ws-3"))  # listing 이전 이벤트
+
+        mark = watcher.mark()
+        watcher.apply(container_event("die", f"{prefix}ws-1"))  # listing 도중
+        watcher.apply(volume_event("destroy", f"{prefix}ws-2-home"))
+        watcher.seed({"ws-1": running}, {"ws-2": volume}, mark)
+
+        assert watcher.containers_for({"ws-1"})["ws-1"].running is False
+        assert watcher.volumes_for({"ws-2"}) == {}
+        assert watcher.containers_for({"ws-3"}) == {}  # listing에 없음 → listing이 최신
+
+        # 다음 sweep에서는 listing이 다시 기준
+        watcher.seed({"ws-1": running}, {"ws-2": volume}, watcher.mark())
+        assert watcher.containers_for({"ws-1"})["ws-1"].running is True
+        watcher.stop()
+
+    async def test_listing_started_before_reconnect_is_not_synced(
+        self, watcher: DockerEventWatcher
+    ):
+        watcher.start()
+        mark = watcher.mark()
+        watcher._resync_after = watcher._next_seq()  # listing 도중 stream 재연결
+
+        watcher.seed({}, {}, mark)
+        assert watcher.synced is False
+
+        watcher.seed({}, {}, watcher.mark())
+        assert watcher.synced is True
+        watcher.stop()
+
+    async def test_changes_are_coalesced_into_targeted_wake(
+        self, watcher: DockerEventWatcher, publisher: AsyncMock
+    ):
+        watcher._mark_dirty("ws-2")
+        watcher._mark_dirty("ws-1")
+        await watcher._flush
+
+        payloads = {call.args[1] for call in publisher.publish.await_args_list}
+        assert payloads == {json.dumps({"ids": ["ws-1", "ws-2"]})}
+        assert publisher.publish.await_count == 2  # observer + wc
+
+    async def test_change_during_publish_is_flushed(
+        self, watcher: DockerEventWatcher, publisher: AsyncMock
+    ):
+        async def _slow_publish(channel: str, payload: str) -> int:
+            await asyncio.sleep(0.01)
+            return 1
+
+        publisher.publish.side_effect = _slow_publish
+        watcher._mark_dirty("ws-1")
+        first = watcher._flush
+        await asyncio.sleep(watcher.WAKE_DEBOUNCE + 0.005)  # publish 진행 중
+        watcher._mark_dirty("ws-2")
+        await first
+        await watcher._flush
+
+        assert publisher.publish.await_args[0][1] == json.dumps({"ids": ["ws-2"]})
+        assert not watcher._dirty
+
+
+class TestBulkObserverEventMode:
+    async def test_targeted_reads_map_when_synced(self, watcher: DockerEventWatcher):
+        ic = AsyncMock(spec=InstanceController)
+        sp = AsyncMock(spec=StorageProvider)
+        sp.list_archives = AsyncMock(return_value=[])
+        watcher.start()
+        watcher.seed(
+            {"ws-1": ContainerInfo(workspace_id="ws-1", running=True, reason="Running", message="")},
+            {"ws-1": VolumeInfo(workspace_id="ws-1", exists=True, reason="VolumeExists", message="")},
+            watcher.mark(),
+        )
+        observer = BulkObserver(ic, sp, watcher)
+
+        containers, volumes, archives = await observer.observe_all({"ws-1"})
+
+        assert containers["ws-1"].running is True
+        assert volumes["ws-1"].exists is True
+        assert archives == {}
+        ic.list_all.assert_not_called()
+        sp.list_volumes.assert_not_called()
+        watcher.stop()
+
+    async def test_inspects_when_not_synced(self, watcher: DockerEventWatcher):
+        ic = AsyncMock(spec=InstanceController)
+        ic.inspect = AsyncMock(return_value=None)
+        sp = AsyncMock(spec=StorageProvider)
+        sp.inspect_volume = AsyncMock(return_value=None)
+        sp.list_archives = AsyncMock(return_value=[])
+        observer = BulkObserver(ic, sp, watcher)
+
+        await observer.observe_all({"ws-1"})
+
+        ic.inspect.assert_awaited_once_with("ws-1")
+        ic.list_all.assert_not_called()
+
+
+def test_coordinator_without_publisher_has_no_watcher():
+    from codehub.control.coordinator.observer import ObserverCoordinator
+
+    coord = ObserverCoordinator(
+        MagicMock(), MagicMock(), MagicMock(), AsyncMock(), AsyncMock()
+    )
+    assert coord._watcher is None
@@ -0,0 +1,167 @@
+"""Tests for CoordinatorRuntime (단일 loop multiplex).
+
+Reference: docs/spec/04-control-plane.md (Unified runtime)
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from codehub.control.coordinator.base import CoordinatorBase, CoordinatorType, encode_wake
+from codehub.control.coordinator.runtime import CoordinatorRuntime
+from codehub.core.interfaces.leader import LeaderElection
+from codehub.infra.redis_pubsub import MultiChannelSubscriber
+
+
+class _Recorder(CoordinatorBase):
+    """tick 순서를 기록하는 Coordinator."""
+
+    MIN_INTERVAL = 0.0
+    IDLE_INTERVAL = 10.0
+    ACTIVE_INTERVAL = 10.0
+    LEADER_RETRY_INTERVAL = 10.0
+
+    def __init__(self, conn, leader, subscriber, log: list[str]) -> None:
+        super().__init__(conn, leader, subscriber)
+        self._log = log
+
+    async def reconcile(self) -> None:
+        self._log.append(self.COORDINATOR_TYPE.value)
+
+
+class _Observer(_Recorder):
+    COORDINATOR_TYPE = CoordinatorType.OBSERVER
+    WAKE_TARGET = "observer"
+
+
+class _WC(_Recorder):
+    COORDINATOR_TYPE = CoordinatorType.WC
+    WAKE_TARGET = "wc"
+
+
+class _Scheduler(_Recorder):
+    COORDINATOR_TYPE = CoordinatorType.SCHEDULER
+
+
+def _leader(is_leader: bool = True) -> AsyncMock:
+    leader = AsyncMock(spec=LeaderElection)
+    leader.is_leader = is_leader
+    leader.try_acquire = AsyncMock(return_value=is_leader)
+    leader.verify_holding = AsyncMock(return_value=is_leader)
+    return leader
+
+
+@pytest.fixture
+def subscriber() -> AsyncMock:
+    subscriber = AsyncMock(spec=MultiChannelSubscriber)
+    subscriber.get_message = AsyncMock(return_value=None)
+    return subscriber
+
+
+@pytest.fixture
+def log() -> list[str]:
+    return []
+
+
+def _runtime(subscriber: AsyncMock, log: list[str], *leaders: AsyncMock) -> CoordinatorRuntime:
+    leaders = leaders or (_leader(), _leader(), _leader())
+    # 등록 순서와 무관하게 priority 순으로 실행되는지 확인하기 위해 역순 등록
+    coordinators = [
+        _Scheduler(AsyncMock(), leaders[2], AsyncMock(), log),
+        _WC(AsyncMock(), leaders[1], AsyncMock(), log),
+        _Observer(AsyncMock(), leaders[0], AsyncMock(), log),
+    ]
+    return CoordinatorRuntime(subscriber, coordinators)
+
+
+async def _run_due(runtime: CoordinatorRuntime) -> None:
+    """지금 due인 tick을 모두 실행."""
+    while runtime._peek_deadline() <= time.monotonic():
+        await runtime._run_next()
+
+
+class TestCoordinatorRuntime:
+    async def test_due_ticks_run_in_priority_order(self, subscriber: AsyncMock, log: list[str]):
+        """동시에 due → Observer → WC → Scheduler, 이후 각자 interval로 재등록."""
+        runtime = _runtime(subscriber, log)
+        for index in range(3):
+            runtime._schedule(index, 0.0)
+        await asyncio.sleep(0.001)
+
+        await _run_due(runtime)
+
+        assert log == ["observer", "wc", "scheduler"]
+        assert runtime._peek_deadline() > time.monotonic() + 5  # IDLE_INTERVAL 10s
+
+    async def test_wake_dispatch_reschedules_target_only(
+        self, subscriber: AsyncMock, log: list[str]
+    ):
+        runtime = _runtime(subscriber, log)
+        for index in range(3):
+            runtime._schedule(index, 10.0)
+
+        runtime._dispatch("codehub:wake:wc", encode_wake({"ws-1"}))
+        await _run_due(runtime)
+
+        assert log == ["wc"]
+        wc = runtime._coordinators[1]
+        assert "ws-1" in wc._hot_ids
+
+    async def test_wake_for_non_leader_ignored(self, subscriber: AsyncMock, log: list[str]):
+        runtime = _runtime(subscriber, log, _leader(), _leader(is_leader=False), _leader())
+        for index in range(3):
+            runtime._schedule(index, 10.0)
+
+        runtime._dispatch("codehub:wake:wc", "")
+        await _run_due(runtime)
+
+        assert log == []
+
+    async def test_non_leader_retries_after_interval(self, subscriber: AsyncMock, log: list[str]):
+        """리더가 아닌 role → reconcile 없이 LEADER_RETRY_INTERVAL 후 재시도 (sleep 없음)."""
+        runtime = _runtime(subscriber, log, _leader(), _leader(is_leader=False), _leader())
+        runtime._schedule(1, 0.0)
+
+        await runtime._run_next()
+
+        assert log == []
+        assert runtime._deadlines[1] >= time.monotonic() + 9
+
+    async def test_wait_returns_on_wake(self, subscriber: AsyncMock, log: list[str]):
+        runtime = _runtime(subscriber, log)
+        for index in range(3):
+            runtime._schedule(index, 10.0)
+        runtime._channels = {"codehub:wake:observer": 2}
+        subscriber.get_message.side_effect = [("codehub:wake:observer", ""), None]
+
+        await asyncio.wait_for(runtime._wait_due(), timeout=1.0)
+        await runtime._run_next()
+
+        assert log == ["observer"]
+
+    async def test_cleanup_releases_each_role(self, subscriber: AsyncMock, log: list[str]):
+        leaders = (_leader(), _leader(), _leader())
+        runtime = _runtime(subscriber, log, *leaders)
+
+        await runtime._cleanup()
+
+        for leader in leaders:
+            leader.release.assert_awaited_once()
+        subscriber.unsubscribe.assert_awaited_once()
+
+    async def test_cancelled_reconcile_stops_runtime(self, subscriber: AsyncMock, log: list[str]):
+        """reconcile 취소 → tick()이 None 반환 (CancelledError를 직접 raise하지 않음) → loop 종료."""
+        runtime = _runtime(subscriber, log)
+        observer = runtime._coordinators[2]
+        observer.reconcile = AsyncMock(side_effect=asyncio.CancelledError)
+
+        assert await observer.tick() is None
+
+        runtime._running = True
+        runtime._schedule(2, 0.0)
+        await runtime._run_next()
+
+        assert runtime._running is False
+        assert all(index != 2 for _, _, index in runtime._heap)  # 재스케줄 없음
@@ -0,0 +1,101 @@
+"""Tests for Scheduler (TTL inline + GC background task).
+
+Reference: docs/spec/04-control-plane.md (Scheduler)
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from codehub.control.coordinator.scheduler import Scheduler
+
+
+@pytest.fixture
+def gc_runs() -> list[float | None]:
+    return []
+
+
+@pytest.fixture
+def scheduler(
+    mock_conn, mock_leader, mock_subscriber, gc_runs, monkeypatch: pytest.MonkeyPatch
+) -> Scheduler:
+    scheduler = Scheduler(
+        mock_conn, mock_leader, mock_subscriber,
+        AsyncMock(), AsyncMock(), AsyncMock(), AsyncMock(), MagicMock(),
+    )
+    scheduler._ttl = AsyncMock()
+    scheduler.GC_RESUME_INTERVAL = 0.0
+    # 첫 run은 budget 초과 (checkpoint), 두 번째 run에서 완료
+    results = iter([False, True])
+
+    class _Runner:
+        resuming = False
+
+        def __init__(self, *_args) -> None:
+            pass
+
+        async def run(self, budget: float | None = None) -> bool:
+            gc_runs.append(budget)
+            done = next(results, True)
+            type(self).resuming = not done
+            return done
+
+    monkeypatch.setattr("codehub.control.coordinator.scheduler.GCRunner", _Runner)
+    return scheduler
+
+
+class TestScheduler:
+    async def test_gc_runs_in_background_with_budget(
+        self, scheduler: Scheduler, gc_runs: list[float | None]
+    ):
+        """reconcile은 GC를 기다리지 않음, GC는 budget 단위로 checkpoint → 재개."""
+        await scheduler.reconcile()
+
+        scheduler._ttl.run.assert_awaited_once()
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert gc_runs == [scheduler.GC_BUDGET, scheduler.GC_BUDGET]
+        assert scheduler._last_gc is not None  # cycle 완료 후에만 기록
+        scheduler._engine.connect.assert_called_once()  # 전용 connection
+        await scheduler._cleanup()
+
+    async def test_slow_gc_does_not_delay_ttl(self, scheduler: Scheduler):
+        """GC 실행 중에도 TTL 주기 유지 (GC task는 하나만)."""
+        scheduler.GC_RESUME_INTERVAL = 3600.0  # checkpoint 후 대기 중인 GC
+        await scheduler.reconcile()
+        task = scheduler._gc_task
+        scheduler._last_ttl = 0.0
+        await scheduler.reconcile()
+
+        assert scheduler._ttl.run.await_count == 2
+        assert scheduler._gc_task is task
+        await scheduler._cleanup()
+
+    async def test_next_deadline_tracks_ttl_only(self, scheduler: Scheduler):
+        await scheduler.reconcile()
+
+        assert scheduler._next_deadline() == pytest.approx(scheduler._ttl_interval, abs=1.0)
+        await scheduler._cleanup()
+
+    async def test_leadership_lost_cancels_gc(self, scheduler: Scheduler):
+        await scheduler.reconcile()
+        task = scheduler._gc_task
+
+        scheduler._on_leadership_lost()
+        await asyncio.gather(task, return_exceptions=True)
+
+        assert task.cancelled()
+        assert scheduler._gc_task is None
+
+    async def test_crashed_gc_task_restarted(self, scheduler: Scheduler):
+        scheduler._engine.connect.side_effect = RuntimeError("db down")
+        await scheduler.reconcile()
+        await asyncio.gather(scheduler._gc_task, return_exceptions=True)
+        scheduler._engine.connect.side_effect = None
+
+        await scheduler.reconcile()
+
+        assert not scheduler._gc_task.done()
+        await scheduler._cleanup()
@@ -3,11 +3,12 @@
 Reference: docs/architecture_v2/ttl-manager.md
 """
 
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from codehub.control.coordinator.scheduler_ttl import TTLRunner
+from codehub.control.coordinator.scheduler_ttl import ArchiveWindow, TTLRunner
 from codehub.infra.redis_kv import ActivityStore
 from codehub.infra.redis_pubsub import ChannelPublisher
 
@@ -25,8 +26,9 @@ def mock_conn() -> AsyncMock:
 def mock_activity() -> AsyncMock:
     """Mock ActivityStore."""
     activity = AsyncMock(spec=ActivityStore)
-    activity.scan_all = AsyncMock(return_value={})
-    activity.delete = AsyncMock(return_value=0)
+    activity.pop_expired = AsyncMock(return_value={})
+    activity.get_since = AsyncMock(return_value=[])
+    activity.get_many = AsyncMock(return_value={})
     return activity
 
 
@@ -60,75 +62,83 @@ class TestTTLRunnerConfig:
         assert runner._archive_ttl > 0
 
 
-class TestSyncToDb:
-    """_sync_to_db() tests."""
+class TestActivityWriteBack:
+    """Activity ZSET → last_access_at lazy write-back tests."""
 
-    async def test_empty_redis(
-        self,
-        runner: TTLRunner,
-        mock_activity: AsyncMock,
-    ):
-        """Returns 0 when no activities in Redis."""
-        mock_activity.scan_all.return_value = {}
+    def _returning(self, ids: list[str]) -> MagicMock:
+        result = MagicMock()
+        result.fetchall.return_value = [(ws_id,) for ws_id in ids]
+        return result
 
-        count = await runner._sync_to_db()
+    async def test_drain_empty(self, runner: TTLRunner, mock_conn: AsyncMock):
+        count = await runner._drain_expired(1704067200.0)
 
         assert count == 0
+        mock_conn.execute.assert_not_called()
 
-    async def test_syncs_activities(
+    async def test_drain_pops_in_chunks(
         self,
         runner: TTLRunner,
         mock_conn: AsyncMock,
         mock_activity: AsyncMock,
     ):
-        """Syncs Redis activities to DB using bulk unnest UPDATE."""
-        activities = {
-            "ws-1": 1704067200.0,
-            "ws-2": 1704067300.0,
-        }
-        mock_activity.scan_all.return_value = activities
-
-        # Mock bulk UPDATE result with RETURNING
-        mock_result = MagicMock()
-        mock_result.fetchall.return_value = [("ws-1",), ("ws-2",)]
-        mock_conn.execute.return_value = mock_result
+        """만료 activity를 chunk 단위 pop → 1 chunk당 1 bulk UPDATE (GREATEST 의미)."""
+        runner._chunk_size = 2
+        mock_activity.pop_expired.side_effect = [
+            {"ws-1": 1704067200.0, "ws-2": 1704067300.0},
+            {"ws-3": 1704067400.0},
+        ]
+        mock_conn.execute.return_value = self._returning(["ws-1"])
+
+        count = await runner._drain_expired(1704067500.0)
+
+        assert count == 3
+        assert mock_activity.pop_expired.await_count == 2
+        assert mock_conn.execute.call_count == 2
+        sql, params = mock_conn.execute.call_args_list[0][0]
+        assert "w.last_access_at < v.ts" in str(sql)  # 기존 값보다 새로울 때만
+        assert params["ids"] == ["ws-1", "ws-2"]
+
+    async def test_drain_bounded_per_run(
+        self,
+        runner: TTLRunner,
+        mock_conn: AsyncMock,
+        mock_activity: AsyncMock,
+    ):
+        """run당 drain_limit까지만 pop (나머지는 다음 run)."""
+        runner._chunk_size = 2
+        runner._drain_limit = 3
+        mock_activity.pop_expired.side_effect = [
+            {"ws-1": 1.0, "ws-2": 2.0},
+            {"ws-3": 3.0},
+        ]
+        mock_conn.execute.return_value = self._returning([])
 
-        count = await runner._sync_to_db()
+        count = await runner._drain_expired(10.0)
 
-        assert count == 2
-        # Should execute 1 bulk UPDATE statement (not N individual updates)
-        assert mock_conn.execute.call_count == 1
-        # Should delete Redis keys for updated workspaces only
-        mock_activity.delete.assert_called_once_with(["ws-1", "ws-2"])
+        assert count == 3
+        assert mock_activity.pop_expired.await_args_list[1][0] == (10.0, 1)
 
-    async def test_partial_update_only_deletes_updated_ids(
+    async def test_periodic_writeback_pages_by_score(
         self,
         runner: TTLRunner,
         mock_conn: AsyncMock,
         mock_activity: AsyncMock,
     ):
-        """Only deletes Redis keys for successfully updated workspaces.
-
-        Scenario: ws-3 was modified by another coordinator (WC) between
-        Redis scan and DB update, so UPDATE doesn't match ws-3.
-        """
-        activities = {
-            "ws-1": 1704067200.0,
-            "ws-2": 1704067300.0,
-            "ws-3": 1704067400.0,  # This one will fail to update
-        }
-        mock_activity.scan_all.return_value = activities
-
-        # Mock: UPDATE only matches ws-1 and ws-2 (ws-3 was modified)
-        mock_result = MagicMock()
-        mock_result.fetchall.return_value = [("ws-1",), ("ws-2",)]
-        mock_conn.execute.return_value = mock_result
+        """마지막 write-back 이후 활동만 score cursor로 page (ZSET에는 유지)."""
+        runner._chunk_size = 2
+        runner._writeback_mark = 100.0
+        mock_activity.get_since.side_effect = [
+            [("ws-1", 101.0), ("ws-2", 102.0)],
+            [("ws-3", 103.0)],
+        ]
+        mock_conn.execute.return_value = self._returning(["ws-1"])
 
-        count = await runner._sync_to_db()
+        await runner._writeback_recent()
 
-        assert count == 2
-        # Should only delete successfully updated IDs (not ws-3)
-        mock_activity.delete.assert_called_once_with(["ws-1", "ws-2"])
+        assert [c[0][0] for c in mock_activity.get_since.await_args_list] == [100.0, 102.0]
+        assert runner._writeback_mark == 103.0
+        assert mock_conn.execute.call_count == 2
 
 
 class TestCheckStandbyTtl:
@@ -145,7 +155,7 @@ class TestCheckStandbyTtl:
         mock_result.fetchall.return_value = []
         mock_conn.execute.return_value = mock_result
 
-        count = await runner._check_standby_ttl()
+        count = await runner._check_standby_ttl(1704067200.0)
 
         assert count == 0
 
@@ -153,18 +163,42 @@ class TestCheckStandbyTtl:
         self,
         runner: TTLRunner,
         mock_conn: AsyncMock,
+        mock_activity: AsyncMock,
     ):
-        """Updates desired_state using single UPDATE + RETURNING."""
-        # Single UPDATE with RETURNING returns updated ids
+        """DB 후보 중 ZSET에 최근 활동이 없는 workspace만 bulk UPDATE."""
+        candidates = MagicMock()
+        candidates.fetchall.return_value = [("ws-1",), ("ws-2",)]
         update_result = MagicMock()
         update_result.fetchall.return_value = [("ws-1",), ("ws-2",)]
-        mock_conn.execute.return_value = update_result
+        mock_conn.execute.side_effect = [candidates, update_result]
 
-        count = await runner._check_standby_ttl()
+        count = await runner._check_standby_ttl(1704067200.0)
 
         assert count == 2
-        # Only 1 UPDATE statement (not 1 SELECT + N UPDATEs)
-        assert mock_conn.execute.call_count == 1
+        mock_activity.get_many.assert_awaited_once_with(["ws-1", "ws-2"])
+        assert mock_conn.execute.call_args[0][1]["ids"] == ["ws-1", "ws-2"]
+
+    async def test_recent_activity_not_expired(
+        self,
+        runner: TTLRunner,
+        mock_conn: AsyncMock,
+        mock_activity: AsyncMock,
+    ):
+        """DB last_access_at이 오래됐어도 ZSET에 cutoff 이후 활동 → 제외 + write-back."""
+        candidates = MagicMock()
+        candidates.fetchall.return_value = [("ws-1",), ("ws-2",)]
+        writeback = MagicMock()
+        writeback.fetchall.return_value = [("ws-1",)]
+        update_result = MagicMock()
+        update_result.fetchall.return_value = [("ws-2",)]
+        mock_conn.execute.side_effect = [candidates, writeback, update_result]
+        mock_activity.get_many.return_value = {"ws-1": 1704067300.0, "ws-2": 1704067100.0}
+
+        count = await runner._check_standby_ttl(1704067200.0)
+
+        assert count == 1
+        assert mock_conn.execute.call_args_list[1][0][1]["ids"] == ["ws-1"]  # write-back
+        assert mock_conn.execute.call_args_list[2][0][1]["ids"] == ["ws-2"]  # standby
 
 
 class TestCheckArchiveTtl:
@@ -202,6 +236,139 @@ class TestCheckArchiveTtl:
         assert mock_conn.execute.call_count == 1
 
 
+class TestArchiveWindow:
+    """ArchiveWindow (off-peak window) tests."""
+
+    def test_disabled_when_empty(self):
+        assert ArchiveWindow.parse("", "UTC") is None
+
+    def test_inside_and_next_window(self):
+        window = ArchiveWindow.parse("01:00-06:00", "UTC")
+
+        inside = datetime(2026, 10, 16, 3, tzinfo=UTC)
+        after = datetime(2026, 10, 16, 12, tzinfo=UTC)
+
+        assert window.bounds(inside) == (
+            datetime(2026, 10, 16, 1, tzinfo=UTC),
+            datetime(2026, 10, 16, 6, tzinfo=UTC),
+        )
+        assert window.bounds(after) == (
+            datetime(2026, 10, 17, 1, tzinfo=UTC),
+            datetime(2026, 10, 17, 6, tzinfo=UTC),
+        )
+
+    def test_window_across_midnight(self):
+        window = ArchiveWindow.parse("22:00-06:00", "UTC")
+
+        now = datetime(2026, 10, 16, 2, tzinfo=UTC)
+
+        assert window.bounds(now) == (
+            datetime(2026, 10, 15, 22, tzinfo=UTC),
+            datetime(2026, 10, 16, 6, tzinfo=UTC),
+        )
+
+    def test_timezone(self):
+        window = ArchiveWindow.parse("01:00-06:00", "Asia/Seoul")
+
+        # 02:00 KST → 진행 중 window (01:00~06:00 KST)
+        assert window.bounds(datetime(2026, 10, 16, 17, tzinfo=UTC)) == (
+            datetime(2026, 10, 16, 16, tzinfo=UTC),
+            datetime(2026, 10, 16, 21, tzinfo=UTC),
+        )
+        # 12:00 KST → 다음 window
+        assert window.bounds(datetime(2026, 10, 16, 3, tzinfo=UTC))[0] == datetime(
+            2026, 10, 16, 16, tzinfo=UTC
+        )
+
+    def test_drain_eta_within_window(self):
+        window = ArchiveWindow.parse("01:00-03:00", "UTC")
+        rate = 10 / 3600  # 10/hour
+
+        # window 안: 남은 2시간에 10개 → 1시간
+        assert window.drain_eta(datetime(2026, 10, 16, 1, tzinfo=UTC), 10, rate) == 3600
+        # window 전 (00:00): 시작까지 1시간 + 1시간
+        assert window.drain_eta(datetime(2026, 10, 16, 0, tzinfo=UTC), 10, rate) == 7200
+
+    def test_drain_eta_spans_windows(self):
+        """Window 용량 (2시간 × 10/hour = 20개)을 넘으면 window 밖 시간까지 포함."""
+        window = ArchiveWindow.parse("01:00-03:00", "UTC")
+        rate = 10 / 3600
+        now = datetime(2026, 10, 16, 1, tzinfo=UTC)
+
+        # 50개: 오늘 20 + 내일 20 + 모레 10 (모레 01:00 + 1시간)
+        expected = datetime(2026, 10, 18, 2, tzinfo=UTC) - now
+        assert window.drain_eta(now, 50, rate) == pytest.approx(expected.total_seconds())
+        # 정확히 2 window 분량 → 내일 window 종료 시 완료
+        expected = datetime(2026, 10, 17, 3, tzinfo=UTC) - now
+        assert window.drain_eta(now, 40, rate) == pytest.approx(expected.total_seconds())
+
+
+class TestArchiveWindowPacing:
+    """_check_archive_ttl() with off-peak window."""
+
+    @pytest.fixture
+    def windowed(self, runner: TTLRunner) -> TTLRunner:
+        runner._archive_window = ArchiveWindow.parse("01:00-06:00", "UTC")
+        return runner
+
+    def _now(self, monkeypatch: pytest.MonkeyPatch, hour: int) -> None:
+        fake = MagicMock(wraps=datetime)
+        fake.now.return_value = datetime(2026, 10, 16, hour, tzinfo=UTC)
+        monkeypatch.setattr("codehub.control.coordinator.scheduler_ttl.datetime", fake)
+
+    def _results(self, mock_conn: AsyncMock, due: int, projected: int, updated: int = 0) -> None:
+        queue = MagicMock()
+        queue.one.return_value = (due, projected)
+        update = MagicMock()
+        update.fetchall.return_value = [(f"ws-{i}",) for i in range(updated)]
+        mock_conn.execute.side_effect = [queue, update]
+
+    async def test_outside_window_only_queues(
+        self, windowed: TTLRunner, mock_conn: AsyncMock, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Window 밖 → 전환 없음, queue만 조회 (due/projected gauge)."""
+        self._now(monkeypatch, 12)
+        self._results(mock_conn, due=40, projected=55)
+
+        assert await windowed._check_archive_ttl() == 0
+
+        assert mock_conn.execute.await_count == 1
+        assert mock_conn.execute.call_args[0][1]["horizon"] == 18 * 3600  # 다음 window 종료까지
+
+    async def test_inside_window_spreads_due_over_remaining(
+        self, windowed: TTLRunner, mock_conn: AsyncMock, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Rate 미설정 → due / 남은 window × 경과 시간만큼만 전환 (오래 대기한 순)."""
+        self._now(monkeypatch, 5)  # 남은 window 1시간
+        self._results(mock_conn, due=120, projected=120, updated=2)
+
+        assert await windowed._check_archive_ttl() == 2
+
+        sql, params = mock_conn.execute.call_args[0]
+        assert "ORDER BY phase_changed_at" in str(sql)
+        # 120 / 3600s × ttl_interval(60s) = 2
+        assert params["limit"] == 2
+
+    async def test_rate_budget_carries_fraction(
+        self, windowed: TTLRunner, monkeypatch: pytest.MonkeyPatch
+    ):
+        """archive_window_rate → run마다 경과 시간 × rate, 소수점은 다음 run으로 이월."""
+        windowed._archive_rate = 30 / 3600  # 30/hour = 0.5 per 60s run
+
+        assert windowed._archive_quota(due=100, remaining=3600) == 0
+        windowed._last_archive_check -= 60
+        assert windowed._archive_quota(due=100, remaining=3600) == 1
+
+    async def test_no_window_archives_all(self, runner: TTLRunner, mock_conn: AsyncMock):
+        update = MagicMock()
+        update.fetchall.return_value = [("ws-1",), ("ws-2",)]
+        mock_conn.execute.return_value = update
+
+        assert await runner._check_archive_ttl() == 2
+
+        assert "limit" not in mock_conn.execute.call_args[0][1]
+
+
 class TestRun:
     """run() tests."""
 
@@ -217,7 +384,6 @@ class TestRun:
         mock_result = MagicMock()
         mock_result.fetchall.return_value = []
         mock_conn.execute.return_value = mock_result
-        mock_activity.scan_all.return_value = {}
 
         await runner.run()
 
@@ -234,16 +400,15 @@ class TestRun:
         mock_activity: AsyncMock,
     ):
         """run() wakes WC when standby_ttl expired."""
-        # Mock: standby UPDATE returns expired workspaces, archive returns none
+        # Mock: standby 후보/UPDATE returns expired workspaces, archive returns none
         standby_result = MagicMock()
         standby_result.fetchall.return_value = [("ws-1",)]
 
         archive_result = MagicMock()
         archive_result.fetchall.return_value = []
 
-        # Order: _check_standby_ttl UPDATE, _check_archive_ttl UPDATE
-        mock_conn.execute.side_effect = [standby_result, archive_result]
-        mock_activity.scan_all.return_value = {}
+        # Order: standby SELECT, standby UPDATE, _check_archive_ttl UPDATE
+        mock_conn.execute.side_effect = [standby_result, standby_result, archive_result]
 
         await runner.run()
 
@@ -265,9 +430,8 @@ class TestRun:
         archive_result = MagicMock()
         archive_result.fetchall.return_value = [("ws-1",)]
 
-        # Order: _check_standby_ttl UPDATE, _check_archive_ttl UPDATE
+        # Order: standby SELECT (후보 없음), _check_archive_ttl UPDATE
         mock_conn.execute.side_effect = [standby_result, archive_result]
-        mock_activity.scan_all.return_value = {}
 
         await runner.run()
 
@@ -3,12 +3,19 @@
 Reference: docs/architecture_v2/wc.md
 """
 
+import time
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from codehub.control.coordinator.wc import WorkspaceController
+from codehub.control.coordinator.base import PollReason, parse_wake
+from codehub.control.coordinator.wc import (
+    CasRow,
+    WorkspaceController,
+    build_cas_row,
+    retry_backoff,
+)
 from codehub.control.coordinator.wc_planner import (
     PlanAction,
     PlanInput,
@@ -24,7 +31,7 @@ from codehub.core.domain.workspace import (
     Phase,
 )
 from codehub.core.interfaces.instance import InstanceController
-from codehub.core.interfaces.storage import StorageProvider
+from codehub.core.interfaces.storage import ArchiveResult, StorageProvider
 from codehub.core.models import Workspace
 
 
@@ -45,7 +52,7 @@ def mock_sp() -> AsyncMock:
     sp = AsyncMock(spec=StorageProvider)
     sp.provision = AsyncMock()
     sp.restore = AsyncMock(return_value="ws-1/op-1/home.tar.zst")
-    sp.archive = AsyncMock(return_value="ws-1/op-1/home.tar.zst")
+    sp.archive = AsyncMock(return_value=ArchiveResult(archive_key="ws-1/op-1/home.tar.zst"))
     sp.delete_volume = AsyncMock()
     sp.create_empty_archive = AsyncMock(return_value="ws-1/op-1/home.tar.zst")
     sp.list_volumes = AsyncMock(return_value=[])
@@ -365,20 +372,33 @@ class TestExecute:
 
         await wc._execute(ws, action)
 
-        mock_sp.archive.assert_called_once_with(ws.id, "op-1")
+        # 현재 archive_key는 retention에서 보호 (새 key persist 전)
+        mock_sp.archive.assert_called_once_with(ws.id, "op-1", retain=ws.archive_key)
         mock_ic.delete.assert_called_once_with(ws.id)  # Exited 컨테이너 정리
         mock_sp.delete_volume.assert_called_once_with(ws.id)
         assert action.archive_key == "ws-1/op-1/home.tar.zst"
 
+    async def test_archiving_keeps_pruned_keys(self, wc: WorkspaceController, mock_sp: AsyncMock):
+        """retention으로 삭제된 key는 persist 시 catalog 제거 대상으로 보관."""
+        mock_sp.archive.return_value = ArchiveResult(
+            archive_key="ws-1/op-2/home.tar.zst", pruned=("ws-1/op-0/home.tar.zst",)
+        )
+        action = PlanAction(operation=Operation.ARCHIVING, phase=Phase.STANDBY, op_id="op-2")
+
+        await wc._execute(make_workspace(), action)
+
+        assert action.archive_key == "ws-1/op-2/home.tar.zst"
+        assert action.pruned_archives == ("ws-1/op-0/home.tar.zst",)
+
     async def test_archiving_call_order(
         self, wc: WorkspaceController, mock_ic: AsyncMock, mock_sp: AsyncMock
     ):
         """ARCHIVING: archive → delete → delete_volume 순서 확인."""
         call_order: list[str] = []
 
-        async def track_archive(*args):
+        async def track_archive(*args, **kwargs):
             call_order.append("archive")
-            return "ws-1/op-1/home.tar.zst"
+            return ArchiveResult(archive_key="ws-1/op-1/home.tar.zst")
 
         async def track_delete(*args):
             call_order.append("delete")
@@ -428,6 +448,28 @@ class TestExecute:
         mock_ic.delete.assert_called_once_with(ws.id)
         mock_sp.delete_volume.assert_called_once_with(ws.id)
 
+    async def test_operation_return_wakes_observer(
+        self,
+        mock_conn: AsyncMock,
+        mock_leader: AsyncMock,
+        mock_subscriber: AsyncMock,
+        mock_ic: AsyncMock,
+        mock_sp: AsyncMock,
+    ):
+        """Operation 반환 직후 Observer targeted wake (workspace 단위 관측)."""
+        publisher = AsyncMock()
+        wc = WorkspaceController(
+            mock_conn, mock_leader, mock_subscriber, mock_ic, mock_sp, publisher
+        )
+        ws = make_workspace()
+        action = PlanAction(operation=Operation.STARTING, phase=Phase.STANDBY)
+
+        await wc._execute_one(ws, action)
+
+        channel, payload = publisher.publish.call_args[0]
+        assert channel.endswith(":observer")
+        assert parse_wake(payload) == {ws.id}
+
 
 class TestPhaseFromDesired:
     """_phase_from_desired() 테스트 - wc_planner 순수 함수."""
@@ -460,7 +502,7 @@ class TestTickParallel:
         sp = AsyncMock(spec=StorageProvider)
         sp.provision = AsyncMock()
         sp.restore = AsyncMock()
-        sp.archive = AsyncMock(return_value="ws-1/op-1/home.tar.zst")
+        sp.archive = AsyncMock(return_value=ArchiveResult(archive_key="ws-1/op-1/home.tar.zst"))
         sp.create_empty_archive = AsyncMock(return_value="ws-1/op-1/home.tar.zst")
         sp.delete_volume = AsyncMock()
         return sp
@@ -507,8 +549,8 @@ class TestTickParallel:
             if ws.id == "ws-2":
                 raise RuntimeError("ws-2 failed")
 
-        async def mock_persist(ws, _action):
-            persist_calls.append(ws.id)
+        async def mock_persist(results, queued=None):
+            persist_calls.extend(ws.id for ws, _action in results)
 
         wc._load_for_reconcile = AsyncMock(return_value=[ws1, ws2, ws3])
         wc._execute = mock_execute
@@ -516,16 +558,20 @@ class TestTickParallel:
 
         # 에러가 발생해도 다른 ws는 처리됨
         await wc.reconcile()
+        # operation은 detached task로 실행 → 완료 후 다음 tick에서 persist
+        await wc._inflight.wait()
+        wc._load_for_reconcile = AsyncMock(return_value=[])
+        await wc.reconcile()
 
         # 3개 workspace 모두 execute 시도됨 (병렬, 재시도 가능)
         # with_retry가 unknown 에러를 재시도하므로 호출 횟수 > 3
         assert set(execute_calls) == {"ws-1", "ws-2", "ws-3"}
-        # 3개 모두 persist 시도됨 (순차, 에러 격리)
+        # 3개 모두 persist 시도됨 (일괄, 에러 격리)
         assert set(persist_calls) == {"ws-1", "ws-2", "ws-3"}
 
 
 class TestCasUpdate:
-    """_cas_update() CAS pattern tests."""
+    """_cas_update_many() batched CAS pattern tests."""
 
     @pytest.fixture
     def wc(
@@ -538,19 +584,10 @@ class TestCasUpdate:
     ) -> WorkspaceController:
         return WorkspaceController(mock_conn, mock_leader, mock_subscriber, mock_ic, mock_sp)
 
-    async def test_cas_success_when_operation_matches(
-        self,
-        wc: WorkspaceController,
-        mock_conn: AsyncMock,
-    ):
-        """CAS succeeds when expected_operation matches current (rowcount=1)."""
-        mock_result = MagicMock()
-        mock_result.rowcount = 1  # 1 row updated
-        mock_conn.execute.return_value = mock_result
-
-        success = await wc._cas_update(
-            workspace_id="ws-1",
-            expected_operation=Operation.NONE,
+    def _cas_row(self, id: str = "ws-1", expected: Operation = Operation.NONE) -> CasRow:
+        return CasRow(
+            id=id,
+            expected_operation=expected,
             phase=Phase.STANDBY,
             operation=Operation.STARTING,
             op_started_at=datetime.now(UTC),
@@ -558,59 +595,432 @@ class TestCasUpdate:
             archive_key=None,
             error_count=0,
             error_reason=None,
+            next_attempt_at=None,
+            home_ctx=None,
         )
 
-        assert success is True
-
-    async def test_cas_fails_when_operation_mismatch(
+    async def test_cas_returns_updated_ids(
         self,
         wc: WorkspaceController,
         mock_conn: AsyncMock,
     ):
-        """CAS fails when another WC modified operation (rowcount=0)."""
+        """RETURNING id → CAS 성공 row만 반환 (나머지는 operation mismatch)."""
         mock_result = MagicMock()
-        mock_result.rowcount = 0  # No row updated (CAS failed)
+        mock_result.fetchall.return_value = [("ws-1",)]
         mock_conn.execute.return_value = mock_result
 
-        success = await wc._cas_update(
-            workspace_id="ws-1",
-            expected_operation=Operation.NONE,  # Expected NONE
-            # But actual DB has STARTING (another WC updated it)
-            phase=Phase.RUNNING,
-            operation=Operation.NONE,
-            op_started_at=None,
-            op_id=None,
-            archive_key=None,
-            error_count=0,
-            error_reason=None,
+        updated = await wc._cas_update_many(
+            [self._cas_row("ws-1"), self._cas_row("ws-2")], datetime.now(UTC)
         )
 
-        assert success is False  # CAS should fail
+        assert updated == {"ws-1"}
 
-    async def test_cas_where_clause_includes_expected_operation(
+    async def test_cas_single_statement_with_expected_operation(
         self,
         wc: WorkspaceController,
         mock_conn: AsyncMock,
     ):
-        """CAS SQL WHERE clause includes operation = expected_operation."""
+        """단일 UPDATE ... FROM unnest, WHERE에 row별 expected operation 포함."""
         mock_result = MagicMock()
-        mock_result.rowcount = 1
+        mock_result.fetchall.return_value = []
         mock_conn.execute.return_value = mock_result
 
-        await wc._cas_update(
-            workspace_id="ws-1",
-            expected_operation=Operation.STARTING,
-            phase=Phase.RUNNING,
-            operation=Operation.NONE,
-            op_started_at=None,
-            op_id=None,
-            archive_key=None,
-            error_count=0,
-            error_reason=None,
+        await wc._cas_update_many(
+            [self._cas_row("ws-1", Operation.STARTING), self._cas_row("ws-2")],
+            datetime.now(UTC),
         )
 
-        # Verify execute was called (CAS pattern in use)
         mock_conn.execute.assert_called_once()
+        stmt, params = mock_conn.execute.call_args[0]
+        assert "unnest" in str(stmt)
+        assert "w.operation = v.expected_op" in str(stmt)
+        assert params["ids"] == ["ws-1", "ws-2"]
+        assert params["expected_ops"] == ["STARTING", "NONE"]
+
+
+class TestPersist:
+    """_persist() 일괄 저장 테스트."""
+
+    @pytest.fixture
+    def wc(
+        self,
+        mock_conn: AsyncMock,
+        mock_leader: AsyncMock,
+        mock_subscriber: AsyncMock,
+        mock_ic: AsyncMock,
+        mock_sp: AsyncMock,
+    ) -> WorkspaceController:
+        return WorkspaceController(mock_conn, mock_leader, mock_subscriber, mock_ic, mock_sp)
+
+    async def test_noop_rows_skipped(self, wc: WorkspaceController, mock_conn: AsyncMock):
+        """변경 없는 row만 있으면 UPDATE/commit 없음."""
+        ws = make_workspace(phase=Phase.RUNNING, desired_state=DesiredState.RUNNING)
+        action = PlanAction(operation=Operation.NONE, phase=Phase.RUNNING)
+
+        await wc._persist([(ws, action)])
+
+        mock_conn.execute.assert_not_called()
+        mock_conn.commit.assert_not_called()
+
+    async def test_single_commit_for_batch(self, wc: WorkspaceController, mock_conn: AsyncMock):
+        """여러 row 변경 → UPDATE 1회 + commit 1회."""
+        ws1 = make_workspace(id="ws-1", phase=Phase.PENDING)
+        ws2 = make_workspace(id="ws-2", phase=Phase.STANDBY)
+        mock_result = MagicMock()
+        mock_result.fetchall.return_value = [("ws-1",), ("ws-2",)]
+        mock_conn.execute.return_value = mock_result
+
+        await wc._persist([
+            (ws1, PlanAction(operation=Operation.PROVISIONING, phase=Phase.PENDING)),
+            (ws2, PlanAction(operation=Operation.STARTING, phase=Phase.STANDBY)),
+        ])
+
+        mock_conn.execute.assert_called_once()
+        mock_conn.commit.assert_called_once()
+
+    async def test_cas_failure_metric(self, wc: WorkspaceController, mock_conn: AsyncMock):
+        """RETURNING에 없는 row → WC_CAS_FAILURES_TOTAL 증가."""
+        from codehub.app.metrics.collector import WC_CAS_FAILURES_TOTAL
+
+        ws1 = make_workspace(id="ws-1", phase=Phase.PENDING)
+        ws2 = make_workspace(id="ws-2", phase=Phase.PENDING)
+        mock_result = MagicMock()
+        mock_result.fetchall.return_value = [("ws-1",)]
+        mock_conn.execute.return_value = mock_result
+        before = WC_CAS_FAILURES_TOTAL._value.get()
+
+        await wc._persist([
+            (ws1, PlanAction(operation=Operation.PROVISIONING, phase=Phase.PENDING)),
+            (ws2, PlanAction(operation=Operation.PROVISIONING, phase=Phase.PENDING)),
+        ])
+
+        assert WC_CAS_FAILURES_TOTAL._value.get() == before + 1
+
+    async def test_new_archive_recorded_in_catalog(
+        self, wc: WorkspaceController, mock_conn: AsyncMock
+    ):
+        """archive 완료 → CAS update와 같은 트랜잭션에서 catalog 등록."""
+        ws = make_workspace(id="ws-1", phase=Phase.STANDBY)
+        action = PlanAction(operation=Operation.ARCHIVING, phase=Phase.STANDBY)
+        action.archive_key = "ws-1/op-1/home.tar.zst"
+
+        await wc._persist([(ws, action)])
+
+        assert mock_conn.execute.call_count == 2
+        catalog_params = mock_conn.execute.call_args_list[1][0][1]
+        assert catalog_params == {"ws_ids": ["ws-1"], "keys": ["ws-1/op-1/home.tar.zst"]}
+        mock_conn.commit.assert_called_once()
+
+    async def test_pruned_archives_removed_from_catalog(
+        self, wc: WorkspaceController, mock_conn: AsyncMock
+    ):
+        """retention 삭제분 → 새 archive 등록과 같은 트랜잭션에서 catalog 제거."""
+        ws = make_workspace(id="ws-1", phase=Phase.STANDBY)
+        action = PlanAction(operation=Operation.ARCHIVING, phase=Phase.STANDBY)
+        action.archive_key = "ws-1/op-2/home.tar.zst"
+        action.pruned_archives = ("ws-1/op-0/home.tar.zst",)
+
+        await wc._persist([(ws, action)])
+
+        assert mock_conn.execute.call_count == 3
+        sql, params = mock_conn.execute.call_args_list[2][0]
+        assert "DELETE FROM archive_catalog" in str(sql)
+        assert params == {"keys": ["ws-1/op-0/home.tar.zst"]}
+        mock_conn.commit.assert_called_once()
+
+
+class TestBuildCasRow:
+    """build_cas_row() 값 계산 테스트."""
+
+    def test_unchanged_returns_none(self):
+        ws = make_workspace(phase=Phase.RUNNING)
+        action = PlanAction(operation=Operation.NONE, phase=Phase.RUNNING)
+
+        assert build_cas_row(ws, action, datetime.now(UTC)) is None
+
+    def test_new_operation_sets_started_at(self):
+        now = datetime.now(UTC)
+        ws = make_workspace(phase=Phase.STANDBY)
+        action = PlanAction(operation=Operation.STARTING, phase=Phase.STANDBY, op_id="op-1")
+
+        row = build_cas_row(ws, action, now)
+
+        assert row is not None
+        assert row.expected_operation == Operation.NONE
+        assert row.op_started_at == now
+        assert row.op_id == "op-1"
+
+    def test_error_increments_count(self):
+        ws = make_workspace(phase=Phase.STANDBY, operation=Operation.STARTING, error_count=1)
+        action = PlanAction(
+            operation=Operation.NONE, phase=Phase.ERROR, error_reason=ErrorReason.TIMEOUT
+        )
+
+        row = build_cas_row(ws, action, datetime.now(UTC))
+
+        assert row is not None
+        assert row.error_count == 2
+        assert row.expected_operation == Operation.STARTING
+
+    def test_restore_marker_merged_into_home_ctx(self):
+        ws = make_workspace(phase=Phase.ARCHIVED, operation=Operation.RESTORING, op_id="op-1")
+        ws.home_ctx = {"other": 1}
+        action = PlanAction(
+            operation=Operation.RESTORING, phase=Phase.ARCHIVED, restore_marker="ws-1/op-1/home.tar.zst"
+        )
+
+        row = build_cas_row(ws, action, datetime.now(UTC))
+
+        assert row is not None
+        assert row.home_ctx == {"other": 1, "restore_marker": "ws-1/op-1/home.tar.zst"}
+
+
+class TestRetryBackoff:
+    """실패한 operation의 재시도 간격 (next_attempt_at) 테스트."""
+
+    @pytest.fixture
+    def wc(
+        self,
+        mock_conn: AsyncMock,
+        mock_leader: AsyncMock,
+        mock_subscriber: AsyncMock,
+        mock_ic: AsyncMock,
+        mock_sp: AsyncMock,
+    ) -> WorkspaceController:
+        return WorkspaceController(mock_conn, mock_leader, mock_subscriber, mock_ic, mock_sp)
+
+    def test_backoff_grows_exponentially_with_cap(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr("codehub.control.coordinator.wc.random.random", lambda: 0.5)
+
+        delays = [retry_backoff(n) for n in (1, 2, 3)]
+
+        assert delays[1] == delays[0] * 2
+        assert delays[2] == delays[0] * 4
+        assert retry_backoff(10_000) == retry_backoff(10_001)  # 상한 (overflow 없음)
+
+    def test_backoff_jitter_range(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr("codehub.control.coordinator.wc.random.random", lambda: 0.0)
+        low = retry_backoff(1)
+        monkeypatch.setattr("codehub.control.coordinator.wc.random.random", lambda: 1.0)
+        high = retry_backoff(1)
+
+        assert high == low * 3  # 50% ~ 150%
+
+    def test_backoff_jitter_never_exceeds_max(self, monkeypatch: pytest.MonkeyPatch):
+        from codehub.control.coordinator.wc import _coordinator_config
+
+        max_delay = _coordinator_config.wc_retry_backoff_max
+        monkeypatch.setattr("codehub.control.coordinator.wc.random.random", lambda: 0.999)
+        assert retry_backoff(10_000) == max_delay  # 상한 이후 jitter가 max를 넘지 않음
+        monkeypatch.setattr("codehub.control.coordinator.wc.random.random", lambda: 0.0)
+        assert retry_backoff(10_000) == max_delay * 0.5
+
+    def test_failed_execution_schedules_next_attempt(self):
+        now = datetime.now(UTC)
+        ws = make_workspace(phase=Phase.STANDBY, operation=Operation.STARTING, error_count=1)
+        action = PlanAction(operation=Operation.STARTING, phase=Phase.STANDBY, failed=True)
+
+        row = build_cas_row(ws, action, now)
+
+        assert row is not None
+        assert row.error_count == 2
+        assert row.next_attempt_at is not None
+        assert row.next_attempt_at > now
+
+    def test_first_failure_starts_operation_with_backoff(self):
+        now = datetime.now(UTC)
+        ws = make_workspace(phase=Phase.STANDBY)
+        action = PlanAction(
+            operation=Operation.STARTING, phase=Phase.STANDBY, op_id="op-1", failed=True
+        )
+
+        row = build_cas_row(ws, action, now)
+
+        assert row is not None
+        assert row.operation == Operation.STARTING
+        assert row.error_count == 1
+        assert row.next_attempt_at > now
+
+    def test_in_progress_keeps_next_attempt(self):
+        """재실행 보류 중 (변경 없음) → 쓰기 없음."""
+        ws = make_workspace(phase=Phase.STANDBY, operation=Operation.STARTING, error_count=1)
+        ws.next_attempt_at = datetime.now(UTC) + timedelta(seconds=30)
+        action = PlanAction(operation=Operation.STARTING, phase=Phase.STANDBY)
+
+        assert build_cas_row(ws, action, datetime.now(UTC)) is None
+
+    def test_completion_clears_next_attempt(self):
+        ws = make_workspace(phase=Phase.STANDBY, operation=Operation.STARTING, error_count=2)
+        ws.next_attempt_at = datetime.now(UTC) - timedelta(seconds=1)
+        action = PlanAction(operation=Operation.NONE, phase=Phase.RUNNING, complete=True)
+
+        row = build_cas_row(ws, action, datetime.now(UTC))
+
+        assert row is not None
+        assert row.error_count == 0
+        assert row.next_attempt_at is None
+
+    def test_retry_held_until_due(self, wc: WorkspaceController):
+        ws = make_workspace(phase=Phase.STANDBY, operation=Operation.STARTING)
+        action = PlanAction(operation=Operation.STARTING, phase=Phase.STANDBY)
+
+        ws.next_attempt_at = datetime.now(UTC) + timedelta(seconds=30)
+        assert wc._needs_execute(action, ws) is False
+
+        ws.next_attempt_at = datetime.now(UTC) - timedelta(seconds=1)
+        assert wc._needs_execute(action, ws) is True
+
+    async def test_execute_failure_marks_action(self, wc: WorkspaceController):
+        wc._run_operation = AsyncMock(return_value=False)
+        ws = make_workspace(phase=Phase.STANDBY)
+        action = PlanAction(operation=Operation.STARTING, phase=Phase.STANDBY)
+
+        _, result = await wc._execute_one(ws, action)
+
+        assert result.failed is True
+
+
+class TestTimeSlicedPass:
+    """Full pass를 tick budget 단위로 나눠 처리."""
+
+    @pytest.fixture
+    def wc(
+        self,
+        mock_conn: AsyncMock,
+        mock_leader: AsyncMock,
+        mock_subscriber: AsyncMock,
+        mock_ic: AsyncMock,
+        mock_sp: AsyncMock,
+    ) -> WorkspaceController:
+        return WorkspaceController(mock_conn, mock_leader, mock_subscriber, mock_ic, mock_sp)
+
+    def _stream(self, wc: WorkspaceController, chunks: list[list[Workspace]]) -> list:
+        consumed: list = []
+
+        async def stream_pass(_size, _snapshot=None):
+            for chunk in chunks:
+                consumed.append(chunk)
+                yield chunk
+
+        wc._loader.stream_pass = stream_pass
+        return consumed
+
+    def _chunks(self) -> list[list[Workspace]]:
+        volume = {"volume": {"exists": True, "reason": "VolumeExists", "message": ""}}
+        return [
+            [
+                make_workspace(
+                    id, phase=Phase.STANDBY, desired_state=DesiredState.STANDBY, conditions=volume
+                )
+            ]
+            for id in ("ws-1", "ws-2")
+        ]
+
+    async def test_stops_at_deadline(self, wc: WorkspaceController):
+        """deadline 경과 → 현재 chunk까지만 처리 (나머지는 다음 tick)."""
+        consumed = self._stream(wc, self._chunks())
+
+        count, _, _ = await wc._reconcile_pass_slice(time.monotonic(), set(), [], [])
+
+        assert count == 1
+        assert len(consumed) == 1
+
+    async def test_processes_chunks_within_budget(self, wc: WorkspaceController):
+        consumed = self._stream(wc, self._chunks())
+        results: list = []
+
+        count, _, _ = await wc._reconcile_pass_slice(time.monotonic() + 10, set(), results, [])
+
+        assert count == 2
+        assert len(consumed) == 2
+        assert [ws.id for ws, _ in results] == ["ws-1", "ws-2"]
+
+    async def test_skips_rows_already_planned(self, wc: WorkspaceController):
+        """이번 tick에 이미 로드/plan된 row는 중복 처리하지 않음."""
+        self._stream(wc, self._chunks())
+        results: list = []
+
+        count, _, _ = await wc._reconcile_pass_slice(time.monotonic() + 10, {"ws-1"}, results, [])
+
+        assert count == 1
+        assert [ws.id for ws, _ in results] == ["ws-2"]
+
+    async def test_pass_keeps_ticks_active_and_full(self, wc: WorkspaceController):
+        wc._loader._cursor = ""  # pass 진행 중
+        wc.add_hot_ids({"ws-9"})
+        wc._active_until = 0.0
+
+        assert wc._select_targets() is None
+        assert wc._get_interval() == wc.ACTIVE_INTERVAL
+
+    async def test_reconcile_continues_pass(self, wc: WorkspaceController):
+        wc._loader._cursor = ""
+        wc._load_for_reconcile = AsyncMock(return_value=[])
+        consumed = self._stream(wc, self._chunks())
+        wc._persist = AsyncMock()
+
+        await wc.reconcile()
+
+        assert len(consumed) >= 1
+        wc._persist.assert_awaited_once()
+
+
+class TestAdaptivePolling:
+    """WC backlog / operation timeout deadline 신호."""
+
+    @pytest.fixture
+    def wc(
+        self,
+        mock_conn: AsyncMock,
+        mock_leader: AsyncMock,
+        mock_subscriber: AsyncMock,
+        mock_ic: AsyncMock,
+        mock_sp: AsyncMock,
+    ) -> WorkspaceController:
+        wc = WorkspaceController(mock_conn, mock_leader, mock_subscriber, mock_ic, mock_sp)
+        wc._active_until = 0.0
+        return wc
+
+    async def test_inflight_is_backlog(self, wc: WorkspaceController):
+        wc._inflight = MagicMock(__len__=MagicMock(return_value=3))
+
+        assert wc._pending_work() == 3
+        assert wc._choose_interval()[1] == PollReason.BACKLOG
+
+    async def test_deadline_from_earliest_operation_timeout(self, wc: WorkspaceController):
+        now = datetime.now(UTC)
+        started = now - timedelta(seconds=wc.OPERATION_TIMEOUT - 5)
+        wc._load_for_reconcile = AsyncMock(
+            return_value=[
+                make_workspace(
+                    "ws-1", Phase.STANDBY, Operation.STARTING, op_started_at=started,
+                    op_id="op-1",
+                ),
+                make_workspace(
+                    "ws-2", Phase.STANDBY, Operation.STARTING, op_started_at=now, op_id="op-2"
+                ),
+            ]
+        )
+        wc._needs_execute = MagicMock(return_value=False)  # 진행 중 operation (backlog 없음)
+        wc._persist = AsyncMock()
+
+        await wc.reconcile()
+
+        assert wc._next_deadline() == pytest.approx(5.0, abs=1.0)
+        interval, reason = wc._choose_interval()
+        assert reason == PollReason.DEADLINE
+        assert interval == pytest.approx(5.0, abs=1.0)
+
+    async def test_targeted_load_keeps_deadline(self, wc: WorkspaceController):
+        """Targeted load는 일부만 로드 → 이전 deadline 유지."""
+        deadline = datetime.now(UTC) + timedelta(seconds=30)
+        wc._timeout_at = deadline
+        wc._select_targets = MagicMock(return_value={"ws-1"})
+        wc._load_for_reconcile = AsyncMock(return_value=[])
+
+        await wc.reconcile()
+
+        assert wc._timeout_at == deadline
 
 
 class TestTickLogging:
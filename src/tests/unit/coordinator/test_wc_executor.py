@@ -0,0 +1,141 @@
+"""Tests for WC OperationExecutor (동시성 제한 + 우선순위 + 공정 큐잉)."""
+
+import asyncio
+from collections import Counter
+
+import pytest
+
+from codehub.control.coordinator.wc_executor import OperationExecutor, Priority
+from codehub.core.domain.workspace import Operation
+
+
+async def _hold(executor: OperationExecutor, op: Operation, owner: str, release: asyncio.Event, order: list):
+    async with executor.slot(op, owner):
+        order.append((op, owner))
+        await release.wait()
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestOperationExecutor:
+    async def test_global_limit(self):
+        """전역 제한 초과 작업은 대기."""
+        executor = OperationExecutor(max_concurrent=2, op_limits={})
+        release = asyncio.Event()
+        order: list = []
+
+        tasks = [
+            asyncio.create_task(_hold(executor, Operation.STOPPING, f"user-{i}", release, order))
+            for i in range(3)
+        ]
+        await _settle()
+
+        assert executor.running == 2
+        assert executor.queued() == 1
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert executor.running == 0
+        assert len(order) == 3
+
+    async def test_per_operation_limit(self):
+        """operation별 제한: ARCHIVING 제한에 걸려도 다른 operation은 실행."""
+        executor = OperationExecutor(max_concurrent=10, op_limits={"ARCHIVING": 1})
+        release = asyncio.Event()
+        order: list = []
+
+        tasks = [
+            asyncio.create_task(_hold(executor, Operation.ARCHIVING, "user-1", release, order)),
+            asyncio.create_task(_hold(executor, Operation.ARCHIVING, "user-2", release, order)),
+            asyncio.create_task(_hold(executor, Operation.STOPPING, "user-3", release, order)),
+        ]
+        await _settle()
+
+        assert order == [(Operation.ARCHIVING, "user-1"), (Operation.STOPPING, "user-3")]
+        assert executor.queued(Priority.BACKGROUND) == 1
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+    async def test_interactive_before_background(self):
+        """슬롯 반환 시 interactive 작업이 background보다 먼저 실행."""
+        executor = OperationExecutor(max_concurrent=1, op_limits={})
+        blocker = asyncio.Event()
+        release = asyncio.Event()
+        order: list = []
+
+        first = asyncio.create_task(_hold(executor, Operation.STOPPING, "user-0", blocker, order))
+        await _settle()
+        tasks = [
+            asyncio.create_task(_hold(executor, Operation.ARCHIVING, "user-1", release, order)),
+            asyncio.create_task(_hold(executor, Operation.DELETING, "user-2", release, order)),
+            asyncio.create_task(_hold(executor, Operation.STARTING, "user-3", release, order)),
+        ]
+        await _settle()
+
+        blocker.set()
+        release.set()
+        await asyncio.gather(first, *tasks)
+
+        assert [op for op, _ in order] == [
+            Operation.STOPPING,
+            Operation.STARTING,
+            Operation.ARCHIVING,
+            Operation.DELETING,
+        ]
+
+    async def test_round_robin_across_owners(self):
+        """같은 우선순위 내에서 owner 간 round-robin."""
+        executor = OperationExecutor(max_concurrent=1, op_limits={})
+        blocker = asyncio.Event()
+        release = asyncio.Event()
+        order: list = []
+
+        first = asyncio.create_task(_hold(executor, Operation.ARCHIVING, "busy", blocker, order))
+        await _settle()
+        tasks = [
+            asyncio.create_task(_hold(executor, Operation.ARCHIVING, owner, release, order))
+            for owner in ["busy", "busy", "busy", "other"]
+        ]
+        await _settle()
+
+        blocker.set()
+        release.set()
+        await asyncio.gather(first, *tasks)
+
+        owners = [owner for _, owner in order]
+        assert owners.index("other") <= 2  # busy 사용자 뒤에 밀리지 않음
+
+    async def test_cancelled_waiter_removed(self):
+        """대기 중 취소 → 큐에서 제거, 슬롯 누수 없음."""
+        executor = OperationExecutor(max_concurrent=1, op_limits={})
+        release = asyncio.Event()
+        order: list = []
+
+        first = asyncio.create_task(_hold(executor, Operation.STARTING, "user-1", release, order))
+        await _settle()
+        waiting = asyncio.create_task(_hold(executor, Operation.STARTING, "user-2", release, order))
+        await _settle()
+        assert executor.queued() == 1
+
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        assert executor.queued() == 0
+
+        release.set()
+        await first
+        assert executor.running == 0
+
+    def test_free_slots(self):
+        """busy 기준 즉시 시작 가능한 수 (operation별 제한 ∧ 전역 제한)."""
+        executor = OperationExecutor(max_concurrent=10, op_limits={"ARCHIVING": 4})
+
+        slots = executor.free_slots(Counter({Operation.ARCHIVING: 5, Operation.STARTING: 3}))
+
+        assert slots[Operation.ARCHIVING] == 0
+        assert slots[Operation.STARTING] == 2
+        assert Operation.NONE not in slots
@@ -0,0 +1,258 @@
+"""Tests for WC in-flight operation registry + detached execution."""
+
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from codehub.control.coordinator.wc import WorkspaceController, build_cas_row
+from codehub.control.coordinator.wc_inflight import InflightRegistry
+from codehub.control.coordinator.wc_loader import WorkspaceRow
+from codehub.control.coordinator.wc_planner import PlanAction
+from codehub.core.domain.workspace import DesiredState, Operation, Phase
+
+from .test_wc import make_workspace
+
+
+async def _result(ws, action, gate: asyncio.Event | None = None):
+    if gate is not None:
+        await gate.wait()
+    return (ws, action)
+
+
+class TestInflightRegistry:
+    async def test_submit_and_drain(self):
+        registry = InflightRegistry()
+        ws = make_workspace()
+        action = PlanAction(operation=Operation.PROVISIONING, phase=Phase.PENDING, op_id="op-1")
+        gate = asyncio.Event()
+
+        registry.submit(ws, action, _result(ws, action, gate))
+
+        assert "ws-1" in registry
+        assert registry.drain() == []
+
+        gate.set()
+        await registry.wait()
+
+        assert "ws-1" not in registry
+        assert registry.drain() == [(ws, action)]
+        assert registry.drain() == []
+
+    async def test_duplicate_submit_rejected(self):
+        registry = InflightRegistry()
+        ws = make_workspace()
+        action = PlanAction(operation=Operation.PROVISIONING, phase=Phase.PENDING, op_id="op-1")
+        gate = asyncio.Event()
+        registry.submit(ws, action, _result(ws, action, gate))
+
+        with pytest.raises(ValueError):
+            registry.submit(ws, action, _result(ws, action))
+
+        gate.set()
+        await registry.wait()
+
+    async def test_cancel_all_discards(self):
+        registry = InflightRegistry()
+        ws = make_workspace()
+        action = PlanAction(operation=Operation.ARCHIVING, phase=Phase.STANDBY, op_id="op-1")
+        registry.submit(ws, action, _result(ws, action, asyncio.Event()))
+
+        registry.cancel_all()
+        await asyncio.sleep(0)
+
+        assert len(registry) == 0
+        assert registry.drain() == []
+
+
+    async def test_checkpoint_settles_after_drain(self):
+        registry = InflightRegistry()
+        ws = make_workspace()
+        action = PlanAction(operation=Operation.STARTING, phase=Phase.STANDBY, op_id="op-2")
+
+        persisted = registry.checkpoint(ws, action)
+        registry.settle({})  # drain 전 settle은 영향 없음
+        assert not persisted.done()
+
+        assert registry.drain() == [(ws, action)]
+        registry.settle({})
+
+        assert persisted.result() is None
+
+
+class TestDetachedExecution:
+    @pytest.fixture
+    def wc(self, mock_conn, mock_leader, mock_subscriber) -> WorkspaceController:
+        return WorkspaceController(mock_conn, mock_leader, mock_subscriber, AsyncMock(), AsyncMock())
+
+    async def test_slow_operation_does_not_block_tick(self, wc: WorkspaceController):
+        """느린 operation 진행 중에도 tick 완료 + 해당 ws는 재제출하지 않음."""
+        gate = asyncio.Event()
+        calls: list[str] = []
+
+        async def slow_execute(ws, _action):
+            calls.append(ws.id)
+            await gate.wait()
+
+        ws = make_workspace(phase=Phase.PENDING, desired_state=DesiredState.RUNNING)
+        wc._execute = slow_execute
+        wc._persist = AsyncMock()
+        wc._load_for_reconcile = AsyncMock(return_value=[ws])
+
+        await asyncio.wait_for(wc.reconcile(), timeout=1.0)
+        await asyncio.sleep(0)
+        assert "ws-1" in wc._inflight
+        assert wc._get_interval() == wc.ACTIVE_INTERVAL
+
+        # 두 번째 tick: in-flight ws는 plan/execute 제외
+        await asyncio.wait_for(wc.reconcile(), timeout=1.0)
+        assert calls == ["ws-1"]
+
+        # 완료 → 다음 tick에서 제출 시점 snapshot으로 persist
+        gate.set()
+        await wc._inflight.wait()
+        await wc.reconcile()
+
+        persisted = wc._persist.call_args[0][0]
+        assert [(w.id, a.operation) for w, a in persisted] == [("ws-1", Operation.PROVISIONING)]
+        assert calls == ["ws-1"]  # 완료 tick에서 재제출 없음
+
+    async def test_leadership_lost_cancels_inflight(self, wc: WorkspaceController):
+        gate = asyncio.Event()
+
+        async def slow_execute(_ws, _action):
+            await gate.wait()
+
+        wc._execute = slow_execute
+        wc._persist = AsyncMock()
+        wc._load_for_reconcile = AsyncMock(
+            return_value=[make_workspace(phase=Phase.PENDING, desired_state=DesiredState.RUNNING)]
+        )
+        await wc.reconcile()
+        assert len(wc._inflight) == 1
+
+        wc._on_leadership_lost()
+
+        assert len(wc._inflight) == 0
+
+
+def _restoring_row() -> WorkspaceRow:
+    return WorkspaceRow(
+        "ws-1", "user-1", "img", Phase.ARCHIVED, Operation.RESTORING, DesiredState.RUNNING,
+        {}, "ws-1/op-1/home.tar.zst", datetime.now(UTC), "op-1", None, None, 0, None,
+    )
+
+
+class TestOperationChaining:
+    """RESTORING 성공 + desired RUNNING → 같은 task에서 STARTING."""
+
+    @pytest.fixture
+    def wc(self, mock_conn, mock_leader, mock_subscriber) -> WorkspaceController:
+        return WorkspaceController(mock_conn, mock_leader, mock_subscriber, AsyncMock(), AsyncMock())
+
+    async def _run_chain(self, wc: WorkspaceController, ws: WorkspaceRow, persist: bool):
+        action = PlanAction(operation=Operation.RESTORING, phase=Phase.ARCHIVED, op_id="op-1")
+        task = asyncio.create_task(wc._execute_one(ws, action))
+        while not wc._inflight._pending and not task.done():
+            await asyncio.sleep(0)
+        if task.done():
+            return task.result()
+
+        # 다음 tick의 drain → persist
+        [(checkpoint_ws, step)] = wc._inflight.drain()
+        row = build_cas_row(checkpoint_ws, step, datetime.now(UTC))
+        wc._inflight.settle({ws.id: row} if persist else {})
+        return await task
+
+    async def test_restore_chains_into_start(self, wc: WorkspaceController):
+        ws = _restoring_row()
+
+        result_ws, result_action = await self._run_chain(wc, ws, persist=True)
+
+        wc._sp.restore.assert_awaited_once_with("ws-1", ws.archive_key)
+        wc._ic.start.assert_awaited_once_with("ws-1", "img")
+        assert result_ws.operation == Operation.STARTING
+        assert result_ws.phase == Phase.STANDBY
+        assert result_ws.home_ctx == {"restore_marker": ws.archive_key}
+        assert result_action.operation == Operation.STARTING
+        # 최종 결과는 checkpoint로 이미 persist된 row와 동일 → 쓰기 없음
+        assert build_cas_row(result_ws, result_action, datetime.now(UTC)) is None
+
+    async def test_checkpoint_starts_new_operation(self, wc: WorkspaceController):
+        ws = _restoring_row()
+        step = PlanAction(
+            operation=Operation.STARTING,
+            phase=Phase.STANDBY,
+            op_id="op-2",
+            complete=True,
+            restore_marker=ws.archive_key,
+        )
+
+        row = build_cas_row(ws, step, datetime.now(UTC))
+
+        assert row.expected_operation == Operation.RESTORING
+        assert row.op_id == "op-2"
+        assert row.op_started_at != ws.op_started_at
+
+    async def test_missing_volume_does_not_chain(self, wc: WorkspaceController):
+        wc._sp.inspect_volume = AsyncMock(return_value=None)
+        ws = _restoring_row()
+
+        result_ws, result_action = await self._run_chain(wc, ws, persist=True)
+
+        wc._ic.start.assert_not_awaited()
+        assert (result_ws, result_action.operation) == (ws, Operation.RESTORING)
+
+    async def test_cas_failure_aborts_chain(self, wc: WorkspaceController):
+        ws = _restoring_row()
+
+        result_ws, result_action = await self._run_chain(wc, ws, persist=False)
+
+        wc._ic.start.assert_not_awaited()
+        assert result_ws is ws
+        assert result_action.operation == Operation.RESTORING
+        assert result_action.restore_marker == ws.archive_key
+
+    async def test_no_chain_when_desired_standby(self, wc: WorkspaceController):
+        ws = _restoring_row()._replace(desired_state=DesiredState.STANDBY)
+
+        _, result_action = await self._run_chain(wc, ws, persist=True)
+
+        wc._sp.inspect_volume.assert_not_awaited()
+        assert result_action.operation == Operation.RESTORING
+
+
+class TestImagePrefetch:
+    """RUNNING으로 가는 PROVISIONING/RESTORING → background image ensure."""
+
+    @pytest.fixture
+    def wc(self, mock_conn, mock_leader, mock_subscriber) -> WorkspaceController:
+        return WorkspaceController(mock_conn, mock_leader, mock_subscriber, AsyncMock(), AsyncMock())
+
+    async def test_provisioning_prefetches_image(self, wc: WorkspaceController):
+        gate = asyncio.Event()
+
+        async def slow_provision(_ws_id):
+            await gate.wait()
+
+        wc._sp.provision.side_effect = slow_provision
+        ws = make_workspace(phase=Phase.PENDING, desired_state=DesiredState.RUNNING)
+        action = PlanAction(operation=Operation.PROVISIONING, phase=Phase.PENDING, op_id="op-1")
+
+        task = asyncio.create_task(wc._execute_one(ws, action))
+        await asyncio.sleep(0.01)
+
+        # provision 진행 중에 pull 시작 (겹쳐서 진행)
+        wc._ic.ensure_image.assert_awaited_once_with(ws.image_ref)
+        gate.set()
+        await task
+
+    async def test_no_prefetch_when_not_heading_to_running(self, wc: WorkspaceController):
+        ws = make_workspace(phase=Phase.PENDING, desired_state=DesiredState.STANDBY)
+        action = PlanAction(operation=Operation.PROVISIONING, phase=Phase.PENDING, op_id="op-1")
+
+        await wc._execute_one(ws, action)
+        await asyncio.sleep(0)
+
+        wc._ic.ensure_image.assert_not_awaited()
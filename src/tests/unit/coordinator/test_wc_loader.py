@@ -0,0 +1,267 @@
+"""Tests for WC workspace loader (watermark 기반 incremental load).
+
+Reference: docs/architecture/wc.md
+"""
+
+from contextlib import aclosing
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from codehub.control.coordinator.wc import WorkspaceController
+from codehub.control.coordinator.wc_loader import WorkspaceLoader, WorkspaceRow
+from codehub.core.domain.workspace import DesiredState, Operation, Phase
+
+
+def make_db_row(id: str = "ws-1", phase: str = "RUNNING") -> SimpleNamespace:
+    """DB row (select 컬럼 projection 결과) mock."""
+    return SimpleNamespace(
+        id=id,
+        owner_user_id="user-1",
+        image_ref="ubuntu:22.04",
+        phase=phase,
+        operation="NONE",
+        desired_state="RUNNING",
+        conditions=None,
+        archive_key=None,
+        op_started_at=None,
+        op_id=None,
+        deleted_at=None,
+        home_ctx=None,
+        error_count=0,
+        error_reason=None,
+        next_attempt_at=None,
+    )
+
+
+@pytest.fixture
+def conn() -> AsyncMock:
+    conn = AsyncMock()
+    result = MagicMock()
+    result.all.return_value = [make_db_row()]
+    conn.execute.return_value = result
+    return conn
+
+
+def _compiled_sql(conn: AsyncMock) -> str:
+    stmt = conn.execute.call_args[0][0]
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class TestWorkspaceLoader:
+    async def test_first_load_is_full(self, conn: AsyncMock):
+        """첫 load는 full (watermark 없음) + 결과는 WorkspaceRow."""
+        loader = WorkspaceLoader(conn)
+
+        rows = await loader.load()
+
+        assert loader.last_mode == "full"
+        assert loader.watermark is not None
+        assert rows == [
+            WorkspaceRow(
+                "ws-1", "user-1", "ubuntu:22.04",
+                Phase.RUNNING, Operation.NONE, DesiredState.RUNNING,
+                {}, None, None, None, None, None, 0, None, None,
+            )
+        ]
+        assert "observed_at >" not in _compiled_sql(conn)
+
+    async def test_narrow_projection(self, conn: AsyncMock):
+        """select(Workspace) 대신 필요한 컬럼만 조회."""
+        loader = WorkspaceLoader(conn)
+
+        await loader.load()
+
+        sql = _compiled_sql(conn)
+        assert "workspaces.memo" not in sql
+        assert "workspaces.description" not in sql
+        assert "workspaces.conditions" in sql
+
+    async def test_second_load_is_incremental(self, conn: AsyncMock):
+        """watermark 이후 변경분만 조회."""
+        loader = WorkspaceLoader(conn)
+        await loader.load()
+        first_watermark = loader.watermark
+
+        await loader.load()
+
+        assert loader.last_mode == "incremental"
+        assert loader.watermark >= first_watermark
+        sql = _compiled_sql(conn)
+        assert "workspaces.updated_at >" in sql
+        assert "workspaces.observed_at >" in sql
+
+    async def test_watermark_has_overlap(self, conn: AsyncMock):
+        """watermark = 쿼리 시작 시각 - overlap."""
+        loader = WorkspaceLoader(conn)
+
+        await loader.load()
+
+        assert loader.watermark <= datetime.now(UTC) - timedelta(seconds=loader.WATERMARK_OVERLAP)
+
+    async def test_periodic_full_resync(self, conn: AsyncMock):
+        """FULL_RESYNC_INTERVAL 경과 시 full load."""
+        loader = WorkspaceLoader(conn)
+        loader.FULL_RESYNC_INTERVAL = 0.0
+
+        await loader.load()
+        await loader.load()
+
+        assert loader.last_mode == "full"
+
+    async def test_reset_forces_full(self, conn: AsyncMock):
+        """reset() 후 다음 load는 full."""
+        loader = WorkspaceLoader(conn)
+        await loader.load()
+
+        loader.reset()
+        await loader.load()
+
+        assert loader.last_mode == "full"
+
+
+    async def test_load_ids_is_targeted(self, conn: AsyncMock):
+        """load_ids() → 지정 id만 조회, watermark 유지."""
+        loader = WorkspaceLoader(conn)
+        await loader.load()
+        watermark = loader.watermark
+
+        rows = await loader.load_ids({"ws-1"})
+
+        assert loader.last_mode == "targeted"
+        assert loader.watermark == watermark
+        assert [r.id for r in rows] == ["ws-1"]
+        assert "workspaces.id IN" in _compiled_sql(conn)
+
+
+    async def test_snapshot_replaces_conditions_column(self, conn: AsyncMock):
+        """Observation snapshot → conditions 컬럼 미조회, snapshot 값 사용."""
+        loader = WorkspaceLoader(conn)
+        snapshot = {"ws-1": {"container": {"running": True}}}
+
+        rows = await loader.load(snapshot)
+
+        assert rows[0].conditions == {"container": {"running": True}}
+        assert "workspaces.conditions" not in _compiled_sql(conn)
+
+    async def test_snapshot_missing_workspace_is_unobserved(self, conn: AsyncMock):
+        loader = WorkspaceLoader(conn)
+
+        rows = await loader.load_ids({"ws-1"}, {})
+
+        assert rows[0].conditions == {}
+
+
+    async def test_excludes_workspaces_in_backoff(self, conn: AsyncMock):
+        """next_attempt_at 미도래 workspace는 full/incremental load에서 제외."""
+        loader = WorkspaceLoader(conn)
+
+        await loader.load()
+        assert "workspaces.next_attempt_at <=" in _compiled_sql(conn)
+
+        await loader.load()
+        assert "workspaces.next_attempt_at <=" in _compiled_sql(conn)
+
+    async def test_full_load_counts_backoff(self, conn: AsyncMock):
+        """Full load마다 backoff 중인 workspace 수 집계 (incremental은 생략)."""
+        loader = WorkspaceLoader(conn)
+
+        await loader.load()
+        assert conn.execute.await_count == 2
+        count_sql = str(
+            conn.execute.call_args_list[0][0][0].compile(dialect=postgresql.dialect())
+        )
+        assert "count(*)" in count_sql
+        assert "workspaces.next_attempt_at >" in count_sql
+
+        await loader.load()
+        assert conn.execute.await_count == 3
+
+    async def test_load_ids_includes_backoff(self, conn: AsyncMock):
+        """Targeted load는 backoff 무관 (완료 판정은 가능, 재실행은 WC가 보류)."""
+        loader = WorkspaceLoader(conn)
+
+        await loader.load_ids({"ws-1"})
+
+        assert "next_attempt_at <=" not in _compiled_sql(conn)
+
+
+def _stream(conn: AsyncMock, partitions: list[list[SimpleNamespace]]) -> MagicMock:
+    """conn.stream() (server-side cursor) mock - partitions(n)는 chunk 순서대로."""
+    result = MagicMock()
+
+    async def _partitions(_size):
+        for partition in partitions:
+            yield partition
+
+    result.partitions = _partitions
+    result.close = AsyncMock()
+    conn.stream = AsyncMock(return_value=result)
+    return result
+
+
+class TestFullPass:
+    async def test_full_load_starts_pass(self, conn: AsyncMock):
+        """Full load는 RUNNING 전체를 한 번에 읽지 않고 pass 시작."""
+        loader = WorkspaceLoader(conn)
+
+        await loader.load()
+
+        assert loader.pass_active
+        assert "workspaces.phase = " not in _compiled_sql(conn)  # 수렴 필요 row만
+
+    async def test_stream_pass_orders_by_id_and_finishes(self, conn: AsyncMock):
+        loader = WorkspaceLoader(conn)
+        await loader.load()
+        result = _stream(conn, [[make_db_row("ws-1")], [make_db_row("ws-2")]])
+
+        chunks = [chunk async for chunk in loader.stream_pass(1)]
+
+        assert [[ws.id for ws in chunk] for chunk in chunks] == [["ws-1"], ["ws-2"]]
+        stmt = conn.stream.call_args[0][0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ORDER BY workspaces.id" in sql
+        assert stmt.get_execution_options()["yield_per"] == 1
+        result.close.assert_awaited_once()
+        assert not loader.pass_active
+
+    async def test_interrupted_pass_resumes_from_cursor(self, conn: AsyncMock):
+        """중간에 멈추면 cursor 유지 → 다음 stream은 그 다음 id부터."""
+        loader = WorkspaceLoader(conn)
+        await loader.load()
+        _stream(conn, [[make_db_row("ws-1")], [make_db_row("ws-2")]])
+
+        async with aclosing(loader.stream_pass(1)) as chunks:
+            async for _chunk in chunks:
+                break
+
+        assert loader.pass_active
+        _stream(conn, [[make_db_row("ws-2")]])
+        [chunk] = [chunk async for chunk in loader.stream_pass(1)]
+        params = conn.stream.call_args[0][0].compile(dialect=postgresql.dialect()).params
+        assert "ws-1" in params.values()
+        assert [ws.id for ws in chunk] == ["ws-2"]
+        assert not loader.pass_active
+
+    async def test_reset_drops_pass(self, conn: AsyncMock):
+        loader = WorkspaceLoader(conn)
+        await loader.load()
+
+        loader.reset()
+
+        assert not loader.pass_active
+
+
+class TestLeadershipLostResetsWatermark:
+    async def test_wc_resets_loader(self, conn: AsyncMock):
+        """리더십 상실 hook → loader watermark 초기화."""
+        wc = WorkspaceController(conn, AsyncMock(), AsyncMock(), AsyncMock(), AsyncMock())
+        await wc._load_for_reconcile()
+        assert wc._loader.watermark is not None
+
+        wc._on_leadership_lost()
+
+        assert wc._loader.watermark is None
@@ -0,0 +1,163 @@
+"""Tests for table-driven plan_many() - plan()과 동일 결과 검증.
+
+전체 입력 공간: phase × operation × desired_state × conditions × deleted × restore_marker × op_started_at
+"""
+
+import itertools
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from codehub.control.coordinator.wc_loader import WorkspaceRow
+from codehub.control.coordinator.wc_plan_table import plan_many, transitions
+from codehub.control.coordinator.wc_planner import PlanAction, PlanInput, plan
+from codehub.core.domain.conditions import RESOURCES, observed_stamp
+from codehub.core.domain.workspace import DesiredState, Operation, Phase
+
+TIMEOUT = 600.0
+STALE = 900.0
+
+_NOW = datetime.now(UTC)
+_STARTED_AT = [None, _NOW - timedelta(seconds=10), _NOW - timedelta(seconds=TIMEOUT + 60)]
+# (home_ctx, archive_key): marker 없음 / 일치 / 불일치
+_MARKERS = [
+    (None, "ws/op/home.tar.zst"),
+    ({"restore_marker": "ws/op/home.tar.zst"}, "ws/op/home.tar.zst"),
+    ({"restore_marker": "ws/old/home.tar.zst"}, "ws/op/home.tar.zst"),
+]
+
+
+def _conditions(container: bool, volume: bool, archive: bool) -> dict:
+    return {
+        "container": {"running": True, "reason": "Running"} if container else None,
+        "volume": {"exists": True, "reason": "VolumeExists"} if volume else None,
+        "archive": {"exists": True, "reason": "ArchiveExists"} if archive else None,
+    }
+
+
+def _all_rows() -> list[WorkspaceRow]:
+    rows = []
+    for phase, operation, desired, c, v, a, deleted, (home_ctx, archive_key) in itertools.product(
+        Phase, Operation, DesiredState, (False, True), (False, True), (False, True),
+        (False, True), _MARKERS,
+    ):
+        started = _STARTED_AT if operation != Operation.NONE else [None]
+        for op_started_at in started:
+            rows.append(WorkspaceRow(
+                id="ws-1",
+                owner_user_id="user-1",
+                image_ref="ubuntu:22.04",
+                phase=phase,
+                operation=operation,
+                desired_state=desired,
+                conditions=_conditions(c, v, a),
+                archive_key=archive_key,
+                op_started_at=op_started_at,
+                op_id="op-1" if operation != Operation.NONE else None,
+                deleted_at=_NOW if deleted else None,
+                home_ctx=home_ctx,
+                error_count=0,
+                error_reason=None,
+            ))
+    return rows
+
+
+def _normalize(action: PlanAction) -> PlanAction:
+    """새 op_id는 uuid4 → 존재 여부만 비교."""
+    if action.op_id and action.op_id != "op-1":
+        action.op_id = "<new>"
+    return action
+
+
+class TestPlanManyEquivalence:
+    def test_table_covers_input_space(self):
+        assert len(transitions()) == len(Phase) * len(Operation) * len(DesiredState) * 32
+
+    def test_identical_to_plan_over_full_input_space(self):
+        rows = _all_rows()
+
+        expected = [
+            _normalize(plan(PlanInput.from_workspace(row), timeout_seconds=TIMEOUT))
+            for row in rows
+        ]
+        actual = [_normalize(a) for a in plan_many(rows, timeout_seconds=TIMEOUT)]
+
+        mismatches = [
+            (row, e, a) for row, e, a in zip(rows, expected, actual, strict=True) if e != a
+        ]
+        assert mismatches == []
+
+    @pytest.mark.parametrize("conditions", [{}, {"container": {}}, {"volume": None}])
+    def test_partial_conditions(self, conditions: dict):
+        """conditions 일부 누락 → plan()과 동일."""
+        row = WorkspaceRow(
+            "ws-1", "user-1", "img", Phase.PENDING, Operation.NONE, DesiredState.RUNNING,
+            conditions, None, None, None, None, None, 0, None,
+        )
+
+        expected = _normalize(plan(PlanInput.from_workspace(row)))
+
+        assert [_normalize(a) for a in plan_many([row])] == [expected]
+
+    def test_new_operation_gets_unique_op_id(self):
+        row = WorkspaceRow(
+            "ws-1", "user-1", "img", Phase.STANDBY, Operation.NONE, DesiredState.RUNNING,
+            _conditions(False, True, False), None, None, None, None, None, 0, None,
+        )
+
+        a1, a2 = plan_many([row, row])
+
+        assert a1.operation == Operation.STARTING
+        assert a1.op_id and a2.op_id and a1.op_id != a2.op_id
+
+
+def _with_stale(row: WorkspaceRow, mask: int) -> WorkspaceRow:
+    """mask bit i → RESOURCES[i] 관측 시각을 STALE 이전으로 (나머지는 방금 관측)."""
+    fresh = observed_stamp(_NOW)
+    stale = observed_stamp(_NOW - timedelta(seconds=STALE + 60))
+    observed = {r: stale if mask & (1 << i) else fresh for i, r in enumerate(RESOURCES)}
+    return row._replace(conditions={**row.conditions, "observed_at": observed})
+
+
+class TestStaleConditions:
+    def test_identical_to_plan_with_stale_resources(self):
+        """Stale mask를 입력 공간 전체에 분산 → plan()과 동일."""
+        rows = [_with_stale(row, i % 8) for i, row in enumerate(_all_rows())]
+
+        expected = [
+            _normalize(
+                plan(PlanInput.from_workspace(row), timeout_seconds=TIMEOUT, stale_seconds=STALE)
+            )
+            for row in rows
+        ]
+        actual = [
+            _normalize(a)
+            for a in plan_many(rows, timeout_seconds=TIMEOUT, stale_seconds=STALE)
+        ]
+
+        mismatches = [
+            (row, e, a) for row, e, a in zip(rows, expected, actual, strict=True) if e != a
+        ]
+        assert mismatches == []
+
+    def _starting(self, mask: int) -> WorkspaceRow:
+        row = WorkspaceRow(
+            "ws-1", "user-1", "img", Phase.STANDBY, Operation.STARTING, DesiredState.RUNNING,
+            _conditions(True, True, False), None, _NOW, "op-1", None, None, 0, None,
+        )
+        return _with_stale(row, mask)
+
+    def test_unrelated_stale_resource_does_not_block(self):
+        """archive만 stale → STARTING 완료 판정 (S3 장애와 무관)."""
+        (action,) = plan_many([self._starting(0b100)], stale_seconds=STALE)
+
+        assert action.complete is True
+        assert action.phase == Phase.RUNNING
+
+    def test_stale_dependency_holds(self):
+        """container stale → 완료 판정 보류 (진행 중 유지)."""
+        (action,) = plan_many([self._starting(0b001)], stale_seconds=STALE)
+
+        assert action.complete is False
+        assert action.operation == Operation.STARTING
+        assert action.op_id == "op-1"
@@ -0,0 +1,279 @@
+"""Tests for WC work queue (multi-worker operation 실행).
+
+Reference: docs/spec/04-control-plane.md (Work queue)
+"""
+
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from codehub.control.coordinator.wc import WorkspaceController
+from codehub.control.coordinator.wc_loader import WorkspaceRow
+from codehub.control.coordinator.wc_planner import PlanAction
+from codehub.control.coordinator.wc_work_queue import WorkItem, WorkQueue
+from codehub.control.coordinator.wc_worker import WorkQueueWorker
+from codehub.core.domain.workspace import DesiredState, Operation, Phase
+from codehub.core.interfaces.storage import ArchiveResult
+
+from .test_wc import make_workspace
+
+
+def _row(operation: Operation = Operation.ARCHIVING, op_id: str | None = "op-1") -> WorkspaceRow:
+    return WorkspaceRow(
+        "ws-1", "user-1", "img", Phase.STANDBY, operation, DesiredState.ARCHIVED,
+        {}, None, datetime.now(UTC), op_id, None, None, 0, None,
+    )
+
+
+@pytest.fixture
+def conn() -> AsyncMock:
+    conn = AsyncMock()
+    conn.execute.return_value = MagicMock()
+    return conn
+
+
+class TestWorkQueue:
+    async def test_enqueue_empty_is_noop(self, conn: AsyncMock):
+        queue = WorkQueue(conn)
+
+        assert await queue.enqueue([]) == 0
+        assert await queue.complete("w-1", []) == set()
+        assert await queue.claim("w-1", 0, {Operation.STARTING: 1}, 60.0) == []
+        assert await queue.claim("w-1", 4, {Operation.ARCHIVING: 0}, 60.0) == []
+
+        conn.execute.assert_not_called()
+
+    async def test_enqueue_ignores_existing(self, conn: AsyncMock):
+        """workspace당 1행 (대기/실행 중이면 무시) + operation 우선순위."""
+        conn.execute.return_value.fetchall.return_value = [("ws-1",)]
+        queue = WorkQueue(conn)
+
+        added = await queue.enqueue(
+            [("ws-1", "op-1", Operation.STARTING), ("ws-2", "op-2", Operation.ARCHIVING)]
+        )
+
+        assert added == 1
+        sql, params = conn.execute.call_args[0]
+        assert "ON CONFLICT (workspace_id) DO NOTHING" in str(sql)
+        assert params["priorities"] == [0, 2]
+
+    async def test_claim_skip_locked_with_lease(self, conn: AsyncMock):
+        conn.execute.return_value.fetchall.return_value = [("ws-1", "op-1", "ARCHIVING")]
+        queue = WorkQueue(conn)
+
+        items = await queue.claim(
+            "w-1", 4, {Operation.ARCHIVING: 2, Operation.DELETING: 0, Operation.STARTING: 4}, 720.0
+        )
+
+        assert items == [WorkItem("ws-1", "op-1", Operation.ARCHIVING)]
+        sql, params = conn.execute.call_args[0]
+        assert "FOR UPDATE SKIP LOCKED" in str(sql)
+        assert "leased_until < now()" in str(sql)  # 만료된 lease 재claim
+        assert params == {
+            "worker_id": "w-1",
+            "lease": 720.0,
+            "limit": 4,
+            # operation별 상한 (빈 슬롯 없는 operation은 claim 대상에서 제외)
+            "operations": ["ARCHIVING", "STARTING"],
+            "slots": [2, 4],
+        }
+
+    async def test_complete_only_own_lease(self, conn: AsyncMock):
+        conn.execute.return_value.fetchall.return_value = [("ws-1",)]
+        queue = WorkQueue(conn)
+
+        owned = await queue.complete("w-1", ["ws-1", "ws-2"])
+
+        assert owned == {"ws-1"}
+        sql, params = conn.execute.call_args[0]
+        assert "worker_id = :worker_id" in str(sql)
+        assert params["worker_id"] == "w-1"
+
+
+class TestWorkQueueWorker:
+    @pytest.fixture
+    def worker(self, conn: AsyncMock, mock_subscriber: AsyncMock) -> WorkQueueWorker:
+        worker = WorkQueueWorker(conn, mock_subscriber, AsyncMock(), AsyncMock(), AsyncMock())
+        worker._queue = AsyncMock(spec=WorkQueue)
+        worker._queue.complete.side_effect = lambda _worker_id, ids: set(ids)
+        worker._catalog = AsyncMock()
+        return worker
+
+    async def _drain_tasks(self, worker: WorkQueueWorker) -> None:
+        while worker._tasks:
+            await asyncio.sleep(0)
+
+    async def test_claim_runs_and_completes_with_cas(
+        self, worker: WorkQueueWorker, conn: AsyncMock, monkeypatch: pytest.MonkeyPatch
+    ):
+        """claim → 실행 → queue 삭제 + 결과 CAS + Observer wake."""
+        ws = _row()
+        worker._queue.claim.return_value = [WorkItem("ws-1", "op-1", Operation.ARCHIVING)]
+        worker._loader.fetch_ids = AsyncMock(return_value=[ws])
+        worker._sp.archive.return_value = ArchiveResult(
+            archive_key="ws-1/op-1/home.tar.zst", pruned=("ws-1/op-0/home.tar.zst",)
+        )
+        cas = AsyncMock(return_value={"ws-1"})
+        monkeypatch.setattr("codehub.control.coordinator.wc_worker.cas_update_many", cas)
+
+        await worker.tick()
+        await self._drain_tasks(worker)
+        worker._queue.claim.return_value = []
+        await worker.tick()
+
+        worker._sp.archive.assert_awaited_once_with("ws-1", "op-1", retain=ws.archive_key)
+        worker._queue.complete.assert_awaited_with(worker.worker_id, ["ws-1"])
+        [row] = cas.await_args[0][1]
+        assert row.operation == Operation.ARCHIVING  # 완료 판정은 리더 (conditions 기준)
+        assert row.archive_key == "ws-1/op-1/home.tar.zst"
+        worker._catalog.record.assert_awaited()
+        assert list(worker._catalog.remove.await_args[0][0]) == ["ws-1/op-0/home.tar.zst"]
+        worker._publisher.publish.assert_awaited_once()
+        assert worker._publisher.publish.await_args[0][0].endswith(":observer")
+
+    async def test_stale_item_deleted_without_execution(self, worker: WorkQueueWorker):
+        """operation/op_id가 바뀐 행 (이미 완료 등) → 실행 없이 삭제."""
+        worker._queue.claim.return_value = [WorkItem("ws-1", "op-old", Operation.ARCHIVING)]
+        worker._loader.fetch_ids = AsyncMock(return_value=[_row(op_id="op-new")])
+
+        await worker.tick()
+
+        assert worker._tasks == {}
+        worker._queue.complete.assert_awaited_once_with(worker.worker_id, ["ws-1"])
+        worker._sp.archive.assert_not_called()
+
+    async def test_lease_lost_discards_result(
+        self, worker: WorkQueueWorker, monkeypatch: pytest.MonkeyPatch
+    ):
+        """lease를 잃은 결과 (다른 worker가 재claim) → CAS 없음."""
+        worker._completed = [(_row(), MagicMock(archive_key=None))]
+        worker._queue.complete.side_effect = None
+        worker._queue.complete.return_value = set()
+        cas = AsyncMock()
+        monkeypatch.setattr("codehub.control.coordinator.wc_worker.cas_update_many", cas)
+
+        await worker._complete()
+
+        cas.assert_not_called()
+        worker._publisher.publish.assert_not_called()
+
+    async def test_failed_execution_schedules_backoff(
+        self, worker: WorkQueueWorker, monkeypatch: pytest.MonkeyPatch
+    ):
+        worker._run_operation = AsyncMock(return_value=False)
+        worker._queue.claim.return_value = [WorkItem("ws-1", "op-1", Operation.ARCHIVING)]
+        worker._loader.fetch_ids = AsyncMock(return_value=[_row()])
+        cas = AsyncMock(return_value={"ws-1"})
+        monkeypatch.setattr("codehub.control.coordinator.wc_worker.cas_update_many", cas)
+
+        await worker.tick()
+        await self._drain_tasks(worker)
+        await worker._complete()
+
+        [row] = cas.await_args[0][1]
+        assert row.error_count == 1
+        assert row.next_attempt_at is not None
+
+    async def test_claim_limited_by_free_slots(self, worker: WorkQueueWorker):
+        worker._queue.claim.return_value = []
+        worker._tasks = {"ws-x": MagicMock()}
+        worker._task_ops = {"ws-x": Operation.STARTING}
+
+        await worker._claim()
+
+        _, limit, slots, _ = worker._queue.claim.await_args[0]
+        assert limit == worker.MAX_CONCURRENT - 1
+        assert slots[Operation.STARTING] == worker.MAX_CONCURRENT - 1
+
+    async def test_claim_limited_by_operation_slots(
+        self, worker: WorkQueueWorker, monkeypatch: pytest.MonkeyPatch
+    ):
+        """대기 중인 ARCHIVING이 operation 제한보다 많음 → 빈 슬롯만큼만 claim.
+
+        executor에서 대기하는 동안 lease가 만료되어 다른 worker가 중복 실행하지 않도록
+        claim한 항목은 모두 즉시 시작 가능해야 함.
+        """
+        cas = AsyncMock(return_value=set())
+        monkeypatch.setattr("codehub.control.coordinator.wc_worker.cas_update_many", cas)
+        limit = worker._executor._op_limits[Operation.ARCHIVING]
+        rows = [_row()._replace(id=f"ws-{i}", op_id=f"op-{i}") for i in range(limit * 3)]
+        worker._loader.fetch_ids = AsyncMock(
+            side_effect=lambda ids, _: [row for row in rows if row.id in ids]
+        )
+        worker._run_operation = AsyncMock(side_effect=lambda *_: asyncio.Event().wait())
+
+        pending = list(rows)
+
+        def claim(_worker_id, total, slots, _lease):
+            n = min(total, slots.get(Operation.ARCHIVING, 0))
+            claimed, pending[:] = pending[:n], pending[n:]
+            return [WorkItem(r.id, r.op_id, Operation.ARCHIVING) for r in claimed]
+
+        worker._queue.claim.side_effect = claim
+
+        await worker._claim()
+        await worker._claim()  # 슬롯이 찼으므로 추가 claim 없음
+
+        assert len(worker._tasks) == limit
+        assert worker._queue.claim.await_args[0][2][Operation.ARCHIVING] == 0
+        await worker._cleanup()
+
+    async def test_restoring_prefetches_image(self, worker: WorkQueueWorker):
+        """Work queue mode에서도 RUNNING으로 가는 RESTORING 중 image pre-pull."""
+        ws = _row(Operation.RESTORING)._replace(desired_state=DesiredState.RUNNING)
+        action = PlanAction(operation=Operation.RESTORING, phase=Phase.ARCHIVED, op_id="op-1")
+        worker._run_operation = AsyncMock(return_value=True)
+
+        await worker._run_one(ws, action)
+        await asyncio.sleep(0)
+
+        worker._ic.ensure_image.assert_awaited_once_with("img")
+
+    async def test_cleanup_releases_leases(self, worker: WorkQueueWorker, conn: AsyncMock):
+        await worker._cleanup()
+
+        worker._queue.release.assert_awaited_once_with(worker.worker_id)
+        conn.commit.assert_awaited()
+
+
+class TestLeaderQueueMode:
+    @pytest.fixture
+    def wc(self, mock_conn, mock_leader, mock_subscriber) -> WorkspaceController:
+        wc = WorkspaceController(
+            mock_conn, mock_leader, mock_subscriber, AsyncMock(), AsyncMock(), AsyncMock()
+        )
+        wc.WORK_QUEUE = True
+        wc._work_queue = AsyncMock(spec=WorkQueue)
+        wc._work_queue.enqueue.return_value = 1
+        wc._catalog = AsyncMock()
+        return wc
+
+    async def test_enqueue_instead_of_execute(self, wc: WorkspaceController):
+        """operation 시작 CAS 성공 → 같은 트랜잭션에서 enqueue (직접 실행 없음)."""
+        ws = make_workspace(phase=Phase.STANDBY)
+        wc._load_for_reconcile = AsyncMock(return_value=[ws])
+        wc._cas_update_many = AsyncMock(return_value={"ws-1"})
+
+        await wc.reconcile()
+
+        assert len(wc._inflight) == 0
+        wc._sp.provision.assert_not_called()
+        [row] = wc._cas_update_many.await_args[0][0]
+        assert row.operation == Operation.PROVISIONING  # volume 없음
+        [item] = list(wc._work_queue.enqueue.await_args[0][0])
+        assert item == ("ws-1", row.op_id, Operation.PROVISIONING)
+        wc._conn.commit.assert_awaited_once()
+        assert wc._publisher.publish.await_args[0][0].endswith(":wc-worker")
+
+    async def test_cas_failure_not_enqueued(self, wc: WorkspaceController):
+        ws = make_workspace(phase=Phase.STANDBY)
+        wc._load_for_reconcile = AsyncMock(return_value=[ws])
+        wc._cas_update_many = AsyncMock(return_value=set())
+        wc._work_queue.enqueue.return_value = 0
+
+        await wc.reconcile()
+
+        assert list(wc._work_queue.enqueue.await_args[0][0]) == []
+        wc._publisher.publish.assert_not_called()
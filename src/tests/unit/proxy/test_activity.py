@@ -245,6 +245,48 @@ class TestActivityStore:
             "codehub:activity", min="-inf", max=1704060000.0
         )
 
+    async def test_pop_expired_uses_lua(self):
+        """pop_expired() pops score <= cutoff atomically (Lua) with a limit."""
+        mock_redis = AsyncMock()
+        mock_redis.eval.return_value = ["ws-1", "1704060000", "ws-2", "1704060001.5"]
+        store = ActivityStore(mock_redis)
+
+        result = await store.pop_expired(1704060002.0, 100)
+
+        assert result == {"ws-1": 1704060000.0, "ws-2": 1704060001.5}
+        script, numkeys, key, cutoff, limit = mock_redis.eval.call_args[0]
+        assert "ZRANGEBYSCORE" in script and "ZREM" in script
+        assert (numkeys, key, cutoff, limit) == (1, "codehub:activity", 1704060002.0, 100)
+
+    async def test_get_since_exclusive_min(self):
+        """get_since() pages with an exclusive score bound."""
+        mock_redis = AsyncMock()
+        mock_redis.zrangebyscore.return_value = [("ws-1", 1704060001.0)]
+        store = ActivityStore(mock_redis)
+
+        result = await store.get_since(1704060000.0, 50)
+
+        assert result == [("ws-1", 1704060001.0)]
+        mock_redis.zrangebyscore.assert_called_once_with(
+            "codehub:activity",
+            min="(1704060000.0",
+            max="+inf",
+            start=0,
+            num=50,
+            withscores=True,
+        )
+
+    async def test_get_many_omits_missing(self):
+        """get_many() uses ZMSCORE and omits members not in the ZSET."""
+        mock_redis = AsyncMock()
+        mock_redis.zmscore.return_value = [1704060000.0, None]
+        store = ActivityStore(mock_redis)
+
+        result = await store.get_many(["ws-1", "ws-2"])
+
+        assert result == {"ws-1": 1704060000.0}
+        mock_redis.zmscore.assert_called_once_with("codehub:activity", ["ws-1", "ws-2"])
+
 
 class TestGetActivityBuffer:
     """get_activity_buffer() singleton tests."""